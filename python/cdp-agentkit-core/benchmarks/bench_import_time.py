@@ -0,0 +1,60 @@
+"""Benchmark cold-start import time of the actions package with all or only selected actions.
+
+Each scenario runs in a fresh interpreter, as a serverless cold start would, and reports the
+median wall time from interpreter start to the actions being ready, and which heavy dependencies
+were imported on the way.
+
+Usage:
+    poetry run python benchmarks/bench_import_time.py [--runs 5]
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+
+HEAVY_MODULES = ("cdp", "web3", "requests", "numpy")
+
+SCENARIOS = {
+    "import actions package": "import cdp_agentkit_core.actions",
+    "load rpg actions": (
+        "from cdp_agentkit_core.actions import load_actions\n"
+        "load_actions(['estimate_fighting_pow', 'get_nft_price', 'simulate_battle'])"
+    ),
+    "load all actions": "from cdp_agentkit_core.actions import CDP_ACTIONS",
+}
+
+_MEASURE = """
+import sys, time
+start = time.perf_counter()
+{code}
+elapsed = time.perf_counter() - start
+heavy = [module for module in {heavy_modules!r} if module in sys.modules]
+print(elapsed, ",".join(heavy))
+"""
+
+
+def _run(code: str) -> tuple[float, str]:
+    output = subprocess.run(
+        [sys.executable, "-c", _MEASURE.format(code=code, heavy_modules=HEAVY_MODULES)],
+        capture_output=True,
+        check=True,
+        text=True,
+    ).stdout.split()
+    return float(output[0]), output[1] if len(output) > 1 else "-"
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--runs", type=int, default=5, help="Fresh interpreters per scenario")
+    options = parser.parse_args()
+
+    for name, code in SCENARIOS.items():
+        results = [_run(code) for _ in range(options.runs)]
+        median_ms = statistics.median(elapsed for elapsed, _ in results) * 1000
+        print(f"{name:<24} median {median_ms:8.1f} ms   imports {results[0][1]}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+"""Benchmark per-call latency of unpooled `requests.get` against the shared read client.
+
+Starts a local keep-alive stub server, then times sequential reads with a new connection per
+call, as read-only actions used to do, and with the pooled `read_client`, plus a burst of
+identical concurrent reads to show request coalescing.
+
+Usage:
+    poetry run python benchmarks/bench_read_client.py [--calls 200] [--latency-ms 5]
+"""
+
+import argparse
+import json
+import statistics
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import requests
+
+from cdp_agentkit_core.actions.read_client import ReadClient
+
+
+class _StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # Headers and body are written separately, which Nagle's algorithm would delay on a
+    # kept-alive connection.
+    disable_nagle_algorithm = True
+    latency = 0.0
+    requests_served = 0
+
+    def do_GET(self):
+        type(self).requests_served += 1
+        time.sleep(self.latency)
+        body = json.dumps({"parsed": [{"price": {"price": "4212345", "expo": -2}}]}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def _time_calls(read, calls: int) -> list[float]:
+    durations = []
+    for i in range(calls):
+        start = time.perf_counter()
+        read(i)
+        durations.append(time.perf_counter() - start)
+    return durations
+
+
+def _report(name: str, durations: list[float]) -> None:
+    durations_ms = sorted(duration * 1000 for duration in durations)
+    p95 = durations_ms[int(len(durations_ms) * 0.95) - 1]
+    print(
+        f"{name:<28} mean {statistics.mean(durations_ms):7.3f} ms   "
+        f"p50 {statistics.median(durations_ms):7.3f} ms   p95 {p95:7.3f} ms"
+    )
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--calls", type=int, default=200, help="Sequential calls per client")
+    parser.add_argument("--latency-ms", type=float, default=5.0, help="Stub server latency")
+    parser.add_argument("--burst", type=int, default=50, help="Identical concurrent reads")
+    options = parser.parse_args()
+
+    _StubHandler.latency = options.latency_ms / 1000
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _StubHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_port}/v2/updates/price/latest"
+
+    def unpooled_read(i):
+        response = requests.get(f"{url}?ids[]={i}", timeout=10)
+        response.raise_for_status()
+        return response.json()
+
+    client = ReadClient()
+    _report("requests.get (unpooled)", _time_calls(unpooled_read, options.calls))
+    _report(
+        "read_client (pooled)",
+        _time_calls(lambda i: client.get_json(f"{url}?ids[]={i}"), options.calls),
+    )
+
+    _StubHandler.requests_served = 0
+    with ThreadPoolExecutor(max_workers=options.burst) as executor:
+        list(executor.map(lambda _: client.get_json(url), range(options.burst)))
+    print(
+        f"{options.burst} identical concurrent reads sent {_StubHandler.requests_served} "
+        f"requests ({client.coalesced} coalesced)"
+    )
+
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""Benchmark estimating NFT battle win rates with simulate_battle_batch against simulate_battle.
+
+The serial estimates call simulate_battle once per battle, as an agent estimating a win rate
+would, either rendering each battle's log or only reading its outcome, and the batch estimate runs
+all battles in simulate_battle_batch's vectorized engine. The exact odds of calculate_battle_odds
+are timed alongside.
+
+Usage:
+    poetry run python benchmarks/bench_simulate_battle_batch.py [--trials 10000]
+"""
+
+import argparse
+import time
+
+from cdp_agentkit_core.actions.rpg.battle_odds import calculate_battle_odds
+from cdp_agentkit_core.actions.rpg.simulate_battle import simulate_battle
+from cdp_agentkit_core.actions.rpg.simulate_battle_batch import simulate_battle_batch
+
+# Matchups of NFT prices, from short lopsided battles to long even ones.
+MATCHUPS = [(100, 50), (10, 14), (30, 30), (0, 100)]
+
+# Battles run serially per matchup, as serial battles are too slow to run as many.
+SERIAL_TRIALS = 1000
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--trials", type=int, default=10000, help="Battles per batch estimate")
+    options = parser.parse_args()
+
+    # Import NumPy before timing.
+    simulate_battle_batch(1, 1, trials=1)
+
+    for nft1_price, nft2_price in MATCHUPS:
+        start = time.perf_counter()
+        for _ in range(SERIAL_TRIALS):
+            str(simulate_battle(nft1_price, nft2_price))
+        logged_ms = (time.perf_counter() - start) / SERIAL_TRIALS * options.trials * 1000
+
+        start = time.perf_counter()
+        for _ in range(SERIAL_TRIALS):
+            simulate_battle(nft1_price, nft2_price, verbosity="summary")
+        serial_ms = (time.perf_counter() - start) / SERIAL_TRIALS * options.trials * 1000
+
+        start = time.perf_counter()
+        result = simulate_battle_batch(nft1_price, nft2_price, trials=options.trials)
+        batch_ms = (time.perf_counter() - start) * 1000
+
+        start = time.perf_counter()
+        odds = calculate_battle_odds(nft1_price, nft2_price)
+        odds_ms = (time.perf_counter() - start) * 1000
+
+        print(
+            f"${nft1_price} vs ${nft2_price}: {options.trials} battles, "
+            f"mean {result.turns_mean:.0f} turns   "
+            f"serial with log {logged_ms:8.1f} ms, without {serial_ms:8.1f} ms (extrapolated)   "
+            f"batch {batch_ms:6.1f} ms   "
+            f"{serial_ms / batch_ms:5.0f}x   "
+            f"exact {odds_ms:6.1f} ms "
+            f"(win rate {result.win_rate:.2%}, exact {odds.win_probability:.2%})"
+        )
+
+
+if __name__ == "__main__":
+    main()
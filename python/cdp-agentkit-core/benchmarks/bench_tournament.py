@@ -0,0 +1,53 @@
+"""Benchmark running NFT tournaments with run_tournament against serial simulate_battle calls.
+
+The serial estimate extrapolates the time of simulate_battle calls, without building their logs,
+to every battle of the tournament, and the tournament runs all its battles in
+simulate_battle_batch's vectorized engine.
+
+Usage:
+    poetry run python benchmarks/bench_tournament.py [--nfts 1000]
+"""
+
+import argparse
+import random
+import time
+
+from cdp_agentkit_core.actions.rpg.simulate_battle import simulate_battle
+from cdp_agentkit_core.actions.rpg.tournament import run_tournament
+
+# Battles run serially, as serial battles are too slow to run a whole tournament.
+SERIAL_BATTLES = 1000
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--nfts", type=int, default=1000, help="NFTs in each tournament")
+    options = parser.parse_args()
+
+    rng = random.Random(0)
+    prices = [round(rng.uniform(0, 200), 2) for _ in range(options.nfts)]
+
+    # Import NumPy before timing.
+    run_tournament(prices[:2], seed=0)
+
+    start = time.perf_counter()
+    for _ in range(SERIAL_BATTLES):
+        simulate_battle(*rng.sample(prices, 2), verbosity="summary")
+    serial_battle_ms = (time.perf_counter() - start) / SERIAL_BATTLES * 1000
+
+    for tournament_format in ("round_robin", "bracket"):
+        start = time.perf_counter()
+        result = run_tournament(prices, tournament_format=tournament_format, seed=0)
+        tournament_ms = (time.perf_counter() - start) * 1000
+        serial_ms = serial_battle_ms * result.battles
+
+        print(
+            f"{tournament_format}: {options.nfts} NFTs, {result.battles} battles   "
+            f"serial {serial_ms:10.1f} ms (extrapolated)   tournament {tournament_ms:7.1f} ms   "
+            f"{serial_ms / tournament_ms:5.0f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
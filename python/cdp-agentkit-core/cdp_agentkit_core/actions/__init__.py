@@ -1,54 +1,58 @@
 from cdp_agentkit_core.actions.cdp_action import CdpAction  # noqa: I001
 
-from cdp_agentkit_core.actions.address_reputation import AddressReputationAction
-from cdp_agentkit_core.actions.deploy_contract import DeployContractAction
-from cdp_agentkit_core.actions.deploy_nft import DeployNftAction
-from cdp_agentkit_core.actions.deploy_token import DeployTokenAction
-from cdp_agentkit_core.actions.get_balance import GetBalanceAction
-from cdp_agentkit_core.actions.get_balance_nft import GetBalanceNftAction
-from cdp_agentkit_core.actions.get_wallet_details import GetWalletDetailsAction
-from cdp_agentkit_core.actions.mint_nft import MintNftAction
-from cdp_agentkit_core.actions.morpho.deposit import MorphoDepositAction
-from cdp_agentkit_core.actions.morpho.withdraw import MorphoWithdrawAction
-from cdp_agentkit_core.actions.pyth.fetch_price import PythFetchPriceAction
-from cdp_agentkit_core.actions.pyth.fetch_price_feed_id import PythFetchPriceFeedIDAction
-from cdp_agentkit_core.actions.register_basename import RegisterBasenameAction
-from cdp_agentkit_core.actions.request_faucet_funds import RequestFaucetFundsAction
-from cdp_agentkit_core.actions.superfluid.create_flow import SuperfluidCreateFlowAction
-from cdp_agentkit_core.actions.superfluid.delete_flow import SuperfluidDeleteFlowAction
-from cdp_agentkit_core.actions.superfluid.update_flow import SuperfluidUpdateFlowAction
-from cdp_agentkit_core.actions.trade import TradeAction
-from cdp_agentkit_core.actions.transfer import TransferAction
-from cdp_agentkit_core.actions.transfer_nft import TransferNftAction
-from cdp_agentkit_core.actions.wow.buy_token import WowBuyTokenAction
-from cdp_agentkit_core.actions.wow.create_token import WowCreateTokenAction
-from cdp_agentkit_core.actions.wow.sell_token import WowSellTokenAction
-from cdp_agentkit_core.actions.wrap_eth import WrapEthAction
-from cdp_agentkit_core.actions.rpg.estimate_fighting_pow import EstimateNFTFightPowerAction
-from cdp_agentkit_core.actions.rpg.get_nft_price import GetNFTPriceAction
-from cdp_agentkit_core.actions.rpg.simulate_battle import SimulationBattleAction
+from cdp_agentkit_core.actions.registry import (
+    ACTION_SPECS,
+    ACTION_TAGS,
+    ActionSpec,
+    load_actions,
+    select_action_specs,
+)
 
+_SPECS_BY_CLASS_NAME = {spec.class_name: spec for spec in ACTION_SPECS}
 
-# WARNING: All new CdpAction subclasses must be imported above, otherwise they will not be discovered
-# by get_all_cdp_actions(). The import ensures the class is registered as a subclass of CdpAction.
-def get_all_cdp_actions() -> list[type[CdpAction]]:
-    """Retrieve all subclasses of CdpAction defined in the package."""
-    actions = []
+
+def get_all_cdp_actions() -> list[CdpAction]:
+    """Retrieve all registered actions, and any other imported subclasses of CdpAction."""
+    actions = load_actions()
+    registered = {type(action) for action in actions}
     for action in CdpAction.__subclasses__():
-        actions.append(action())
+        if action not in registered:
+            actions.append(action())
     return actions
 
 
-CDP_ACTIONS = get_all_cdp_actions()
+def __getattr__(name: str):
+    """Import action classes and `CDP_ACTIONS` on first access, rather than with the package."""
+    if name == "CDP_ACTIONS":
+        value = get_all_cdp_actions()
+    elif name in _SPECS_BY_CLASS_NAME:
+        value = _SPECS_BY_CLASS_NAME[name].load_class()
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
+
 
 __all__ = [
     "CDP_ACTIONS",
+    "ACTION_SPECS",
+    "ACTION_TAGS",
+    "ActionSpec",
     "CdpAction",
+    "get_all_cdp_actions",
+    "load_actions",
+    "select_action_specs",
     "AddressReputationAction",
     "DeployNftAction",
     "DeployTokenAction",
     "DeployContractAction",
     "GetBalanceAction",
+    "GetBalancesAction",
     "GetBalanceNftAction",
     "GetWalletDetailsAction",
     "MintNftAction",
@@ -59,6 +63,7 @@ __all__ = [
     "TransferNftAction",
     "WowBuyTokenAction",
     "WowCreateTokenAction",
+    "WowQuoteCurveAction",
     "WowSellTokenAction",
     "WrapEthAction",
     "MorphoDepositAction",
@@ -71,4 +76,7 @@ __all__ = [
     "EstimateNFTFightPowerAction",
     "GetNFTPriceAction",
     "SimulationBattleAction",
+    "SimulationBattleBatchAction",
+    "CalculateBattleOddsAction",
+    "RunTournamentAction",
 ]
@@ -1,10 +1,13 @@
 import re
 from collections.abc import Callable
+from dataclasses import dataclass
 
 from cdp import Address
+from cdp.address_reputation import AddressReputation
 from pydantic import BaseModel, Field, field_validator
 
 from cdp_agentkit_core.actions import CdpAction
+from cdp_agentkit_core.actions.result import ActionFailure, ActionResult
 
 ADDRESS_REPUTATION_PROMPT = """
 This tool checks the reputation of an address on a given network. It takes:
@@ -44,7 +47,32 @@ class AddressReputationInput(BaseModel):
         return v
 
 
-def check_address_reputation(address: str, network: str) -> str:
+@dataclass(frozen=True)
+class AddressReputationResult(ActionResult):
+    """Reputation of an address.
+
+    Attributes:
+        address: Address that was checked
+        network: Network the address is on
+        reputation: Reputation of the address
+
+    """
+
+    address: str
+    network: str
+    reputation: AddressReputation
+
+    def render(self) -> str:
+        """Render the reputation as the message given to the LLM.
+
+        Returns:
+            str: The message.
+
+        """
+        return str(self.reputation)
+
+
+def check_address_reputation(address: str, network: str) -> AddressReputationResult | ActionFailure:
     """Check the reputation of an address.
 
     Args:
@@ -52,15 +80,16 @@ def check_address_reputation(address: str, network: str) -> str:
         network (str): The network the address is on
 
     Returns:
-        str: A string containing the reputation json data or error message
+        AddressReputationResult | ActionFailure: The address's reputation, rendering to a string
+            containing the reputation json data, or the error
 
     """
     try:
-        address = Address(network, address)
-        reputation = address.reputation()
-        return str(reputation)
+        reputation = Address(network, address).reputation()
     except Exception as e:
-        return f"Error checking address reputation: {e!s}"
+        return ActionFailure(f"Error checking address reputation: {e!s}", e)
+
+    return AddressReputationResult(address=address, network=network, reputation=reputation)
 
 
 class AddressReputationAction(CdpAction):
@@ -69,4 +98,4 @@ class AddressReputationAction(CdpAction):
     name: str = "address_reputation"
     description: str = ADDRESS_REPUTATION_PROMPT
     args_schema: type[BaseModel] | None = AddressReputationInput
-    func: Callable[..., str] = check_address_reputation
+    func: Callable[..., AddressReputationResult | ActionFailure] = check_address_reputation
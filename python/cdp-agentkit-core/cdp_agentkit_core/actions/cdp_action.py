@@ -1,7 +1,9 @@
-from collections.abc import Callable
+from collections.abc import Awaitable, Callable
 
 from pydantic import BaseModel
 
+from cdp_agentkit_core.actions.result import ActionResult
+
 
 class CdpAction(BaseModel):
     """CDP Action Base Class."""
@@ -9,4 +11,5 @@ class CdpAction(BaseModel):
     name: str
     description: str
     args_schema: type[BaseModel] | None = None
-    func: Callable[..., str]
+    func: Callable[..., str | ActionResult]
+    afunc: Callable[..., Awaitable[str | ActionResult]] | None = None
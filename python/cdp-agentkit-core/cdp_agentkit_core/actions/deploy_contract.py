@@ -1,10 +1,12 @@
 from collections.abc import Callable
+from dataclasses import dataclass
 from typing import Any
 
 from cdp import Wallet
 from pydantic import BaseModel, Field
 
 from cdp_agentkit_core.actions import CdpAction
+from cdp_agentkit_core.actions.result import ActionFailure, TransactionResult
 
 DEPLOY_CONTRACT_PROMPT = """
 Deploys smart contract with required args: solidity version (string), solidity input json (string), contract name (string), and optional constructor args (Dict[str, Any])
@@ -67,13 +69,36 @@ class DeployContractInput(BaseModel):
     )
 
 
+@dataclass(frozen=True)
+class DeployContractResult(TransactionResult):
+    """Deployed smart contract, with its deployment transaction.
+
+    Attributes:
+        contract_name: Name of the contract class deployed
+        contract_address: Address of the contract
+
+    """
+
+    contract_name: str
+    contract_address: str
+
+    def render(self) -> str:
+        """Render the deployment as the message given to the LLM.
+
+        Returns:
+            str: The message.
+
+        """
+        return f"Deployed contract {self.contract_name} at address {self.contract_address}. Transaction link: {self.transaction_link}"
+
+
 def deploy_contract(
     wallet: Wallet,
     solidity_version: str,
     solidity_input_json: str,
     contract_name: str,
     constructor_args: dict[str, Any] | None = None,
-) -> str:
+) -> DeployContractResult | ActionFailure:
     """Deploy an arbitrary contract.
 
     Args:
@@ -84,7 +109,8 @@ def deploy_contract(
         constructor_args (dict[str, Any] | None): The constructor arguments for the contract.
 
     Returns:
-        str: A message containing the deployed contract address and details.
+        DeployContractResult | ActionFailure: The deployed contract, rendering to a message
+            containing the deployed contract address and details.
 
     """
     try:
@@ -96,10 +122,15 @@ def deploy_contract(
             contract_name=contract_name,
             constructor_args=constructor_args or {},
         ).wait()
-
-        return f"Deployed contract {contract_name} at address {contract.contract_address}. Transaction link: {contract.transaction.transaction_link}"
     except Exception as e:
-        return f"Error deploying contract: {e}"
+        return ActionFailure(f"Error deploying contract: {e}", e)
+
+    return DeployContractResult(
+        contract_name=contract_name,
+        contract_address=contract.contract_address,
+        transaction_hash=contract.transaction.transaction_hash,
+        transaction_link=contract.transaction.transaction_link,
+    )
 
 
 class DeployContractAction(CdpAction):
@@ -108,4 +139,4 @@ class DeployContractAction(CdpAction):
     name: str = "deploy_contract"
     description: str = DEPLOY_CONTRACT_PROMPT
     args_schema: type[BaseModel] = DeployContractInput
-    func: Callable = deploy_contract
+    func: Callable[..., DeployContractResult | ActionFailure] = deploy_contract
@@ -1,9 +1,11 @@
 from collections.abc import Callable
+from dataclasses import dataclass
 
 from cdp import Wallet
 from pydantic import BaseModel, Field
 
 from cdp_agentkit_core.actions import CdpAction
+from cdp_agentkit_core.actions.result import ActionFailure, TransactionResult
 
 DEPLOY_NFT_PROMPT = """
 This tool will deploy an NFT (ERC-721) contract onchain from the wallet.
@@ -28,7 +30,34 @@ class DeployNftInput(BaseModel):
     )
 
 
-def deploy_nft(wallet: Wallet, name: str, symbol: str, base_uri: str) -> str:
+@dataclass(frozen=True)
+class DeployNftResult(TransactionResult):
+    """Deployed NFT (ERC-721) collection, with its deployment transaction.
+
+    Attributes:
+        name: Name of the NFT collection
+        contract_address: Address of the NFT contract
+        network_id: Network the NFT contract was deployed on
+
+    """
+
+    name: str
+    contract_address: str
+    network_id: str
+
+    def render(self) -> str:
+        """Render the deployment as the message given to the LLM.
+
+        Returns:
+            str: The message.
+
+        """
+        return f"Deployed NFT Collection {self.name} to address {self.contract_address} on network {self.network_id}.\nTransaction hash for the deployment: {self.transaction_hash}\nTransaction link for the deployment: {self.transaction_link}"
+
+
+def deploy_nft(
+    wallet: Wallet, name: str, symbol: str, base_uri: str
+) -> DeployNftResult | ActionFailure:
     """Deploy an NFT (ERC-721) token collection onchain from the wallet.
 
     Args:
@@ -38,15 +67,22 @@ def deploy_nft(wallet: Wallet, name: str, symbol: str, base_uri: str) -> str:
         base_uri (str): The base URI for the NFT (ERC-721) token collection's metadata, e.g. `https://www.helpfulhippos.xyz/metadata/`.
 
     Returns:
-        str: A message containing the NFT token deployment details.
+        DeployNftResult | ActionFailure: The deployed NFT contract, rendering to a message
+            containing the NFT token deployment details.
 
     """
     try:
         nft_contract = wallet.deploy_nft(name=name, symbol=symbol, base_uri=base_uri).wait()
     except Exception as e:
-        return f"Error deploying NFT {e!s}"
+        return ActionFailure(f"Error deploying NFT {e!s}", e)
 
-    return f"Deployed NFT Collection {name} to address {nft_contract.contract_address} on network {wallet.network_id}.\nTransaction hash for the deployment: {nft_contract.transaction.transaction_hash}\nTransaction link for the deployment: {nft_contract.transaction.transaction_link}"
+    return DeployNftResult(
+        name=name,
+        contract_address=nft_contract.contract_address,
+        network_id=wallet.network_id,
+        transaction_hash=nft_contract.transaction.transaction_hash,
+        transaction_link=nft_contract.transaction.transaction_link,
+    )
 
 
 class DeployNftAction(CdpAction):
@@ -55,4 +91,4 @@ class DeployNftAction(CdpAction):
     name: str = "deploy_nft"
     description: str = DEPLOY_NFT_PROMPT
     args_schema: type[BaseModel] | None = DeployNftInput
-    func: Callable[..., str] = deploy_nft
+    func: Callable[..., DeployNftResult | ActionFailure] = deploy_nft
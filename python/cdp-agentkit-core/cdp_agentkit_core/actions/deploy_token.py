@@ -1,9 +1,11 @@
 from collections.abc import Callable
+from dataclasses import dataclass
 
 from cdp import Wallet
 from pydantic import BaseModel, Field
 
 from cdp_agentkit_core.actions import CdpAction
+from cdp_agentkit_core.actions.result import ActionFailure, TransactionResult
 
 DEPLOY_TOKEN_PROMPT = """
 This tool will deploy an ERC20 token smart contract. It takes the token name, symbol, and total supply as input.
@@ -21,7 +23,36 @@ class DeployTokenInput(BaseModel):
     )
 
 
-def deploy_token(wallet: Wallet, name: str, symbol: str, total_supply: str) -> str:
+@dataclass(frozen=True)
+class DeployTokenResult(TransactionResult):
+    """Deployed ERC20 token contract, with its deployment transaction.
+
+    Attributes:
+        name: Name of the token
+        symbol: Symbol of the token
+        total_supply: Total supply of tokens minted
+        contract_address: Address of the token contract
+
+    """
+
+    name: str
+    symbol: str
+    total_supply: str
+    contract_address: str
+
+    def render(self) -> str:
+        """Render the deployment as the message given to the LLM.
+
+        Returns:
+            str: The message.
+
+        """
+        return f"Deployed ERC20 token contract {self.name} ({self.symbol}) with total supply of {self.total_supply} tokens at address {self.contract_address}. Transaction link: {self.transaction_link}"
+
+
+def deploy_token(
+    wallet: Wallet, name: str, symbol: str, total_supply: str
+) -> DeployTokenResult | ActionFailure:
     """Deploy an ERC20 token smart contract.
 
     Args:
@@ -31,7 +62,8 @@ def deploy_token(wallet: Wallet, name: str, symbol: str, total_supply: str) -> s
         total_supply (str): The total supply of tokens to mint (e.g., "1000000")
 
     Returns:
-        str: A message containing the deployed token contract address and details
+        DeployTokenResult | ActionFailure: The deployed token contract, rendering to a message
+            containing the deployed token contract address and details
 
     """
     try:
@@ -39,9 +71,16 @@ def deploy_token(wallet: Wallet, name: str, symbol: str, total_supply: str) -> s
 
         token_contract.wait()
     except Exception as e:
-        return f"Error deploying token {e!s}"
-
-    return f"Deployed ERC20 token contract {name} ({symbol}) with total supply of {total_supply} tokens at address {token_contract.contract_address}. Transaction link: {token_contract.transaction.transaction_link}"
+        return ActionFailure(f"Error deploying token {e!s}", e)
+
+    return DeployTokenResult(
+        name=name,
+        symbol=symbol,
+        total_supply=total_supply,
+        contract_address=token_contract.contract_address,
+        transaction_hash=token_contract.transaction.transaction_hash,
+        transaction_link=token_contract.transaction.transaction_link,
+    )
 
 
 class DeployTokenAction(CdpAction):
@@ -50,4 +89,4 @@ class DeployTokenAction(CdpAction):
     name: str = "deploy_token"
     description: str = DEPLOY_TOKEN_PROMPT
     args_schema: type[BaseModel] | None = DeployTokenInput
-    func: Callable[..., str] = deploy_token
+    func: Callable[..., DeployTokenResult | ActionFailure] = deploy_token
@@ -1,15 +1,27 @@
 from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from decimal import Decimal
 
-from cdp import Wallet
+from cdp import Address, Wallet
 from pydantic import BaseModel, Field
 
 from cdp_agentkit_core.actions import CdpAction
+from cdp_agentkit_core.actions.result import ActionFailure, ActionResult
+
+# Maximum balance reads in flight at once for one call.
+DEFAULT_MAX_BALANCE_WORKERS = 8
 
 GET_BALANCE_PROMPT = """
 This tool will get the balance of all the addresses in the wallet for a given asset.
 It takes the asset ID as input. Always use 'eth' for the native asset ETH and 'usdc' for USDC.
 """
 
+GET_BALANCES_PROMPT = """
+This tool will get the balances of all the addresses in the wallet for several assets at once.
+It takes the asset IDs as input. Always use 'eth' for the native asset ETH and 'usdc' for USDC.
+"""
+
 
 class GetBalanceInput(BaseModel):
     """Input argument schema for get balance action."""
@@ -20,31 +32,204 @@ class GetBalanceInput(BaseModel):
     )
 
 
-def get_balance(wallet: Wallet, asset_id: str) -> str:
+class GetBalancesInput(BaseModel):
+    """Input argument schema for get balances action."""
+
+    asset_ids: list[str] = Field(
+        ...,
+        min_length=1,
+        description="The asset IDs to get the balances for, e.g. `eth`, `usdc`, `0x036CbD53842c5426634e7929541eC2318f3dCF7e`",
+    )
+
+
+@dataclass(frozen=True)
+class WalletBalances(ActionResult):
+    """Balances of an asset held by each address of a wallet.
+
+    Attributes:
+        wallet_id: ID of the wallet
+        asset_id: Asset ID the balances are for
+        balances: Balance of each address, by address ID
+        errors: Error reading the balance of each address that failed, by address ID
+
+    """
+
+    wallet_id: str
+    asset_id: str
+    balances: dict[str, Decimal]
+    errors: dict[str, Exception] = field(default_factory=dict)
+
+    def _lines(self, indent: str) -> list[str]:
+        # Format each balance entry on a new line
+        return [f"{indent}{addr}: {balance}" for addr, balance in self.balances.items()] + [
+            f"{indent}{addr}: Error getting balance {error!s}"
+            for addr, error in self.errors.items()
+        ]
+
+    def render(self) -> str:
+        """Render the balances as the message given to the LLM.
+
+        Returns:
+            str: The message.
+
+        """
+        formatted_balances = "\n".join(self._lines("  "))
+        return f"Balances for wallet {self.wallet_id}:\n{formatted_balances}"
+
+
+@dataclass(frozen=True)
+class MultiAssetBalances(ActionResult):
+    """Balances of several assets held by each address of a wallet.
+
+    Attributes:
+        wallet_id: ID of the wallet
+        assets: Balances of each asset, by asset ID
+
+    """
+
+    wallet_id: str
+    assets: dict[str, WalletBalances]
+
+    def render(self) -> str:
+        """Render the balances as the message given to the LLM.
+
+        Returns:
+            str: The message.
+
+        """
+        lines = [f"Balances for wallet {self.wallet_id}:"]
+        for asset_id, balances in self.assets.items():
+            lines.append(f"  {asset_id}:")
+            lines.extend(balances._lines("    "))
+        return "\n".join(lines)
+
+
+def _read_balance(address: Address, asset_id: str) -> Decimal | Exception:
+    try:
+        return address.balance(asset_id)
+    except Exception as e:
+        return e
+
+
+def fetch_balances(
+    addresses: list[Address],
+    asset_ids: list[str],
+    max_workers: int = DEFAULT_MAX_BALANCE_WORKERS,
+) -> dict[tuple[str, str], Decimal | Exception]:
+    """Read the balance of each asset at each address concurrently.
+
+    Each balance is read separately, so a failed read only loses that balance, and is returned as
+    the exception it raised.
+
+    Args:
+        addresses: Addresses to read the balances of
+        asset_ids: Asset IDs to read the balances for
+        max_workers: Maximum balance reads in flight at once
+
+    Returns:
+        dict[tuple[str, str], Decimal | Exception]: The balance, or the error reading it, by address
+            ID and asset ID, in the order of `asset_ids` and then `addresses`.
+
+    """
+    reads = [(address, asset_id) for asset_id in asset_ids for address in addresses]
+    if len(reads) <= 1:
+        results = [_read_balance(address, asset_id) for address, asset_id in reads]
+    else:
+        with ThreadPoolExecutor(
+            max_workers=min(max_workers, len(reads)), thread_name_prefix="get_balance"
+        ) as executor:
+            results = list(executor.map(lambda read: _read_balance(*read), reads))
+
+    return {
+        (address.address_id, asset_id): result
+        for (address, asset_id), result in zip(reads, results, strict=True)
+    }
+
+
+def _wallet_balances(
+    wallet_id: str,
+    asset_id: str,
+    addresses: list[Address],
+    results: dict[tuple[str, str], Decimal | Exception],
+) -> WalletBalances:
+    balances, errors = {}, {}
+    for address in addresses:
+        result = results[address.address_id, asset_id]
+        if isinstance(result, Exception):
+            errors[address.address_id] = result
+        else:
+            balances[address.address_id] = result
+    return WalletBalances(wallet_id, asset_id, balances, errors)
+
+
+def get_balance(wallet: Wallet, asset_id: str) -> WalletBalances | ActionFailure:
     """Get balance for all addresses in the wallet for a given asset.
 
+    The balances of the addresses are read concurrently. An address whose balance cannot be read
+    is reported in the result's `errors`, without discarding the other balances.
+
     Args:
         wallet (Wallet): The wallet to get the balance for.
         asset_id (str): The asset ID to get the balance for (e.g., "eth", "usdc", or a valid contract address like "0x036CbD53842c5426634e7929541eC2318f3dCF7e")
 
     Returns:
-        str: A message containing the balance information of all addresses in the wallet.
+        WalletBalances | ActionFailure: The balance of each address in the wallet, rendering to a
+            message containing the balance information of all addresses in the wallet, or a
+            failure if no balance could be read.
 
     """
-    # for each address in the wallet, get the balance for the asset
-    balances = {}
-
     try:
-        for address in wallet.addresses:
-            balance = address.balance(asset_id)
-            balances[address.address_id] = balance
+        addresses = wallet.addresses
     except Exception as e:
-        return f"Error getting balance for all addresses in the wallet {e!s}"
+        return ActionFailure(f"Error getting balance for all addresses in the wallet {e!s}", e)
+
+    balances = _wallet_balances(
+        wallet.id, asset_id, addresses, fetch_balances(addresses, [asset_id])
+    )
+    if balances.errors and not balances.balances:
+        error = next(iter(balances.errors.values()))
+        return ActionFailure(
+            f"Error getting balance for all addresses in the wallet {error!s}", error
+        )
+
+    return balances
 
-    # Format each balance entry on a new line
-    balance_lines = [f"  {addr}: {balance}" for addr, balance in balances.items()]
-    formatted_balances = "\n".join(balance_lines)
-    return f"Balances for wallet {wallet.id}:\n{formatted_balances}"
+
+def get_balances(wallet: Wallet, asset_ids: list[str]) -> MultiAssetBalances | ActionFailure:
+    """Get balances for all addresses in the wallet for several assets, in one call.
+
+    The balance of every asset at every address is read concurrently. A balance that cannot be
+    read is reported in its asset's `errors`, without discarding the other balances.
+
+    Args:
+        wallet (Wallet): The wallet to get the balances for.
+        asset_ids (list[str]): The asset IDs to get the balances for (e.g., "eth", "usdc", or a valid contract address like "0x036CbD53842c5426634e7929541eC2318f3dCF7e")
+
+    Returns:
+        MultiAssetBalances | ActionFailure: The balances of each asset at each address in the
+            wallet, rendering to a message containing the balance information, or a failure if no
+            balance could be read.
+
+    """
+    try:
+        addresses = wallet.addresses
+    except Exception as e:
+        return ActionFailure(f"Error getting balances for all addresses in the wallet {e!s}", e)
+
+    results = fetch_balances(addresses, asset_ids)
+    errors = [result for result in results.values() if isinstance(result, Exception)]
+    if errors and len(errors) == len(results):
+        return ActionFailure(
+            f"Error getting balances for all addresses in the wallet {errors[0]!s}", errors[0]
+        )
+
+    return MultiAssetBalances(
+        wallet.id,
+        {
+            asset_id: _wallet_balances(wallet.id, asset_id, addresses, results)
+            for asset_id in asset_ids
+        },
+    )
 
 
 class GetBalanceAction(CdpAction):
@@ -53,4 +238,13 @@ class GetBalanceAction(CdpAction):
     name: str = "get_balance"
     description: str = GET_BALANCE_PROMPT
     args_schema: type[BaseModel] | None = GetBalanceInput
-    func: Callable[..., str] = get_balance
+    func: Callable[..., WalletBalances | ActionFailure] = get_balance
+
+
+class GetBalancesAction(CdpAction):
+    """Get wallet balances of several assets action."""
+
+    name: str = "get_balances"
+    description: str = GET_BALANCES_PROMPT
+    args_schema: type[BaseModel] | None = GetBalancesInput
+    func: Callable[..., MultiAssetBalances | ActionFailure] = get_balances
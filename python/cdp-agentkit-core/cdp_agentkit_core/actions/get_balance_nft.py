@@ -1,10 +1,12 @@
 from collections.abc import Callable
+from dataclasses import dataclass
 
 from cdp import Wallet
-from cdp.smart_contract import SmartContract
 from pydantic import BaseModel, Field
 
 from cdp_agentkit_core.actions import CdpAction
+from cdp_agentkit_core.actions.read_client import read_client
+from cdp_agentkit_core.actions.result import ActionFailure, ActionResult
 
 GET_BALANCE_NFT_PROMPT = """
 This tool will get the NFTs (ERC721 tokens) owned by the wallet for a specific NFT contract.
@@ -25,11 +27,40 @@ class GetBalanceNftInput(BaseModel):
     )
 
 
+@dataclass(frozen=True)
+class NftBalance(ActionResult):
+    """NFTs an address owns in an NFT contract.
+
+    Attributes:
+        address: Address the balance is for
+        contract_address: Address of the NFT contract
+        token_ids: IDs of the tokens the address owns
+
+    """
+
+    address: str
+    contract_address: str
+    token_ids: list[int]
+
+    def render(self) -> str:
+        """Render the balance as the message given to the LLM.
+
+        Returns:
+            str: The message.
+
+        """
+        if not self.token_ids:
+            return f"Address {self.address} owns no NFTs in contract {self.contract_address}"
+
+        token_list = ", ".join(str(token_id) for token_id in self.token_ids)
+        return f"Address {self.address} owns {len(self.token_ids)} NFTs in contract {self.contract_address}.\nToken IDs: {token_list}"
+
+
 def get_balance_nft(
     wallet: Wallet,
     contract_address: str,
     address: str | None = None,
-) -> str:
+) -> NftBalance | ActionFailure:
     """Get NFT balance for a specific contract.
 
     Args:
@@ -38,24 +69,24 @@ def get_balance_nft(
         address (str | None): The address to check balance for. Defaults to wallet's default address.
 
     Returns:
-        str: A message containing the NFT balance details.
+        NftBalance | ActionFailure: The IDs of the owned tokens, rendering to a message containing
+            the NFT balance details.
 
     """
     try:
         check_address = address if address is not None else wallet.default_address.address_id
 
-        owned_tokens = SmartContract.read(
+        owned_tokens = read_client.read_contract(
             wallet.network_id, contract_address, "tokensOfOwner", args={"owner": check_address}
         )
 
-        if not owned_tokens:
-            return f"Address {check_address} owns no NFTs in contract {contract_address}"
-
-        token_list = ", ".join(str(token_id) for token_id in owned_tokens)
-        return f"Address {check_address} owns {len(owned_tokens)} NFTs in contract {contract_address}.\nToken IDs: {token_list}"
+        return NftBalance(check_address, contract_address, list(owned_tokens or ()))
 
     except Exception as e:
-        return f"Error getting NFT balance for address {check_address} in contract {contract_address}: {e!s}"
+        return ActionFailure(
+            f"Error getting NFT balance for address {check_address} in contract {contract_address}: {e!s}",
+            e,
+        )
 
 
 class GetBalanceNftAction(CdpAction):
@@ -64,4 +95,4 @@ class GetBalanceNftAction(CdpAction):
     name: str = "get_balance_nft"
     description: str = GET_BALANCE_NFT_PROMPT
     args_schema: type[BaseModel] | None = GetBalanceNftInput
-    func: Callable[..., str] = get_balance_nft
+    func: Callable[..., NftBalance | ActionFailure] = get_balance_nft
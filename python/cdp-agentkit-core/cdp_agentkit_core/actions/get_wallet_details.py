@@ -1,26 +1,57 @@
 from collections.abc import Callable
+from dataclasses import dataclass
 
 from cdp import Wallet
 from pydantic import BaseModel
 
 from cdp_agentkit_core.actions import CdpAction
+from cdp_agentkit_core.actions.result import ActionResult
 
 
 class GetWalletDetailsInput(BaseModel):
     """Input argument schema for get wallet details action."""
 
 
-def get_wallet_details(wallet: Wallet) -> str:
+@dataclass(frozen=True)
+class WalletDetails(ActionResult):
+    """Details of a wallet.
+
+    Attributes:
+        wallet_id: ID of the wallet
+        network_id: Network the wallet is on
+        default_address: Default address of the wallet
+
+    """
+
+    wallet_id: str
+    network_id: str
+    default_address: str
+
+    def render(self) -> str:
+        """Render the details as the message given to the LLM.
+
+        Returns:
+            str: The message.
+
+        """
+        return f"Wallet: {self.wallet_id} on network: {self.network_id} with default address: {self.default_address}"
+
+
+def get_wallet_details(wallet: Wallet) -> WalletDetails:
     """Get a wallet's details.
 
     Args:
         wallet (Wallet): The wallet to trade the asset from.
 
     Returns:
-        str: A message containing the wallet details.
+        WalletDetails: The wallet's details, rendering to a message containing them.
 
     """
-    return f"Wallet: {wallet.id} on network: {wallet.network_id} with default address: {wallet.default_address.address_id}"
+    return WalletDetails(
+        wallet_id=wallet.id,
+        network_id=wallet.network_id,
+        default_address=wallet.default_address.address_id,
+    )
 
 
 class GetWalletDetailsAction(CdpAction):
@@ -29,4 +60,4 @@ class GetWalletDetailsAction(CdpAction):
     name: str = "get_wallet_details"
     description: str = "This tool will get details about the MPC Wallet."
     args_schema: type[BaseModel] | None = GetWalletDetailsInput
-    func: Callable[..., str] = get_wallet_details
+    func: Callable[..., WalletDetails] = get_wallet_details
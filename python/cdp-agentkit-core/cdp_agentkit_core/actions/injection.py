@@ -0,0 +1,74 @@
+import functools
+import inspect
+from collections.abc import Callable, Iterable, Mapping
+from dataclasses import dataclass
+from typing import Any
+
+
+@dataclass(frozen=True)
+class Injection:
+    """A parameter of an action function that receives a context object.
+
+    Attributes:
+        parameter: Name of the parameter
+        context_type: Type of the context object the parameter is annotated with, such as `Wallet`
+
+    """
+
+    parameter: str
+    context_type: type
+
+
+@dataclass(frozen=True)
+class InjectionSpec:
+    """Context objects an action function takes, resolved once from its signature.
+
+    Resolving the spec when a tool is built means calling the action only looks up its context
+    objects, rather than inspecting the function's signature on every call.
+    """
+
+    injections: tuple[Injection, ...] = ()
+
+    @classmethod
+    def from_function(
+        cls, func: Callable[..., Any], context_types: Iterable[type]
+    ) -> "InjectionSpec":
+        """Resolve which parameters of a function receive context objects.
+
+        Args:
+            func: Action function
+            context_types: Types of the context objects that can be injected, such as `Wallet`
+
+        Returns:
+            InjectionSpec: A spec injecting each parameter annotated with one of `context_types`.
+
+        """
+        context_types = tuple(context_types)
+        return cls(
+            tuple(
+                Injection(name, parameter.annotation)
+                for name, parameter in inspect.signature(func).parameters.items()
+                if any(parameter.annotation is context_type for context_type in context_types)
+            )
+        )
+
+    def bind(
+        self, func: Callable[..., Any], context: Mapping[type, Any], **kwargs: Any
+    ) -> Callable[[], Any]:
+        """Bind an action function to its context objects and arguments.
+
+        Args:
+            func: Action function the spec was resolved from
+            context: Context objects by type
+            **kwargs: Arguments of the action
+
+        Returns:
+            Callable[[], Any]: The action function with all of its arguments bound.
+
+        Raises:
+            KeyError: If the context has no object of an injected type.
+
+        """
+        for injection in self.injections:
+            kwargs[injection.parameter] = context[injection.context_type]
+        return functools.partial(func, **kwargs)
@@ -1,9 +1,11 @@
 from collections.abc import Callable
+from dataclasses import dataclass
 
 from cdp import Wallet
 from pydantic import BaseModel, Field
 
 from cdp_agentkit_core.actions import CdpAction
+from cdp_agentkit_core.actions.result import ActionFailure, TransactionResult
 
 MINT_NFT_PROMPT = """
 This tool will mint an NFT (ERC-721) to a specified destination address onchain via a contract invocation.
@@ -25,7 +27,34 @@ class MintNftInput(BaseModel):
     )
 
 
-def mint_nft(wallet: Wallet, contract_address: str, destination: str) -> str:
+@dataclass(frozen=True)
+class MintNftResult(TransactionResult):
+    """Minted NFT (ERC-721), with its mint transaction.
+
+    Attributes:
+        contract_address: Address of the NFT contract
+        destination: Address receiving the NFT
+        network_id: Network the NFT was minted on
+
+    """
+
+    contract_address: str
+    destination: str
+    network_id: str
+
+    def render(self) -> str:
+        """Render the mint as the message given to the LLM.
+
+        Returns:
+            str: The message.
+
+        """
+        return f"Minted NFT from contract {self.contract_address} to address {self.destination} on network {self.network_id}.\nTransaction hash for the mint: {self.transaction_hash}\nTransaction link for the mint: {self.transaction_link}"
+
+
+def mint_nft(
+    wallet: Wallet, contract_address: str, destination: str
+) -> MintNftResult | ActionFailure:
     """Mint an NFT (ERC-721) to a specified destination address onchain via a contract invocation.
 
     Args:
@@ -34,7 +63,8 @@ def mint_nft(wallet: Wallet, contract_address: str, destination: str) -> str:
         destination (str): The destination address that will receive the NFT onchain, e.g. `0x036CbD53842c5426634e7929541eC2318f3dCF7e`.
 
     Returns:
-        str: A message containing the NFT mint details.
+        MintNftResult | ActionFailure: The mint's transaction, rendering to a message containing
+            the NFT mint details.
 
     """
     mint_args = {"to": destination, "quantity": "1"}
@@ -44,9 +74,15 @@ def mint_nft(wallet: Wallet, contract_address: str, destination: str) -> str:
             contract_address=contract_address, method="mint", args=mint_args
         ).wait()
     except Exception as e:
-        return f"Error minting NFT {e!s}"
-
-    return f"Minted NFT from contract {contract_address} to address {destination} on network {wallet.network_id}.\nTransaction hash for the mint: {mint_invocation.transaction.transaction_hash}\nTransaction link for the mint: {mint_invocation.transaction.transaction_link}"
+        return ActionFailure(f"Error minting NFT {e!s}", e)
+
+    return MintNftResult(
+        contract_address=contract_address,
+        destination=destination,
+        network_id=wallet.network_id,
+        transaction_hash=mint_invocation.transaction.transaction_hash,
+        transaction_link=mint_invocation.transaction.transaction_link,
+    )
 
 
 class MintNftAction(CdpAction):
@@ -55,4 +91,4 @@ class MintNftAction(CdpAction):
     name: str = "mint_nft"
     description: str = MINT_NFT_PROMPT
     args_schema: type[BaseModel] | None = MintNftInput
-    func: Callable[..., str] = mint_nft
+    func: Callable[..., MintNftResult | ActionFailure] = mint_nft
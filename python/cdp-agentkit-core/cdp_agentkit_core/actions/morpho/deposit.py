@@ -1,4 +1,5 @@
 from collections.abc import Callable
+from dataclasses import dataclass
 from decimal import Decimal
 
 from cdp import Asset, Wallet
@@ -6,6 +7,7 @@ from pydantic import BaseModel, Field
 
 from cdp_agentkit_core.actions import CdpAction
 from cdp_agentkit_core.actions.morpho.constants import METAMORPHO_ABI
+from cdp_agentkit_core.actions.result import ActionFailure, TransactionResult
 from cdp_agentkit_core.actions.utils import approve
 
 
@@ -42,13 +44,36 @@ Important notes:
 """
 
 
+@dataclass(frozen=True)
+class MorphoDepositResult(TransactionResult):
+    """Deposit into a Morpho Vault, with its transaction.
+
+    Attributes:
+        assets: Amount of assets deposited, in whole units
+        vault_address: Address of the Morpho Vault
+
+    """
+
+    assets: str
+    vault_address: str
+
+    def render(self) -> str:
+        """Render the deposit as the message given to the LLM.
+
+        Returns:
+            str: The message.
+
+        """
+        return f"Deposited {self.assets} to Morpho Vault {self.vault_address} with transaction hash: {self.transaction_hash} and transaction link: {self.transaction_link}"
+
+
 def deposit_to_morpho(
     wallet: Wallet,
     vault_address: str,
     assets: str,
     receiver: str,
     token_address: str,
-) -> str:
+) -> MorphoDepositResult | ActionFailure:
     """Deposit assets into a Morpho Vault.
 
     Args:
@@ -59,11 +84,12 @@ def deposit_to_morpho(
         token_address (str): The address of the token to approve
 
     Returns:
-        str: A success message with transaction hash or error message
+        MorphoDepositResult | ActionFailure: The deposit's transaction, rendering to a success
+            message with the transaction hash, or the error
 
     """
     if float(assets) <= 0:
-        return "Error: Assets amount must be greater than 0"
+        return ActionFailure("Error: Assets amount must be greater than 0")
 
     try:
         token_asset = Asset.fetch(wallet.network_id, token_address)
@@ -72,7 +98,7 @@ def deposit_to_morpho(
 
         approval_result = approve(wallet, token_address, vault_address, atomic_assets)
         if approval_result.startswith("Error"):
-            return f"Error approving Morpho Vault as spender: {approval_result}"
+            return ActionFailure(f"Error approving Morpho Vault as spender: {approval_result}")
 
         deposit_args = {"assets": atomic_assets, "receiver": receiver}
 
@@ -82,11 +108,15 @@ def deposit_to_morpho(
             abi=METAMORPHO_ABI,
             args=deposit_args,
         ).wait()
-
-        return f"Deposited {assets} to Morpho Vault {vault_address} with transaction hash: {invocation.transaction_hash} and transaction link: {invocation.transaction_link}"
-
     except Exception as e:
-        return f"Error depositing to Morpho Vault: {e!s}"
+        return ActionFailure(f"Error depositing to Morpho Vault: {e!s}", e)
+
+    return MorphoDepositResult(
+        assets=assets,
+        vault_address=vault_address,
+        transaction_hash=invocation.transaction_hash,
+        transaction_link=invocation.transaction_link,
+    )
 
 
 class MorphoDepositAction(CdpAction):
@@ -95,4 +125,4 @@ class MorphoDepositAction(CdpAction):
     name: str = "morpho_deposit"
     description: str = DEPOSIT_PROMPT
     args_schema: type[BaseModel] = MorphoDepositInput
-    func: Callable[..., str] = deposit_to_morpho
+    func: Callable[..., MorphoDepositResult | ActionFailure] = deposit_to_morpho
@@ -1,10 +1,12 @@
 from collections.abc import Callable
+from dataclasses import dataclass
 
 from cdp import Wallet
 from pydantic import BaseModel, Field
 
 from cdp_agentkit_core.actions import CdpAction
 from cdp_agentkit_core.actions.morpho.constants import METAMORPHO_ABI
+from cdp_agentkit_core.actions.result import ActionFailure, TransactionResult
 
 
 class MorphoWithdrawInput(BaseModel):
@@ -24,7 +26,32 @@ This tool allows withdrawing assets from a Morpho Vault. It takes:
 """
 
 
-def withdraw_from_morpho(wallet: Wallet, vault_address: str, assets: str, receiver: str) -> str:
+@dataclass(frozen=True)
+class MorphoWithdrawResult(TransactionResult):
+    """Withdrawal from a Morpho Vault, with its transaction.
+
+    Attributes:
+        assets: Amount of assets withdrawn, in atomic units
+        vault_address: Address of the Morpho Vault
+
+    """
+
+    assets: str
+    vault_address: str
+
+    def render(self) -> str:
+        """Render the withdrawal as the message given to the LLM.
+
+        Returns:
+            str: The message.
+
+        """
+        return f"Withdrawn {self.assets} from Morpho Vault {self.vault_address} with transaction hash: {self.transaction_hash} and transaction link: {self.transaction_link}"
+
+
+def withdraw_from_morpho(
+    wallet: Wallet, vault_address: str, assets: str, receiver: str
+) -> MorphoWithdrawResult | ActionFailure:
     """Withdraw assets from a Morpho Vault.
 
     Args:
@@ -34,11 +61,12 @@ def withdraw_from_morpho(wallet: Wallet, vault_address: str, assets: str, receiv
         receiver (str): The address to receive the shares
 
     Returns:
-        str: A success message with transaction hash or error message
+        MorphoWithdrawResult | ActionFailure: The withdrawal's transaction, rendering to a success
+            message with the transaction hash, or the error
 
     """
     if int(assets) <= 0:
-        return "Error: Assets amount must be greater than 0"
+        return ActionFailure("Error: Assets amount must be greater than 0")
 
     try:
         invocation = wallet.invoke_contract(
@@ -51,11 +79,15 @@ def withdraw_from_morpho(wallet: Wallet, vault_address: str, assets: str, receiv
                 "owner": receiver,
             },
         ).wait()
-
-        return f"Withdrawn {assets} from Morpho Vault {vault_address} with transaction hash: {invocation.transaction_hash} and transaction link: {invocation.transaction_link}"
-
     except Exception as e:
-        return f"Error withdrawing from Morpho Vault: {e!s}"
+        return ActionFailure(f"Error withdrawing from Morpho Vault: {e!s}", e)
+
+    return MorphoWithdrawResult(
+        assets=assets,
+        vault_address=vault_address,
+        transaction_hash=invocation.transaction_hash,
+        transaction_link=invocation.transaction_link,
+    )
 
 
 class MorphoWithdrawAction(CdpAction):
@@ -64,4 +96,4 @@ class MorphoWithdrawAction(CdpAction):
     name: str = "morpho_withdraw"
     description: str = WITHDRAW_PROMPT
     args_schema: type[BaseModel] = MorphoWithdrawInput
-    func: Callable[..., str] = withdraw_from_morpho
+    func: Callable[..., MorphoWithdrawResult | ActionFailure] = withdraw_from_morpho
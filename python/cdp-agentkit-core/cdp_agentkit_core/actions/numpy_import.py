@@ -0,0 +1,20 @@
+from types import ModuleType
+
+
+def import_numpy() -> ModuleType:
+    """Import NumPy when an action first needs it, so importing actions does not import it.
+
+    Returns:
+        ModuleType: The `numpy` module.
+
+    Raises:
+        ImportError: If NumPy is not installed.
+
+    """
+    try:
+        import numpy as np
+    except ImportError:
+        raise ImportError(
+            "NumPy is not installed. Please install it with `pip install numpy`"
+        ) from None
+    return np
@@ -1,9 +1,12 @@
-from collections.abc import Callable
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from decimal import Decimal
 
-import requests
 from pydantic import BaseModel, Field
 
 from cdp_agentkit_core.actions import CdpAction
+from cdp_agentkit_core.actions.read_client import read_client
+from cdp_agentkit_core.actions.result import ActionResult
 
 PYTH_FETCH_PRICE_PROMPT = """
 Fetch the price of a given price feed from Pyth. First fetch the price feed ID forusing the pyth_fetch_price_feed_id action.
@@ -25,30 +28,66 @@ class PythFetchPriceInput(BaseModel):
     price_feed_id: str = Field(..., description="The price feed ID to fetch the price for.")
 
 
-def pyth_fetch_price(price_feed_id: str) -> str:
+@dataclass(frozen=True)
+class PythPrice(ActionResult):
+    """Latest price of a Pyth price feed, as Pyth publishes it.
+
+    Attributes:
+        price_feed_id: ID of the price feed
+        price: Price, in units of `10 ** exponent`
+        exponent: Exponent of the price
+
+    """
+
+    price_feed_id: str
+    price: int
+    exponent: int
+
+    @property
+    def value(self) -> Decimal:
+        """The exact price."""
+        return Decimal(self.price).scaleb(self.exponent)
+
+    def render(self) -> str:
+        """Render the price, truncated to two decimals, as the message given to the LLM.
+
+        Returns:
+            str: The message.
+
+        """
+        if self.exponent < 0:
+            adjusted_price = self.price * 100
+            divisor = 10**-self.exponent
+            scaled_price = adjusted_price // divisor
+            price_str = f"{scaled_price // 100}.{scaled_price % 100:02}"
+            return price_str if not price_str.startswith(".") else f"0{price_str}"
+
+        scaled_price = self.price // (10**self.exponent)
+        return str(scaled_price)
+
+
+def _price_url(price_feed_id: str) -> str:
+    return f"https://hermes.pyth.network/v2/updates/price/latest?ids[]={price_feed_id}"
+
+
+def pyth_fetch_price(price_feed_id: str) -> PythPrice:
     """Fetch the price of a given price feed from Pyth."""
-    url = f"https://hermes.pyth.network/v2/updates/price/latest?ids[]={price_feed_id}"
-    response = requests.get(url)
-    response.raise_for_status()
-    data = response.json()
+    return _parse_price(price_feed_id, read_client.get_json(_price_url(price_feed_id)))
+
+
+async def apyth_fetch_price(price_feed_id: str) -> PythPrice:
+    """Fetch the price of a given price feed from Pyth, without blocking the event loop."""
+    return _parse_price(price_feed_id, await read_client.aget_json(_price_url(price_feed_id)))
+
+
+def _parse_price(price_feed_id: str, data: dict) -> PythPrice:
     parsed_data = data["parsed"]
 
     if not parsed_data:
         raise ValueError(f"No price data found for {price_feed_id}")
 
     price_info = parsed_data[0]["price"]
-    price = int(price_info["price"])
-    exponent = price_info["expo"]
-
-    if exponent < 0:
-        adjusted_price = price * 100
-        divisor = 10**-exponent
-        scaled_price = adjusted_price // divisor
-        price_str = f"{scaled_price // 100}.{scaled_price % 100:02}"
-        return price_str if not price_str.startswith(".") else f"0{price_str}"
-
-    scaled_price = price // (10**exponent)
-    return str(scaled_price)
+    return PythPrice(price_feed_id, int(price_info["price"]), price_info["expo"])
 
 
 class PythFetchPriceAction(CdpAction):
@@ -57,4 +96,5 @@ class PythFetchPriceAction(CdpAction):
     name: str = "pyth_fetch_price"
     description: str = PYTH_FETCH_PRICE_PROMPT
     args_schema: type[BaseModel] | None = PythFetchPriceInput
-    func: Callable[..., str] = pyth_fetch_price
+    func: Callable[..., PythPrice] = pyth_fetch_price
+    afunc: Callable[..., Awaitable[PythPrice]] | None = apyth_fetch_price
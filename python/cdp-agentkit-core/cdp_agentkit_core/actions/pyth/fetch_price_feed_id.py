@@ -1,9 +1,9 @@
-from collections.abc import Callable
+from collections.abc import Awaitable, Callable
 
-import requests
 from pydantic import BaseModel, Field
 
 from cdp_agentkit_core.actions import CdpAction
+from cdp_agentkit_core.actions.read_client import read_client
 
 PYTH_FETCH_PRICE_FEED_ID_PROMPT = """
 Fetch the price feed ID for a given token symbol (e.g. BTC, ETH, etc.) from Pyth.
@@ -16,13 +16,22 @@ class PythFetchPriceFeedIDInput(BaseModel):
     token_symbol: str = Field(..., description="The token symbol to fetch the price feed ID for.")
 
 
+def _price_feeds_url(token_symbol: str) -> str:
+    return f"https://hermes.pyth.network/v2/price_feeds?query={token_symbol}&asset_type=crypto"
+
+
 def pyth_fetch_price_feed_id(token_symbol: str) -> str:
     """Fetch the price feed ID for a given token symbol from Pyth."""
-    url = f"https://hermes.pyth.network/v2/price_feeds?query={token_symbol}&asset_type=crypto"
-    response = requests.get(url)
-    response.raise_for_status()
-    data = response.json()
+    return _find_price_feed_id(token_symbol, read_client.get_json(_price_feeds_url(token_symbol)))
+
+
+async def apyth_fetch_price_feed_id(token_symbol: str) -> str:
+    """Fetch the price feed ID for a given token symbol from Pyth, without blocking the event loop."""
+    data = await read_client.aget_json(_price_feeds_url(token_symbol))
+    return _find_price_feed_id(token_symbol, data)
+
 
+def _find_price_feed_id(token_symbol: str, data: list[dict]) -> str:
     if not data:
         raise ValueError(f"No price feed found for {token_symbol}")
 
@@ -42,3 +51,4 @@ class PythFetchPriceFeedIDAction(CdpAction):
     description: str = PYTH_FETCH_PRICE_FEED_ID_PROMPT
     args_schema: type[BaseModel] | None = PythFetchPriceFeedIDInput
     func: Callable[..., str] = pyth_fetch_price_feed_id
+    afunc: Callable[..., Awaitable[str]] | None = apyth_fetch_price_feed_id
@@ -0,0 +1,197 @@
+import asyncio
+import json
+import threading
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+from urllib.parse import urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from cdp_agentkit_core.actions.single_flight import SingleFlight, contract_read_key
+
+# Maximum concurrent requests, and pooled keep-alive connections, per host.
+DEFAULT_MAX_CONNECTIONS_PER_HOST = 10
+
+# Seconds to wait for an HTTP response.
+DEFAULT_TIMEOUT = 10.0
+
+# Maximum threads running blocking reads for async callers.
+DEFAULT_MAX_WORKERS = 32
+
+
+class ReadClient:
+    """Shared client for read-only HTTP and contract reads.
+
+    HTTP reads go through one `requests.Session`, which keeps connections alive and pools up to
+    `max_connections_per_host` of them per host. Contract reads go through the CDP SDK's pooled API
+    client. Both are limited to `max_connections_per_host` concurrent requests per host, so bursts
+    reuse pooled connections instead of opening new ones.
+
+    Identical reads issued while one is already in flight wait for and share its result, instead
+    of being sent again, through the `single_flight` layer, which also reports how many reads were
+    deduplicated. Shared results must not be mutated.
+
+    The CDP SDK and `requests` are blocking, so async reads run in a bounded executor of
+    `max_workers` threads, and async callers of an identical in-flight read await it without
+    holding a thread.
+    """
+
+    def __init__(
+        self,
+        max_connections_per_host: int = DEFAULT_MAX_CONNECTIONS_PER_HOST,
+        timeout: float = DEFAULT_TIMEOUT,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+    ):
+        self.max_connections_per_host = max_connections_per_host
+        self.timeout = timeout
+        self.executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="read_client"
+        )
+        self.single_flight = SingleFlight("read_client")
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_maxsize=max_connections_per_host, pool_block=True)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self._host_limits: dict[str, threading.BoundedSemaphore] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def coalesced(self) -> int:
+        """Number of reads that shared the result of an identical in-flight read."""
+        return self.single_flight.deduplicated
+
+    def _host_limit(self, host: str) -> threading.BoundedSemaphore:
+        with self._lock:
+            limit = self._host_limits.get(host)
+            if limit is None:
+                limit = self._host_limits[host] = threading.BoundedSemaphore(
+                    self.max_connections_per_host
+                )
+            return limit
+
+    def _get_json_call(self, url: str, params: dict | None) -> tuple[tuple, Callable[[], Any]]:
+        def read() -> Any:
+            with self._host_limit(urlparse(url).netloc):
+                response = self.session.get(url, params=params, timeout=self.timeout)
+            response.raise_for_status()
+            return response.json()
+
+        return ("GET", url, json.dumps(params, sort_keys=True)), read
+
+    def _read_contract_call(
+        self,
+        network_id: str,
+        contract_address: str,
+        method: str,
+        abi: list[dict] | None,
+        args: dict | None,
+    ) -> tuple[tuple, Callable[[], Any]]:
+        # Imported on first contract read, so HTTP-only actions do not pay for importing the SDK.
+        from cdp import Cdp, SmartContract
+
+        def read() -> Any:
+            with self._host_limit(urlparse(Cdp.base_path).netloc):
+                return SmartContract.read(network_id, contract_address, method, abi=abi, args=args)
+
+        return ("read", *contract_read_key(network_id, contract_address, method, args)), read
+
+    def get_json(self, url: str, params: dict | None = None) -> Any:
+        """Send a GET request and decode its JSON response.
+
+        Args:
+            url: URL to request
+            params: (Optional) Query parameters of the request
+
+        Returns:
+            Any: The decoded JSON response.
+
+        Raises:
+            requests.RequestException: If the request fails or returns an error status.
+
+        """
+        return self.single_flight.do(*self._get_json_call(url, params))
+
+    async def aget_json(self, url: str, params: dict | None = None) -> Any:
+        """Send a GET request and decode its JSON response, without blocking the event loop.
+
+        Args:
+            url: URL to request
+            params: (Optional) Query parameters of the request
+
+        Returns:
+            Any: The decoded JSON response.
+
+        Raises:
+            requests.RequestException: If the request fails or returns an error status.
+
+        """
+        return await self.single_flight.ado(*self._get_json_call(url, params), self.executor)
+
+    def read_contract(
+        self,
+        network_id: str,
+        contract_address: str,
+        method: str,
+        abi: list[dict] | None = None,
+        args: dict | None = None,
+    ) -> Any:
+        """Read data from a smart contract through `SmartContract.read`.
+
+        Args:
+            network_id: Network ID, such as `base-sepolia`
+            contract_address: Address of the contract to read from
+            method: Name of the view method to call
+            abi: (Optional) ABI of the contract
+            args: (Optional) Arguments of the method
+
+        Returns:
+            Any: The data read from the contract.
+
+        """
+        return self.single_flight.do(
+            *self._read_contract_call(network_id, contract_address, method, abi, args)
+        )
+
+    async def aread_contract(
+        self,
+        network_id: str,
+        contract_address: str,
+        method: str,
+        abi: list[dict] | None = None,
+        args: dict | None = None,
+    ) -> Any:
+        """Read data from a smart contract, without blocking the event loop.
+
+        Args:
+            network_id: Network ID, such as `base-sepolia`
+            contract_address: Address of the contract to read from
+            method: Name of the view method to call
+            abi: (Optional) ABI of the contract
+            args: (Optional) Arguments of the method
+
+        Returns:
+            Any: The data read from the contract.
+
+        """
+        return await self.single_flight.ado(
+            *self._read_contract_call(network_id, contract_address, method, abi, args),
+            self.executor,
+        )
+
+    async def arun(self, fn: Callable[..., Any], *args: Any) -> Any:
+        """Run a blocking read, such as a multi-step quote, in the read executor.
+
+        Args:
+            fn: Blocking function to run
+            *args: Arguments of the function
+
+        Returns:
+            Any: The result of the function.
+
+        """
+        return await asyncio.get_running_loop().run_in_executor(self.executor, fn, *args)
+
+
+read_client = ReadClient()
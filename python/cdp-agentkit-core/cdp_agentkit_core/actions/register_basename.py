@@ -1,4 +1,5 @@
 from collections.abc import Callable
+from dataclasses import dataclass
 
 from cdp import Wallet
 from pydantic import BaseModel, Field
@@ -6,6 +7,7 @@ from web3 import Web3
 from web3.exceptions import ContractLogicError
 
 from cdp_agentkit_core.actions import CdpAction
+from cdp_agentkit_core.actions.result import ActionFailure, TransactionResult
 
 # Constants
 REGISTER_BASENAME_PROMPT = """
@@ -37,7 +39,32 @@ class RegisterBasenameInput(BaseModel):
     )
 
 
-def register_basename(wallet: Wallet, basename: str, amount: str = "0.002") -> str:
+@dataclass(frozen=True)
+class RegisterBasenameResult(TransactionResult):
+    """Registered Basename, with its registration transaction.
+
+    Attributes:
+        basename: Basename registered, with its suffix
+        address_id: Address the Basename was registered for
+
+    """
+
+    basename: str
+    address_id: str
+
+    def render(self) -> str:
+        """Render the registration as the message given to the LLM.
+
+        Returns:
+            str: The message.
+
+        """
+        return f"Successfully registered basename {self.basename} for address {self.address_id}"
+
+
+def register_basename(
+    wallet: Wallet, basename: str, amount: str = "0.002"
+) -> RegisterBasenameResult | ActionFailure:
     """Register a Basename for the agent.
 
     Args:
@@ -46,7 +73,8 @@ def register_basename(wallet: Wallet, basename: str, amount: str = "0.002") -> s
         amount (str): The amount of ETH to pay for the registration. The default is set to 0.002.
 
     Returns:
-        str: Confirmation message with the basename.
+        RegisterBasenameResult | ActionFailure: The registration's transaction, rendering to a
+            confirmation message with the basename.
 
     """
     address_id = wallet.default_address.address_id
@@ -74,11 +102,17 @@ def register_basename(wallet: Wallet, basename: str, amount: str = "0.002") -> s
             asset_id="eth",
         )
         invocation.wait()
-        return f"Successfully registered basename {basename} for address {address_id}"
     except ContractLogicError as e:
-        return f"Error registering basename: {e!s}"
+        return ActionFailure(f"Error registering basename: {e!s}", e)
     except Exception as e:
-        return f"Unexpected error registering basename: {e!s}"
+        return ActionFailure(f"Unexpected error registering basename: {e!s}", e)
+
+    return RegisterBasenameResult(
+        basename=basename,
+        address_id=address_id,
+        transaction_hash=invocation.transaction_hash,
+        transaction_link=invocation.transaction_link,
+    )
 
 
 # Function to create registration arguments for Basenames
@@ -173,4 +207,4 @@ class RegisterBasenameAction(CdpAction):
     name: str = "register_basename"
     description: str = REGISTER_BASENAME_PROMPT
     args_schema: type[BaseModel] | None = RegisterBasenameInput
-    func: Callable[..., str] = register_basename
+    func: Callable[..., RegisterBasenameResult | ActionFailure] = register_basename
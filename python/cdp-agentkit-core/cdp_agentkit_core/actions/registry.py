@@ -0,0 +1,314 @@
+import importlib
+from dataclasses import dataclass
+from functools import cache
+
+from cdp_agentkit_core.actions.cdp_action import CdpAction
+
+
+@dataclass(frozen=True)
+class ActionSpec:
+    """Declaration of a CDP action, whose module is only imported when the action is loaded.
+
+    Attributes:
+        name: Name of the action, as given to the LLM
+        class_name: Name of the action's CdpAction subclass
+        module: Module defining the action, relative to `cdp_agentkit_core.actions`
+        tags: Tags selecting the action, such as its category, or `read-only` if it never signs
+            transactions
+
+    """
+
+    name: str
+    class_name: str
+    module: str
+    tags: frozenset[str] = frozenset()
+
+    def load_class(self) -> type[CdpAction]:
+        """Import the action's module and return its CdpAction subclass.
+
+        Returns:
+            type[CdpAction]: The action's class.
+
+        """
+        return getattr(importlib.import_module(f".{self.module}", __package__), self.class_name)
+
+    def load(self) -> CdpAction:
+        """Import the action's module and return the action.
+
+        Returns:
+            CdpAction: The action, shared between callers.
+
+        """
+        return _load_action(self)
+
+
+@cache
+def _load_action(spec: ActionSpec) -> CdpAction:
+    return spec.load_class()()
+
+
+# WARNING: All new CdpAction subclasses must be declared here, otherwise they will not be discovered
+# by get_all_cdp_actions().
+ACTION_SPECS = (
+    ActionSpec(
+        "address_reputation",
+        "AddressReputationAction",
+        "address_reputation",
+        frozenset({"wallet", "read-only"}),
+    ),
+    ActionSpec(
+        "deploy_contract",
+        "DeployContractAction",
+        "deploy_contract",
+        frozenset({"contract"}),
+    ),
+    ActionSpec(
+        "deploy_nft",
+        "DeployNftAction",
+        "deploy_nft",
+        frozenset({"nft"}),
+    ),
+    ActionSpec(
+        "deploy_token",
+        "DeployTokenAction",
+        "deploy_token",
+        frozenset({"token"}),
+    ),
+    ActionSpec(
+        "get_balance",
+        "GetBalanceAction",
+        "get_balance",
+        frozenset({"wallet", "read-only"}),
+    ),
+    ActionSpec(
+        "get_balances",
+        "GetBalancesAction",
+        "get_balance",
+        frozenset({"wallet", "read-only"}),
+    ),
+    ActionSpec(
+        "get_balance_nft",
+        "GetBalanceNftAction",
+        "get_balance_nft",
+        frozenset({"nft", "read-only"}),
+    ),
+    ActionSpec(
+        "get_wallet_details",
+        "GetWalletDetailsAction",
+        "get_wallet_details",
+        frozenset({"wallet", "read-only"}),
+    ),
+    ActionSpec(
+        "mint_nft",
+        "MintNftAction",
+        "mint_nft",
+        frozenset({"nft"}),
+    ),
+    ActionSpec(
+        "morpho_deposit",
+        "MorphoDepositAction",
+        "morpho.deposit",
+        frozenset({"defi", "morpho"}),
+    ),
+    ActionSpec(
+        "morpho_withdraw",
+        "MorphoWithdrawAction",
+        "morpho.withdraw",
+        frozenset({"defi", "morpho"}),
+    ),
+    ActionSpec(
+        "pyth_fetch_price",
+        "PythFetchPriceAction",
+        "pyth.fetch_price",
+        frozenset({"pyth", "read-only"}),
+    ),
+    ActionSpec(
+        "pyth_fetch_price_feed_id",
+        "PythFetchPriceFeedIDAction",
+        "pyth.fetch_price_feed_id",
+        frozenset({"pyth", "read-only"}),
+    ),
+    ActionSpec(
+        "register_basename",
+        "RegisterBasenameAction",
+        "register_basename",
+        frozenset({"basename"}),
+    ),
+    ActionSpec(
+        "request_faucet_funds",
+        "RequestFaucetFundsAction",
+        "request_faucet_funds",
+        frozenset({"wallet"}),
+    ),
+    ActionSpec(
+        "superfluid_create_flow",
+        "SuperfluidCreateFlowAction",
+        "superfluid.create_flow",
+        frozenset({"defi", "superfluid"}),
+    ),
+    ActionSpec(
+        "superfluid_delete_flow",
+        "SuperfluidDeleteFlowAction",
+        "superfluid.delete_flow",
+        frozenset({"defi", "superfluid"}),
+    ),
+    ActionSpec(
+        "superfluid_update_flow",
+        "SuperfluidUpdateFlowAction",
+        "superfluid.update_flow",
+        frozenset({"defi", "superfluid"}),
+    ),
+    ActionSpec(
+        "trade",
+        "TradeAction",
+        "trade",
+        frozenset({"wallet", "defi"}),
+    ),
+    ActionSpec(
+        "transfer",
+        "TransferAction",
+        "transfer",
+        frozenset({"wallet"}),
+    ),
+    ActionSpec(
+        "transfer_nft",
+        "TransferNftAction",
+        "transfer_nft",
+        frozenset({"nft"}),
+    ),
+    ActionSpec(
+        "wow_buy_token",
+        "WowBuyTokenAction",
+        "wow.buy_token",
+        frozenset({"wow", "token"}),
+    ),
+    ActionSpec(
+        "wow_create_token",
+        "WowCreateTokenAction",
+        "wow.create_token",
+        frozenset({"wow", "token"}),
+    ),
+    ActionSpec(
+        "wow_quote_curve",
+        "WowQuoteCurveAction",
+        "wow.quote_curve",
+        frozenset({"wow", "read-only"}),
+    ),
+    ActionSpec(
+        "wow_sell_token",
+        "WowSellTokenAction",
+        "wow.sell_token",
+        frozenset({"wow", "token"}),
+    ),
+    ActionSpec(
+        "wrap_eth",
+        "WrapEthAction",
+        "wrap_eth",
+        frozenset({"wallet", "defi"}),
+    ),
+    ActionSpec(
+        "estimate_fighting_pow",
+        "EstimateNFTFightPowerAction",
+        "rpg.estimate_fighting_pow",
+        frozenset({"rpg", "read-only"}),
+    ),
+    ActionSpec(
+        "get_nft_price",
+        "GetNFTPriceAction",
+        "rpg.get_nft_price",
+        frozenset({"rpg", "read-only"}),
+    ),
+    ActionSpec(
+        "simulate_battle",
+        "SimulationBattleAction",
+        "rpg.simulate_battle",
+        frozenset({"rpg", "read-only"}),
+    ),
+    ActionSpec(
+        "simulate_battle_batch",
+        "SimulationBattleBatchAction",
+        "rpg.simulate_battle_batch",
+        frozenset({"rpg", "read-only"}),
+    ),
+    ActionSpec(
+        "calculate_battle_odds",
+        "CalculateBattleOddsAction",
+        "rpg.battle_odds",
+        frozenset({"rpg", "read-only"}),
+    ),
+    ActionSpec(
+        "run_tournament",
+        "RunTournamentAction",
+        "rpg.tournament",
+        frozenset({"rpg", "read-only"}),
+    ),
+)
+
+_SPECS_BY_NAME = {spec.name: spec for spec in ACTION_SPECS}
+
+ACTION_TAGS = frozenset().union(*(spec.tags for spec in ACTION_SPECS))
+
+
+def select_action_specs(
+    names: list[str] | None = None,
+    tags: list[str] | None = None,
+    exclude_names: list[str] | None = None,
+    exclude_tags: list[str] | None = None,
+) -> list[ActionSpec]:
+    """Select registered actions by name or tag, without importing them.
+
+    Args:
+        names: (Optional) Names of actions to select
+        tags: (Optional) Tags of actions to select, such as `rpg` or `read-only`. Actions are
+            selected if they match any of `names` or `tags`, or all actions if both are omitted.
+        exclude_names: (Optional) Names of actions to leave out of the selection
+        exclude_tags: (Optional) Tags of actions to leave out of the selection
+
+    Returns:
+        list[ActionSpec]: The selected actions, in registration order.
+
+    Raises:
+        ValueError: If an action name or tag is not registered.
+
+    """
+    names, tags = set(names or ()), set(tags or ())
+    exclude_names, exclude_tags = set(exclude_names or ()), set(exclude_tags or ())
+
+    unknown_names = sorted((names | exclude_names) - _SPECS_BY_NAME.keys())
+    if unknown_names:
+        raise ValueError(f"Unknown CDP actions: {', '.join(unknown_names)}")
+
+    unknown_tags = sorted((tags | exclude_tags) - ACTION_TAGS)
+    if unknown_tags:
+        raise ValueError(f"Unknown CDP action tags: {', '.join(unknown_tags)}")
+
+    return [
+        spec
+        for spec in ACTION_SPECS
+        if ((not names and not tags) or spec.name in names or spec.tags & tags)
+        and spec.name not in exclude_names
+        and not spec.tags & exclude_tags
+    ]
+
+
+def load_actions(names: list[str] | None = None) -> list[CdpAction]:
+    """Load registered actions, importing only the modules of the requested actions.
+
+    Args:
+        names: (Optional) Names of the actions to load. All registered actions when omitted.
+
+    Returns:
+        list[CdpAction]: The actions, in registration order, or in the order of `names`.
+
+    Raises:
+        ValueError: If an action name is not registered.
+
+    """
+    if names is None:
+        return [spec.load() for spec in ACTION_SPECS]
+
+    unknown = [name for name in names if name not in _SPECS_BY_NAME]
+    if unknown:
+        raise ValueError(f"Unknown CDP actions: {', '.join(unknown)}")
+
+    return [_SPECS_BY_NAME[name].load() for name in names]
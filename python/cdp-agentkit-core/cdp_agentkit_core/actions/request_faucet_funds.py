@@ -1,9 +1,11 @@
 from collections.abc import Callable
+from dataclasses import dataclass
 
 from cdp import Wallet
 from pydantic import BaseModel, Field
 
 from cdp_agentkit_core.actions import CdpAction
+from cdp_agentkit_core.actions.result import ActionFailure, TransactionResult
 
 REQUEST_FAUCET_FUNDS_PROMPT = """
 This tool will request test tokens from the faucet for the default address in the wallet. It takes the wallet and asset ID as input.
@@ -22,7 +24,30 @@ class RequestFaucetFundsInput(BaseModel):
     )
 
 
-def request_faucet_funds(wallet: Wallet, asset_id: str | None = None) -> str:
+@dataclass(frozen=True)
+class FaucetResult(TransactionResult):
+    """Test tokens received from the faucet, with the faucet transaction.
+
+    Attributes:
+        asset_id: Asset ID requested, or None for the network's native asset
+
+    """
+
+    asset_id: str | None
+
+    def render(self) -> str:
+        """Render the faucet funds as the message given to the LLM.
+
+        Returns:
+            str: The message.
+
+        """
+        return f"Received {self.asset_id} from the faucet. Transaction: {self.transaction_link}"
+
+
+def request_faucet_funds(
+    wallet: Wallet, asset_id: str | None = None
+) -> FaucetResult | ActionFailure:
     """Request test tokens from the faucet for the default address in the wallet.
 
     Args:
@@ -30,7 +55,8 @@ def request_faucet_funds(wallet: Wallet, asset_id: str | None = None) -> str:
         asset_id (str | None): The optional asset ID to request from the faucet. Accepts "eth" or "usdc". When omitted, defaults to the network's native asset.
 
     Returns:
-        str: Confirmation message with transaction details
+        FaucetResult | ActionFailure: The faucet transaction, rendering to a confirmation message
+            with transaction details
 
     """
     try:
@@ -40,9 +66,13 @@ def request_faucet_funds(wallet: Wallet, asset_id: str | None = None) -> str:
         # Wait for the faucet transaction to be confirmed.
         faucet_tx.wait()
     except Exception as e:
-        return f"Error requesting faucet funds {e!s}"
+        return ActionFailure(f"Error requesting faucet funds {e!s}", e)
 
-    return f"Received {asset_id} from the faucet. Transaction: {faucet_tx.transaction_link}"
+    return FaucetResult(
+        asset_id=asset_id,
+        transaction_hash=faucet_tx.transaction_hash,
+        transaction_link=faucet_tx.transaction_link,
+    )
 
 
 class RequestFaucetFundsAction(CdpAction):
@@ -51,4 +81,4 @@ class RequestFaucetFundsAction(CdpAction):
     name: str = "request_faucet_funds"
     description: str = REQUEST_FAUCET_FUNDS_PROMPT
     args_schema: type[BaseModel] | None = RequestFaucetFundsInput
-    func: Callable[..., str] = request_faucet_funds
+    func: Callable[..., FaucetResult | ActionFailure] = request_faucet_funds
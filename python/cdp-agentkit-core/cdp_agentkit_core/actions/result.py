@@ -0,0 +1,66 @@
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from functools import cached_property
+
+
+class ActionResult(ABC):
+    """Structured result of an action, rendered to the message given to the LLM only when needed.
+
+    Programmatic callers read the result's fields, such as balances, transaction hashes or quotes,
+    directly. Tools call `str(result)`, which renders the message on first use and caches it.
+    """
+
+    @abstractmethod
+    def render(self) -> str:
+        """Render the result as the message given to the LLM.
+
+        Returns:
+            str: The message.
+
+        """
+
+    @cached_property
+    def text(self) -> str:
+        """The message given to the LLM, rendered once."""
+        return self.render()
+
+    def __str__(self) -> str:
+        """Return the message given to the LLM."""
+        return self.text
+
+
+@dataclass(frozen=True)
+class ActionFailure(ActionResult):
+    """Result of an action that failed, with the error it failed with.
+
+    Attributes:
+        message: Message given to the LLM
+        error: (Optional) Exception the action failed with
+
+    """
+
+    message: str
+    error: Exception | None = None
+
+    def render(self) -> str:
+        """Render the failure as the message given to the LLM.
+
+        Returns:
+            str: The message.
+
+        """
+        return self.message
+
+
+@dataclass(frozen=True)
+class TransactionResult(ActionResult):
+    """Result of an action that sent an onchain transaction.
+
+    Attributes:
+        transaction_hash: Hash of the transaction
+        transaction_link: Link to the transaction on a block explorer
+
+    """
+
+    transaction_hash: str
+    transaction_link: str
@@ -0,0 +1,303 @@
+import itertools
+import math
+from collections import Counter
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any
+
+from pydantic import BaseModel, Field
+
+from cdp_agentkit_core.actions import CdpAction
+from cdp_agentkit_core.actions.numpy_import import import_numpy
+from cdp_agentkit_core.actions.result import ActionResult
+from cdp_agentkit_core.actions.rpg.simulate_battle import STAT_FORMULAS
+from cdp_agentkit_core.actions.rpg.simulate_battle_batch import (
+    COUNTER_PROBABILITY,
+    CRIT_PROBABILITY,
+    DODGE_PROBABILITY,
+    MISS_PROBABILITY,
+    simulate_battle_batch,
+)
+
+CALCULATE_BATTLE_ODDS_PROMPT = """
+This tool calculates exactly how likely an NFT is to win a battle against another NFT, without simulating any battle.
+The odds follow the same rules, and account for the same randomly varied stats, as simulate_battle.
+It takes the price of two NFTs in USD, and returns NFT 1's probability of winning and the expected number of turns of the battle.
+When the NFTs can take too many strikes to solve the battle exactly, the odds are estimated by simulating many battles instead, and marked as approximate.
+
+Use this tool instead of simulate_battle or simulate_battle_batch to find out who is likely to win.
+"""
+
+# Largest battles solved: the most strikes both NFTs can take in total, and the most states of
+# the battle, pairs of strikes each NFT can take.
+MAX_SOLVER_STRIKES = 2**14
+MAX_SOLVER_STATES = 2**19
+
+# Battles simulated to estimate the odds of battles too large to solve.
+FALLBACK_TRIALS = 100000
+
+
+class CalculateBattleOddsInput(BaseModel):
+    """Input argument schema for calculating the odds of an NFT battle."""
+
+    nft1_price: float = Field(..., description="The price of NFT 1 in USD.")
+    nft2_price: float = Field(..., description="The price of NFT 2 in USD.")
+
+
+def _stat_values(nft_price: float, stat: str) -> list[float]:
+    base, scale, variance = STAT_FORMULAS[stat]
+    return [
+        round(base + (nft_price * scale) + offset, 2) for offset in range(-variance, variance + 1)
+    ]
+
+
+def strikes_distribution(defender_price: float, attacker_price: float) -> dict[int, float]:
+    """Compute the distribution of the number of strikes an NFT can take before falling.
+
+    A strike is an attack of the other NFT landing normally, or countering. Critical hits count as
+    two strikes. The number of strikes depends on the defender's HP and Defense and the
+    attacker's Attack, which vary randomly as in `generate_nft_stats`.
+
+    Args:
+        defender_price: Price in USD of the NFT taking the strikes
+        attacker_price: Price in USD of the NFT striking
+
+    Returns:
+        dict[int, float]: The probability of each number of strikes.
+
+    """
+    counts = Counter(
+        max(1, math.ceil(hp / max(1, attack - defense)))
+        for hp, attack, defense in itertools.product(
+            _stat_values(defender_price, "HP"),
+            _stat_values(attacker_price, "Attack"),
+            _stat_values(defender_price, "Defense"),
+        )
+    )
+    total = sum(counts.values())
+    return {strikes: count / total for strikes, count in sorted(counts.items())}
+
+
+def speed_odds(nft1_price: float, nft2_price: float) -> dict[tuple[bool, bool], float]:
+    """Compute the probability of which NFT is faster, and so can dodge the other's attacks.
+
+    Args:
+        nft1_price: Price of NFT 1 in USD
+        nft2_price: Price of NFT 2 in USD
+
+    Returns:
+        dict[tuple[bool, bool], float]: The probability that NFT 2 dodges NFT 1's attacks and that
+            NFT 1 dodges NFT 2's attacks, by whether each does.
+
+    """
+    counts = Counter(
+        (speed2 > speed1, speed1 > speed2)
+        for speed1, speed2 in itertools.product(
+            _stat_values(nft1_price, "Speed"), _stat_values(nft2_price, "Speed")
+        )
+    )
+    total = sum(counts.values())
+    return {dodges: count / total for dodges, count in counts.items()}
+
+
+def solve_battles(strikes_1: int, strikes_2: int, lands_1: Any, lands_2: Any) -> tuple[Any, Any]:
+    """Solve the odds and expected length of battles, following the rules of `simulate_battle`.
+
+    A battle is a Markov chain over the strikes each NFT can still take, and which NFT attacks.
+    Each turn the attacker misses, is countered, taking a strike, or lands a normal or critical
+    hit, giving one or two strikes, or is dodged, with the probabilities of `simulate_battle`.
+    The probability that NFT 1 wins, and the expected number of turns left, of each state only
+    depends on states where fewer strikes are left, or on the same state with the other NFT
+    attacking after a miss or dodge. States are solved exactly, an anti-diagonal of states with
+    the same total of strikes left at a time, solving the pair of states of each NFT attacking
+    together.
+
+    Args:
+        strikes_1: Most strikes NFT 1 can take, the number of rows of the solution
+        strikes_2: Most strikes NFT 2 can take, the number of columns of the solution
+        lands_1: Probability that NFT 1's attacks land, in each of a sequence of battles
+        lands_2: Probability that NFT 2's attacks land, in each of a sequence of battles
+
+    Returns:
+        tuple[Any, Any]: The probability that NFT 1 wins, and the expected number of turns of the
+            battle, when NFT 1 attacks first, as arrays indexed by battle, the strikes NFT 1 can
+            take and the strikes NFT 2 can take.
+
+    """
+    np = import_numpy()
+
+    lands_1 = np.asarray(lands_1, dtype=float).reshape(-1, 1)
+    lands_2 = np.asarray(lands_2, dtype=float).reshape(-1, 1)
+
+    # Probability of each outcome of a turn: the attacker taking no strike or a counter, and the
+    # defender taking one or two strikes.
+    hit_probability = 1 - MISS_PROBABILITY - COUNTER_PROBABILITY
+    stay_1 = MISS_PROBABILITY + hit_probability - lands_1
+    stay_2 = MISS_PROBABILITY + hit_probability - lands_2
+    normal_1, critical_1 = lands_1 * (1 - CRIT_PROBABILITY), lands_1 * CRIT_PROBABILITY
+    normal_2, critical_2 = lands_2 * (1 - CRIT_PROBABILITY), lands_2 * CRIT_PROBABILITY
+    cycle = 1 - stay_1 * stay_2
+
+    # States are stored by anti-diagonal, and by position along it, the strikes left of the NFT
+    # able to take fewer, from -1. The states a turn leads to are then slices of the previous two
+    # anti-diagonals, shifted by the strikes taken. States where an NFT has fallen hold the
+    # outcome of the battle.
+    by_row = strikes_1 <= strikes_2
+    positions, others = (strikes_1, strikes_2) if by_row else (strikes_2, strikes_1)
+    shift_1, shift_2 = (1, 0) if by_row else (0, 1)
+    totals = np.arange(strikes_1 + strikes_2 + 1).reshape(-1, 1)
+    position = np.arange(-1, positions + 1)
+    rows, columns = (position, totals - position) if by_row else (totals - position, position)
+
+    # Outcome of each state, with NFT 1 or NFT 2 attacking: the probability that NFT 1 wins, and
+    # the expected turns left, each turn adding one.
+    outcome_1 = np.zeros((2, lands_1.shape[0], totals.size, position.size))
+    outcome_1[0] = (columns <= 0) & (rows > 0)
+    outcome_2 = outcome_1.copy()
+    turn = np.array([0.0, 1.0]).reshape(2, 1, 1)
+
+    for total in range(2, strikes_1 + strikes_2 + 1):
+        first = max(1, total - others) + 1
+        last = min(positions, total - 1) + 2
+        one_1, two_1 = (slice(first - n * shift_1, last - n * shift_1) for n in (1, 2))
+        one_2, two_2 = (slice(first - n * shift_2, last - n * shift_2) for n in (1, 2))
+
+        # Expected outcome of NFT 1's and NFT 2's turns, from the states they lead to with fewer
+        # strikes left.
+        after_1 = (
+            turn
+            + COUNTER_PROBABILITY * outcome_2[:, :, total - 1, one_1]
+            + normal_1 * outcome_2[:, :, total - 1, one_2]
+            + critical_1 * outcome_2[:, :, total - 2, two_2]
+        )
+        after_2 = (
+            turn
+            + COUNTER_PROBABILITY * outcome_1[:, :, total - 1, one_2]
+            + normal_2 * outcome_1[:, :, total - 1, one_1]
+            + critical_2 * outcome_1[:, :, total - 2, two_1]
+        )
+        outcome_1[:, :, total, first:last] = (after_1 + stay_1 * after_2) / cycle
+        outcome_2[:, :, total, first:last] = (after_2 + stay_2 * after_1) / cycle
+
+    strikes_left_1 = np.arange(strikes_1 + 1).reshape(-1, 1)
+    strikes_left_2 = np.arange(strikes_2 + 1)
+    wins, turns = outcome_1[
+        :,
+        :,
+        strikes_left_1 + strikes_left_2,
+        (strikes_left_1 if by_row else strikes_left_2) + 1,
+    ]
+    return wins, turns
+
+
+@dataclass(frozen=True)
+class BattleOdds(ActionResult):
+    """Odds of a battle between two NFTs.
+
+    Attributes:
+        nft1_price: Price of NFT 1 in USD
+        nft2_price: Price of NFT 2 in USD
+        win_probability: Probability that NFT 1 wins
+        turns_mean: Expected number of turns of the battle
+        simulated_battles: Number of battles simulated to estimate the odds, or None if they are
+            exact
+
+    """
+
+    nft1_price: float
+    nft2_price: float
+    win_probability: float
+    turns_mean: float
+    simulated_battles: int | None = None
+
+    @property
+    def exact(self) -> bool:
+        """Whether the odds were solved exactly, rather than estimated by simulation."""
+        return self.simulated_battles is None
+
+    def render(self) -> str:
+        """Render the odds as the message given to the LLM.
+
+        Returns:
+            str: The message.
+
+        """
+        title = "🏆 **NFT battle odds**"
+        if not self.exact:
+            title += f" (approximate, from {self.simulated_battles} simulated battles)"
+        return "\n".join(
+            [
+                title,
+                f"🔹 **NFT 1** (${self.nft1_price}) wins with probability "
+                f"{self.win_probability:.2%}",
+                f"🔸 **NFT 2** (${self.nft2_price}) wins with probability "
+                f"{1 - self.win_probability:.2%}",
+                f"⏱️ **Turns:** {self.turns_mean:.1f} expected",
+            ]
+        )
+
+
+def calculate_battle_odds(nft1_price: float, nft2_price: float) -> BattleOdds:
+    """Calculate the exact probability that NFT 1 wins a battle, and its expected length.
+
+    The odds are averaged over the random variance of the NFTs' stats: the strikes each NFT can
+    take, and which NFT is faster, are independent, so every combination is weighted by its
+    probability from one solution of `solve_battles` per combination of speeds. Battles where the
+    NFTs can take too many strikes to solve are estimated with `simulate_battle_batch` instead.
+
+    Args:
+        nft1_price (float): The price of NFT 1 in USD.
+        nft2_price (float): The price of NFT 2 in USD.
+
+    Returns:
+        BattleOdds: The probability that NFT 1 wins, and the expected number of turns, approximate
+            if the battle was too large to solve.
+
+    """
+    np = import_numpy()
+
+    strikes_1 = strikes_distribution(nft1_price, nft2_price)
+    strikes_2 = strikes_distribution(nft2_price, nft1_price)
+    most_strikes_1, most_strikes_2 = max(strikes_1), max(strikes_2)
+    if (
+        most_strikes_1 + most_strikes_2 > MAX_SOLVER_STRIKES
+        or most_strikes_1 * most_strikes_2 > MAX_SOLVER_STATES
+    ):
+        simulated = simulate_battle_batch(nft1_price, nft2_price, trials=FALLBACK_TRIALS)
+        return BattleOdds(
+            nft1_price=nft1_price,
+            nft2_price=nft2_price,
+            win_probability=simulated.win_rate,
+            turns_mean=simulated.turns_mean,
+            simulated_battles=simulated.trials,
+        )
+
+    odds_1 = np.zeros(most_strikes_1 + 1)
+    odds_1[list(strikes_1)] = list(strikes_1.values())
+    odds_2 = np.zeros(most_strikes_2 + 1)
+    odds_2[list(strikes_2)] = list(strikes_2.values())
+
+    speeds = speed_odds(nft1_price, nft2_price)
+    hit_probability = 1 - MISS_PROBABILITY - COUNTER_PROBABILITY
+    lands_1, lands_2 = (
+        [hit_probability * (1 - DODGE_PROBABILITY if dodges[dodger] else 1) for dodges in speeds]
+        for dodger in (0, 1)
+    )
+    wins, turns = solve_battles(most_strikes_1, most_strikes_2, lands_1, lands_2)
+
+    weights = np.array(list(speeds.values()))
+    return BattleOdds(
+        nft1_price=nft1_price,
+        nft2_price=nft2_price,
+        win_probability=min(1.0, float(weights @ (odds_1 @ wins @ odds_2))),
+        turns_mean=float(weights @ (odds_1 @ turns @ odds_2)),
+    )
+
+
+class CalculateBattleOddsAction(CdpAction):
+    """Calculate the odds of an NFT battle action."""
+
+    name: str = "calculate_battle_odds"
+    description: str = CALCULATE_BATTLE_ODDS_PROMPT
+    args_schema: type[BaseModel] | None = CalculateBattleOddsInput
+    func: Callable[..., BattleOdds] = calculate_battle_odds
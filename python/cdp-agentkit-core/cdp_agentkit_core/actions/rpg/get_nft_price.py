@@ -1,8 +1,9 @@
-from collections.abc import Callable
+from collections.abc import Awaitable, Callable
 from pydantic import BaseModel, Field
 import requests
 
 from cdp_agentkit_core.actions import CdpAction
+from cdp_agentkit_core.actions.read_client import read_client
 
 GET_NFT_PRICE_PROMPT = """
 This tool retrieves the current market price of an NFT on the Ethereum blockchain, denominated in HUSD.
@@ -29,23 +30,56 @@ def get_nft_price(nft_id: str) -> float:
 
     Raises:
         ValueError: If no price data is found for the given NFT.
-        requests.RequestException: If the API request fails.
+        requests.RequestException: If the API request fails, of the same type as the failure,
+            such as `requests.HTTPError`.
     """
-    url = f"https://coins.llama.fi/prices/current/ethereum:{nft_id}"
-
     try:
-        response = requests.get(url, timeout=10)
-        response.raise_for_status()
-        data = response.json()
+        data = read_client.get_json(_nft_price_url(nft_id))
+    except requests.RequestException as e:
+        raise _price_request_error(e) from e
+
+    return _parse_nft_price(nft_id, data)
+
+
+async def aget_nft_price(nft_id: str) -> float:
+    """Fetch the current market price of an NFT in HUSD, without blocking the event loop.
+
+    Args:
+        nft_id (str): The unique identifier (contract address or token ID) of the NFT.
 
-        key = f"ethereum:{nft_id}"
-        if "coins" in data and key in data["coins"] and "price" in data["coins"][key]:
-            return float(data["coins"][key]["price"])
+    Returns:
+        float: The latest market price of the NFT in HUSD.
 
-        raise ValueError(f"No price feed found for NFT: {nft_id}")
+    Raises:
+        ValueError: If no price data is found for the given NFT.
+        requests.RequestException: If the API request fails, of the same type as the failure,
+            such as `requests.HTTPError`.
 
+    """
+    try:
+        data = await read_client.aget_json(_nft_price_url(nft_id))
     except requests.RequestException as e:
-        raise requests.RequestException(f"Failed to retrieve NFT price: {e}") from e
+        raise _price_request_error(e) from e
+
+    return _parse_nft_price(nft_id, data)
+
+
+def _nft_price_url(nft_id: str) -> str:
+    return f"https://coins.llama.fi/prices/current/ethereum:{nft_id}"
+
+
+def _price_request_error(error: requests.RequestException) -> requests.RequestException:
+    return type(error)(
+        f"Failed to retrieve NFT price: {error}", request=error.request, response=error.response
+    )
+
+
+def _parse_nft_price(nft_id: str, data: dict) -> float:
+    key = f"ethereum:{nft_id}"
+    if "coins" in data and key in data["coins"] and "price" in data["coins"][key]:
+        return float(data["coins"][key]["price"])
+
+    raise ValueError(f"No price feed found for NFT: {nft_id}")
 
 
 class GetNFTPriceAction(CdpAction):
@@ -55,3 +89,4 @@ class GetNFTPriceAction(CdpAction):
     description: str = GET_NFT_PRICE_PROMPT
     args_schema: type[BaseModel] | None = GetNFTPriceInput
     func: Callable[..., float] = get_nft_price
+    afunc: Callable[..., Awaitable[float]] | None = aget_nft_price
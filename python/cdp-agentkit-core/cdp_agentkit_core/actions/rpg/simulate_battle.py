@@ -1,8 +1,14 @@
 import random
+import secrets
+import struct
 from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Literal
+
 from pydantic import BaseModel, Field
 
 from cdp_agentkit_core.actions import CdpAction
+from cdp_agentkit_core.actions.result import ActionResult
 
 SIMULATION_BATTLE_PROMPT = """
 This tool simulates a battle between two NFTs based on their price or randomly generated stats.
@@ -10,8 +16,30 @@ It takes the price of two NFTs as inputs and generates attributes such as attack
 The battle proceeds turn by turn until one NFT is defeated.
 
 If prices are not provided, random values will be assigned to the NFTs.
+
+Every battle is seeded, and the battle log ends with its seed. To replay a battle, pass the same prices and its seed.
+Use the `summary` verbosity when only the outcome of the battle is needed, rather than the turn-by-turn log.
 """
 
+# Base value, price scaling and random variance of each stat.
+STAT_FORMULAS = {
+    "Attack": (50, 0.5, 5),
+    "Defense": (40, 0.3, 3),
+    "Speed": (30, 0.2, 2),
+    "HP": (450, 0.7, 20),
+}
+
+# Battle rules. Each turn the attacker rolls 1-100, missing below MISS_ROLL and being countered
+# above COUNTER_ROLL. Hits are critical on a 1-in-CRIT_ODDS roll, and a faster defender dodges
+# them on a 1-100 roll below DODGE_ROLL.
+MISS_ROLL = 10
+COUNTER_ROLL = 90
+CRIT_ODDS = 10
+DODGE_ROLL = 15
+
+# Bits of a battle seed.
+SEED_BITS = 64
+
 
 class SimulationBattleInput(BaseModel):
     """Input argument schema for simulating an NFT battle."""
@@ -22,52 +50,192 @@ class SimulationBattleInput(BaseModel):
     nft2_price: float = Field(
         ..., description="The price of NFT 2 in USD."
     )
+    seed: int | None = Field(
+        None,
+        ge=0,
+        lt=2**SEED_BITS,
+        description="The seed of a previous battle to replay. Omit it for a new battle.",
+    )
+    verbosity: Literal["full", "summary"] = Field(
+        "full",
+        description="`full` for the turn-by-turn battle log, or `summary` for only the outcome.",
+    )
+
+
+@dataclass(frozen=True)
+class BattleReplay:
+    """Seed and inputs of a battle, which regenerate its full log.
+
+    Attributes:
+        seed: Seed of the battle's random generator
+        nft1_price: Price of NFT 1 in USD
+        nft2_price: Price of NFT 2 in USD
+
+    """
+
+    seed: int
+    nft1_price: float
+    nft2_price: float
+
+    # Seed as an unsigned 64-bit integer, and prices as doubles, little-endian.
+    _FORMAT = struct.Struct("<Qdd")
+
+    def to_bytes(self) -> bytes:
+        """Encode the replay in 24 bytes.
+
+        Returns:
+            bytes: The encoded replay.
+
+        """
+        return self._FORMAT.pack(self.seed, self.nft1_price, self.nft2_price)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "BattleReplay":
+        """Decode a replay encoded with `to_bytes`.
+
+        Args:
+            data: The encoded replay
+
+        Returns:
+            BattleReplay: The replay.
+
+        Raises:
+            struct.error: If the data is not an encoded replay.
+
+        """
+        return cls(*cls._FORMAT.unpack(data))
+
+    def battle_log(self) -> str:
+        """Regenerate the battle's log.
+
+        Returns:
+            str: The battle log, identical to the original battle's.
+
+        """
+        battle_log = []
+        _fight(self, battle_log)
+        battle_log.append(_replay_line(self))
+        return "\n".join(battle_log)
 
 
-def generate_nft_stats(nft_price: float) -> dict:
-    """Generate stats based on NFT price with a small random variance."""
-    
-    base_attack = 50
-    base_defense = 40
-    base_speed = 30
-    base_hp = 450
+@dataclass(frozen=True)
+class BattleResult(ActionResult):
+    """Outcome of an NFT battle, whose log is only generated when rendered.
 
-    attack = base_attack + (nft_price * 0.5) + random.randint(-5, 5)
-    defense = base_defense + (nft_price * 0.3) + random.randint(-3, 3)
-    speed = base_speed + (nft_price * 0.2) + random.randint(-2, 2)
-    hp = base_hp + (nft_price * 0.7) + random.randint(-20, 20)
+    Attributes:
+        replay: Seed and prices of the battle
+        nft1_stats: Stats of NFT 1 at the start of the battle
+        nft2_stats: Stats of NFT 2 at the start of the battle
+        winner: Number of the NFT that won, 1 or 2
+        turns: Number of turns the battle lasted
+        nft1_hp: HP NFT 1 had left at the end of the battle
+        nft2_hp: HP NFT 2 had left at the end of the battle
+        crits: Number of critical hits
+        dodges: Number of dodged attacks
+        verbosity: Whether the result renders to the full battle log or a summary
 
+    """
+
+    replay: BattleReplay
+    nft1_stats: dict
+    nft2_stats: dict
+    winner: int
+    turns: int
+    nft1_hp: float
+    nft2_hp: float
+    crits: int
+    dodges: int
+    verbosity: Literal["full", "summary"] = "full"
+
+    def battle_log(self) -> str:
+        """Generate the battle's turn-by-turn log, by replaying it.
+
+        Returns:
+            str: The battle log, ending with the battle's seed and replay code.
+
+        """
+        return self.replay.battle_log()
+
+    def render(self) -> str:
+        """Render the battle log, or a summary of the outcome, as the message given to the LLM.
+
+        Returns:
+            str: The message.
+
+        """
+        if self.verbosity == "full":
+            return self.battle_log()
+
+        loser_hp = self.nft2_hp if self.winner == 1 else self.nft1_hp
+        winner_hp = self.nft1_hp if self.winner == 1 else self.nft2_hp
+        return "\n".join(
+            [
+                f"🔹 **NFT 1 Stats:** {self.nft1_stats}",
+                f"🔸 **NFT 2 Stats:** {self.nft2_stats}",
+                f"🏆 **NFT {self.winner} wins the battle** after {self.turns} turns, "
+                f"with {round(winner_hp, 2)} HP left against {round(loser_hp, 2)}.",
+                f"💥 {self.crits} critical hits, 🌀 {self.dodges} dodges.",
+                _replay_line(self.replay).lstrip("\n"),
+            ]
+        )
+
+
+def generate_nft_stats(nft_price: float, rng: random.Random | None = None) -> dict:
+    """Generate stats based on NFT price with a small random variance.
+
+    Args:
+        nft_price (float): The price of the NFT in USD.
+        rng (random.Random | None): (Optional) Random generator drawing the variance. Defaults to
+            the `random` module's shared generator.
+
+    Returns:
+        dict: Stats of the NFT (Attack, Defense, Speed, HP).
+
+    """
+    rng = rng or random
     return {
-        "Attack": round(attack, 2),
-        "Defense": round(defense, 2),
-        "Speed": round(speed, 2),
-        "HP": round(hp, 2),
+        stat: round(base + (nft_price * scale) + rng.randint(-variance, variance), 2)
+        for stat, (base, scale, variance) in STAT_FORMULAS.items()
     }
 
 
-def simulate_battle(nft1_price: float, nft2_price: float) -> str:
-    """Simulate an NFT battle and return the battle log."""
-    
-    nft1 = generate_nft_stats(nft1_price)
-    nft2 = generate_nft_stats(nft2_price)
+def _replay_line(replay: BattleReplay) -> str:
+    return f"\n🎲 **Seed:** {replay.seed} (replay code {replay.to_bytes().hex()})"
+
+
+def _fight(
+    replay: BattleReplay,
+    battle_log: list[str] | None,
+    verbosity: Literal["full", "summary"] = "full",
+) -> BattleResult:
+    """Run a battle, appending to its log only if a log is given."""
+    rng = random.Random(replay.seed)
+    nft1 = generate_nft_stats(replay.nft1_price, rng)
+    nft2 = generate_nft_stats(replay.nft2_price, rng)
+    nft1_stats, nft2_stats = dict(nft1), dict(nft2)
 
-    battle_log = [f"🏆 **NFT Battle Begins!** 🏆"]
-    battle_log.append(f"🔹 **NFT 1 Stats:** {nft1}")
-    battle_log.append(f"🔸 **NFT 2 Stats:** {nft2}")
+    if battle_log is not None:
+        battle_log.append("🏆 **NFT Battle Begins!** 🏆")
+        battle_log.append(f"🔹 **NFT 1 Stats:** {nft1}")
+        battle_log.append(f"🔸 **NFT 2 Stats:** {nft2}")
 
     turn = 1
+    crits = dodges = 0
     while nft1["HP"] > 0 and nft2["HP"] > 0:
         attacker, defender = (nft1, nft2) if turn % 2 != 0 else (nft2, nft1)
-        battle_log.append(f"\n🎭 **Turn {turn}:** {('NFT 1' if turn % 2 != 0 else 'NFT 2')} attacks!")
+        if battle_log is not None:
+            battle_log.append(f"\n🎭 **Turn {turn}:** {('NFT 1' if turn % 2 != 0 else 'NFT 2')} attacks!")
 
         # RNG for special events
-        event_chance = random.randint(1, 100)
-        if event_chance < 10:
-            battle_log.append("💨 The attacker **misses the attack** completely!")
+        event_chance = rng.randint(1, 100)
+        if event_chance < MISS_ROLL:
+            if battle_log is not None:
+                battle_log.append("💨 The attacker **misses the attack** completely!")
             turn += 1
             continue
-        elif event_chance > 90:
-            battle_log.append("⚡ The defender **counters the attack**, striking back!")
+        elif event_chance > COUNTER_ROLL:
+            if battle_log is not None:
+                battle_log.append("⚡ The defender **counters the attack**, striking back!")
             attacker["HP"] -= max(1, defender["Attack"] - attacker["Defense"])
             turn += 1
             continue
@@ -76,26 +244,75 @@ def simulate_battle(nft1_price: float, nft2_price: float) -> str:
         damage = max(1, attacker["Attack"] - defender["Defense"])
 
         # Critical hit
-        if random.randint(1, 10) == 1:
+        if rng.randint(1, CRIT_ODDS) == 1:
             damage *= 2
-            battle_log.append("💥 **CRITICAL HIT!**")
+            crits += 1
+            if battle_log is not None:
+                battle_log.append("💥 **CRITICAL HIT!**")
 
         # Dodge chance
-        if defender["Speed"] > attacker["Speed"] and random.randint(1, 100) < 15:
-            battle_log.append("🌀 The defender **dodges the attack** effortlessly!")
+        if defender["Speed"] > attacker["Speed"] and rng.randint(1, 100) < DODGE_ROLL:
+            dodges += 1
+            if battle_log is not None:
+                battle_log.append("🌀 The defender **dodges the attack** effortlessly!")
         else:
             defender["HP"] -= damage
-            battle_log.append(f"🔥 The attack hits! **{damage} damage dealt!**")
+            if battle_log is not None:
+                battle_log.append(f"🔥 The attack hits! **{damage} damage dealt!**")
 
         # Check for defeat
         if defender["HP"] <= 0:
-            battle_log.append(f"\n💀 **NFT {('2' if turn % 2 != 0 else '1')} has fallen!**")
-            battle_log.append(f"🏆 **NFT {('1' if turn % 2 != 0 else '2')} wins the battle!**")
-            return "\n".join(battle_log)
+            if battle_log is not None:
+                battle_log.append(f"\n💀 **NFT {('2' if turn % 2 != 0 else '1')} has fallen!**")
+                battle_log.append(f"🏆 **NFT {('1' if turn % 2 != 0 else '2')} wins the battle!**")
+            turn += 1
+            break
 
         turn += 1
 
-    return "\n".join(battle_log)
+    return BattleResult(
+        replay=replay,
+        nft1_stats=nft1_stats,
+        nft2_stats=nft2_stats,
+        winner=1 if nft2["HP"] <= 0 else 2,
+        turns=turn - 1,
+        nft1_hp=nft1["HP"],
+        nft2_hp=nft2["HP"],
+        crits=crits,
+        dodges=dodges,
+        verbosity=verbosity,
+    )
+
+
+def simulate_battle(
+    nft1_price: float,
+    nft2_price: float,
+    seed: int | None = None,
+    verbosity: Literal["full", "summary"] = "full",
+) -> BattleResult:
+    """Simulate an NFT battle and return its outcome.
+
+    Each battle draws its stats and events from its own random generator, so battles are
+    reproducible from their seed and concurrent battles do not share random state. The battle runs
+    without building its log, which is only generated, by replaying the battle, when the result is
+    rendered with the `full` verbosity.
+
+    Args:
+        nft1_price (float): The price of NFT 1 in USD.
+        nft2_price (float): The price of NFT 2 in USD.
+        seed (int | None): (Optional) Seed of the battle, to replay it. A new random seed when omitted.
+        verbosity (Literal["full", "summary"]): Whether the result renders to the full battle log,
+            or a summary of the outcome.
+
+    Returns:
+        BattleResult: The winner, number of turns, remaining HP, critical hits and dodges of the
+            battle, rendering to the battle log, ending with the battle's seed and replay code.
+
+    """
+    if seed is None:
+        seed = secrets.randbits(SEED_BITS)
+
+    return _fight(BattleReplay(seed, nft1_price, nft2_price), None, verbosity)
 
 
 class SimulationBattleAction(CdpAction):
@@ -104,4 +321,4 @@ class SimulationBattleAction(CdpAction):
     name: str = "simulate_battle"
     description: str = SIMULATION_BATTLE_PROMPT
     args_schema: type[BaseModel] | None = SimulationBattleInput
-    func: Callable[..., str] = simulate_battle
+    func: Callable[..., BattleResult] = simulate_battle
@@ -0,0 +1,314 @@
+import math
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any
+
+from pydantic import BaseModel, Field
+
+from cdp_agentkit_core.actions import CdpAction
+from cdp_agentkit_core.actions.numpy_import import import_numpy
+from cdp_agentkit_core.actions.result import ActionResult
+from cdp_agentkit_core.actions.rpg.simulate_battle import (
+    COUNTER_ROLL,
+    CRIT_ODDS,
+    DODGE_ROLL,
+    MISS_ROLL,
+    STAT_FORMULAS,
+)
+
+SIMULATION_BATTLE_BATCH_PROMPT = """
+This tool estimates how likely an NFT is to win a battle against another NFT, by simulating many battles between them.
+The battles follow the same rules, and use the same randomly varied stats, as simulate_battle.
+It takes the price of two NFTs in USD, and optionally the number of battles to simulate.
+It returns NFT 1's win rate with a 95% confidence interval, and the distribution of the number of turns battles last.
+
+Use this tool instead of calling simulate_battle many times to estimate who is likely to win.
+"""
+
+# Probability of each event of a turn, from the battle rules.
+MISS_PROBABILITY = (MISS_ROLL - 1) / 100
+COUNTER_PROBABILITY = (100 - COUNTER_ROLL) / 100
+CRIT_PROBABILITY = 1 / CRIT_ODDS
+DODGE_PROBABILITY = (DODGE_ROLL - 1) / 100
+
+# z-score of the confidence interval of the win rate.
+CONFIDENCE_Z = 1.96
+
+# Battles are simulated a block of turns at a time. Blocks start at MIN_BLOCK_TURNS turns and
+# double while battles run on, up to BLOCK_SIZE turns across all battles still running.
+BLOCK_SIZE = 2**20
+MIN_BLOCK_TURNS = 16
+MAX_BLOCK_TURNS = 4096
+
+# Number of distinct values of a roll.
+ROLL_RANGE = 2**16
+
+# Percentiles of the number of turns reported.
+TURN_PERCENTILES = (5, 25, 50, 75, 95)
+
+
+class SimulationBattleBatchInput(BaseModel):
+    """Input argument schema for simulating many NFT battles."""
+
+    nft1_price: float = Field(..., description="The price of NFT 1 in USD.")
+    nft2_price: float = Field(..., description="The price of NFT 2 in USD.")
+    trials: int = Field(10000, ge=1, le=1000000, description="The number of battles to simulate.")
+
+
+def generate_nft_stats_batch(nft_prices: Any, rng: Any) -> dict[str, Any]:
+    """Generate stats for many NFTs at once, as `generate_nft_stats` does for one.
+
+    Args:
+        nft_prices: Prices of the NFTs in USD, as a NumPy array
+        rng: NumPy random Generator drawing the variance of the stats
+
+    Returns:
+        dict[str, Any]: An array of each stat, by stat name.
+
+    """
+    np = import_numpy()
+    return {
+        stat: np.round(
+            base + nft_prices * scale + rng.integers(-variance, variance + 1, nft_prices.shape),
+            2,
+        )
+        for stat, (base, scale, variance) in STAT_FORMULAS.items()
+    }
+
+
+def simulate_battles(nft1: dict[str, Any], nft2: dict[str, Any], rng: Any) -> tuple[Any, Any]:
+    """Simulate many independent battles at once, following the rules of `simulate_battle`.
+
+    Each NFT falls after taking a number of strikes of the other's damage: hits, counters, and
+    critical hits, which count twice. Battles are simulated a block of turns at a time. Every turn
+    of the block draws one roll, which decides whether the attack is countered, misses, is
+    dodged, or lands as a normal or critical hit, with the probabilities of `simulate_battle`. A
+    battle ends on the first turn where either NFT has taken the strikes it can take. Battles
+    still running carry their strikes over to the next block, which is sized from the expected
+    length of the battles.
+
+    Args:
+        nft1: Stats of NFT 1 in each battle, as arrays by stat name
+        nft2: Stats of NFT 2 in each battle, as arrays by stat name
+        rng: NumPy random Generator drawing the events of the battles
+
+    Returns:
+        tuple[Any, Any]: Whether NFT 1 won each battle, and the number of turns each battle lasted.
+
+    """
+    np = import_numpy()
+
+    # Strikes of the other NFT's damage each NFT can take before falling.
+    strikes_left_1 = np.ceil(nft1["HP"] / np.maximum(1, nft2["Attack"] - nft1["Defense"]))
+    strikes_left_2 = np.ceil(nft2["HP"] / np.maximum(1, nft1["Attack"] - nft2["Defense"]))
+    strikes_left_1 = np.maximum(strikes_left_1, 1).astype(np.int32)
+    strikes_left_2 = np.maximum(strikes_left_2, 1).astype(np.int32)
+
+    # Probability that each NFT's attacks land, as they can only be dodged by a faster defender.
+    hit_probability = 1 - MISS_PROBABILITY - COUNTER_PROBABILITY
+    lands_1, lands_2 = (
+        hit_probability * np.where(defender["Speed"] > attacker["Speed"], 1 - DODGE_PROBABILITY, 1)
+        for attacker, defender in ((nft1, nft2), (nft2, nft1))
+    )
+
+    # Expected strikes each NFT takes per round of two turns, to size blocks.
+    rate_1 = lands_2 * (1 + CRIT_PROBABILITY) + COUNTER_PROBABILITY
+    rate_2 = lands_1 * (1 + CRIT_PROBABILITY) + COUNTER_PROBABILITY
+
+    # Rolls below `counter_roll` are countered, and rolls from `land_roll` on land, critically
+    # from `crit_roll` on. Rolls are drawn as 16-bit integers, which is exact to within
+    # 1 / ROLL_RANGE of each probability, and twice as fast to draw as floats.
+    counter_roll = round(COUNTER_PROBABILITY * ROLL_RANGE)
+    land_roll_1, land_roll_2, crit_roll_1, crit_roll_2 = (
+        np.round(ROLL_RANGE * (1 - probability)).astype(np.int32)
+        for probability in (
+            lands_1,
+            lands_2,
+            lands_1 * CRIT_PROBABILITY,
+            lands_2 * CRIT_PROBABILITY,
+        )
+    )
+
+    nft1_wins = np.zeros(strikes_left_1.shape, dtype=bool)
+    turns = np.zeros(strikes_left_1.shape, dtype=np.int64)
+    active = np.arange(strikes_left_1.size)
+    first_turn = 1
+
+    while active.size:
+        # Blocks are whole rounds, so each starts with NFT 1 attacking. They are laid out turn
+        # by turn, so each turn updates the contiguous row of all battles.
+        expected_rounds = np.minimum(
+            strikes_left_1[active] / rate_1[active], strikes_left_2[active] / rate_2[active]
+        )
+        rounds = int(
+            np.clip(
+                np.percentile(expected_rounds, 90) + MIN_BLOCK_TURNS // 2,
+                MIN_BLOCK_TURNS // 2,
+                max(min(MAX_BLOCK_TURNS, BLOCK_SIZE // active.size) // 2, 1),
+            )
+        )
+        roll = rng.integers(0, ROLL_RANGE, (rounds, 2, active.size), dtype=np.uint16)
+        taken_1 = np.empty(roll.shape, dtype=np.int32)
+        taken_2 = np.empty(roll.shape, dtype=np.int32)
+        np.less(roll[:, 0], counter_roll, out=taken_1[:, 0])
+        np.less(roll[:, 1], counter_roll, out=taken_2[:, 1])
+        np.greater_equal(roll[:, 0], land_roll_1[active], out=taken_2[:, 0])
+        taken_2[:, 0] += roll[:, 0] >= crit_roll_1[active]
+        np.greater_equal(roll[:, 1], land_roll_2[active], out=taken_1[:, 1])
+        taken_1[:, 1] += roll[:, 1] >= crit_roll_2[active]
+
+        # Strikes taken by the end of each turn. Adding turn by turn is faster than np.cumsum.
+        taken_1 = taken_1.reshape(2 * rounds, active.size)
+        taken_2 = taken_2.reshape(2 * rounds, active.size)
+        for turn in range(1, 2 * rounds):
+            taken_1[turn] += taken_1[turn - 1]
+            taken_2[turn] += taken_2[turn - 1]
+        fallen_2 = taken_2 >= strikes_left_2[active]
+        ended = (taken_1 >= strikes_left_1[active]) | fallen_2
+
+        finished = ended.any(axis=0)
+        columns = np.flatnonzero(finished)
+        last_turns = ended[:, columns].argmax(axis=0)
+        turns[active[columns]] = first_turn + last_turns
+        nft1_wins[active[columns]] = fallen_2[last_turns, columns]
+
+        strikes_left_1[active] -= taken_1[-1]
+        strikes_left_2[active] -= taken_2[-1]
+        active = active[~finished]
+        first_turn += 2 * rounds
+
+    return nft1_wins, turns
+
+
+def wilson_interval(wins: int, trials: int, z: float = CONFIDENCE_Z) -> tuple[float, float]:
+    """Compute the Wilson score confidence interval of a win rate.
+
+    Args:
+        wins: Number of battles won
+        trials: Number of battles
+        z: z-score of the confidence level, 1.96 for 95%
+
+    Returns:
+        tuple[float, float]: The lower and upper bounds of the win rate.
+
+    """
+    rate = wins / trials
+    denominator = 1 + z**2 / trials
+    center = (rate + z**2 / (2 * trials)) / denominator
+    margin = z * math.sqrt(rate * (1 - rate) / trials + z**2 / (4 * trials**2)) / denominator
+    return max(0.0, center - margin), min(1.0, center + margin)
+
+
+@dataclass(frozen=True)
+class BattleBatchResult(ActionResult):
+    """Outcome of many simulated battles between two NFTs.
+
+    Attributes:
+        nft1_price: Price of NFT 1 in USD
+        nft2_price: Price of NFT 2 in USD
+        trials: Number of battles simulated
+        nft1_wins: Number of battles NFT 1 won
+        confidence_interval: 95% confidence interval of NFT 1's win rate
+        turns_mean: Mean number of turns of a battle
+        turns_percentiles: Number of turns of a battle at each of TURN_PERCENTILES
+        turns_min: Fewest turns a battle lasted
+        turns_max: Most turns a battle lasted
+
+    """
+
+    nft1_price: float
+    nft2_price: float
+    trials: int
+    nft1_wins: int
+    confidence_interval: tuple[float, float]
+    turns_mean: float
+    turns_percentiles: dict[int, float]
+    turns_min: int
+    turns_max: int
+
+    @property
+    def win_rate(self) -> float:
+        """Fraction of the battles NFT 1 won."""
+        return self.nft1_wins / self.trials
+
+    def render(self) -> str:
+        """Render the outcome as the message given to the LLM.
+
+        Returns:
+            str: The message.
+
+        """
+        low, high = self.confidence_interval
+        percentiles = ", ".join(
+            f"p{percentile} {turns:g}" for percentile, turns in self.turns_percentiles.items()
+        )
+        return "\n".join(
+            [
+                f"🏆 **Simulated {self.trials} NFT battles**",
+                f"🔹 **NFT 1** (${self.nft1_price}) wins {self.win_rate:.2%} "
+                f"(95% confidence interval {low:.2%} to {high:.2%})",
+                f"🔸 **NFT 2** (${self.nft2_price}) wins {1 - self.win_rate:.2%}",
+                f"⏱️ **Turns:** mean {self.turns_mean:.1f}, {percentiles}, "
+                f"min {self.turns_min}, max {self.turns_max}",
+            ]
+        )
+
+
+def simulate_battle_batch(
+    nft1_price: float, nft2_price: float, trials: int = 10000, seed: int | None = None
+) -> BattleBatchResult:
+    """Simulate many NFT battles and summarize who wins and how long battles last.
+
+    Each battle generates its own stats, with the same random variance as `simulate_battle`.
+
+    Args:
+        nft1_price (float): The price of NFT 1 in USD.
+        nft2_price (float): The price of NFT 2 in USD.
+        trials (int): The number of battles to simulate.
+        seed (int | None): (Optional) Seed of the random generator, for reproducible results.
+
+    Returns:
+        BattleBatchResult: NFT 1's win rate and its confidence interval, and the distribution of
+            the number of turns.
+
+    Raises:
+        ValueError: If the number of battles is not positive.
+
+    """
+    if trials < 1:
+        raise ValueError("The number of battles must be positive.")
+
+    np = import_numpy()
+    rng = np.random.default_rng(seed)
+
+    nft1 = generate_nft_stats_batch(np.full(trials, float(nft1_price)), rng)
+    nft2 = generate_nft_stats_batch(np.full(trials, float(nft2_price)), rng)
+    nft1_wins, turns = simulate_battles(nft1, nft2, rng)
+
+    wins = int(nft1_wins.sum())
+    return BattleBatchResult(
+        nft1_price=nft1_price,
+        nft2_price=nft2_price,
+        trials=trials,
+        nft1_wins=wins,
+        confidence_interval=wilson_interval(wins, trials),
+        turns_mean=float(turns.mean()),
+        turns_percentiles=dict(
+            zip(
+                TURN_PERCENTILES,
+                (float(turns) for turns in np.percentile(turns, TURN_PERCENTILES)),
+                strict=True,
+            )
+        ),
+        turns_min=int(turns.min()),
+        turns_max=int(turns.max()),
+    )
+
+
+class SimulationBattleBatchAction(CdpAction):
+    """Simulate many NFT battles action."""
+
+    name: str = "simulate_battle_batch"
+    description: str = SIMULATION_BATTLE_BATCH_PROMPT
+    args_schema: type[BaseModel] | None = SimulationBattleBatchInput
+    func: Callable[..., BattleBatchResult] = simulate_battle_batch
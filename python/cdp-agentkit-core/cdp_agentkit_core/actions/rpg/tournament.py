@@ -0,0 +1,304 @@
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any, Literal
+
+from pydantic import BaseModel, Field
+
+from cdp_agentkit_core.actions import CdpAction
+from cdp_agentkit_core.actions.numpy_import import import_numpy
+from cdp_agentkit_core.actions.read_client import read_client
+from cdp_agentkit_core.actions.result import ActionResult
+from cdp_agentkit_core.actions.rpg.get_nft_price import get_nft_price
+from cdp_agentkit_core.actions.rpg.simulate_battle_batch import (
+    generate_nft_stats_batch,
+    simulate_battles,
+)
+
+RUN_TOURNAMENT_PROMPT = """
+This tool runs a tournament between many NFTs, with the same battle rules, and randomly varied stats, as simulate_battle.
+It takes either the prices of the NFTs in USD, or their unique identifiers (contract address or token ID) to fetch their prices, and the tournament format:
+- `round_robin`: every NFT battles every other NFT once.
+- `bracket`: a single elimination bracket, seeded by price, where the winner of each battle advances.
+It returns a leaderboard of the NFTs with their Elo ratings, wins and losses.
+"""
+
+# Most NFTs in a tournament.
+MAX_TOURNAMENT_NFTS = 1000
+
+# Elo rating of every NFT before its first battle, and most rating points changing hands in a
+# battle.
+ELO_INITIAL_RATING = 1500
+ELO_K_FACTOR = 32
+
+# Number of NFTs shown in the rendered leaderboard.
+LEADERBOARD_SIZE = 10
+
+
+class RunTournamentInput(BaseModel):
+    """Input argument schema for running an NFT tournament."""
+
+    nft_prices: list[float] | None = Field(
+        None,
+        min_length=2,
+        max_length=MAX_TOURNAMENT_NFTS,
+        description="The prices of the NFTs in USD.",
+    )
+    nft_ids: list[str] | None = Field(
+        None,
+        min_length=2,
+        max_length=MAX_TOURNAMENT_NFTS,
+        description="The unique identifiers (contract address or token ID) of the NFTs, to fetch their prices instead of passing them.",
+    )
+    tournament_format: Literal["round_robin", "bracket"] = Field(
+        "round_robin", description="The tournament format, `round_robin` or `bracket`."
+    )
+    seed: int | None = Field(
+        None,
+        ge=0,
+        description="The seed of the tournament, to run it again. Omit it for a new one.",
+    )
+
+
+@dataclass(frozen=True)
+class Standing:
+    """Standing of an NFT at the end of a tournament.
+
+    Attributes:
+        nft: Name of the NFT, its unique identifier if given
+        price: Price of the NFT in USD
+        rating: Elo rating of the NFT
+        wins: Number of battles the NFT won
+        losses: Number of battles the NFT lost
+
+    """
+
+    nft: str
+    price: float
+    rating: float
+    wins: int
+    losses: int
+
+
+@dataclass(frozen=True)
+class TournamentResult(ActionResult):
+    """Leaderboard of an NFT tournament.
+
+    Attributes:
+        tournament_format: Format of the tournament, `round_robin` or `bracket`
+        standings: Standing of each NFT, from first to last
+        battles: Number of battles of the tournament
+        rounds: Number of rounds of the tournament
+
+    """
+
+    tournament_format: Literal["round_robin", "bracket"]
+    standings: list[Standing]
+    battles: int
+    rounds: int
+
+    @property
+    def champion(self) -> Standing:
+        """Standing of the NFT that won the tournament."""
+        return self.standings[0]
+
+    def render(self) -> str:
+        """Render the leaderboard as the message given to the LLM.
+
+        Returns:
+            str: The message.
+
+        """
+        name = "Round robin" if self.tournament_format == "round_robin" else "Bracket"
+        lines = [
+            f"🏆 **{name} tournament of {len(self.standings)} NFTs:** "
+            f"{self.battles} battles over {self.rounds} rounds",
+            f"🥇 **Champion:** {self.champion.nft} (${self.champion.price}), "
+            f"Elo {self.champion.rating:.0f}",
+            "📋 **Leaderboard:**",
+        ]
+        lines.extend(
+            f"{rank}. {standing.nft} (${standing.price}): Elo {standing.rating:.0f}, "
+            f"{standing.wins} wins, {standing.losses} losses"
+            for rank, standing in enumerate(self.standings[:LEADERBOARD_SIZE], start=1)
+        )
+        if len(self.standings) > LEADERBOARD_SIZE:
+            lines.append(f"... and {len(self.standings) - LEADERBOARD_SIZE} more NFTs")
+        return "\n".join(lines)
+
+
+def round_robin_rounds(entrants: int) -> tuple[Any, Any]:
+    """Schedule a round robin, where every entrant meets every other once.
+
+    Rounds follow the circle method: entrant 0 stays in place while the others rotate by one
+    position each round, and each position meets the opposite one. An odd number of entrants
+    gets a bye, one entrant sitting out each round.
+
+    Args:
+        entrants: Number of entrants
+
+    Returns:
+        tuple[Any, Any]: The entrants meeting in each pairing of each round, as two arrays
+            indexed by round and pairing.
+
+    """
+    np = import_numpy()
+
+    # A bye is an extra entrant, whose pairings are left out.
+    slots = entrants + entrants % 2
+    rounds = np.arange(slots - 1).reshape(-1, 1)
+    rotated = 1 + (rounds + np.arange(slots - 1)) % (slots - 1)
+    order = np.concatenate([np.zeros_like(rounds), rotated], axis=1)
+    first, second = order[:, : slots // 2], order[:, : slots // 2 - 1 : -1]
+
+    if slots > entrants:
+        played = (first != entrants) & (second != entrants)
+        first = first[played].reshape(slots - 1, -1)
+        second = second[played].reshape(slots - 1, -1)
+    return first, second
+
+
+def bracket_order(size: int) -> list[int]:
+    """Order the seeds of a single elimination bracket, so the best seeds meet last.
+
+    Args:
+        size: Number of slots of the bracket, a power of two
+
+    Returns:
+        list[int]: The seed, from 0 for the best, in each slot of the bracket. Slots 2k and
+            2k + 1 meet in the first round.
+
+    """
+    order = [0]
+    while len(order) < size:
+        order = [seed for top in order for seed in (top, 2 * len(order) - 1 - top)]
+    return order
+
+
+def _battle(prices: Any, first: Any, second: Any, rng: Any) -> Any:
+    """Battle pairs of entrants, returning whether the first of each pair won."""
+    np = import_numpy()
+
+    # Which NFT attacks first is drawn, as attacking first is an advantage.
+    swap = rng.random(first.shape) < 0.5
+    attackers, defenders = np.where(swap, second, first), np.where(swap, first, second)
+    nft1_wins, _ = simulate_battles(
+        generate_nft_stats_batch(prices[attackers], rng),
+        generate_nft_stats_batch(prices[defenders], rng),
+        rng,
+    )
+    return nft1_wins ^ swap
+
+
+def _update_ratings(ratings: Any, first: Any, second: Any, first_wins: Any) -> None:
+    """Update the Elo ratings of the entrants of a round, each battling at most once."""
+    expected = 1 / (1 + 10 ** ((ratings[second] - ratings[first]) / 400))
+    change = ELO_K_FACTOR * (first_wins - expected)
+    ratings[first] += change
+    ratings[second] -= change
+
+
+def run_tournament(
+    nft_prices: list[float] | None = None,
+    nft_ids: list[str] | None = None,
+    tournament_format: Literal["round_robin", "bracket"] = "round_robin",
+    seed: int | None = None,
+) -> TournamentResult:
+    """Run a tournament between NFTs, and rank them with Elo ratings.
+
+    Each battle generates its own stats and follows the rules of `simulate_battle`, with which NFT
+    attacks first drawn at random. All battles of a round robin, or of each round of a bracket,
+    are simulated at once in the vectorized engine of `simulate_battle_batch`. Ratings are then
+    updated round by round, in the order battles were scheduled.
+
+    Args:
+        nft_prices (list[float] | None): The prices of the NFTs in USD.
+        nft_ids (list[str] | None): The unique identifiers of the NFTs, to fetch their prices
+            instead of passing them.
+        tournament_format (Literal["round_robin", "bracket"]): `round_robin` for every NFT to
+            battle every other once, or `bracket` for a single elimination bracket seeded by price.
+        seed (int | None): (Optional) Seed of the random generator, for reproducible results.
+
+    Returns:
+        TournamentResult: The standings of the NFTs, ordered by Elo rating in a round robin, and
+            by the rounds won, then Elo rating, in a bracket.
+
+    Raises:
+        ValueError: If not exactly one of `nft_prices` and `nft_ids` is given, or fewer than two
+            NFTs are, or no price is found for an NFT.
+        requests.RequestException: If fetching the price of an NFT fails.
+
+    """
+    if (nft_prices is None) == (nft_ids is None):
+        raise ValueError("Either the prices or the IDs of the NFTs must be given.")
+    if nft_ids is not None:
+        nft_prices = list(read_client.executor.map(get_nft_price, nft_ids))
+        names = list(nft_ids)
+    else:
+        names = [f"NFT {index + 1}" for index in range(len(nft_prices))]
+    if len(nft_prices) < 2:
+        raise ValueError("A tournament needs at least two NFTs.")
+
+    np = import_numpy()
+    rng = np.random.default_rng(seed)
+    prices = np.asarray(nft_prices, dtype=float)
+    ratings = np.full(prices.size, float(ELO_INITIAL_RATING))
+    wins = np.zeros(prices.size, dtype=np.int64)
+    losses = np.zeros(prices.size, dtype=np.int64)
+
+    def play(first: Any, second: Any, first_wins: Any) -> None:
+        _update_ratings(ratings, first, second, first_wins)
+        winners, losers = np.where(first_wins, first, second), np.where(first_wins, second, first)
+        np.add.at(wins, winners, 1)
+        np.add.at(losses, losers, 1)
+
+    if tournament_format == "round_robin":
+        first, second = round_robin_rounds(prices.size)
+        first_wins = _battle(prices, first.ravel(), second.ravel(), rng).reshape(first.shape)
+        for round_first, round_second, round_first_wins in zip(
+            first, second, first_wins, strict=True
+        ):
+            play(round_first, round_second, round_first_wins)
+        rounds = first.shape[0]
+        order = np.lexsort((-wins, -ratings))
+    else:
+        # Slots without an entrant are byes, whose opponent advances without a battle.
+        seeds = np.argsort(-prices, kind="stable")
+        size = 1 << (prices.size - 1).bit_length()
+        slots = np.array(
+            [seeds[seed] if seed < prices.size else -1 for seed in bracket_order(size)]
+        )
+        rounds = 0
+        while slots.size > 1:
+            first, second = slots[0::2], slots[1::2]
+            fought = (first >= 0) & (second >= 0)
+            first_wins = second < 0
+            first_wins[fought] = _battle(prices, first[fought], second[fought], rng)
+            play(first[fought], second[fought], first_wins[fought])
+            slots = np.where(first_wins, first, second)
+            rounds += 1
+        order = np.lexsort((-ratings, -wins))
+
+    return TournamentResult(
+        tournament_format=tournament_format,
+        standings=[
+            Standing(
+                nft=names[index],
+                price=nft_prices[index],
+                rating=float(ratings[index]),
+                wins=int(wins[index]),
+                losses=int(losses[index]),
+            )
+            for index in order
+        ],
+        battles=int(wins.sum()),
+        rounds=rounds,
+    )
+
+
+class RunTournamentAction(CdpAction):
+    """Run an NFT tournament action."""
+
+    name: str = "run_tournament"
+    description: str = RUN_TOURNAMENT_PROMPT
+    args_schema: type[BaseModel] | None = RunTournamentInput
+    func: Callable[..., TournamentResult] = run_tournament
@@ -0,0 +1,145 @@
+import asyncio
+import json
+import threading
+from collections.abc import Callable, Hashable
+from concurrent.futures import Executor, Future
+from typing import Any
+
+from cdp_agentkit_core.actions.tracing import tracer
+
+# Block tag of contract reads. `SmartContract.read` always reads the latest block.
+LATEST_BLOCK_TAG = "latest"
+
+
+def contract_read_key(
+    network_id: str,
+    contract_address: str,
+    method: str,
+    args: dict | None = None,
+    block_tag: str = LATEST_BLOCK_TAG,
+) -> tuple:
+    """Build the key identifying identical contract reads.
+
+    Args:
+        network_id: Network ID, such as `base-sepolia`
+        contract_address: Address of the contract to read from
+        method: Name of the view method to call
+        args: (Optional) Arguments of the method
+        block_tag: (Optional) Block the read is made at
+
+    Returns:
+        tuple: The key of the read.
+
+    """
+    return (
+        network_id,
+        contract_address.lower(),
+        method,
+        json.dumps(args or {}, sort_keys=True, default=str),
+        block_tag,
+    )
+
+
+class SingleFlight:
+    """Shares one in-flight call, and its result or error, between identical concurrent calls.
+
+    Calls are identified by a key, and a call made while another call with the same key is in
+    flight waits for that call instead of running again. Results are only shared while in flight,
+    never cached. Every call is counted in `calls`, and calls that waited in `deduplicated`.
+    """
+
+    def __init__(self, name: str = "single_flight"):
+        self.name = name
+        self.calls = 0
+        self.deduplicated = 0
+        self._in_flight: dict[Hashable, Future] = {}
+        self._lock = threading.Lock()
+
+    def _join(self, key: Hashable) -> tuple[Future, bool]:
+        """Join the in-flight call of a key, or register a new one.
+
+        Returns:
+            tuple[Future, bool]: The future of the call, and whether the caller must make the call.
+
+        """
+        with self._lock:
+            self.calls += 1
+            future = self._in_flight.get(key)
+            if future is None:
+                future = self._in_flight[key] = Future()
+                return future, True
+            self.deduplicated += 1
+
+        tracer.count(f"{self.name}.deduplicated")
+        return future, False
+
+    def _lead(self, key: Hashable, future: Future, fn: Callable[[], Any]) -> Any:
+        """Make a registered call, sharing its result or error through its future."""
+        try:
+            result = fn()
+        except BaseException as error:
+            future.set_exception(error)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                del self._in_flight[key]
+
+    def do(self, key: Hashable, fn: Callable[[], Any]) -> Any:
+        """Call a function, or wait for an identical call that is already in flight.
+
+        Args:
+            key: Key identifying identical calls
+            fn: Function to call
+
+        Returns:
+            Any: The result of the call, shared with identical concurrent calls.
+
+        """
+        future, is_leader = self._join(key)
+        if is_leader:
+            return self._lead(key, future, fn)
+        return future.result()
+
+    async def ado(self, key: Hashable, fn: Callable[[], Any], executor: Executor) -> Any:
+        """Call a blocking function in an executor, or await an identical in-flight call.
+
+        Awaiting callers do not hold an executor thread while an identical call is in flight, and
+        share calls with `do` callers of the same key.
+
+        Args:
+            key: Key identifying identical calls
+            fn: Blocking function to call
+            executor: Executor to call the function in
+
+        Returns:
+            Any: The result of the call, shared with identical concurrent calls.
+
+        """
+        future, is_leader = self._join(key)
+        if is_leader:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(executor, self._lead, key, future, fn)
+        return await asyncio.wrap_future(future)
+
+    def stats(self) -> dict[str, int]:
+        """Report how many calls were made and how many of them were deduplicated.
+
+        Returns:
+            dict[str, int]: The `calls`, `deduplicated` and currently `in_flight` call counts.
+
+        """
+        with self._lock:
+            return {
+                "calls": self.calls,
+                "deduplicated": self.deduplicated,
+                "in_flight": len(self._in_flight),
+            }
+
+    def reset_stats(self) -> None:
+        """Reset the call counters."""
+        with self._lock:
+            self.calls = 0
+            self.deduplicated = 0
@@ -1,10 +1,11 @@
 from collections.abc import Callable
-from json import dumps
 
 import tweepy
 from pydantic import BaseModel
 
+from cdp_agentkit_core.actions.result import ActionFailure
 from cdp_agentkit_core.actions.social.twitter.action import TwitterAction
+from cdp_agentkit_core.actions.social.twitter.result import TwitterResult
 
 ACCOUNT_DETAILS_PROMPT = """
 This tool will return account details for the currently authenticated Twitter (X) user context.
@@ -23,30 +24,28 @@ class AccountDetailsInput(BaseModel):
     """Input argument schema for Twitter account details action."""
 
 
-def account_details(client: tweepy.Client) -> str:
+def account_details(client: tweepy.Client) -> TwitterResult | ActionFailure:
     """Get the authenticated Twitter (X) user account details.
 
     Args:
         client (tweepy.Client): The Twitter (X) client used to authenticate with.
 
     Returns:
-        str: A message containing account details for the authenticated user context.
+        TwitterResult | ActionFailure: The API response, rendering to a message containing account
+            details for the authenticated user context.
 
     """
-    message = ""
-
     try:
         response = client.get_me()
-        data = response["data"]
-        data["url"] = f"https://x.com/{data['username']}"
-
-        message = (
-            f"""Successfully retrieved authenticated user account details:\n{dumps(response)}"""
-        )
     except tweepy.errors.TweepyException as e:
-        message = f"Error retrieving authenticated user account details:\n{e}"
+        return ActionFailure(f"Error retrieving authenticated user account details:\n{e}", e)
+
+    data = response["data"]
+    data["url"] = f"https://x.com/{data['username']}"
 
-    return message
+    return TwitterResult(
+        summary="Successfully retrieved authenticated user account details", response=response
+    )
 
 
 class AccountDetailsAction(TwitterAction):
@@ -55,4 +54,4 @@ class AccountDetailsAction(TwitterAction):
     name: str = "account_details"
     description: str = ACCOUNT_DETAILS_PROMPT
     args_schema: type[BaseModel] | None = AccountDetailsInput
-    func: Callable[..., str] = account_details
+    func: Callable[..., TwitterResult | ActionFailure] = account_details
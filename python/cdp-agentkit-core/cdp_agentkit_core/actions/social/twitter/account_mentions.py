@@ -1,10 +1,11 @@
 from collections.abc import Callable
-from json import dumps
 
 import tweepy
 from pydantic import BaseModel, Field
 
+from cdp_agentkit_core.actions.result import ActionFailure
 from cdp_agentkit_core.actions.social.twitter.action import TwitterAction
+from cdp_agentkit_core.actions.social.twitter.result import TwitterResult
 
 ACCOUNT_MENTIONS_PROMPT = """
 This tool will return account mentions for the currently authenticated Twitter (X) user context.
@@ -29,7 +30,7 @@ class AccountMentionsInput(BaseModel):
     )
 
 
-def account_mentions(client: tweepy.Client, account_id: str) -> str:
+def account_mentions(client: tweepy.Client, account_id: str) -> TwitterResult | ActionFailure:
     """Get the authenticated Twitter (X) user account mentions.
 
     Args:
@@ -37,20 +38,20 @@ def account_mentions(client: tweepy.Client, account_id: str) -> str:
         account_id (str): The Twitter (X) account id to  get mentions for.
 
     Returns:
-        str: A message containing account mentions for the authenticated user context.
+        TwitterResult | ActionFailure: The API response, rendering to a message containing account
+            mentions for the authenticated user context.
 
     """
-    message = ""
-
     print(f"attempting to get mentions for account_id: {account_id}")
 
     try:
         response = client.get_users_mentions(account_id)
-        message = f"Successfully retrieved authenticated user account mentions:\n{dumps(response)}"
     except tweepy.errors.TweepyException as e:
-        message = f"Error retrieving authenticated user account mentions:\n{e}"
+        return ActionFailure(f"Error retrieving authenticated user account mentions:\n{e}", e)
 
-    return message
+    return TwitterResult(
+        summary="Successfully retrieved authenticated user account mentions", response=response
+    )
 
 
 class AccountMentionsAction(TwitterAction):
@@ -59,4 +60,4 @@ class AccountMentionsAction(TwitterAction):
     name: str = "account_mentions"
     description: str = ACCOUNT_MENTIONS_PROMPT
     args_schema: type[BaseModel] | None = AccountMentionsInput
-    func: Callable[..., str] = account_mentions
+    func: Callable[..., TwitterResult | ActionFailure] = account_mentions
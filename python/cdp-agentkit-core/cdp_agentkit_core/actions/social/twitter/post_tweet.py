@@ -1,10 +1,11 @@
 from collections.abc import Callable
-from json import dumps
 
 import tweepy
 from pydantic import BaseModel, Field
 
+from cdp_agentkit_core.actions.result import ActionFailure
 from cdp_agentkit_core.actions.social.twitter import TwitterAction
+from cdp_agentkit_core.actions.social.twitter.result import TwitterResult
 
 POST_TWEET_PROMPT = """
 This tool will post a tweet on Twitter. The tool takes the text of the tweet as input. Tweets can be maximum 280 characters.
@@ -27,7 +28,7 @@ class PostTweetInput(BaseModel):
     )
 
 
-def post_tweet(client: tweepy.Client, tweet: str) -> str:
+def post_tweet(client: tweepy.Client, tweet: str) -> TwitterResult | ActionFailure:
     """Post tweet to Twitter.
 
     Args:
@@ -35,18 +36,16 @@ def post_tweet(client: tweepy.Client, tweet: str) -> str:
         tweet (str): The text of the tweet to post to twitter. Tweets can be maximum 280 characters.
 
     Returns:
-        str: A message containing the result of the post action and the tweet.
+        TwitterResult | ActionFailure: The API response, rendering to a message containing the
+            result of the post action and the tweet.
 
     """
-    message = ""
-
     try:
         response = client.create_tweet(text=tweet)
-        message = f"Successfully posted to Twitter:\n{dumps(response)}"
     except tweepy.errors.TweepyException as e:
-        message = f"Error posting to Twitter:\n{e}"
+        return ActionFailure(f"Error posting to Twitter:\n{e}", e)
 
-    return message
+    return TwitterResult(summary="Successfully posted to Twitter", response=response)
 
 
 class PostTweetAction(TwitterAction):
@@ -55,4 +54,4 @@ class PostTweetAction(TwitterAction):
     name: str = "post_tweet"
     description: str = POST_TWEET_PROMPT
     args_schema: type[BaseModel] | None = PostTweetInput
-    func: Callable[..., str] = post_tweet
+    func: Callable[..., TwitterResult | ActionFailure] = post_tweet
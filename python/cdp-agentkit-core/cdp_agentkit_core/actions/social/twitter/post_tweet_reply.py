@@ -1,10 +1,11 @@
 from collections.abc import Callable
-from json import dumps
 
 import tweepy
 from pydantic import BaseModel, Field
 
+from cdp_agentkit_core.actions.result import ActionFailure
 from cdp_agentkit_core.actions.social.twitter import TwitterAction
+from cdp_agentkit_core.actions.social.twitter.result import TwitterResult
 
 POST_TWEET_REPLY_PROMPT = """
 This tool will post a reply to a tweet on Twitter. The tool takes the text of the reply and the tweet id to reply to as input. Tweets can be maximum 280 characters.
@@ -32,7 +33,9 @@ class PostTweetReplyInput(BaseModel):
     )
 
 
-def post_tweet_reply(client: tweepy.Client, tweet_id: str, tweet_reply: str) -> str:
+def post_tweet_reply(
+    client: tweepy.Client, tweet_id: str, tweet_reply: str
+) -> TwitterResult | ActionFailure:
     """Post tweet reply to Twitter.
 
     Args:
@@ -41,18 +44,16 @@ def post_tweet_reply(client: tweepy.Client, tweet_id: str, tweet_reply: str) ->
         tweet_reply (str): The text of the reply to post in response to a tweet on twitter.
 
     Returns:
-        str: A message containing the result of the reply action and any associated data.
+        TwitterResult | ActionFailure: The API response, rendering to a message containing the
+            result of the reply action and any associated data.
 
     """
-    message = ""
-
     try:
         response = client.create_tweet(in_reply_to_tweet_id=tweet_id, text=tweet_reply)
-        message = f"Successfully posted reply to Twitter:\n{dumps(response)}"
     except tweepy.errors.TweepyException as e:
-        message = f"Error posting reply to Twitter:\n{e}"
+        return ActionFailure(f"Error posting reply to Twitter:\n{e}", e)
 
-    return message
+    return TwitterResult(summary="Successfully posted reply to Twitter", response=response)
 
 
 class PostTweetReplyAction(TwitterAction):
@@ -61,4 +62,4 @@ class PostTweetReplyAction(TwitterAction):
     name: str = "post_tweet_reply"
     description: str = POST_TWEET_REPLY_PROMPT
     args_schema: type[BaseModel] | None = PostTweetReplyInput
-    func: Callable[..., str] = post_tweet_reply
+    func: Callable[..., TwitterResult | ActionFailure] = post_tweet_reply
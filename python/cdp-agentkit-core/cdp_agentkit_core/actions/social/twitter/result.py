@@ -0,0 +1,28 @@
+from dataclasses import dataclass
+from json import dumps
+from typing import Any
+
+from cdp_agentkit_core.actions.result import ActionResult
+
+
+@dataclass(frozen=True)
+class TwitterResult(ActionResult):
+    """Response of a Twitter (X) API call made by an action.
+
+    Attributes:
+        summary: What the action did, e.g. `Successfully posted to Twitter`
+        response: JSON payload returned by the Twitter (X) API
+
+    """
+
+    summary: str
+    response: dict[str, Any]
+
+    def render(self) -> str:
+        """Render the response as the message given to the LLM.
+
+        Returns:
+            str: The message.
+
+        """
+        return f"{self.summary}:\n{dumps(self.response)}"
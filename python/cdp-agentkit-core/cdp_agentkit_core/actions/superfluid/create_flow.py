@@ -4,9 +4,11 @@ from cdp import Wallet
 from pydantic import BaseModel, Field
 
 from cdp_agentkit_core.actions import CdpAction
+from cdp_agentkit_core.actions.result import ActionFailure
 from cdp_agentkit_core.actions.superfluid.constants import (
     CREATE_ABI,
 )
+from cdp_agentkit_core.actions.superfluid.result import FlowResult
 
 SUPERFLUID_CREATE_FLOW_PROMPT = """
 This tool will create a money flow to a specified token recipient using Superfluid. Do not use this tool for any other purpose, or trading other assets.
@@ -35,7 +37,7 @@ class SuperfluidCreateFlowInput(BaseModel):
 
 def superfluid_create_flow(
     wallet: Wallet, recipient: str, token_address: str, flow_rate: str
-) -> str:
+) -> FlowResult | ActionFailure:
     """Create a money flow using Superfluid.
 
     Args:
@@ -45,7 +47,8 @@ def superfluid_create_flow(
         flow_rate (str): Rate of token flow in wei per second.
 
     Returns:
-        str: Confirmation of flow creation.
+        FlowResult | ActionFailure: The flow's transaction, rendering to a confirmation of flow
+            creation.
 
     """
     try:
@@ -63,11 +66,17 @@ def superfluid_create_flow(
         )
 
         invocation.wait()
-
-        return f"Flow created successfully. Result: {invocation}"
-
     except Exception as e:
-        return f"Error creating flow: {e!s}"
+        return ActionFailure(f"Error creating flow: {e!s}", e)
+
+    return FlowResult(
+        operation="created",
+        recipient=recipient,
+        token_address=token_address,
+        invocation=invocation,
+        transaction_hash=invocation.transaction_hash,
+        transaction_link=invocation.transaction_link,
+    )
 
 
 class SuperfluidCreateFlowAction(CdpAction):
@@ -76,4 +85,4 @@ class SuperfluidCreateFlowAction(CdpAction):
     name: str = "superfluid_create_flow"
     description: str = SUPERFLUID_CREATE_FLOW_PROMPT
     args_schema: type[BaseModel] | None = SuperfluidCreateFlowInput
-    func: Callable[..., str] = superfluid_create_flow
+    func: Callable[..., FlowResult | ActionFailure] = superfluid_create_flow
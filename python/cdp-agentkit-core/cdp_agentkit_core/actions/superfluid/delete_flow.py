@@ -4,9 +4,11 @@ from cdp import Wallet
 from pydantic import BaseModel, Field
 
 from cdp_agentkit_core.actions import CdpAction
+from cdp_agentkit_core.actions.result import ActionFailure
 from cdp_agentkit_core.actions.superfluid.constants import (
     DELETE_ABI,
 )
+from cdp_agentkit_core.actions.superfluid.result import FlowResult
 
 SUPERFLUID_DELETE_FLOW_PROMPT = """
 This tool will delete an existing money flow to a token recipient using Superfluid. Do not use this tool for any other purpose, or trading other assets.
@@ -25,7 +27,9 @@ class SuperfluidDeleteFlowInput(BaseModel):
     token_address: str = Field(..., description="The address of the token being flowed")
 
 
-def superfluid_delete_flow(wallet: Wallet, recipient: str, token_address: str) -> str:
+def superfluid_delete_flow(
+    wallet: Wallet, recipient: str, token_address: str
+) -> FlowResult | ActionFailure:
     """Delete an existing money flow using Superfluid.
 
     Args:
@@ -34,7 +38,8 @@ def superfluid_delete_flow(wallet: Wallet, recipient: str, token_address: str) -
         token_address (str): Address of the token being streamed.
 
     Returns:
-        str: Confirmation of flow closure.
+        FlowResult | ActionFailure: The flow's transaction, rendering to a confirmation of flow
+            closure.
 
     """
     try:
@@ -51,10 +56,17 @@ def superfluid_delete_flow(wallet: Wallet, recipient: str, token_address: str) -
         )
 
         invocation.wait()
-
-        return f"Flow deleted successfully. Result: {invocation}"
     except Exception as e:
-        return f"Error deleting flow: {e!s}"
+        return ActionFailure(f"Error deleting flow: {e!s}", e)
+
+    return FlowResult(
+        operation="deleted",
+        recipient=recipient,
+        token_address=token_address,
+        invocation=invocation,
+        transaction_hash=invocation.transaction_hash,
+        transaction_link=invocation.transaction_link,
+    )
 
 
 class SuperfluidDeleteFlowAction(CdpAction):
@@ -63,4 +75,4 @@ class SuperfluidDeleteFlowAction(CdpAction):
     name: str = "superfluid_delete_flow"
     description: str = SUPERFLUID_DELETE_FLOW_PROMPT
     args_schema: type[BaseModel] | None = SuperfluidDeleteFlowInput
-    func: Callable[..., str] = superfluid_delete_flow
+    func: Callable[..., FlowResult | ActionFailure] = superfluid_delete_flow
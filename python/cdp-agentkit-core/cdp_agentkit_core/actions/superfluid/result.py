@@ -0,0 +1,32 @@
+from dataclasses import dataclass
+
+from cdp import ContractInvocation
+
+from cdp_agentkit_core.actions.result import TransactionResult
+
+
+@dataclass(frozen=True)
+class FlowResult(TransactionResult):
+    """Created, updated or deleted Superfluid flow, with its transaction.
+
+    Attributes:
+        operation: What was done to the flow, e.g. `created`
+        recipient: Recipient's wallet address
+        token_address: Address of the token being streamed
+        invocation: Contract invocation that changed the flow
+
+    """
+
+    operation: str
+    recipient: str
+    token_address: str
+    invocation: ContractInvocation
+
+    def render(self) -> str:
+        """Render the flow change as the message given to the LLM.
+
+        Returns:
+            str: The message.
+
+        """
+        return f"Flow {self.operation} successfully. Result: {self.invocation}"
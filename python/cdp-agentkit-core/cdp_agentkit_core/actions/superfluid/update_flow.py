@@ -4,9 +4,11 @@ from cdp import Wallet
 from pydantic import BaseModel, Field
 
 from cdp_agentkit_core.actions import CdpAction
+from cdp_agentkit_core.actions.result import ActionFailure
 from cdp_agentkit_core.actions.superfluid.constants import (
     UPDATE_ABI,
 )
+from cdp_agentkit_core.actions.superfluid.result import FlowResult
 
 SUPERFLUID_UPDATE_FLOW_PROMPT = """
 This tool will update an existing money flow to a specified token recipient using Superfluid. Do not use this tool for any other purpose, or trading other assets.
@@ -35,7 +37,7 @@ class SuperfluidUpdateFlowInput(BaseModel):
 
 def superfluid_update_flow(
     wallet: Wallet, recipient: str, token_address: str, new_flow_rate: str
-) -> str:
+) -> FlowResult | ActionFailure:
     """Update an existing money flow using Superfluid.
 
     Args:
@@ -45,7 +47,8 @@ def superfluid_update_flow(
         new_flow_rate (str): New rate of token flow in wei per second.
 
     Returns:
-        str: Confirmation of flow update.
+        FlowResult | ActionFailure: The flow's transaction, rendering to a confirmation of flow
+            update.
 
     """
     try:
@@ -63,11 +66,17 @@ def superfluid_update_flow(
         )
 
         invocation.wait()
-
-        return f"Flow updated successfully. Result: {invocation}"
-
     except Exception as e:
-        return f"Error updating flow: {e!s}"
+        return ActionFailure(f"Error updating flow: {e!s}", e)
+
+    return FlowResult(
+        operation="updated",
+        recipient=recipient,
+        token_address=token_address,
+        invocation=invocation,
+        transaction_hash=invocation.transaction_hash,
+        transaction_link=invocation.transaction_link,
+    )
 
 
 class SuperfluidUpdateFlowAction(CdpAction):
@@ -76,4 +85,4 @@ class SuperfluidUpdateFlowAction(CdpAction):
     name: str = "superfluid_update_flow"
     description: str = SUPERFLUID_UPDATE_FLOW_PROMPT
     args_schema: type[BaseModel] | None = SuperfluidUpdateFlowInput
-    func: Callable[..., str] = superfluid_update_flow
+    func: Callable[..., FlowResult | ActionFailure] = superfluid_update_flow
@@ -0,0 +1,145 @@
+import os
+import threading
+import time
+from bisect import bisect_left
+from contextlib import contextmanager, nullcontext
+from dataclasses import dataclass, field
+
+# Upper bounds, in seconds, of the span duration histogram buckets. Durations above the last
+# bound are counted in an extra overflow bucket.
+DURATION_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+_NO_OP_SPAN = nullcontext()
+
+
+@dataclass
+class Histogram:
+    """Distribution of observed values over fixed buckets."""
+
+    buckets: tuple[float, ...] = DURATION_BUCKETS
+    count: int = 0
+    sum: float = 0.0
+    bucket_counts: list[int] = field(default_factory=lambda: [0] * (len(DURATION_BUCKETS) + 1))
+
+    def observe(self, value: float) -> None:
+        """Record a value.
+
+        Args:
+            value: The value to record
+
+        """
+        self.count += 1
+        self.sum += value
+        self.bucket_counts[bisect_left(self.buckets, value)] += 1
+
+
+class Tracer:
+    """Records span durations as histograms and events as counters.
+
+    Tracing is off by default, in which case `span` returns a shared no-op context manager and
+    `count` returns immediately, so instrumented code pays only an attribute check. It is turned
+    on with `enable`, or by setting the `CDP_AGENTKIT_TRACING` environment variable to `1`.
+    """
+
+    def __init__(self, enabled: bool = False):
+        self.enabled = enabled
+        self._counters: dict[str, int] = {}
+        self._histograms: dict[str, Histogram] = {}
+        self._lock = threading.Lock()
+
+    def enable(self) -> None:
+        """Start recording spans and counters."""
+        self.enabled = True
+
+    def disable(self) -> None:
+        """Stop recording spans and counters, keeping what was already recorded."""
+        self.enabled = False
+
+    def span(self, name: str):
+        """Time a block of code, recording its duration in the `name` histogram.
+
+        Spans that raise are also counted in the `{name}.errors` counter.
+
+        Args:
+            name: Name of the span, such as `wow.quote.pool_info`
+
+        Returns:
+            A context manager timing the block, or a no-op context manager if tracing is off.
+
+        """
+        if not self.enabled:
+            return _NO_OP_SPAN
+        return self._span(name)
+
+    @contextmanager
+    def _span(self, name: str):
+        start = time.perf_counter()
+        try:
+            yield
+        except BaseException:
+            self.count(f"{name}.errors")
+            raise
+        finally:
+            self.observe(name, time.perf_counter() - start)
+
+    def count(self, name: str, value: int = 1) -> None:
+        """Increment a counter.
+
+        Args:
+            name: Name of the counter, such as `wow.quote.quoter.errors`
+            value: (Optional) Amount to increment the counter by
+
+        """
+        if not self.enabled:
+            return
+        with self._lock:
+            self._counters[name] = self._counters.get(name, 0) + value
+
+    def observe(self, name: str, value: float) -> None:
+        """Record a value in a histogram.
+
+        Args:
+            name: Name of the histogram, such as `wow.quote.pool_info`
+            value: The value to record, in seconds for span durations
+
+        """
+        if not self.enabled:
+            return
+        with self._lock:
+            histogram = self._histograms.get(name)
+            if histogram is None:
+                histogram = self._histograms[name] = Histogram()
+            histogram.observe(value)
+
+    def snapshot(self) -> dict:
+        """Export the recorded counters and histograms.
+
+        Returns:
+            dict: A dict with `counters`, mapping names to counts, and `histograms`, mapping names
+                to their `count`, `sum` and cumulative `buckets` keyed by upper bound.
+
+        """
+        with self._lock:
+            histograms = {}
+            for name, histogram in self._histograms.items():
+                cumulative, buckets = 0, {}
+                for bound, bucket_count in zip(
+                    (*histogram.buckets, float("inf")), histogram.bucket_counts, strict=True
+                ):
+                    cumulative += bucket_count
+                    buckets[bound] = cumulative
+                histograms[name] = {
+                    "count": histogram.count,
+                    "sum": histogram.sum,
+                    "buckets": buckets,
+                }
+            return {"counters": dict(self._counters), "histograms": histograms}
+
+    def reset(self) -> None:
+        """Remove all recorded counters and histograms."""
+        with self._lock:
+            self._counters.clear()
+            self._histograms.clear()
+
+
+tracer = Tracer(enabled=os.environ.get("CDP_AGENTKIT_TRACING") == "1")
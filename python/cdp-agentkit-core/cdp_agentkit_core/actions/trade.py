@@ -1,9 +1,12 @@
 from collections.abc import Callable
+from dataclasses import dataclass
+from decimal import Decimal
 
 from cdp import Wallet
 from pydantic import BaseModel, Field
 
 from cdp_agentkit_core.actions import CdpAction
+from cdp_agentkit_core.actions.result import ActionFailure, TransactionResult
 
 TRADE_PROMPT = """
 This tool will trade a specified amount of a 'from asset' to a 'to asset' for the wallet.
@@ -36,7 +39,36 @@ class TradeInput(BaseModel):
     )
 
 
-def trade(wallet: Wallet, amount: str, from_asset_id: str, to_asset_id: str) -> str:
+@dataclass(frozen=True)
+class TradeResult(TransactionResult):
+    """Completed trade of one asset for another, with its transaction.
+
+    Attributes:
+        amount: Amount of the from asset traded
+        from_asset_id: Asset ID traded
+        to_amount: Amount of the to asset received
+        to_asset_id: Asset ID received
+
+    """
+
+    amount: str
+    from_asset_id: str
+    to_amount: Decimal
+    to_asset_id: str
+
+    def render(self) -> str:
+        """Render the trade as the message given to the LLM.
+
+        Returns:
+            str: The message.
+
+        """
+        return f"Traded {self.amount} of {self.from_asset_id} for {self.to_amount} of {self.to_asset_id}.\nTransaction hash for the trade: {self.transaction_hash}\nTransaction link for the trade: {self.transaction_link}"
+
+
+def trade(
+    wallet: Wallet, amount: str, from_asset_id: str, to_asset_id: str
+) -> TradeResult | ActionFailure:
     """Trade a specified amount of a from asset to a to asset for the wallet. Trades are only supported on Mainnets.
 
     Args:
@@ -46,7 +78,8 @@ def trade(wallet: Wallet, amount: str, from_asset_id: str, to_asset_id: str) ->
         to_asset_id (str): The from asset ID to trade (e.g., "eth", "usdc", or a valid contract address like "0x036CbD53842c5426634e7929541eC2318f3dCF7e").
 
     Returns:
-        str: A message containing the trade details.
+        TradeResult | ActionFailure: The trade's transaction, rendering to a message containing the
+            trade details.
 
     """
     try:
@@ -54,9 +87,16 @@ def trade(wallet: Wallet, amount: str, from_asset_id: str, to_asset_id: str) ->
             amount=amount, from_asset_id=from_asset_id, to_asset_id=to_asset_id
         ).wait()
     except Exception as e:
-        return f"Error trading assets {e!s}"
-
-    return f"Traded {amount} of {from_asset_id} for {trade_result.to_amount} of {to_asset_id}.\nTransaction hash for the trade: {trade_result.transaction.transaction_hash}\nTransaction link for the trade: {trade_result.transaction.transaction_link}"
+        return ActionFailure(f"Error trading assets {e!s}", e)
+
+    return TradeResult(
+        amount=amount,
+        from_asset_id=from_asset_id,
+        to_amount=trade_result.to_amount,
+        to_asset_id=to_asset_id,
+        transaction_hash=trade_result.transaction.transaction_hash,
+        transaction_link=trade_result.transaction.transaction_link,
+    )
 
 
 class TradeAction(CdpAction):
@@ -65,4 +105,4 @@ class TradeAction(CdpAction):
     name: str = "trade"
     description: str = TRADE_PROMPT
     args_schema: type[BaseModel] | None = TradeInput
-    func: Callable[..., str] = trade
+    func: Callable[..., TradeResult | ActionFailure] = trade
@@ -1,9 +1,11 @@
 from collections.abc import Callable
+from dataclasses import dataclass
 
 from cdp import Wallet
 from pydantic import BaseModel, Field
 
 from cdp_agentkit_core.actions import CdpAction
+from cdp_agentkit_core.actions.result import ActionFailure, TransactionResult
 
 TRANSFER_PROMPT = """
 This tool will transfer an asset from the wallet to another onchain address.
@@ -43,9 +45,34 @@ class TransferInput(BaseModel):
     )
 
 
+@dataclass(frozen=True)
+class TransferResult(TransactionResult):
+    """Completed transfer of an asset, with its transaction.
+
+    Attributes:
+        amount: Amount of the asset transferred
+        asset_id: Asset ID transferred
+        destination: Destination of the transfer
+
+    """
+
+    amount: str
+    asset_id: str
+    destination: str
+
+    def render(self) -> str:
+        """Render the transfer as the message given to the LLM.
+
+        Returns:
+            str: The message.
+
+        """
+        return f"Transferred {self.amount} of {self.asset_id} to {self.destination}.\nTransaction hash for the transfer: {self.transaction_hash}\nTransaction link for the transfer: {self.transaction_link}"
+
+
 def transfer(
     wallet: Wallet, amount: str, asset_id: str, destination: str, gasless: bool = False
-) -> str:
+) -> TransferResult | ActionFailure:
     """Transfer a specified amount of an asset to a destination onchain. USDC Transfers on Base Sepolia and Mainnet can be gasless. Always use the gasless option when available.
 
     Args:
@@ -56,7 +83,8 @@ def transfer(
         gasless (bool): Whether to send a gasless transfer (Defaults to False.).
 
     Returns:
-        str: A message containing the transfer details.
+        TransferResult | ActionFailure: The transfer's transaction, rendering to a message
+            containing the transfer details.
 
     """
     try:
@@ -64,9 +92,15 @@ def transfer(
             amount=amount, asset_id=asset_id, destination=destination, gasless=gasless
         ).wait()
     except Exception as e:
-        return f"Error transferring the asset {e!s}"
-
-    return f"Transferred {amount} of {asset_id} to {destination}.\nTransaction hash for the transfer: {transfer_result.transaction_hash}\nTransaction link for the transfer: {transfer_result.transaction_link}"
+        return ActionFailure(f"Error transferring the asset {e!s}", e)
+
+    return TransferResult(
+        amount=amount,
+        asset_id=asset_id,
+        destination=destination,
+        transaction_hash=transfer_result.transaction_hash,
+        transaction_link=transfer_result.transaction_link,
+    )
 
 
 class TransferAction(CdpAction):
@@ -75,4 +109,4 @@ class TransferAction(CdpAction):
     name: str = "transfer"
     description: str = TRANSFER_PROMPT
     args_schema: type[BaseModel] | None = TransferInput
-    func: Callable[..., str] = transfer
+    func: Callable[..., TransferResult | ActionFailure] = transfer
@@ -1,9 +1,11 @@
 from collections.abc import Callable
+from dataclasses import dataclass
 
 from cdp import Wallet
 from pydantic import BaseModel, Field
 
 from cdp_agentkit_core.actions import CdpAction
+from cdp_agentkit_core.actions.result import ActionFailure, TransactionResult
 
 TRANSFER_NFT_PROMPT = """
 This tool will transfer an NFT (ERC721 token) from the wallet to another onchain address.
@@ -35,13 +37,40 @@ class TransferNftInput(BaseModel):
     )
 
 
+@dataclass(frozen=True)
+class TransferNftResult(TransactionResult):
+    """Completed transfer of an NFT (ERC721 token), with its transaction.
+
+    Attributes:
+        contract_address: Address of the NFT contract
+        token_id: ID of the NFT transferred
+        from_address: Address the NFT was transferred from
+        destination: Destination of the transfer
+
+    """
+
+    contract_address: str
+    token_id: str
+    from_address: str
+    destination: str
+
+    def render(self) -> str:
+        """Render the transfer as the message given to the LLM.
+
+        Returns:
+            str: The message.
+
+        """
+        return f"Transferred NFT (ID: {self.token_id}) from contract {self.contract_address} to {self.destination}.\nTransaction hash: {self.transaction_hash}\nTransaction link: {self.transaction_link}"
+
+
 def transfer_nft(
     wallet: Wallet,
     contract_address: str,
     token_id: str,
     destination: str,
     from_address: str | None = None,
-) -> str:
+) -> TransferNftResult | ActionFailure:
     """Transfer an NFT (ERC721 token) to a destination address.
 
     Args:
@@ -52,7 +81,8 @@ def transfer_nft(
         from_address (str | None): The address to transfer from. Defaults to wallet's default address.
 
     Returns:
-        str: A message containing the transfer details.
+        TransferNftResult | ActionFailure: The transfer's transaction, rendering to a message
+            containing the transfer details.
 
     """
     try:
@@ -63,9 +93,19 @@ def transfer_nft(
             args={"from": from_addr, "to": destination, "tokenId": token_id},
         ).wait()
     except Exception as e:
-        return f"Error transferring the NFT (contract: {contract_address}, ID: {token_id}) from {from_addr} to {destination}): {e!s}"
-
-    return f"Transferred NFT (ID: {token_id}) from contract {contract_address} to {destination}.\nTransaction hash: {transfer_result.transaction_hash}\nTransaction link: {transfer_result.transaction_link}"
+        return ActionFailure(
+            f"Error transferring the NFT (contract: {contract_address}, ID: {token_id}) from {from_addr} to {destination}): {e!s}",
+            e,
+        )
+
+    return TransferNftResult(
+        contract_address=contract_address,
+        token_id=token_id,
+        from_address=from_addr,
+        destination=destination,
+        transaction_hash=transfer_result.transaction_hash,
+        transaction_link=transfer_result.transaction_link,
+    )
 
 
 class TransferNftAction(CdpAction):
@@ -74,4 +114,4 @@ class TransferNftAction(CdpAction):
     name: str = "transfer_nft"
     description: str = TRANSFER_NFT_PROMPT
     args_schema: type[BaseModel] | None = TransferNftInput
-    func: Callable[..., str] = transfer_nft
+    func: Callable[..., TransferNftResult | ActionFailure] = transfer_nft
@@ -0,0 +1,250 @@
+import random
+import threading
+from dataclasses import dataclass, field
+from decimal import Decimal, localcontext
+
+from cdp_agentkit_core.actions.read_client import read_client
+from cdp_agentkit_core.actions.wow.cache import token_metadata_cache
+from cdp_agentkit_core.actions.wow.constants import BONDING_CURVE_ABI, WOW_ABI
+from cdp_agentkit_core.actions.wow.uniswap.multicall import ContractCall, multicall
+
+WAD = 10**18
+
+# Fraction of local quotes that are also quoted on-chain, to check the local curve math.
+VALIDATION_SAMPLE_RATE = 0.05
+
+# Maximum relative difference between a local and an on-chain quote before the local quote is
+# discarded in favour of the on-chain one.
+VALIDATION_TOLERANCE = Decimal("1e-6")
+
+
+@dataclass
+class BondingCurve:
+    """Parameters of a Zora Wow bonding curve, priced as y = A * e^(B * x)."""
+
+    a: int
+    b: int
+
+
+@dataclass
+class BondingCurveState:
+    """Bonding curve and current supply of a Zora Wow token."""
+
+    curve: BondingCurve
+    current_supply: int
+
+
+@dataclass
+class ValidationStats:
+    """Counters of local bonding curve quotes checked against the contract.
+
+    Counters are updated with `record`, under a lock, as quotes are sampled from concurrent
+    threads. A sampled quote whose on-chain read fails counts as `failed` rather than compared.
+    """
+
+    sampled: int = 0
+    mismatched: int = 0
+    failed: int = 0
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
+
+    def record(self, mismatched: bool = False, failed: bool = False) -> None:
+        """Count a sampled quote.
+
+        Args:
+            mismatched: Whether the local quote differed from the on-chain quote
+            failed: Whether the on-chain quote could not be read
+
+        """
+        with self._lock:
+            self.sampled += 1
+            self.mismatched += mismatched
+            self.failed += failed
+
+
+validation_stats = ValidationStats()
+
+
+def _exp_wad(x: int) -> int:
+    """Calculate e^x for a wad (18 decimals) fixed point number."""
+    with localcontext() as ctx:
+        ctx.prec = 60
+        return int((Decimal(x) / WAD).exp() * WAD)
+
+
+def _ln_wad(x: int) -> int:
+    """Calculate ln(x) for a wad (18 decimals) fixed point number."""
+    with localcontext() as ctx:
+        ctx.prec = 60
+        return int((Decimal(x) / WAD).ln() * WAD)
+
+
+def get_eth_buy_quote(curve: BondingCurve, current_supply: int, eth_order_size: int) -> int:
+    """Calculate the amount of tokens received for an amount of ETH, without an on-chain call.
+
+    This mirrors `BondingCurve.getEthBuyQuote`, which the Wow token's `getEthBuyQuote` calls with
+    its `totalSupply`.
+
+    Args:
+        curve: The bonding curve of the token
+        current_supply: The current total supply of the token (in wei)
+        eth_order_size: Amount of ETH to spend (in wei)
+
+    Returns:
+        int: Amount of tokens to receive (in wei).
+
+    """
+    exp_b_x0 = _exp_wad(curve.b * current_supply // WAD)
+    exp_b_x1 = exp_b_x0 + eth_order_size * curve.b // curve.a
+    return _ln_wad(exp_b_x1) * WAD // curve.b - current_supply
+
+
+def get_token_sell_quote(curve: BondingCurve, current_supply: int, token_order_size: int) -> int:
+    """Calculate the amount of ETH received for an amount of tokens, without an on-chain call.
+
+    This mirrors `BondingCurve.getTokenSellQuote`, which the Wow token's `getTokenSellQuote` calls
+    with its `totalSupply`.
+
+    Args:
+        curve: The bonding curve of the token
+        current_supply: The current total supply of the token (in wei)
+        token_order_size: Amount of tokens to sell (in wei)
+
+    Returns:
+        int: Amount of ETH to receive (in wei).
+
+    Raises:
+        ValueError: If the order size exceeds the current supply.
+
+    """
+    if token_order_size > current_supply:
+        raise ValueError("Insufficient supply")
+
+    exp_b_x0 = _exp_wad(curve.b * current_supply // WAD)
+    exp_b_x1 = _exp_wad(curve.b * (current_supply - token_order_size) // WAD)
+    return (exp_b_x0 - exp_b_x1) * curve.a // curve.b
+
+
+def get_bonding_curve_state(network_id: str, token_address: str) -> BondingCurveState:
+    """Get the bonding curve and current supply of a token.
+
+    The bonding curve address and its parameters never change, so they are read once and then
+    served from the token metadata cache, leaving the total supply as the only read.
+
+    Args:
+        network_id: Network ID, which is either `base-sepolia` or `base-mainnet`
+        token_address: Address of the token contract, such as `0x036CbD53842c5426634e7929541eC2318f3dCF7e`
+
+    Returns:
+        BondingCurveState: A BondingCurveState object containing the curve and current supply.
+
+    """
+    curve_address = token_metadata_cache.get(network_id, token_address, "bondingCurve")
+
+    calls = [ContractCall(token_address, "totalSupply", WOW_ABI)]
+    if curve_address is None:
+        calls.append(ContractCall(token_address, "bondingCurve", WOW_ABI))
+    current_supply, *results = multicall(network_id, calls)
+
+    if curve_address is None:
+        curve_address = str(results[0])
+        token_metadata_cache.set(network_id, token_address, "bondingCurve", curve_address)
+
+    a = token_metadata_cache.get(network_id, curve_address, "A")
+    b = token_metadata_cache.get(network_id, curve_address, "B")
+    if a is None or b is None:
+        a, b = multicall(
+            network_id,
+            [
+                ContractCall(curve_address, "A", BONDING_CURVE_ABI),
+                ContractCall(curve_address, "B", BONDING_CURVE_ABI),
+            ],
+        )
+        token_metadata_cache.set(network_id, curve_address, "A", a)
+        token_metadata_cache.set(network_id, curve_address, "B", b)
+
+    return BondingCurveState(curve=BondingCurve(a=a, b=b), current_supply=current_supply)
+
+
+def _validate_sample(
+    network_id: str, token_address: str, method: str, args: dict, local_quote: int
+) -> int:
+    """Check a sample of local quotes against the contract.
+
+    A mismatch can also be caused by a trade landing between the supply read and the on-chain
+    quote, so the on-chain quote is returned whenever the two differ. The check is best effort: if
+    the on-chain read fails, the failure is counted and the local quote returned.
+
+    Args:
+        network_id: Network ID, which is either `base-sepolia` or `base-mainnet`
+        token_address: Address of the token contract, such as `0x036CbD53842c5426634e7929541eC2318f3dCF7e`
+        method: The on-chain quote method, such as `getEthBuyQuote`
+        args: The arguments of the on-chain quote method
+        local_quote: The locally computed quote
+
+    Returns:
+        int: The on-chain quote if it was sampled and differs from the local quote, otherwise the
+            local quote.
+
+    """
+    if random.random() >= VALIDATION_SAMPLE_RATE:
+        return local_quote
+
+    try:
+        onchain_quote = read_client.read_contract(
+            network_id, token_address, method, abi=WOW_ABI, args=args
+        )
+    except Exception:
+        validation_stats.record(failed=True)
+        return local_quote
+
+    if abs(onchain_quote - local_quote) > VALIDATION_TOLERANCE * max(onchain_quote, 1):
+        validation_stats.record(mismatched=True)
+        return onchain_quote
+    validation_stats.record()
+    return local_quote
+
+
+def get_local_buy_quote(network_id: str, token_address: str, amount_eth_in_wei: str) -> int:
+    """Get a bonding curve quote for buying tokens, computed locally from the token's supply.
+
+    Args:
+        network_id: Network ID, which is either `base-sepolia` or `base-mainnet`
+        token_address: Address of the token contract, such as `0x036CbD53842c5426634e7929541eC2318f3dCF7e`
+        amount_eth_in_wei: Amount of ETH to buy (in wei), meaning 1 is 1 wei or 0.000000000000000001 of ETH
+
+    Returns:
+        int: Amount of tokens to receive (in wei).
+
+    """
+    state = get_bonding_curve_state(network_id, token_address)
+    quote = get_eth_buy_quote(state.curve, state.current_supply, int(amount_eth_in_wei))
+    return _validate_sample(
+        network_id,
+        token_address,
+        "getEthBuyQuote",
+        {"ethOrderSize": str(amount_eth_in_wei)},
+        quote,
+    )
+
+
+def get_local_sell_quote(network_id: str, token_address: str, amount_tokens_in_wei: str) -> int:
+    """Get a bonding curve quote for selling tokens, computed locally from the token's supply.
+
+    Args:
+        network_id: Network ID, which is either `base-sepolia` or `base-mainnet`
+        token_address: Address of the token contract, such as `0x036CbD53842c5426634e7929541eC2318f3dCF7e`
+        amount_tokens_in_wei: Amount of tokens to sell (in wei), meaning 1 is 1 wei or 0.000000000000000001 of the token
+
+    Returns:
+        int: Amount of ETH to receive (in wei).
+
+    """
+    state = get_bonding_curve_state(network_id, token_address)
+    quote = get_token_sell_quote(state.curve, state.current_supply, int(amount_tokens_in_wei))
+    return _validate_sample(
+        network_id,
+        token_address,
+        "getTokenSellQuote",
+        {"tokenOrderSize": str(amount_tokens_in_wei)},
+        quote,
+    )
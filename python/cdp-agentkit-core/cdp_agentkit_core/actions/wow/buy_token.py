@@ -1,13 +1,15 @@
 from collections.abc import Callable
+from dataclasses import dataclass
 
 from cdp import Wallet
 from pydantic import BaseModel, Field
 
 from cdp_agentkit_core.actions import CdpAction
+from cdp_agentkit_core.actions.result import ActionFailure, TransactionResult
 from cdp_agentkit_core.actions.wow.constants import (
     WOW_ABI,
 )
-from cdp_agentkit_core.actions.wow.uniswap.index import get_has_graduated
+from cdp_agentkit_core.actions.wow.uniswap.index import get_market_state
 from cdp_agentkit_core.actions.wow.utils import get_buy_quote
 
 WOW_BUY_TOKEN_PROMPT = """
@@ -43,7 +45,34 @@ class WowBuyTokenInput(BaseModel):
     )
 
 
-def wow_buy_token(wallet: Wallet, contract_address: str, amount_eth_in_wei: str) -> str:
+@dataclass(frozen=True)
+class WowBuyResult(TransactionResult):
+    """Purchase of a Zora Wow ERC20 memecoin, with its transaction.
+
+    Attributes:
+        contract_address: WOW token contract address
+        amount_eth_in_wei: Amount of ETH spent, in wei
+        min_tokens: Minimum amount of tokens accepted for the ETH, in wei
+
+    """
+
+    contract_address: str
+    amount_eth_in_wei: str
+    min_tokens: str
+
+    def render(self) -> str:
+        """Render the purchase as the message given to the LLM.
+
+        Returns:
+            str: The message.
+
+        """
+        return f"Purchased WoW ERC20 memecoin with transaction hash: {self.transaction_hash}"
+
+
+def wow_buy_token(
+    wallet: Wallet, contract_address: str, amount_eth_in_wei: str
+) -> WowBuyResult | ActionFailure:
     """Buy a Zora Wow ERC20 memecoin with ETH.
 
     Args:
@@ -52,16 +81,18 @@ def wow_buy_token(wallet: Wallet, contract_address: str, amount_eth_in_wei: str)
         amount_eth_in_wei (str): Amount of ETH to spend (in wei), meaning 1 is 1 wei or 0.000000000000000001 of ETH
 
     Returns:
-        str: A message containing the token purchase details.
+        WowBuyResult | ActionFailure: The purchase's transaction, rendering to a message containing
+            the token purchase details.
 
     """
-    token_quote = get_buy_quote(wallet.network_id, contract_address, amount_eth_in_wei)
+    market_state = get_market_state(wallet.network_id, contract_address)
+    token_quote = get_buy_quote(
+        wallet.network_id, contract_address, amount_eth_in_wei, market_state
+    )
 
     # Multiply by 99/100 and floor to get 99% of quote as minimum
     min_tokens = str(int((token_quote * 99) // 100))  # Using integer division to floor the result
 
-    has_graduated = get_has_graduated(wallet.network_id, contract_address)
-
     try:
         invocation = wallet.invoke_contract(
             contract_address=contract_address,
@@ -71,7 +102,7 @@ def wow_buy_token(wallet: Wallet, contract_address: str, amount_eth_in_wei: str)
                 "recipient": wallet.default_address.address_id,
                 "refundRecipient": wallet.default_address.address_id,
                 "orderReferrer": "0x0000000000000000000000000000000000000000",
-                "expectedMarketType": (has_graduated and "1") or "0",
+                "expectedMarketType": (market_state.has_graduated and "1") or "0",
                 "minOrderSize": min_tokens,
                 "sqrtPriceLimitX96": "0",
                 "comment": "",
@@ -80,9 +111,15 @@ def wow_buy_token(wallet: Wallet, contract_address: str, amount_eth_in_wei: str)
             asset_id="wei",
         ).wait()
     except Exception as e:
-        return f"Error buying Zora Wow ERC20 memecoin {e!s}"
-
-    return f"Purchased WoW ERC20 memecoin with transaction hash: {invocation.transaction.transaction_hash}"
+        return ActionFailure(f"Error buying Zora Wow ERC20 memecoin {e!s}", e)
+
+    return WowBuyResult(
+        contract_address=contract_address,
+        amount_eth_in_wei=amount_eth_in_wei,
+        min_tokens=min_tokens,
+        transaction_hash=invocation.transaction.transaction_hash,
+        transaction_link=invocation.transaction.transaction_link,
+    )
 
 
 class WowBuyTokenAction(CdpAction):
@@ -91,4 +128,4 @@ class WowBuyTokenAction(CdpAction):
     name: str = "wow_buy_token"
     description: str = WOW_BUY_TOKEN_PROMPT
     args_schema: type[BaseModel] | None = WowBuyTokenInput
-    func: Callable[..., str] = wow_buy_token
+    func: Callable[..., WowBuyResult | ActionFailure] = wow_buy_token
@@ -0,0 +1,85 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Any
+
+# Seconds a non-graduated `marketType` is trusted before being re-read. Graduation is one way,
+# so a graduated market type is cached permanently.
+MARKET_TYPE_TTL = 30.0
+
+
+class TokenMetadataCache:
+    """LRU cache of Zora Wow token and pool metadata, keyed by network and contract address.
+
+    Entries are permanent unless set with a TTL, in which case they expire after `ttl` seconds.
+    Lookups are counted in `hits` and `misses`.
+    """
+
+    def __init__(self, max_size: int = 1024):
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[tuple[str, str, str], tuple[Any, float | None]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, network_id: str, address: str, field: str) -> Any | None:
+        """Get a cached value.
+
+        Args:
+            network_id: Network ID, which is either `base-sepolia` or `base-mainnet`
+            address: Contract address the value belongs to
+            field: Name of the cached value, such as `marketType`
+
+        Returns:
+            Any | None: The cached value, or None if it is missing or expired.
+
+        """
+        key = (network_id, address.lower(), field)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[1] is not None and entry[1] <= time.monotonic():
+                del self._entries[key]
+                entry = None
+
+            if entry is None:
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def set(
+        self, network_id: str, address: str, field: str, value: Any, ttl: float | None = None
+    ) -> None:
+        """Cache a value, evicting the least recently used entry when the cache is full.
+
+        Args:
+            network_id: Network ID, which is either `base-sepolia` or `base-mainnet`
+            address: Contract address the value belongs to
+            field: Name of the cached value, such as `marketType`
+            value: The value to cache
+            ttl: (Optional) Seconds until the value expires. The value never expires if not set.
+
+        """
+        key = (network_id, address.lower(), field)
+        expires_at = None if ttl is None else time.monotonic() + ttl
+        with self._lock:
+            self._entries[key] = (value, expires_at)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all entries and reset the hit and miss counters."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def __len__(self) -> int:
+        """Return the number of cached entries, including expired ones not yet evicted."""
+        return len(self._entries)
+
+
+token_metadata_cache = TokenMetadataCache()
@@ -814,6 +814,23 @@ WOW_ABI = [
     {"stateMutability": "payable", "type": "receive"},
 ]
 
+BONDING_CURVE_ABI = [
+    {
+        "inputs": [],
+        "name": "A",
+        "outputs": [{"internalType": "uint256", "name": "", "type": "uint256"}],
+        "stateMutability": "view",
+        "type": "function",
+    },
+    {
+        "inputs": [],
+        "name": "B",
+        "outputs": [{"internalType": "uint256", "name": "", "type": "uint256"}],
+        "stateMutability": "view",
+        "type": "function",
+    },
+]
+
 WOW_FACTORY_CONTRACT_ADDRESSES = {
     "base-sepolia": "0x04870e22fa217Cb16aa00501D7D5253B8838C1eA",
     "base-mainnet": "0x997020E5F59cCB79C74D527Be492Cc610CB9fA2B",
@@ -829,6 +846,7 @@ addresses = {
         "SwapRouter02": "0x94cC0AaC535CCDB3C01d6787D6413C739ae12bc4",
         "WETH": "0x4200000000000000000000000000000000000006",
         "UniswapQuoter": "0xC5290058841028F1614F3A6F0F5816cAd0df5E27",
+        "Multicall3": "0xcA11bde05779ba9813e5bD8E4A0a5C5E2b1c2D5b",
     },
     "base-mainnet": {
         "WowFactory": "0xA06262157905913f855573f53AD48DE2D4ba1F4A",
@@ -839,6 +857,7 @@ addresses = {
         "SwapRouter02": "0x2626664c2603336E57B271c5C0b26F421741e481",
         "WETH": "0x4200000000000000000000000000000000000006",
         "UniswapQuoter": "0x3d4e44Eb1374240CE5F1B871ab261CD16335B76a",
+        "Multicall3": "0xcA11bde05779ba9813e5bD8E4A0a5C5E2b1c2D5b",
     },
 }
 
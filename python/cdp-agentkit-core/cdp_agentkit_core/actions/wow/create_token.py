@@ -1,9 +1,11 @@
 from collections.abc import Callable
+from dataclasses import dataclass
 
 from cdp import Wallet
 from pydantic import BaseModel, Field
 
 from cdp_agentkit_core.actions import CdpAction
+from cdp_agentkit_core.actions.result import ActionFailure, TransactionResult
 from cdp_agentkit_core.actions.wow.constants import (
     GENERIC_TOKEN_METADATA_URI,
     WOW_FACTORY_ABI,
@@ -43,7 +45,34 @@ class WowCreateTokenInput(BaseModel):
     )
 
 
-def wow_create_token(wallet: Wallet, name: str, symbol: str, token_uri: str | None = None) -> str:
+@dataclass(frozen=True)
+class WowCreateResult(TransactionResult):
+    """Created Zora Wow ERC20 memecoin, with its creation transaction.
+
+    Attributes:
+        name: Name of the token
+        symbol: Symbol of the token
+        network_id: Network the token was created on
+
+    """
+
+    name: str
+    symbol: str
+    network_id: str
+
+    def render(self) -> str:
+        """Render the token creation as the message given to the LLM.
+
+        Returns:
+            str: The message.
+
+        """
+        return f"Created WoW ERC20 memecoin {self.name} with symbol {self.symbol} on network {self.network_id}.\nTransaction hash for the token creation: {self.transaction_hash}\nTransaction link for the token creation: {self.transaction_link}"
+
+
+def wow_create_token(
+    wallet: Wallet, name: str, symbol: str, token_uri: str | None = None
+) -> WowCreateResult | ActionFailure:
     """Create a Zora Wow ERC20 memecoin.
 
     Args:
@@ -53,7 +82,8 @@ def wow_create_token(wallet: Wallet, name: str, symbol: str, token_uri: str | No
         token_uri (str | None): The URI of the token metadata to store on IPFS e.g. ipfs://QmY1GqprFYvojCcUEKgqHeDj9uhZD9jmYGrQTfA9vAE78J.
 
     Returns:
-        str: A message containing the token creation details.
+        WowCreateResult | ActionFailure: The creation's transaction, rendering to a message
+            containing the token creation details.
 
     """
     factory_address = get_factory_address(wallet.network_id)
@@ -72,9 +102,15 @@ def wow_create_token(wallet: Wallet, name: str, symbol: str, token_uri: str | No
             },
         ).wait()
     except Exception as e:
-        return f"Error creating Zora Wow ERC20 memecoin {e!s}"
-
-    return f"Created WoW ERC20 memecoin {name} with symbol {symbol} on network {wallet.network_id}.\nTransaction hash for the token creation: {invocation.transaction.transaction_hash}\nTransaction link for the token creation: {invocation.transaction.transaction_link}"
+        return ActionFailure(f"Error creating Zora Wow ERC20 memecoin {e!s}", e)
+
+    return WowCreateResult(
+        name=name,
+        symbol=symbol,
+        network_id=wallet.network_id,
+        transaction_hash=invocation.transaction.transaction_hash,
+        transaction_link=invocation.transaction.transaction_link,
+    )
 
 
 class WowCreateTokenAction(CdpAction):
@@ -83,4 +119,4 @@ class WowCreateTokenAction(CdpAction):
     name: str = "wow_create_token"
     description: str = WOW_CREATE_TOKEN_PROMPT
     args_schema: type[BaseModel] | None = WowCreateTokenInput
-    func: Callable[..., str] = wow_create_token
+    func: Callable[..., WowCreateResult | ActionFailure] = wow_create_token
@@ -0,0 +1,311 @@
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from typing import Literal
+
+from cdp import Wallet
+from pydantic import BaseModel, Field
+from web3 import Web3
+from web3.types import Wei
+
+from cdp_agentkit_core.actions import CdpAction
+from cdp_agentkit_core.actions.numpy_import import import_numpy
+from cdp_agentkit_core.actions.read_client import read_client
+from cdp_agentkit_core.actions.result import ActionFailure, ActionResult
+from cdp_agentkit_core.actions.wow.bonding_curve import WAD, get_bonding_curve_state
+from cdp_agentkit_core.actions.wow.constants import addresses
+from cdp_agentkit_core.actions.wow.uniswap.constants import Q96
+from cdp_agentkit_core.actions.wow.uniswap.index import (
+    Balance,
+    Quote,
+    get_market_state,
+    get_pool_info,
+)
+
+WOW_QUOTE_CURVE_PROMPT = """
+This tool can only be used to estimate the output, effective price and price impact of buying or selling a Zora Wow ERC20 memecoin for several order sizes at once. It does not execute any trade.
+
+Inputs:
+- WOW token contract address
+- Order sizes (in wei). For buys, these are amounts of ETH to spend. For sells, these are amounts of tokens to sell
+- Whether to quote buys or sells
+
+Important notes:
+- The order sizes are strings and cannot have any decimal points, since the unit of measurement is wei.
+- 1 wei = 0.000000000000000001 ETH
+- Quotes are estimates computed from the current pool or bonding curve state, and use wow_buy_token or wow_sell_token to trade.
+- Only supported on the following networks:
+  - Base Sepolia (ie, 'base-sepolia')
+  - Base Mainnet (ie, 'base', 'base-mainnet')
+"""
+
+
+class WowQuoteCurveInput(BaseModel):
+    """Input argument schema for quote curve action."""
+
+    contract_address: str = Field(
+        ...,
+        description="The WOW token contract address, such as `0x036CbD53842c5426634e7929541eC2318f3dCF7e`",
+    )
+
+    amounts_in_wei: list[str] = Field(
+        ...,
+        description="Order sizes to quote (in wei). Amounts of ETH to spend for buys, or amounts of tokens to sell for sells",
+    )
+
+    quote_type: Literal["buy", "sell"] = Field(
+        ...,
+        description="Whether to quote buying the token with ETH (`buy`) or selling the token for ETH (`sell`)",
+    )
+
+
+@dataclass
+class QuoteCurvePoint:
+    """Quote, effective price and price impact for a given order size."""
+
+    quote: Quote
+    effective_price: Wei
+    price_impact: float
+
+
+def _bonding_curve_amounts_out(np, network_id, token_address, amounts_in, quote_type):
+    """Compute order outputs along the token's bonding curve, y = A * e^(B * x).
+
+    Returns:
+        tuple: The amounts out, the spot price (in wei of ETH per token), which orders cannot be
+            filled, and the pool balance and fee, which are None for the bonding curve.
+
+    """
+    state = get_bonding_curve_state(network_id, token_address)
+    a, b = float(state.curve.a), float(state.curve.b)
+    exp_b_x0 = np.exp(b * state.current_supply / WAD**2)
+
+    if quote_type == "buy":
+        amounts_out = WAD**2 / b * np.log1p(amounts_in * b / (a * WAD * exp_b_x0))
+        insufficient = np.zeros(amounts_in.shape, dtype=bool)
+    else:
+        amounts_out = a * WAD / b * exp_b_x0 * -np.expm1(-b * amounts_in / WAD**2)
+        insufficient = amounts_in > state.current_supply
+
+    return amounts_out, a * exp_b_x0, insufficient, None, None
+
+
+def _uniswap_amounts_out(np, network_id, token_address, pool_address, amounts_in, quote_type):
+    """Compute order outputs in the token's uniswap v3 pool.
+
+    The in-range liquidity is assumed to be constant, which is exact for swaps that do not cross
+    an initialized tick and an estimate for larger swaps.
+
+    Returns:
+        tuple: The amounts out, the spot price (in wei of ETH per token), which orders cannot be
+            filled, the pool balance and the fee.
+
+    """
+    pool = get_pool_info(network_id, pool_address, token_address)
+    is_token0_weth = pool.token0.lower() == addresses[network_id]["WETH"].lower()
+    zero_for_one = (quote_type == "buy") == is_token0_weth
+
+    liquidity = float(pool.liquidity)
+    sqrt_price = pool.sqrt_price_x96 / Q96
+    amounts_in_less_fee = amounts_in * (1 - pool.fee / 1000000)
+
+    # The price differences are expanded so small orders do not lose precision to cancellation.
+    if zero_for_one:
+        amounts_out = (
+            liquidity
+            * amounts_in_less_fee
+            * sqrt_price**2
+            / (liquidity + amounts_in_less_fee * sqrt_price)
+        )
+    else:
+        next_sqrt_price = sqrt_price + amounts_in_less_fee / liquidity
+        amounts_out = amounts_in_less_fee / (sqrt_price * next_sqrt_price)
+
+    # The pool price is the amount of token1 per token0.
+    spot_price = (1 / sqrt_price**2 if is_token0_weth else sqrt_price**2) * WAD
+
+    balance = Balance(
+        erc20z=Wei(pool.balance1 if is_token0_weth else pool.balance0),
+        weth=Wei(pool.balance0 if is_token0_weth else pool.balance1),
+    )
+    insufficient = amounts_out > (balance.erc20z if quote_type == "buy" else balance.weth)
+
+    return amounts_out, spot_price, insufficient, balance, pool.fee / 1000000
+
+
+def get_quote_curve(
+    network_id: str,
+    token_address: str,
+    amounts_in_wei: list[str],
+    quote_type: Literal["buy", "sell"],
+) -> list[QuoteCurvePoint]:
+    """Get quotes, effective prices and price impacts for many order sizes at once.
+
+    The token's pool or bonding curve state is read once, and every order size is then priced
+    against it in a single vectorized computation, rather than with one quote call per order size.
+
+    Args:
+        network_id: Network ID, which is either `base-sepolia` or `base-mainnet`
+        token_address: Token address, such as `0x036CbD53842c5426634e7929541eC2318f3dCF7e`
+        amounts_in_wei: Order sizes (in wei). Amounts of ETH to spend for buys, or amounts of tokens to sell for sells
+        quote_type: 'buy' or 'sell'
+
+    Returns:
+        list[QuoteCurvePoint]: A QuoteCurvePoint for each order size, in the same order, with the
+            effective price in wei of ETH per token and the price impact as a fraction of the spot price.
+
+    """
+    np = import_numpy()
+
+    amounts_in = np.array([int(amount) for amount in amounts_in_wei], dtype=np.float64)
+    if amounts_in.size == 0:
+        return []
+
+    market_state = get_market_state(network_id, token_address)
+    if market_state.has_graduated:
+        amounts_out, spot_price, insufficient_liquidity, balance, fee = _uniswap_amounts_out(
+            np, network_id, token_address, market_state.pool_address, amounts_in, quote_type
+        )
+    else:
+        amounts_out, spot_price, insufficient_liquidity, balance, fee = _bonding_curve_amounts_out(
+            np, network_id, token_address, amounts_in, quote_type
+        )
+
+    eth_amounts, token_amounts = (
+        (amounts_in, amounts_out) if quote_type == "buy" else (amounts_out, amounts_in)
+    )
+    with np.errstate(divide="ignore", invalid="ignore"):
+        effective_prices = np.where(
+            token_amounts > 0, eth_amounts / token_amounts * WAD, spot_price
+        )
+    price_impacts = (effective_prices - spot_price) / spot_price
+    if quote_type == "sell":
+        price_impacts = -price_impacts
+
+    return [
+        QuoteCurvePoint(
+            quote=Quote(
+                amount_in=int(amount_in),
+                amount_out=Wei(0) if insufficient else Wei(int(amount_out)),
+                balance=balance,
+                fee=fee,
+                error="Insufficient liquidity" if insufficient else None,
+            ),
+            effective_price=Wei(int(effective_price)),
+            price_impact=float(price_impact),
+        )
+        for amount_in, amount_out, effective_price, price_impact, insufficient in zip(
+            amounts_in_wei,
+            amounts_out,
+            effective_prices,
+            price_impacts,
+            insufficient_liquidity,
+            strict=True,
+        )
+    ]
+
+
+@dataclass(frozen=True)
+class QuoteCurve(ActionResult):
+    """Quotes of a WoW ERC20 memecoin for several order sizes.
+
+    Attributes:
+        contract_address: Address of the token
+        quote_type: Whether the orders are buys or sells
+        points: A QuoteCurvePoint for each order size
+
+    """
+
+    contract_address: str
+    quote_type: Literal["buy", "sell"]
+    points: list[QuoteCurvePoint]
+
+    def render(self) -> str:
+        """Render the quotes as the message given to the LLM.
+
+        Returns:
+            str: The message.
+
+        """
+        unit_in, unit_out = ("ETH", "tokens") if self.quote_type == "buy" else ("tokens", "ETH")
+        lines = [
+            f"Quote curve for {self.quote_type}ing WoW ERC20 memecoin {self.contract_address}:"
+        ]
+        for point in self.points:
+            amount_in = Web3.from_wei(point.quote.amount_in, "ether")
+            if point.quote.error:
+                lines.append(f"- {amount_in} {unit_in}: {point.quote.error}")
+                continue
+            amount_out = Web3.from_wei(point.quote.amount_out, "ether")
+            effective_price = Web3.from_wei(point.effective_price, "ether")
+            lines.append(
+                f"- {amount_in} {unit_in} -> {amount_out} {unit_out}, effective price "
+                f"{effective_price} ETH per token, price impact {point.price_impact:.4%}"
+            )
+
+        return "\n".join(lines)
+
+
+def wow_quote_curve(
+    wallet: Wallet,
+    contract_address: str,
+    amounts_in_wei: list[str],
+    quote_type: Literal["buy", "sell"],
+) -> QuoteCurve | ActionFailure:
+    """Quote buying or selling a Zora Wow ERC20 memecoin for several order sizes.
+
+    Args:
+        wallet (Wallet): The wallet whose network the token is on.
+        contract_address (str): The WOW token contract address, such as `0x036CbD53842c5426634e7929541eC2318f3dCF7e`
+        amounts_in_wei (list[str]): Order sizes (in wei). Amounts of ETH to spend for buys, or amounts of tokens to sell for sells
+        quote_type (Literal["buy", "sell"]): Whether to quote buys or sells
+
+    Returns:
+        QuoteCurve | ActionFailure: The quote of each order size, rendering to a message containing
+            the output, effective price and price impact of each order size.
+
+    """
+    try:
+        points = get_quote_curve(wallet.network_id, contract_address, amounts_in_wei, quote_type)
+    except Exception as e:
+        return ActionFailure(f"Error quoting Zora Wow ERC20 memecoin {e!s}", e)
+
+    return QuoteCurve(contract_address, quote_type, points)
+
+
+async def awow_quote_curve(
+    wallet: Wallet,
+    contract_address: str,
+    amounts_in_wei: list[str],
+    quote_type: Literal["buy", "sell"],
+) -> QuoteCurve | ActionFailure:
+    """Quote buying or selling a Zora Wow ERC20 memecoin for several order sizes, without blocking the event loop.
+
+    Args:
+        wallet (Wallet): The wallet whose network the token is on.
+        contract_address (str): The WOW token contract address, such as `0x036CbD53842c5426634e7929541eC2318f3dCF7e`
+        amounts_in_wei (list[str]): Order sizes (in wei). Amounts of ETH to spend for buys, or amounts of tokens to sell for sells
+        quote_type (Literal["buy", "sell"]): Whether to quote buys or sells
+
+    Returns:
+        QuoteCurve | ActionFailure: The quote of each order size, rendering to a message containing
+            the output, effective price and price impact of each order size.
+
+    """
+    try:
+        points = await read_client.arun(
+            get_quote_curve, wallet.network_id, contract_address, amounts_in_wei, quote_type
+        )
+    except Exception as e:
+        return ActionFailure(f"Error quoting Zora Wow ERC20 memecoin {e!s}", e)
+
+    return QuoteCurve(contract_address, quote_type, points)
+
+
+class WowQuoteCurveAction(CdpAction):
+    """Zora Wow quote curve action."""
+
+    name: str = "wow_quote_curve"
+    description: str = WOW_QUOTE_CURVE_PROMPT
+    args_schema: type[BaseModel] | None = WowQuoteCurveInput
+    func: Callable[..., QuoteCurve | ActionFailure] = wow_quote_curve
+    afunc: Callable[..., Awaitable[QuoteCurve | ActionFailure]] | None = awow_quote_curve
@@ -1,13 +1,15 @@
 from collections.abc import Callable
+from dataclasses import dataclass
 
 from cdp import Wallet
 from pydantic import BaseModel, Field
 
 from cdp_agentkit_core.actions.cdp_action import CdpAction
+from cdp_agentkit_core.actions.result import ActionFailure, TransactionResult
 from cdp_agentkit_core.actions.wow.constants import (
     WOW_ABI,
 )
-from cdp_agentkit_core.actions.wow.uniswap.index import get_has_graduated
+from cdp_agentkit_core.actions.wow.uniswap.index import get_market_state
 from cdp_agentkit_core.actions.wow.utils import get_sell_quote
 
 WOW_SELL_TOKEN_PROMPT = """
@@ -42,7 +44,34 @@ class WowSellTokenInput(BaseModel):
     )
 
 
-def wow_sell_token(wallet: Wallet, contract_address: str, amount_tokens_in_wei: str):
+@dataclass(frozen=True)
+class WowSellResult(TransactionResult):
+    """Sale of a Zora Wow ERC20 memecoin, with its transaction.
+
+    Attributes:
+        contract_address: WOW token contract address
+        amount_tokens_in_wei: Amount of tokens sold, in wei
+        min_eth: Minimum amount of ETH accepted for the tokens, in wei
+
+    """
+
+    contract_address: str
+    amount_tokens_in_wei: str
+    min_eth: str
+
+    def render(self) -> str:
+        """Render the sale as the message given to the LLM.
+
+        Returns:
+            str: The message.
+
+        """
+        return f"Sold WoW ERC20 memecoin with transaction hash: {self.transaction_hash}"
+
+
+def wow_sell_token(
+    wallet: Wallet, contract_address: str, amount_tokens_in_wei: str
+) -> WowSellResult | ActionFailure:
     """Sell WOW tokens for ETH.
 
     Args:
@@ -51,11 +80,14 @@ def wow_sell_token(wallet: Wallet, contract_address: str, amount_tokens_in_wei:
         amount_tokens_in_wei (str): Amount of tokens to sell (in wei), meaning 1 is 1 wei or 0.000000000000000001 of the token
 
     Returns:
-        str: A message confirming the sale with the transaction hash
+        WowSellResult | ActionFailure: The sale's transaction, rendering to a message confirming
+            the sale with the transaction hash
 
     """
-    eth_quote = get_sell_quote(wallet.network_id, contract_address, amount_tokens_in_wei)
-    has_graduated = get_has_graduated(wallet.network_id, contract_address)
+    market_state = get_market_state(wallet.network_id, contract_address)
+    eth_quote = get_sell_quote(
+        wallet.network_id, contract_address, amount_tokens_in_wei, market_state
+    )
 
     # Multiply by 98/100 and floor to get 98% of quote as minimum (slippage protection)
     min_eth = str(int((eth_quote * 98) // 100))
@@ -70,16 +102,20 @@ def wow_sell_token(wallet: Wallet, contract_address: str, amount_tokens_in_wei:
                 "recipient": wallet.default_address.address_id,
                 "orderReferrer": "0x0000000000000000000000000000000000000000",
                 "comment": "",
-                "expectedMarketType": "1" if has_graduated else "0",
+                "expectedMarketType": "1" if market_state.has_graduated else "0",
                 "minPayoutSize": min_eth,
                 "sqrtPriceLimitX96": "0",
             },
         ).wait()
     except Exception as e:
-        return f"Error selling Zora Wow ERC20 memecoin {e!s}"
-
-    return (
-        f"Sold WoW ERC20 memecoin with transaction hash: {invocation.transaction.transaction_hash}"
+        return ActionFailure(f"Error selling Zora Wow ERC20 memecoin {e!s}", e)
+
+    return WowSellResult(
+        contract_address=contract_address,
+        amount_tokens_in_wei=amount_tokens_in_wei,
+        min_eth=min_eth,
+        transaction_hash=invocation.transaction.transaction_hash,
+        transaction_link=invocation.transaction.transaction_link,
     )
 
 
@@ -89,4 +125,4 @@ class WowSellTokenAction(CdpAction):
     name: str = "wow_sell_token"
     description: str = WOW_SELL_TOKEN_PROMPT
     args_schema: type[BaseModel] | None = WowSellTokenInput
-    func: Callable[..., str] = wow_sell_token
+    func: Callable[..., WowSellResult | ActionFailure] = wow_sell_token
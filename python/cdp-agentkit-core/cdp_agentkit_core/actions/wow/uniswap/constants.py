@@ -96,3 +96,49 @@ UNISWAP_V3_ABI = [
         "type": "function",
     },
 ]
+
+# `aggregate3` is declared payable on-chain, but it is only ever used here through an eth_call,
+# so it is declared as a view function to allow reading it through `SmartContract.read`.
+MULTICALL3_ABI = [
+    {
+        "inputs": [
+            {
+                "components": [
+                    {"internalType": "address", "name": "target", "type": "address"},
+                    {"internalType": "bool", "name": "allowFailure", "type": "bool"},
+                    {"internalType": "bytes", "name": "callData", "type": "bytes"},
+                ],
+                "internalType": "struct Multicall3.Call3[]",
+                "name": "calls",
+                "type": "tuple[]",
+            }
+        ],
+        "name": "aggregate3",
+        "outputs": [
+            {
+                "components": [
+                    {"internalType": "bool", "name": "success", "type": "bool"},
+                    {"internalType": "bytes", "name": "returnData", "type": "bytes"},
+                ],
+                "internalType": "struct Multicall3.Result[]",
+                "name": "returnData",
+                "type": "tuple[]",
+            }
+        ],
+        "stateMutability": "view",
+        "type": "function",
+    },
+]
+
+Q96 = 1 << 96
+
+MIN_TICK = -887272
+MAX_TICK = 887272
+
+# Tick spacing of each Uniswap v3 fee tier, with fees in hundredths of a bip.
+FEE_TICK_SPACINGS = {
+    100: 1,
+    500: 10,
+    3000: 60,
+    10000: 200,
+}
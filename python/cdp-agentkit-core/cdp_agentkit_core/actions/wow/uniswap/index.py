@@ -2,12 +2,16 @@ from dataclasses import dataclass
 from decimal import Decimal
 from typing import Literal
 
-from cdp import SmartContract
 from web3 import Web3
 from web3.types import Wei
 
+from cdp_agentkit_core.actions.read_client import read_client
+from cdp_agentkit_core.actions.tracing import tracer
+from cdp_agentkit_core.actions.wow.cache import MARKET_TYPE_TTL, token_metadata_cache
 from cdp_agentkit_core.actions.wow.constants import WOW_ABI, addresses
 from cdp_agentkit_core.actions.wow.uniswap.constants import UNISWAP_QUOTER_ABI, UNISWAP_V3_ABI
+from cdp_agentkit_core.actions.wow.uniswap.multicall import ContractCall, multicall
+from cdp_agentkit_core.actions.wow.uniswap.swap_math import simulate_exact_input_single
 
 
 @dataclass
@@ -45,6 +49,14 @@ class Quote:
     error: str | None
 
 
+@dataclass
+class MarketState:
+    """Market state for a given Zora Wow token."""
+
+    has_graduated: bool
+    pool_address: str
+
+
 @dataclass
 class PoolInfo:
     """Pool info for a given uniswap v3 pool."""
@@ -56,6 +68,7 @@ class PoolInfo:
     fee: int
     liquidity: int
     sqrt_price_x96: int
+    tick: int | None = None
 
 
 def create_price_info(wei_amount: Wei, eth_price_in_usd: float) -> PriceInfo:
@@ -74,6 +87,24 @@ def create_price_info(wei_amount: Wei, eth_price_in_usd: float) -> PriceInfo:
     return PriceInfo(eth=wei_amount, usd=Decimal(str(usd)))
 
 
+def _cache_market_type(network_id: str, token_address: str, market_type: int) -> None:
+    """Cache a token's market type, permanently once the token has graduated.
+
+    Args:
+        network_id: Network ID, which is either `base-sepolia` or `base-mainnet`
+        token_address: Token address, such as `0x036CbD53842c5426634e7929541eC2318f3dCF7e`
+        market_type: The market type read from the token contract
+
+    """
+    token_metadata_cache.set(
+        network_id,
+        token_address,
+        "marketType",
+        market_type,
+        ttl=None if market_type == 1 else MARKET_TYPE_TTL,
+    )
+
+
 def get_has_graduated(network_id: str, token_address: str) -> bool:
     """Check if a token has graduated from the Zora Wow protocol.
 
@@ -85,74 +116,119 @@ def get_has_graduated(network_id: str, token_address: str) -> bool:
         bool: True if the token has graduated, False otherwise
 
     """
-    market_type = SmartContract.read(
-        network_id,
-        contract_address=token_address,
-        method="marketType",
-        abi=WOW_ABI,
-    )
+    market_type = token_metadata_cache.get(network_id, token_address, "marketType")
+    if market_type is None:
+        market_type = read_client.read_contract(
+            network_id,
+            contract_address=token_address,
+            method="marketType",
+            abi=WOW_ABI,
+        )
+        _cache_market_type(network_id, token_address, market_type)
     return market_type == 1
 
 
-def get_pool_info(network_id: str, pool_address: str) -> PoolInfo:
+def get_market_state(network_id: str, token_address: str) -> MarketState:
+    """Get the graduation status and uniswap v3 pool address of a token in a single batched read.
+
+    Values already held in the token metadata cache are not read again.
+
+    Args:
+        network_id: Network ID, which is either `base-sepolia` or `base-mainnet`
+        token_address: Token address, such as `0x036CbD53842c5426634e7929541eC2318f3dCF7e`
+
+    Returns:
+        MarketState: A MarketState object containing the graduation status and pool address.
+
+    """
+    market_type = token_metadata_cache.get(network_id, token_address, "marketType")
+    pool_address = token_metadata_cache.get(network_id, token_address, "poolAddress")
+
+    calls = []
+    if market_type is None:
+        calls.append(ContractCall(token_address, "marketType", WOW_ABI))
+    if pool_address is None:
+        calls.append(ContractCall(token_address, "poolAddress", WOW_ABI))
+    results = iter(multicall(network_id, calls) if calls else [])
+
+    if market_type is None:
+        market_type = next(results)
+        _cache_market_type(network_id, token_address, market_type)
+    if pool_address is None:
+        pool_address = str(next(results))
+        token_metadata_cache.set(network_id, token_address, "poolAddress", pool_address)
+
+    return MarketState(has_graduated=market_type == 1, pool_address=pool_address)
+
+
+def get_pool_info(network_id: str, pool_address: str, token_address: str | None = None) -> PoolInfo:
     """Get pool info for a given uniswap v3 pool address.
 
+    The pool's token0, token1 and fee never change, so they are read once and then served from the
+    token metadata cache. Wow pools always pair the token with WETH, so when either the pool tokens
+    are cached or the token address is known, the pool state and both token balances are fetched
+    in a single batched read. Otherwise, the balances are fetched in a second batched read, as they
+    depend on the pool's token addresses.
+
     Args:
         network_id: Network ID, which is either `base-sepolia` or `base-mainnet`
         pool_address: Uniswap v3 pool address
+        token_address: (Optional) Address of the Wow token paired with WETH in the pool
 
     Returns:
         PoolInfo: A PoolInfo object containing the token0, balance0, token1, balance1, fee, liquidity, and sqrt_price_x96.
 
     """
-    try:
-        # Parallel execution of contract calls
-        token0 = SmartContract.read(
-            network_id,
-            pool_address,
-            "token0",
-            abi=UNISWAP_V3_ABI,
-        )
-        token1 = SmartContract.read(
-            network_id,
-            pool_address,
-            "token1",
-            abi=UNISWAP_V3_ABI,
-        )
-        fee = SmartContract.read(
-            network_id,
-            pool_address,
-            "fee",
-            abi=UNISWAP_V3_ABI,
-        )
-        liquidity = SmartContract.read(
-            network_id,
-            pool_address,
-            "liquidity",
-            abi=UNISWAP_V3_ABI,
-        )
-        slot0 = SmartContract.read(
-            network_id,
-            pool_address,
-            "slot0",
-            abi=UNISWAP_V3_ABI,
-        )
-
-        balance0 = SmartContract.read(
-            network_id,
-            token0,
-            "balanceOf",
-            abi=WOW_ABI,
-            args={"account": pool_address},
-        )
+    token0 = token_metadata_cache.get(network_id, pool_address, "token0")
+    token1 = token_metadata_cache.get(network_id, pool_address, "token1")
+    fee = token_metadata_cache.get(network_id, pool_address, "fee")
+    has_pool_tokens = token0 is not None and token1 is not None and fee is not None
+
+    calls = [
+        ContractCall(pool_address, "liquidity", UNISWAP_V3_ABI),
+        ContractCall(pool_address, "slot0", UNISWAP_V3_ABI),
+    ]
+    if not has_pool_tokens:
+        calls += [
+            ContractCall(pool_address, "token0", UNISWAP_V3_ABI),
+            ContractCall(pool_address, "token1", UNISWAP_V3_ABI),
+            ContractCall(pool_address, "fee", UNISWAP_V3_ABI),
+        ]
+
+    balance_tokens = None
+    if has_pool_tokens:
+        balance_tokens = (token0, token1)
+    elif token_address:
+        balance_tokens = (token_address, addresses[network_id]["WETH"])
+    if balance_tokens:
+        calls += [
+            ContractCall(token, "balanceOf", WOW_ABI, {"account": pool_address})
+            for token in balance_tokens
+        ]
 
-        balance1 = SmartContract.read(
-            network_id,
-            token1,
-            "balanceOf",
-            abi=WOW_ABI,
-            args={"account": pool_address},
-        )
+    try:
+        results = multicall(network_id, calls)
+        liquidity, slot0 = results[:2]
+
+        if not has_pool_tokens:
+            token0, token1, fee = results[2:5]
+            token_metadata_cache.set(network_id, pool_address, "token0", token0)
+            token_metadata_cache.set(network_id, pool_address, "token1", token1)
+            token_metadata_cache.set(network_id, pool_address, "fee", fee)
+
+        if balance_tokens:
+            balances = dict(
+                zip((token.lower() for token in balance_tokens), results[-2:], strict=True)
+            )
+            balance0, balance1 = balances[token0.lower()], balances[token1.lower()]
+        else:
+            balance0, balance1 = multicall(
+                network_id,
+                [
+                    ContractCall(token0, "balanceOf", WOW_ABI, {"account": pool_address}),
+                    ContractCall(token1, "balanceOf", WOW_ABI, {"account": pool_address}),
+                ],
+            )
 
         return PoolInfo(
             token0=token0,
@@ -162,11 +238,38 @@ def get_pool_info(network_id: str, pool_address: str) -> PoolInfo:
             fee=fee,
             liquidity=liquidity,
             sqrt_price_x96=slot0[0],
+            tick=slot0[1],
         )
     except Exception as error:
         raise Exception(f"Failed to fetch pool information: {error!s}") from error
 
 
+def simulate_pool_exact_input(pool_info: PoolInfo, token_in: str, amount_in: int) -> int | None:
+    """Compute an exact input quote from already fetched pool info, without an on-chain call.
+
+    Args:
+        pool_info: Pool info of the uniswap v3 pool to swap through
+        token_in: Token address to swap from, such as `0x036CbD53842c5426634e7929541eC2318f3dCF7e`
+        amount_in: Amount of tokens to swap (in Wei)
+
+    Returns:
+        int | None: Amount of tokens to receive (in Wei), or None if the swap may cross a tick and
+            must be quoted on-chain.
+
+    """
+    if pool_info.tick is None:
+        return None
+
+    return simulate_exact_input_single(
+        pool_info.sqrt_price_x96,
+        pool_info.tick,
+        pool_info.liquidity,
+        pool_info.fee,
+        token_in.lower() == pool_info.token0.lower(),
+        amount_in,
+    )
+
+
 def exact_input_single(
     network_id: str, token_in: str, token_out: str, amount_in: str, fee: str
 ) -> int:
@@ -184,7 +287,7 @@ def exact_input_single(
 
     """
     try:
-        amount = SmartContract.read(
+        amount = read_client.read_contract(
             network_id,
             addresses[network_id]["UniswapQuoter"],
             "quoteExactInputSingle",
@@ -199,13 +302,17 @@ def exact_input_single(
         )
 
         return amount
-    except Exception as error:
-        print(f"Quoter error: {error}")
+    except Exception:
+        tracer.count("wow.quote.quoter.errors")
         return 0
 
 
 def get_uniswap_quote(
-    network_id: str, token_address: str, amount: int, quote_type: Literal["buy", "sell"]
+    network_id: str,
+    token_address: str,
+    amount: int,
+    quote_type: Literal["buy", "sell"],
+    pool_address: str | None = None,
 ) -> Quote:
     """Get Uniswap quote for buying or selling tokens.
 
@@ -214,6 +321,7 @@ def get_uniswap_quote(
         token_address: Token address, such as `0x036CbD53842c5426634e7929541eC2318f3dCF7e`
         amount: Amount of tokens (in Wei)
         quote_type: 'buy' or 'sell'
+        pool_address: (Optional) Uniswap v3 pool address of the token, if already known
 
     Returns:
         Quote: A Quote object containing the amount in, amount out, balance, fee, and any error messages.
@@ -227,12 +335,15 @@ def get_uniswap_quote(
     utilization = Wei(0)
     insufficient_liquidity = False
 
-    pool_address = get_pool_address(token_address)
+    amount = int(amount)
+    if not pool_address:
+        with tracer.span("wow.quote.pool_address"):
+            pool_address = get_pool_address(network_id, token_address)
     invalid_pool_error = "Invalid pool address" if not pool_address else None
-    print("pool address: " + pool_address)
 
     try:
-        pool_info = get_pool_info(network_id, pool_address)
+        with tracer.span("wow.quote.pool_info"):
+            pool_info = get_pool_info(network_id, pool_address, token_address)
         token0, token1 = pool_info.token0, pool_info.token1
         balance0, balance1 = pool_info.balance0, pool_info.balance1
         fee = pool_info.fee
@@ -250,15 +361,19 @@ def get_uniswap_quote(
         )
 
         token_out, balance_out = (token1, balance1) if token_in == token0 else (token0, balance0)
-        print("123", balance_out, amount)
-        print(type(balance_out), type(amount))
         insufficient_liquidity = quote_type == "buy" and amount > balance_out
         utilization = Wei(int(amount / balance_out)) if quote_type == "buy" else Wei(0)
 
-        quote_result = exact_input_single(network_id, token_in, token_out, amount, fee)
-        print("quote_result", quote_result)
-    except Exception as error:
-        print(f"Error fetching quote: {error}")
+        # Swaps that stay within the current tick range are quoted locally, and only swaps that
+        # may cross a tick are quoted on-chain.
+        quote_result = simulate_pool_exact_input(pool_info, token_in, amount)
+        if quote_result is None:
+            with tracer.span("wow.quote.quoter"):
+                quote_result = exact_input_single(network_id, token_in, token_out, amount, fee)
+        else:
+            tracer.count("wow.quote.simulated")
+    except Exception:
+        tracer.count("wow.quote.errors")
 
     insufficient_liquidity = (
         quote_type == "sell" and pool and not quote_result
@@ -274,7 +389,6 @@ def get_uniswap_quote(
     elif not quote_result:
         error_msg = "Failed fetching quote"
 
-    print(tokens)
     balance_result = None
     if tokens and balances:
         is_weth_token0 = tokens[0].lower() == addresses[network_id]["WETH"].lower()
@@ -292,15 +406,24 @@ def get_uniswap_quote(
     )
 
 
-def get_pool_address(token_address: str) -> str:
+def get_pool_address(network_id: str, token_address: str) -> str:
     """Fetch the uniswap v3 pool address for a given token.
 
+    The pool address of a token never changes, so it is read once per network and then served
+    from the token metadata cache.
+
     Args:
+        network_id (str): Network ID, which is either `base-sepolia` or `base-mainnet`
         token_address (str): The address of the token contract, such as `0x036CbD53842c5426634e7929541eC2318f3dCF7e`
 
     Returns:
         str: The uniswap v3 pool address associated with the token.
 
     """
-    pool_address = SmartContract.read("base-sepolia", token_address, "poolAddress", abi=WOW_ABI)
-    return str(pool_address)
+    pool_address = token_metadata_cache.get(network_id, token_address, "poolAddress")
+    if pool_address is None:
+        pool_address = str(
+            read_client.read_contract(network_id, token_address, "poolAddress", abi=WOW_ABI)
+        )
+        token_metadata_cache.set(network_id, token_address, "poolAddress", pool_address)
+    return pool_address
@@ -0,0 +1,182 @@
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any
+
+from eth_abi import decode
+from eth_utils.abi import collapse_if_tuple
+from web3 import Web3
+
+from cdp_agentkit_core.actions.read_client import read_client
+from cdp_agentkit_core.actions.wow.constants import addresses
+from cdp_agentkit_core.actions.wow.uniswap.constants import MULTICALL3_ABI
+
+_w3 = Web3()
+
+
+@dataclass
+class ContractCall:
+    """A read-only contract call to be batched."""
+
+    contract_address: str
+    method: str
+    abi: list[dict]
+    args: dict[str, Any] = field(default_factory=dict)
+
+
+def _get_function_abi(abi: list[dict], method: str) -> dict:
+    """Find the ABI entry of a function by name.
+
+    Args:
+        abi: The contract ABI
+        method: The function name
+
+    Returns:
+        dict: The ABI entry of the function.
+
+    Raises:
+        ValueError: If the function is not part of the ABI.
+
+    """
+    for item in abi:
+        if item.get("type") == "function" and item.get("name") == method:
+            return item
+    raise ValueError(f"Method {method} not found in ABI")
+
+
+def encode_call(call: ContractCall) -> str:
+    """Encode the calldata of a contract call.
+
+    Args:
+        call: The contract call to encode
+
+    Returns:
+        str: The hex encoded calldata, including the function selector.
+
+    """
+    function_abi = _get_function_abi(call.abi, call.method)
+    args = [
+        Web3.to_checksum_address(call.args[param["name"]])
+        if param["type"] == "address"
+        else call.args[param["name"]]
+        for param in function_abi["inputs"]
+    ]
+    return _w3.eth.contract(abi=[function_abi]).encode_abi(call.method, args=args)
+
+
+def decode_result(call: ContractCall, data: bytes) -> Any:
+    """Decode the return data of a contract call.
+
+    Single output functions are decoded to their value, and multiple output functions to a tuple
+    of values, matching the shape returned by `SmartContract.read`.
+
+    Args:
+        call: The contract call that produced the data
+        data: The raw return data
+
+    Returns:
+        Any: The decoded return value.
+
+    """
+    outputs = _get_function_abi(call.abi, call.method)["outputs"]
+    values = tuple(
+        Web3.to_checksum_address(value) if output["type"] == "address" else value
+        for output, value in zip(
+            outputs, decode([collapse_if_tuple(output) for output in outputs], data), strict=True
+        )
+    )
+    return values[0] if len(values) == 1 else values
+
+
+def _aggregate3(network_id: str, multicall_address: str, calls: list[ContractCall]) -> list[Any]:
+    """Execute contract calls in a single Multicall3 `aggregate3` read.
+
+    Args:
+        network_id: Network ID, which is either `base-sepolia` or `base-mainnet`
+        multicall_address: The Multicall3 contract address
+        calls: The contract calls to execute
+
+    Returns:
+        list[Any]: The decoded results, in the same order as the calls.
+
+    """
+    results = read_client.read_contract(
+        network_id,
+        multicall_address,
+        "aggregate3",
+        abi=MULTICALL3_ABI,
+        args={
+            "calls": [
+                {
+                    "target": Web3.to_checksum_address(call.contract_address),
+                    "allowFailure": False,
+                    "callData": encode_call(call),
+                }
+                for call in calls
+            ]
+        },
+    )
+
+    decoded = []
+    for call, result in zip(calls, results, strict=True):
+        if not result["success"]:
+            raise Exception(f"Multicall read of {call.method} failed")
+        return_data = result["returnData"]
+        if isinstance(return_data, str):
+            return_data = bytes.fromhex(return_data.removeprefix("0x"))
+        decoded.append(decode_result(call, return_data))
+    return decoded
+
+
+def _read_concurrently(network_id: str, calls: list[ContractCall]) -> list[Any]:
+    """Execute contract calls as concurrent `SmartContract.read` calls.
+
+    Args:
+        network_id: Network ID, which is either `base-sepolia` or `base-mainnet`
+        calls: The contract calls to execute
+
+    Returns:
+        list[Any]: The results, in the same order as the calls.
+
+    """
+    with ThreadPoolExecutor(max_workers=len(calls)) as executor:
+        return list(
+            executor.map(
+                lambda call: read_client.read_contract(
+                    network_id,
+                    call.contract_address,
+                    call.method,
+                    abi=call.abi,
+                    args=call.args,
+                ),
+                calls,
+            )
+        )
+
+
+def multicall(network_id: str, calls: list[ContractCall]) -> list[Any]:
+    """Execute a batch of read-only contract calls.
+
+    The calls are batched into a single Multicall3 `aggregate3` read. If Multicall3 is not
+    available on the network, or the batched read fails, the calls are executed as concurrent
+    individual reads instead.
+
+    Args:
+        network_id: Network ID, which is either `base-sepolia` or `base-mainnet`
+        calls: The contract calls to execute
+
+    Returns:
+        list[Any]: The results, in the same order as the calls.
+
+    """
+    if not calls:
+        return []
+
+    multicall_address = addresses.get(network_id, {}).get("Multicall3")
+    if multicall_address:
+        try:
+            return _aggregate3(network_id, multicall_address, calls)
+        except Exception:
+            # Fall back to individual reads, which also surface the failing call's own error.
+            pass
+
+    return _read_concurrently(network_id, calls)
@@ -0,0 +1,227 @@
+from collections.abc import Iterable
+
+from cdp_agentkit_core.actions.wow.uniswap.constants import (
+    FEE_TICK_SPACINGS,
+    MAX_TICK,
+    MIN_TICK,
+    Q96,
+)
+
+# Multipliers used by Uniswap v3 TickMath.getSqrtRatioAtTick, one per bit of the absolute tick.
+_TICK_RATIO_MULTIPLIERS = (
+    0xFFF97272373D413259A46990580E213A,
+    0xFFF2E50F5F656932EF12357CF3C7FDCC,
+    0xFFE5CACA7E10E4E61C3624EAA0941CD0,
+    0xFFCB9843D60F6159C9DB58835C926644,
+    0xFF973B41FA98C081472E6896DFB254C0,
+    0xFF2EA16466C96A3843EC78B326B52861,
+    0xFE5DEE046A99A2A811C461F1969C3053,
+    0xFCBE86C7900A88AEDCFFC83B479AA3A4,
+    0xF987A7253AC413176F2B074CF7815E54,
+    0xF3392B0822B70005940C7A398E4B70F3,
+    0xE7159475A2C29B7443B29C7FA6E889D9,
+    0xD097F3BDFD2022B8845AD8F792AA5825,
+    0xA9F746462D870FDF8A65DC1F90E061E5,
+    0x70D869A156D2A1B890BB3DF62BAF32F7,
+    0x31BE135F97D08FD981231505542FCFA6,
+    0x9AA508B5B7A84E1C677DE54F3E99BC9,
+    0x5D6AF8DEDB81196699C329225EE604,
+    0x2216E584F5FA1EA926041BEDFE98,
+    0x48A170391F7DC42444E8FA2,
+)
+
+_FEE_DENOMINATOR = 1_000_000
+_UINT256_MAX = (1 << 256) - 1
+
+
+def get_sqrt_ratio_at_tick(tick: int) -> int:
+    """Calculate the sqrt price of a tick, as a Q64.96 fixed point number.
+
+    This is an exact port of Uniswap v3 `TickMath.getSqrtRatioAtTick`.
+
+    Args:
+        tick: The tick to get the sqrt price of
+
+    Returns:
+        int: The sqrt price of the tick, as a Q64.96 fixed point number.
+
+    Raises:
+        ValueError: If the tick is out of range.
+
+    """
+    if not MIN_TICK <= tick <= MAX_TICK:
+        raise ValueError(f"Tick {tick} is out of range")
+
+    abs_tick = abs(tick)
+    ratio = 0xFFFCB933BD6FAD37AA2D162D1A594001 if abs_tick & 0x1 else 1 << 128
+    for bit, multiplier in enumerate(_TICK_RATIO_MULTIPLIERS, start=1):
+        if abs_tick & (1 << bit):
+            ratio = (ratio * multiplier) >> 128
+
+    if tick > 0:
+        ratio = _UINT256_MAX // ratio
+
+    # Round up when converting from Q128.128 to Q64.96.
+    return (ratio >> 32) + (0 if ratio % (1 << 32) == 0 else 1)
+
+
+def _div_rounding_up(numerator: int, denominator: int) -> int:
+    return -(-numerator // denominator)
+
+
+def get_tick_range(tick: int, fee: int) -> tuple[int, int]:
+    """Get the tick spacing aligned range containing a tick.
+
+    Initialized ticks are always multiples of the pool's tick spacing, so a swap whose price stays
+    strictly within this range cannot cross an initialized tick, and the pool's liquidity is
+    constant over the whole swap.
+
+    Args:
+        tick: The current tick of the pool
+        fee: The fee tier of the pool, in hundredths of a bip
+
+    Returns:
+        tuple[int, int]: The lower and upper tick of the range.
+
+    Raises:
+        ValueError: If the fee tier is not supported.
+
+    """
+    if fee not in FEE_TICK_SPACINGS:
+        raise ValueError(f"Unsupported fee tier: {fee}")
+
+    tick_spacing = FEE_TICK_SPACINGS[fee]
+    lower_tick = (tick // tick_spacing) * tick_spacing
+    return max(lower_tick, MIN_TICK), min(lower_tick + tick_spacing, MAX_TICK)
+
+
+def _compute_exact_input(
+    sqrt_price_x96: int,
+    liquidity: int,
+    fee: int,
+    zero_for_one: bool,
+    target_sqrt_price_x96: int,
+    amount_in: int,
+) -> int | None:
+    """Compute the output of an exact input swap step that stays within a single tick range.
+
+    This follows Uniswap v3 `SwapMath.computeSwapStep` for the case where the target price is not
+    reached, including its rounding.
+
+    Args:
+        sqrt_price_x96: The current sqrt price of the pool
+        liquidity: The liquidity in range
+        fee: The fee tier of the pool, in hundredths of a bip
+        zero_for_one: Whether token0 is swapped for token1
+        target_sqrt_price_x96: The sqrt price at the boundary of the tick range
+        amount_in: The amount of the input token, including the fee
+
+    Returns:
+        int | None: The amount of the output token, or None if the swap would reach the target price.
+
+    """
+    amount_in_less_fee = amount_in * (_FEE_DENOMINATOR - fee) // _FEE_DENOMINATOR
+    liquidity_x96 = liquidity << 96
+
+    if zero_for_one:
+        max_amount_in = _div_rounding_up(
+            _div_rounding_up(
+                liquidity_x96 * (sqrt_price_x96 - target_sqrt_price_x96), sqrt_price_x96
+            ),
+            target_sqrt_price_x96,
+        )
+        if amount_in_less_fee >= max_amount_in:
+            return None
+
+        product = amount_in_less_fee * sqrt_price_x96
+        if product <= _UINT256_MAX and liquidity_x96 + product <= _UINT256_MAX:
+            next_sqrt_price_x96 = _div_rounding_up(
+                liquidity_x96 * sqrt_price_x96, liquidity_x96 + product
+            )
+        else:
+            # The contract switches to a less precise formula when the product would overflow.
+            next_sqrt_price_x96 = _div_rounding_up(
+                liquidity_x96, liquidity_x96 // sqrt_price_x96 + amount_in_less_fee
+            )
+        return liquidity * (sqrt_price_x96 - next_sqrt_price_x96) // Q96
+
+    max_amount_in = _div_rounding_up(liquidity * (target_sqrt_price_x96 - sqrt_price_x96), Q96)
+    if amount_in_less_fee >= max_amount_in:
+        return None
+
+    next_sqrt_price_x96 = sqrt_price_x96 + (amount_in_less_fee << 96) // liquidity
+    return (
+        liquidity_x96 * (next_sqrt_price_x96 - sqrt_price_x96) // next_sqrt_price_x96
+    ) // sqrt_price_x96
+
+
+def simulate_exact_input_many(
+    sqrt_price_x96: int,
+    tick: int,
+    liquidity: int,
+    fee: int,
+    zero_for_one: bool,
+    amounts_in: Iterable[int],
+) -> list[int | None]:
+    """Compute exact input quotes for many order sizes from a pool's current state.
+
+    The tick range boundary is computed once and shared across all order sizes.
+
+    Args:
+        sqrt_price_x96: The current sqrt price of the pool
+        tick: The current tick of the pool
+        liquidity: The liquidity in range
+        fee: The fee tier of the pool, in hundredths of a bip
+        zero_for_one: Whether token0 is swapped for token1
+        amounts_in: The amounts of the input token, including the fee
+
+    Returns:
+        list[int | None]: The amount of the output token for each order size, or None for order
+            sizes that would cross a tick and need to be quoted on-chain.
+
+    """
+    amounts_in = [int(amount_in) for amount_in in amounts_in]
+    if liquidity <= 0 or fee not in FEE_TICK_SPACINGS:
+        return [None] * len(amounts_in)
+
+    lower_tick, upper_tick = get_tick_range(tick, fee)
+    target_sqrt_price_x96 = get_sqrt_ratio_at_tick(lower_tick if zero_for_one else upper_tick)
+
+    return [
+        _compute_exact_input(
+            sqrt_price_x96, liquidity, fee, zero_for_one, target_sqrt_price_x96, amount_in
+        )
+        if amount_in > 0
+        else 0
+        for amount_in in amounts_in
+    ]
+
+
+def simulate_exact_input_single(
+    sqrt_price_x96: int,
+    tick: int,
+    liquidity: int,
+    fee: int,
+    zero_for_one: bool,
+    amount_in: int,
+) -> int | None:
+    """Compute an exact input quote from a pool's current state, without an on-chain call.
+
+    The result matches the Uniswap v3 quoter for swaps that do not cross a tick.
+
+    Args:
+        sqrt_price_x96: The current sqrt price of the pool
+        tick: The current tick of the pool
+        liquidity: The liquidity in range
+        fee: The fee tier of the pool, in hundredths of a bip
+        zero_for_one: Whether token0 is swapped for token1
+        amount_in: The amount of the input token, including the fee
+
+    Returns:
+        int | None: The amount of the output token, or None if the swap would cross a tick and
+            needs to be quoted on-chain.
+
+    """
+    return simulate_exact_input_many(
+        sqrt_price_x96, tick, liquidity, fee, zero_for_one, [amount_in]
+    )[0]
@@ -1,40 +1,57 @@
-from cdp import SmartContract
-
+from cdp_agentkit_core.actions.read_client import read_client
+from cdp_agentkit_core.actions.tracing import tracer
+from cdp_agentkit_core.actions.wow.bonding_curve import get_local_buy_quote, get_local_sell_quote
 from cdp_agentkit_core.actions.wow.constants import WOW_ABI
-from cdp_agentkit_core.actions.wow.uniswap.index import get_has_graduated, get_uniswap_quote
+from cdp_agentkit_core.actions.wow.uniswap.index import (
+    MarketState,
+    get_market_state,
+    get_uniswap_quote,
+)
 
 
-def get_current_supply(token_address):
+def get_current_supply(network_id: str, token_address: str) -> int:
     """Get the current supply of a token.
 
     Args:
+        network_id: Network ID, which is either `base-sepolia` or `base-mainnet`
         token_address: Address of the token contract, such as `0x036CbD53842c5426634e7929541eC2318f3dCF7e`
 
+    Returns:
+        int: The total supply of the token (in wei).
+
     """
-    test = SmartContract.read(
-        "base-sepolia",
+    return read_client.read_contract(
+        network_id,
         token_address,
         "totalSupply",
         WOW_ABI,
     )
-    print(test)
-    return test
 
 
-def get_buy_quote(network_id: str, token_address: str, amount_eth_in_wei: str):
+def get_buy_quote(
+    network_id: str,
+    token_address: str,
+    amount_eth_in_wei: str,
+    market_state: MarketState | None = None,
+):
     """Get quote for buying tokens.
 
     Args:
         network_id: Network ID, which is either `base-sepolia` or `base-mainnet`
         token_address: Address of the token contract, such as `0x036CbD53842c5426634e7929541eC2318f3dCF7e`
         amount_eth_in_wei: Amount of ETH to buy (in wei), meaning 1 is 1 wei or 0.000000000000000001 of ETH
+        market_state: (Optional) Market state of the token, if already fetched by the caller
 
     """
-    has_graduated = get_has_graduated(network_id, token_address)
-    token_quote = (
-        has_graduated
-        and (get_uniswap_quote(network_id, token_address, amount_eth_in_wei, "buy")).amount_out
-    ) or SmartContract.read(
+    if market_state is None:
+        with tracer.span("wow.quote.market_state"):
+            market_state = get_market_state(network_id, token_address)
+    if not market_state.has_graduated:
+        return get_local_buy_quote(network_id, token_address, amount_eth_in_wei)
+
+    token_quote = get_uniswap_quote(
+        network_id, token_address, amount_eth_in_wei, "buy", market_state.pool_address
+    ).amount_out or read_client.read_contract(
         network_id,
         token_address,
         "getEthBuyQuote",
@@ -44,20 +61,30 @@ def get_buy_quote(network_id: str, token_address: str, amount_eth_in_wei: str):
     return token_quote
 
 
-def get_sell_quote(network_id: str, token_address: str, amount_tokens_in_wei: str):
+def get_sell_quote(
+    network_id: str,
+    token_address: str,
+    amount_tokens_in_wei: str,
+    market_state: MarketState | None = None,
+):
     """Get quote for selling tokens.
 
     Args:
         network_id: Network ID, which is either `base-sepolia` or `base-mainnet`
         token_address: Address of the token contract, such as `0x036CbD53842c5426634e7929541eC2318f3dCF7e`
         amount_tokens_in_wei (str): Amount of tokens to sell (in wei), meaning 1 is 1 wei or 0.000000000000000001 of the token
+        market_state: (Optional) Market state of the token, if already fetched by the caller
 
     """
-    has_graduated = get_has_graduated(network_id, token_address)
-    token_quote = (
-        has_graduated
-        and (get_uniswap_quote(network_id, token_address, amount_tokens_in_wei, "sell")).amount_out
-    ) or SmartContract.read(
+    if market_state is None:
+        with tracer.span("wow.quote.market_state"):
+            market_state = get_market_state(network_id, token_address)
+    if not market_state.has_graduated:
+        return get_local_sell_quote(network_id, token_address, amount_tokens_in_wei)
+
+    token_quote = get_uniswap_quote(
+        network_id, token_address, amount_tokens_in_wei, "sell", market_state.pool_address
+    ).amount_out or read_client.read_contract(
         network_id,
         token_address,
         "getTokenSellQuote",
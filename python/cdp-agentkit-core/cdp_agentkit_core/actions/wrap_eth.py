@@ -1,9 +1,11 @@
 from collections.abc import Callable
+from dataclasses import dataclass
 
 from cdp import Wallet
 from pydantic import BaseModel, Field
 
 from cdp_agentkit_core.actions import CdpAction
+from cdp_agentkit_core.actions.result import ActionFailure, TransactionResult
 
 WETH_ADDRESS = "0x4200000000000000000000000000000000000006"
 
@@ -58,7 +60,28 @@ class WrapEthInput(BaseModel):
     )
 
 
-def wrap_eth(wallet: Wallet, amount_to_wrap: str) -> str:
+@dataclass(frozen=True)
+class WrapEthResult(TransactionResult):
+    """ETH wrapped to WETH, with the wrapping transaction.
+
+    Attributes:
+        amount_to_wrap: Amount of ETH wrapped in wei
+
+    """
+
+    amount_to_wrap: str
+
+    def render(self) -> str:
+        """Render the wrapping as the message given to the LLM.
+
+        Returns:
+            str: The message.
+
+        """
+        return f"Wrapped ETH with transaction hash: {self.transaction_hash}"
+
+
+def wrap_eth(wallet: Wallet, amount_to_wrap: str) -> WrapEthResult | ActionFailure:
     """Wrap ETH to WETH.
 
     Args:
@@ -66,7 +89,8 @@ def wrap_eth(wallet: Wallet, amount_to_wrap: str) -> str:
         amount_to_wrap (str): The amount of ETH to wrap in wei.
 
     Returns:
-        str: A message containing the wrapped ETH details.
+        WrapEthResult | ActionFailure: The wrapping transaction, rendering to a message containing
+            the wrapped ETH details.
 
     """
     try:
@@ -79,9 +103,14 @@ def wrap_eth(wallet: Wallet, amount_to_wrap: str) -> str:
             asset_id="wei",
         )
         result = invocation.wait()
-        return f"Wrapped ETH with transaction hash: {result.transaction.transaction_hash}"
     except Exception as e:
-        return f"Unexpected error wrapping ETH: {e!s}"
+        return ActionFailure(f"Unexpected error wrapping ETH: {e!s}", e)
+
+    return WrapEthResult(
+        amount_to_wrap=amount_to_wrap,
+        transaction_hash=result.transaction.transaction_hash,
+        transaction_link=result.transaction.transaction_link,
+    )
 
 
 class WrapEthAction(CdpAction):
@@ -90,4 +119,4 @@ class WrapEthAction(CdpAction):
     name: str = "wrap_eth"
     description: str = WRAP_ETH_PROMPT
     args_schema: type[BaseModel] | None = WrapEthInput
-    func: Callable[..., str] = wrap_eth
+    func: Callable[..., WrapEthResult | ActionFailure] = wrap_eth
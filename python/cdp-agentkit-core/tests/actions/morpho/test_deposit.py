@@ -74,7 +74,8 @@ def test_deposit_success(wallet_factory, contract_invocation_factory, asset_fact
         )
 
         expected_response = f"Deposited {MOCK_ASSETS} to Morpho Vault {MOCK_VAULT_ADDRESS} with transaction hash: {mock_contract_instance.transaction_hash} and transaction link: {mock_contract_instance.transaction_link}"
-        assert action_response == expected_response
+        assert str(action_response) == expected_response
+        assert action_response.transaction_hash == mock_contract_instance.transaction_hash
 
         mock_approve.assert_called_once_with(
             mock_wallet, MOCK_TOKEN_ADDRESS, MOCK_VAULT_ADDRESS, MOCK_ASSETS_WEI
@@ -121,7 +122,7 @@ def test_deposit_api_error(wallet_factory, asset_factory):
         )
 
         expected_response = "Error depositing to Morpho Vault: API error"
-        assert action_response == expected_response
+        assert str(action_response) == expected_response
 
         mock_get_asset.assert_called_once_with(MOCK_NETWORK_ID, MOCK_TOKEN_ADDRESS)
 
@@ -156,7 +157,7 @@ def test_deposit_approval_failure(wallet_factory, asset_factory):
         )
 
         expected_response = "Error approving Morpho Vault as spender: Error: Approval failed"
-        assert action_response == expected_response
+        assert str(action_response) == expected_response
 
         mock_approve.assert_called_once_with(
             mock_wallet, MOCK_TOKEN_ADDRESS, MOCK_VAULT_ADDRESS, MOCK_ASSETS_WEI
@@ -56,7 +56,8 @@ def test_withdraw_success(wallet_factory, contract_invocation_factory):
         )
 
         expected_response = f"Withdrawn {MOCK_ASSETS_WETH} from Morpho Vault {MOCK_VAULT_ADDRESS} with transaction hash: {mock_contract_instance.transaction_hash} and transaction link: {mock_contract_instance.transaction_link}"
-        assert action_response == expected_response
+        assert str(action_response) == expected_response
+        assert action_response.transaction_hash == mock_contract_instance.transaction_hash
 
         mock_invoke.assert_called_once_with(
             contract_address=MOCK_VAULT_ADDRESS,
@@ -88,5 +89,5 @@ def test_withdraw_api_error(wallet_factory):
         )
 
         expected_response = "Error withdrawing from Morpho Vault: API error"
-        assert action_response == expected_response
+        assert str(action_response) == expected_response
         mock_invoke.assert_called_once()
@@ -1,3 +1,5 @@
+import asyncio
+from decimal import Decimal
 from unittest.mock import patch
 
 import pytest
@@ -5,6 +7,7 @@ import requests
 
 from cdp_agentkit_core.actions.pyth.fetch_price import (
     PythFetchPriceInput,
+    apyth_fetch_price,
     pyth_fetch_price,
 )
 
@@ -41,21 +44,34 @@ def test_pyth_fetch_price_success():
         ]
     }
 
-    with patch("requests.get") as mock_get:
+    with patch("requests.Session.get") as mock_get:
         mock_get.return_value.json.return_value = mock_response
         mock_get.return_value.raise_for_status.return_value = None
 
         result = pyth_fetch_price(MOCK_PRICE_FEED_ID)
 
-        assert result == "42123.45"
+        assert str(result) == "42123.45"
+        assert result.value == Decimal("42123.45")
 
 
 def test_pyth_fetch_price_http_error():
     """Test pyth fetch price error with HTTP error."""
-    with patch("requests.get") as mock_get:
+    with patch("requests.Session.get") as mock_get:
         mock_get.return_value.raise_for_status.side_effect = requests.exceptions.HTTPError(
             "404 Client Error: Not Found"
         )
 
         with pytest.raises(requests.exceptions.HTTPError):
             pyth_fetch_price(MOCK_PRICE_FEED_ID)
+
+
+def test_apyth_fetch_price_success():
+    """Test successful async pyth fetch price with valid parameters."""
+    mock_response = {"parsed": [{"price": {"price": "4212345", "expo": -2}}]}
+
+    with patch("requests.Session.get") as mock_get:
+        mock_get.return_value.json.return_value = mock_response
+
+        result = asyncio.run(apyth_fetch_price(MOCK_PRICE_FEED_ID))
+
+        assert str(result) == "42123.45"
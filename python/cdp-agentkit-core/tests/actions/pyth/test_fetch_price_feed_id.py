@@ -7,6 +7,7 @@ from cdp_agentkit_core.actions.pyth.fetch_price_feed_id import (
     PythFetchPriceFeedIDInput,
     pyth_fetch_price_feed_id,
 )
+from cdp_agentkit_core.actions.read_client import DEFAULT_TIMEOUT
 
 MOCK_TOKEN_SYMBOL = "BTC"
 
@@ -38,7 +39,7 @@ def test_pyth_fetch_price_feed_id_success():
         ]
     }
 
-    with patch("requests.get") as mock_get:
+    with patch("requests.Session.get") as mock_get:
         mock_get.return_value.json.return_value = mock_response["data"]
         mock_get.return_value.raise_for_status.return_value = None
 
@@ -46,13 +47,15 @@ def test_pyth_fetch_price_feed_id_success():
 
         assert result == "0ff1e87c65eb6e6f7768e66543859b7f3076ba8a3529636f6b2664f367c3344a"
         mock_get.assert_called_once_with(
-            "https://hermes.pyth.network/v2/price_feeds?query=BTC&asset_type=crypto"
+            "https://hermes.pyth.network/v2/price_feeds?query=BTC&asset_type=crypto",
+            params=None,
+            timeout=DEFAULT_TIMEOUT,
         )
 
 
 def test_pyth_fetch_price_feed_id_empty_response():
     """Test pyth fetch price feed id error with empty response for ticker symbol."""
-    with patch("requests.get") as mock_get:
+    with patch("requests.Session.get") as mock_get:
         mock_get.return_value.json.return_value = []
         mock_get.return_value.raise_for_status.return_value = None
 
@@ -62,7 +65,7 @@ def test_pyth_fetch_price_feed_id_empty_response():
 
 def test_pyth_fetch_price_feed_id_http_error():
     """Test pyth fetch price feed id error with HTTP error."""
-    with patch("requests.get") as mock_get:
+    with patch("requests.Session.get") as mock_get:
         mock_get.return_value.raise_for_status.side_effect = requests.exceptions.HTTPError(
             "404 Client Error: Not Found"
         )
@@ -0,0 +1,100 @@
+import pytest
+
+from cdp_agentkit_core.actions.rpg.battle_odds import (
+    FALLBACK_TRIALS,
+    MAX_SOLVER_STRIKES,
+    calculate_battle_odds,
+    solve_battles,
+    speed_odds,
+    strikes_distribution,
+)
+from cdp_agentkit_core.actions.rpg.simulate_battle_batch import simulate_battle_batch
+
+# NFT 1's attacks land unless they miss or are countered.
+HIT_PROBABILITY = 0.81
+
+
+def test_solve_battles_single_strike():
+    """Test the odds of NFTs falling to a single strike against the chain solved by hand."""
+    wins, turns = solve_battles(1, 1, [HIT_PROBABILITY], [HIT_PROBABILITY])
+
+    # NFT 1 wins by landing or being missed and countering, and a miss repeats the turn pair.
+    assert wins[0, 1, 1] == pytest.approx((0.81 + 0.09 * 0.1) / (1 - 0.09**2))
+    assert turns[0, 1, 1] == pytest.approx((1 + 0.09) / (1 - 0.09**2))
+
+
+def test_solve_battles_fallen_nft():
+    """Test that an NFT with no strikes left has lost, after no turns."""
+    wins, turns = solve_battles(3, 3, [HIT_PROBABILITY], [HIT_PROBABILITY])
+
+    assert (wins[0, 1:, 0] == 1).all()
+    assert (wins[0, 0, 1:] == 0).all()
+    assert (turns[0, :, 0] == 0).all()
+
+
+def test_solve_battles_symmetric():
+    """Test that evenly matched NFTs favor NFT 1, which attacks first."""
+    wins, _ = solve_battles(20, 20, [HIT_PROBABILITY], [HIT_PROBABILITY])
+
+    assert 0.5 < wins[0, 20, 20] < 0.6
+    assert wins[0, 20, 10] > 0.9
+
+
+def test_solve_battles_independent_of_size():
+    """Test that states are solved the same whichever NFT can take more strikes."""
+    wins, turns = solve_battles(4, 6, [HIT_PROBABILITY], [0.7])
+    larger_wins, larger_turns = solve_battles(8, 6, [HIT_PROBABILITY], [0.7])
+
+    assert larger_wins[:, :5, :] == pytest.approx(wins)
+    assert larger_turns[:, :5, :] == pytest.approx(turns)
+
+
+def test_strikes_distribution():
+    """Test the strikes an NFT can take against a far stronger attacker."""
+    strikes = strikes_distribution(0, 100)
+
+    assert sum(strikes.values()) == pytest.approx(1)
+    # 430 to 470 HP against 52 to 68 damage.
+    assert min(strikes) == 7
+    assert max(strikes) == 10
+
+
+def test_speed_odds():
+    """Test which NFT is faster, from the variance of their speeds."""
+    assert speed_odds(0, 100) == {(True, False): 1.0}
+    assert speed_odds(10, 10) == pytest.approx(
+        {(True, False): 0.4, (False, True): 0.4, (False, False): 0.2}
+    )
+
+
+@pytest.mark.parametrize("nft1_price, nft2_price", [(10, 14), (30, 30), (100, 50)])
+def test_calculate_battle_odds_matches_simulation(nft1_price, nft2_price):
+    """Test that the odds match simulating many battles."""
+    trials = 100000
+    simulated = simulate_battle_batch(nft1_price, nft2_price, trials=trials, seed=0)
+
+    odds = calculate_battle_odds(nft1_price, nft2_price)
+
+    # Within four standard errors of the simulated estimates.
+    assert odds.win_probability == pytest.approx(simulated.win_rate, abs=4 * (0.25 / trials) ** 0.5)
+    assert odds.turns_mean == pytest.approx(simulated.turns_mean, rel=0.01)
+
+
+def test_calculate_battle_odds_result():
+    """Test the rendered odds of a battle."""
+    odds = calculate_battle_odds(0, 100)
+
+    assert odds.exact
+    assert odds.win_probability < 1e-9
+    assert "NFT 2** ($100) wins with probability 100.00%" in str(odds)
+
+
+@pytest.mark.parametrize("nft1_price, nft2_price", [(MAX_SOLVER_STRIKES * 2, 0), (0, 30000)])
+def test_calculate_battle_odds_too_many_strikes(nft1_price, nft2_price):
+    """Test that battles too large to solve are estimated by simulation, as approximate odds."""
+    odds = calculate_battle_odds(nft1_price, nft2_price)
+
+    assert not odds.exact
+    assert odds.simulated_battles == FALLBACK_TRIALS
+    assert odds.win_probability == (1.0 if nft1_price > nft2_price else 0.0)
+    assert f"(approximate, from {FALLBACK_TRIALS} simulated battles)" in str(odds)
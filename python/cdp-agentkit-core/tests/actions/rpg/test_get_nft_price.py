@@ -1,9 +1,14 @@
+import asyncio
 from unittest.mock import patch
 
 import pytest
 import requests
 
-from cdp_agentkit_core.actions.rpg.get_nft_price import GetNFTPriceInput, get_nft_price
+from cdp_agentkit_core.actions.rpg.get_nft_price import (
+    GetNFTPriceInput,
+    aget_nft_price,
+    get_nft_price,
+)
 
 MOCK_ID = "0xdF574c24545E5FfEcb9a659c229253D4111d87e1"
 
@@ -36,7 +41,7 @@ def test_get_nft_price_success():
         }
     }
 
-    with patch("requests.get") as mock_get:
+    with patch("requests.Session.get") as mock_get:
         mock_get.return_value.json.return_value = mock_response
         mock_get.return_value.raise_for_status.return_value = None
 
@@ -47,10 +52,20 @@ def test_get_nft_price_success():
 
 def test_get_nft_price_http_error():
     """Test NFT price fetch error with HTTP error."""
-    with patch("requests.get") as mock_get:
+    with patch("requests.Session.get") as mock_get:
         mock_get.return_value.raise_for_status.side_effect = requests.exceptions.HTTPError(
             "404 Client Error: Not Found"
         )
 
-        with pytest.raises(requests.exceptions.HTTPError):
+        with pytest.raises(requests.exceptions.HTTPError, match="Failed to retrieve NFT price"):
             get_nft_price(MOCK_ID)
+
+
+def test_aget_nft_price_success():
+    """Test successful async NFT price fetch with valid parameters."""
+    mock_response = {"coins": {f"ethereum:{MOCK_ID}": {"price": 0.02678196}}}
+
+    with patch("requests.Session.get") as mock_get:
+        mock_get.return_value.json.return_value = mock_response
+
+        assert asyncio.run(aget_nft_price(MOCK_ID)) == 0.02678196
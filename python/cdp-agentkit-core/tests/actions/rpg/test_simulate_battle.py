@@ -0,0 +1,107 @@
+import random
+import struct
+from unittest.mock import patch
+
+import pytest
+
+from cdp_agentkit_core.actions.rpg.simulate_battle import (
+    BattleReplay,
+    BattleResult,
+    SimulationBattleInput,
+    generate_nft_stats,
+    simulate_battle,
+)
+
+MOCK_NFT1_PRICE = 12.5
+MOCK_NFT2_PRICE = 20.0
+MOCK_SEED = 42
+
+
+def test_simulation_battle_input_model_seed_optional():
+    """Test that SimulationBattleInput accepts an optional 64-bit seed."""
+    assert SimulationBattleInput(nft1_price=1, nft2_price=2).seed is None
+    assert SimulationBattleInput(nft1_price=1, nft2_price=2, seed=2**64 - 1).seed == 2**64 - 1
+
+    with pytest.raises(ValueError):
+        SimulationBattleInput(nft1_price=1, nft2_price=2, seed=2**64)
+
+
+def test_generate_nft_stats_with_rng_reproducible():
+    """Test that stats drawn from generators with the same seed are the same."""
+    assert generate_nft_stats(100, random.Random(1)) == generate_nft_stats(100, random.Random(1))
+
+
+def test_simulate_battle_reproducible_with_seed():
+    """Test that a seed reproduces the same battle, independently of the global RNG."""
+    random.seed(0)
+    battle_log = str(simulate_battle(MOCK_NFT1_PRICE, MOCK_NFT2_PRICE, MOCK_SEED))
+    random.seed(1)
+
+    assert str(simulate_battle(MOCK_NFT1_PRICE, MOCK_NFT2_PRICE, MOCK_SEED)) == battle_log
+    assert str(simulate_battle(MOCK_NFT1_PRICE, MOCK_NFT2_PRICE, MOCK_SEED + 1)) != battle_log
+    assert battle_log.splitlines()[-1].startswith(f"🎲 **Seed:** {MOCK_SEED} (replay code ")
+
+
+def test_simulate_battle_without_seed_differs():
+    """Test that battles without a seed get different seeds."""
+    seeds = {simulate_battle(MOCK_NFT1_PRICE, MOCK_NFT2_PRICE).replay.seed for _ in range(5)}
+
+    assert len(seeds) == 5
+
+
+def test_battle_replay_regenerates_log():
+    """Test that a replay decoded from a battle's replay code regenerates its log."""
+    battle_log = str(simulate_battle(MOCK_NFT1_PRICE, MOCK_NFT2_PRICE, MOCK_SEED))
+    replay_code = battle_log.rsplit("replay code ", 1)[1].rstrip(")")
+
+    replay = BattleReplay.from_bytes(bytes.fromhex(replay_code))
+
+    assert replay == BattleReplay(MOCK_SEED, MOCK_NFT1_PRICE, MOCK_NFT2_PRICE)
+    assert len(replay.to_bytes()) == 24
+    assert replay.battle_log() == battle_log
+
+
+def test_simulate_battle_result_matches_log():
+    """Test that the battle's outcome matches the events of its log."""
+    result = simulate_battle(MOCK_NFT1_PRICE, MOCK_NFT2_PRICE, MOCK_SEED)
+    battle_log = result.battle_log()
+
+    assert isinstance(result, BattleResult)
+    assert f"**Turn {result.turns}:**" in battle_log
+    assert f"**Turn {result.turns + 1}:**" not in battle_log
+    assert battle_log.count("CRITICAL HIT") == result.crits
+    assert battle_log.count("dodges the attack") == result.dodges
+    loser_hp = result.nft2_hp if result.winner == 1 else result.nft1_hp
+    assert loser_hp <= 0
+    assert f"**NFT 1 Stats:** {result.nft1_stats}" in battle_log
+
+
+def test_simulate_battle_builds_log_only_when_rendered():
+    """Test that the battle log is only built when a full result is rendered."""
+    with patch.object(BattleReplay, "battle_log", autospec=True) as battle_log:
+        battle_log.return_value = "battle log"
+        result = simulate_battle(MOCK_NFT1_PRICE, MOCK_NFT2_PRICE, MOCK_SEED)
+        summary = simulate_battle(MOCK_NFT1_PRICE, MOCK_NFT2_PRICE, MOCK_SEED, "summary")
+
+        assert battle_log.call_count == 0
+        assert str(summary).startswith("🔹 **NFT 1 Stats:**")
+        assert battle_log.call_count == 0
+        assert str(result) == "battle log"
+        assert battle_log.call_count == 1
+
+
+def test_simulate_battle_summary():
+    """Test that the summary reports the outcome and the seed, without the turns."""
+    result = simulate_battle(MOCK_NFT1_PRICE, MOCK_NFT2_PRICE, MOCK_SEED, verbosity="summary")
+
+    summary = str(result)
+
+    assert f"**NFT {result.winner} wins the battle** after {result.turns} turns" in summary
+    assert "**Turn 1:**" not in summary
+    assert summary.splitlines()[-1].startswith(f"🎲 **Seed:** {MOCK_SEED} (replay code ")
+
+
+def test_battle_replay_invalid_bytes():
+    """Test that decoding data of the wrong size fails."""
+    with pytest.raises(struct.error):
+        BattleReplay.from_bytes(b"\x00" * 16)
@@ -0,0 +1,103 @@
+import numpy as np
+import pytest
+
+from cdp_agentkit_core.actions.rpg.simulate_battle import simulate_battle
+from cdp_agentkit_core.actions.rpg.simulate_battle_batch import (
+    SimulationBattleBatchInput,
+    generate_nft_stats_batch,
+    simulate_battle_batch,
+    simulate_battles,
+    wilson_interval,
+)
+
+
+def _stats(attack, defense, speed, hp, trials):
+    return {
+        "Attack": np.full(trials, float(attack)),
+        "Defense": np.full(trials, float(defense)),
+        "Speed": np.full(trials, float(speed)),
+        "HP": np.full(trials, float(hp)),
+    }
+
+
+def _simulate_battle_win_rate(nft1_price, nft2_price, trials):
+    """Estimate NFT 1's win rate by running `simulate_battle` repeatedly."""
+    wins = sum(
+        simulate_battle(nft1_price, nft2_price, seed, verbosity="summary").winner == 1
+        for seed in range(trials)
+    )
+    return wins / trials
+
+
+def test_simulate_battle_batch_input_model_defaults():
+    """Test that SimulationBattleBatchInput defaults to 10000 battles and rejects none."""
+    assert SimulationBattleBatchInput(nft1_price=1, nft2_price=2).trials == 10000
+
+    with pytest.raises(ValueError):
+        SimulationBattleBatchInput(nft1_price=1, nft2_price=2, trials=0)
+
+
+def test_generate_nft_stats_batch_within_variance():
+    """Test that stats vary around the price scaling as `generate_nft_stats` does."""
+    stats = generate_nft_stats_batch(np.full(1000, 100.0), np.random.default_rng(0))
+
+    assert stats["Attack"].min() >= 95 and stats["Attack"].max() <= 105
+    assert stats["HP"].min() >= 500 and stats["HP"].max() <= 540
+    assert len(np.unique(stats["Speed"])) == 5
+
+
+def test_simulate_battles_lopsided():
+    """Test that the NFT dealing far more damage wins, within the possible number of turns."""
+    # NFT 1 deals 10 damage and needs 10 strikes; NFT 2 deals 1 damage and needs 100 strikes.
+    nft1 = _stats(attack=50, defense=49, speed=10, hp=100, trials=2000)
+    nft2 = _stats(attack=50, defense=40, speed=10, hp=100, trials=2000)
+
+    nft1_wins, turns = simulate_battles(nft1, nft2, np.random.default_rng(0))
+
+    assert nft1_wins.all()
+    # At most 2 strikes (a critical hit) on NFT 1's turns and 1 (a counter) on NFT 2's turns.
+    assert turns.min() >= 7
+    assert turns.max() < 100
+
+
+def test_simulate_battle_batch_matches_simulate_battle():
+    """Test that the batch engine's win rate matches running `simulate_battle` repeatedly."""
+    expected = _simulate_battle_win_rate(10, 14, 2000)
+
+    result = simulate_battle_batch(10, 14, trials=20000, seed=0)
+
+    # Within four standard errors of the serial estimate.
+    assert result.win_rate == pytest.approx(expected, abs=4 * (0.25 / 2000) ** 0.5)
+
+
+def test_simulate_battle_batch_reproducible_with_seed():
+    """Test that a seed reproduces the same results."""
+    assert simulate_battle_batch(20, 25, 1000, seed=7) == simulate_battle_batch(
+        20, 25, 1000, seed=7
+    )
+
+
+def test_simulate_battle_batch_result():
+    """Test the summary and rendered message of a batch."""
+    result = simulate_battle_batch(100, 50, trials=1000, seed=0)
+
+    assert result.trials == 1000
+    low, high = result.confidence_interval
+    assert low <= result.win_rate <= high
+    assert result.turns_min <= result.turns_percentiles[50] <= result.turns_max
+    assert "Simulated 1000 NFT battles" in str(result)
+
+
+def test_simulate_battle_batch_invalid_trials():
+    """Test that a batch needs at least one battle."""
+    with pytest.raises(ValueError, match="must be positive"):
+        simulate_battle_batch(1, 2, trials=0)
+
+
+def test_wilson_interval():
+    """Test the Wilson score interval at the edges and the center."""
+    assert wilson_interval(0, 100)[0] == 0.0
+    assert wilson_interval(100, 100)[1] == pytest.approx(1.0)
+    low, high = wilson_interval(50, 100)
+    assert low == pytest.approx(0.4038, abs=1e-4)
+    assert high == pytest.approx(0.5962, abs=1e-4)
@@ -0,0 +1,104 @@
+from unittest.mock import patch
+
+import pytest
+
+from cdp_agentkit_core.actions.rpg.tournament import (
+    ELO_INITIAL_RATING,
+    RunTournamentInput,
+    bracket_order,
+    round_robin_rounds,
+    run_tournament,
+)
+
+
+def test_run_tournament_input_model_needs_two_nfts():
+    """Test that RunTournamentInput defaults to a round robin and needs at least two NFTs."""
+    assert RunTournamentInput(nft_prices=[1, 2]).tournament_format == "round_robin"
+
+    with pytest.raises(ValueError):
+        RunTournamentInput(nft_prices=[1])
+
+
+@pytest.mark.parametrize("entrants", [2, 3, 6, 9])
+def test_round_robin_rounds(entrants):
+    """Test that every pair of entrants meets once, and each entrant at most once a round."""
+    first, second = round_robin_rounds(entrants)
+
+    pairs = {frozenset(pair) for pair in zip(first.ravel(), second.ravel(), strict=True)}
+    assert len(pairs) == first.size == entrants * (entrants - 1) // 2
+    for round_first, round_second in zip(first, second, strict=True):
+        assert len({*round_first, *round_second}) == 2 * first.shape[1]
+
+
+def test_bracket_order():
+    """Test that the best seeds are in opposite halves of the bracket."""
+    assert bracket_order(8) == [0, 7, 3, 4, 1, 6, 2, 5]
+
+
+def test_run_tournament_round_robin():
+    """Test that every NFT battles every other once, and the strongest NFT comes first."""
+    result = run_tournament([1, 2, 3, 4, 5000], seed=0)
+
+    assert result.battles == 10
+    assert result.rounds == 5
+    assert result.champion.nft == "NFT 5"
+    assert result.champion.wins == 4
+    assert all(standing.wins + standing.losses == 4 for standing in result.standings)
+    assert sum(standing.rating for standing in result.standings) == pytest.approx(
+        5 * ELO_INITIAL_RATING
+    )
+
+
+def test_run_tournament_bracket():
+    """Test that a bracket with byes takes one battle per eliminated NFT."""
+    result = run_tournament([5000, 1, 2, 3, 4], tournament_format="bracket", seed=0)
+
+    assert result.battles == 4
+    assert result.rounds == 3
+    assert result.champion.nft == "NFT 1"
+    assert result.champion.losses == 0
+    assert sum(standing.losses for standing in result.standings) == 4
+
+
+def test_run_tournament_reproducible_with_seed():
+    """Test that a seed reproduces the same tournament."""
+    prices = [10, 12, 14, 16, 18, 20]
+
+    assert run_tournament(prices, seed=3) == run_tournament(prices, seed=3)
+
+
+def test_run_tournament_fetches_prices_of_ids():
+    """Test that the prices of NFTs given by ID are fetched, and the NFTs named by ID."""
+    prices = {"0xweak": 1.0, "0xstrong": 5000.0}
+
+    with patch(
+        "cdp_agentkit_core.actions.rpg.tournament.get_nft_price", side_effect=prices.get
+    ) as mock_get_nft_price:
+        result = run_tournament(nft_ids=list(prices), seed=0)
+
+    assert mock_get_nft_price.call_count == 2
+    assert result.champion.nft == "0xstrong"
+    assert result.champion.price == 5000.0
+
+
+def test_run_tournament_needs_prices_or_ids():
+    """Test that exactly one of the prices and the IDs of the NFTs must be given."""
+    with pytest.raises(ValueError, match="Either the prices or the IDs"):
+        run_tournament()
+
+    with pytest.raises(ValueError, match="Either the prices or the IDs"):
+        run_tournament([1, 2], ["0x1", "0x2"])
+
+    with pytest.raises(ValueError, match="at least two NFTs"):
+        run_tournament([1])
+
+
+def test_run_tournament_render():
+    """Test that the rendered leaderboard is limited to its top NFTs."""
+    result = run_tournament([float(price) for price in range(12)], seed=0)
+
+    message = str(result)
+
+    assert "Round robin tournament of 12 NFTs:** 66 battles over 11 rounds" in message
+    assert f"🥇 **Champion:** {result.champion.nft}" in message
+    assert message.splitlines()[-1] == "... and 2 more NFTs"
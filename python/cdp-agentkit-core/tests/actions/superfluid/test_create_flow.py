@@ -50,7 +50,8 @@ def test_create_flow_success(wallet_factory, contract_invocation_factory):
         )
 
         expected_response = f"Flow created successfully. Result: {mock_contract_invocation}"
-        assert action_response == expected_response
+        assert str(action_response) == expected_response
+        assert action_response.invocation is mock_contract_invocation
         mock_invoke_contract.assert_called_once_with(
             contract_address="0xcfA132E353cB4E398080B9700609bb008eceB125",
             abi=CREATE_ABI,
@@ -78,7 +79,7 @@ def test_create_flow_api_error(wallet_factory):
         )
 
         expected_response = "Error creating flow: API error"
-        assert action_response == expected_response
+        assert str(action_response) == expected_response
         mock_invoke_contract.assert_called_once_with(
             contract_address="0xcfA132E353cB4E398080B9700609bb008eceB125",
             abi=CREATE_ABI,
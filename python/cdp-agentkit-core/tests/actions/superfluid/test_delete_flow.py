@@ -45,7 +45,8 @@ def test_delete_flow_success(wallet_factory, contract_invocation_factory):
         action_response = superfluid_delete_flow(mock_wallet, MOCK_RECIPIENT, MOCK_TOKEN_ADDRESS)
 
         expected_response = f"Flow deleted successfully. Result: {mock_contract_invocation}"
-        assert action_response == expected_response
+        assert str(action_response) == expected_response
+        assert action_response.invocation is mock_contract_invocation
         mock_invoke_contract.assert_called_once_with(
             contract_address="0xcfA132E353cB4E398080B9700609bb008eceB125",
             abi=DELETE_ABI,
@@ -70,7 +71,7 @@ def test_delete_flow_api_error(wallet_factory):
         action_response = superfluid_delete_flow(mock_wallet, MOCK_RECIPIENT, MOCK_TOKEN_ADDRESS)
 
         expected_response = "Error deleting flow: API error"
-        assert action_response == expected_response
+        assert str(action_response) == expected_response
         mock_invoke_contract.assert_called_once_with(
             contract_address="0xcfA132E353cB4E398080B9700609bb008eceB125",
             abi=DELETE_ABI,
@@ -76,7 +76,8 @@ def test_address_reputation_success():
 
         mock_address.assert_called_once_with(MOCK_NETWORK, MOCK_ADDRESS)
         mock_address_instance.reputation.assert_called_once()
-        assert action_response == expected_response
+        assert str(action_response) == expected_response
+        assert action_response.reputation is mock_reputation
 
 
 def test_address_reputation_failure():
@@ -90,4 +91,4 @@ def test_address_reputation_failure():
 
         mock_address.assert_called_once_with(MOCK_NETWORK, MOCK_ADDRESS)
         mock_address_instance.reputation.assert_called_once()
-        assert action_response == expected_response
+        assert str(action_response) == expected_response
@@ -56,7 +56,8 @@ def test_deploy_contract_success(wallet_factory, smart_contract_factory):
         )
 
         expected_response = f"Deployed contract {MOCK_CONTRACT_NAME} at address {mock_contract_instance.contract_address}. Transaction link: {mock_contract_instance.transaction.transaction_link}"
-        assert action_response == expected_response
+        assert str(action_response) == expected_response
+        assert action_response.contract_address == mock_contract_instance.contract_address
         mock_deploy.assert_called_once_with(
             solidity_version="0.8.0+commit.c7dfd78e",
             solidity_input_json=MOCK_SOLIDITY_INPUT_JSON,
@@ -83,7 +84,7 @@ def test_deploy_contract_api_error(wallet_factory):
 
         expected_response = "Error deploying contract: API error"
 
-        assert action_response == expected_response
+        assert str(action_response) == expected_response
         mock_deploy.assert_called_once_with(
             solidity_version="0.8.0+commit.c7dfd78e",
             solidity_input_json=MOCK_SOLIDITY_INPUT_JSON,
@@ -45,7 +45,8 @@ def test_deploy_nft_success(wallet_factory, smart_contract_factory):
         action_response = deploy_nft(mock_wallet, MOCK_NAME, MOCK_SYMBOL, MOCK_BASE_URI)
 
         expected_response = f"Deployed NFT Collection {MOCK_NAME} to address {mock_contract_instance.contract_address} on network {mock_wallet.network_id}.\nTransaction hash for the deployment: {mock_contract_instance.transaction.transaction_hash}\nTransaction link for the deployment: {mock_contract_instance.transaction.transaction_link}"
-        assert action_response == expected_response
+        assert str(action_response) == expected_response
+        assert action_response.contract_address == mock_contract_instance.contract_address
         mock_deploy.assert_called_once_with(
             name=MOCK_NAME,
             symbol=MOCK_SYMBOL,
@@ -62,7 +63,7 @@ def test_deploy_nft_api_error(wallet_factory):
         action_response = deploy_nft(mock_wallet, MOCK_NAME, MOCK_SYMBOL, MOCK_BASE_URI)
 
         expected_response = "Error deploying NFT API error"
-        assert action_response == expected_response
+        assert str(action_response) == expected_response
         mock_deploy.assert_called_once_with(
             name=MOCK_NAME,
             symbol=MOCK_SYMBOL,
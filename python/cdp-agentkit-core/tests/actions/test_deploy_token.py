@@ -47,7 +47,8 @@ def test_deploy_token_success(wallet_factory, smart_contract_factory):
         action_response = deploy_token(mock_wallet, MOCK_NAME, MOCK_SYMBOL, MOCK_TOTAL_SUPPLY)
 
         expected_response = f"Deployed ERC20 token contract {MOCK_NAME} ({MOCK_SYMBOL}) with total supply of {MOCK_TOTAL_SUPPLY} tokens at address {mock_contract_instance.contract_address}. Transaction link: {mock_contract_instance.transaction.transaction_link}"
-        assert action_response == expected_response
+        assert str(action_response) == expected_response
+        assert action_response.contract_address == mock_contract_instance.contract_address
         mock_deploy.assert_called_once_with(
             name=MOCK_NAME,
             symbol=MOCK_SYMBOL,
@@ -67,7 +68,7 @@ def test_deploy_token_api_error(wallet_factory):
 
         expected_response = "Error deploying token API error"
 
-        assert action_response == expected_response
+        assert str(action_response) == expected_response
         mock_deploy.assert_called_once_with(
             name=MOCK_NAME,
             symbol=MOCK_SYMBOL,
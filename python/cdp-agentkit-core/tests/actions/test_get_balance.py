@@ -0,0 +1,156 @@
+import threading
+from decimal import Decimal
+from unittest.mock import Mock, PropertyMock
+
+import pytest
+from cdp import Address, Wallet
+
+from cdp_agentkit_core.actions.get_balance import (
+    GetBalanceInput,
+    GetBalancesInput,
+    get_balance,
+    get_balances,
+)
+from cdp_agentkit_core.actions.result import ActionFailure
+
+MOCK_ASSET_ID = "eth"
+MOCK_WALLET_ID = "test-wallet-id"
+
+
+def _address(address_id, balances):
+    """Create an Address mock whose balance is looked up by asset ID, or raised if an error."""
+    address = Mock(spec=Address)
+    address.address_id = address_id
+
+    def balance(asset_id):
+        result = balances[asset_id]
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    address.balance.side_effect = balance
+    return address
+
+
+def _wallet(addresses):
+    wallet = Mock(spec=Wallet)
+    wallet.id = MOCK_WALLET_ID
+    wallet.addresses = addresses
+    return wallet
+
+
+def test_get_balance_input_model_valid():
+    """Test that GetBalanceInput accepts valid parameters."""
+    assert GetBalanceInput(asset_id=MOCK_ASSET_ID).asset_id == MOCK_ASSET_ID
+
+
+def test_get_balances_input_model_requires_assets():
+    """Test that GetBalancesInput requires at least one asset ID."""
+    with pytest.raises(ValueError):
+        GetBalancesInput(asset_ids=[])
+
+
+def test_get_balance_success():
+    """Test that the balance of each address is returned and rendered."""
+    wallet = _wallet(
+        [
+            _address("0xfirst", {MOCK_ASSET_ID: Decimal("1.5")}),
+            _address("0xsecond", {MOCK_ASSET_ID: Decimal("0")}),
+        ]
+    )
+
+    action_response = get_balance(wallet, MOCK_ASSET_ID)
+
+    assert action_response.balances == {"0xfirst": Decimal("1.5"), "0xsecond": Decimal("0")}
+    assert action_response.errors == {}
+    assert (
+        str(action_response)
+        == f"Balances for wallet {MOCK_WALLET_ID}:\n  0xfirst: 1.5\n  0xsecond: 0"
+    )
+
+
+def test_get_balance_reads_addresses_concurrently():
+    """Test that the balances of the addresses are read at the same time."""
+    barrier = threading.Barrier(3, timeout=5)
+
+    def balance(_asset_id):
+        barrier.wait()
+        return Decimal("1")
+
+    addresses = [_address(f"0x{index}", {}) for index in range(3)]
+    for address in addresses:
+        address.balance.side_effect = balance
+
+    action_response = get_balance(_wallet(addresses), MOCK_ASSET_ID)
+
+    assert list(action_response.balances) == ["0x0", "0x1", "0x2"]
+
+
+def test_get_balance_isolates_address_errors():
+    """Test that an address whose balance cannot be read does not discard the others."""
+    error = Exception("API error")
+    wallet = _wallet(
+        [
+            _address("0xfirst", {MOCK_ASSET_ID: error}),
+            _address("0xsecond", {MOCK_ASSET_ID: Decimal("2")}),
+        ]
+    )
+
+    action_response = get_balance(wallet, MOCK_ASSET_ID)
+
+    assert action_response.balances == {"0xsecond": Decimal("2")}
+    assert action_response.errors == {"0xfirst": error}
+    assert str(action_response) == (
+        f"Balances for wallet {MOCK_WALLET_ID}:\n"
+        "  0xsecond: 2\n"
+        "  0xfirst: Error getting balance API error"
+    )
+
+
+def test_get_balance_all_addresses_fail():
+    """Test that a failure is returned when no balance can be read."""
+    wallet = _wallet([_address("0xfirst", {MOCK_ASSET_ID: Exception("API error")})])
+
+    action_response = get_balance(wallet, MOCK_ASSET_ID)
+
+    assert isinstance(action_response, ActionFailure)
+    assert str(action_response) == "Error getting balance for all addresses in the wallet API error"
+
+
+def test_get_balance_addresses_error():
+    """Test that a failure is returned when the wallet's addresses cannot be listed."""
+    wallet = Mock(spec=Wallet)
+    type(wallet).addresses = PropertyMock(side_effect=Exception("API error"))
+
+    action_response = get_balance(wallet, MOCK_ASSET_ID)
+
+    assert str(action_response) == "Error getting balance for all addresses in the wallet API error"
+
+
+def test_get_balances_multiple_assets():
+    """Test that the balances of several assets are read in one call."""
+    error = Exception("API error")
+    wallet = _wallet(
+        [
+            _address("0xfirst", {"eth": Decimal("1"), "usdc": Decimal("10")}),
+            _address("0xsecond", {"eth": Decimal("2"), "usdc": error}),
+        ]
+    )
+
+    action_response = get_balances(wallet, ["eth", "usdc"])
+
+    assert action_response.assets["eth"].balances == {
+        "0xfirst": Decimal("1"),
+        "0xsecond": Decimal("2"),
+    }
+    assert action_response.assets["usdc"].balances == {"0xfirst": Decimal("10")}
+    assert action_response.assets["usdc"].errors == {"0xsecond": error}
+    assert str(action_response) == (
+        f"Balances for wallet {MOCK_WALLET_ID}:\n"
+        "  eth:\n"
+        "    0xfirst: 1\n"
+        "    0xsecond: 2\n"
+        "  usdc:\n"
+        "    0xfirst: 10\n"
+        "    0xsecond: Error getting balance API error"
+    )
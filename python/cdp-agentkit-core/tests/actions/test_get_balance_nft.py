@@ -52,7 +52,8 @@ def test_get_balance_nft_success(wallet_factory):
         )
 
         expected_response = f"Address {MOCK_ADDRESS} owns {len(MOCK_TOKEN_IDS)} NFTs in contract {MOCK_CONTRACT_ADDRESS}.\nToken IDs: 1, 2, 3"
-        assert action_response == expected_response
+        assert str(action_response) == expected_response
+        assert action_response.token_ids == MOCK_TOKEN_IDS
 
 
 def test_get_balance_nft_no_tokens(wallet_factory):
@@ -70,7 +71,7 @@ def test_get_balance_nft_no_tokens(wallet_factory):
         expected_response = (
             f"Address {MOCK_ADDRESS} owns no NFTs in contract {MOCK_CONTRACT_ADDRESS}"
         )
-        assert action_response == expected_response
+        assert str(action_response) == expected_response
 
 
 def test_get_balance_nft_with_address(wallet_factory):
@@ -87,7 +88,7 @@ def test_get_balance_nft_with_address(wallet_factory):
         )
 
         expected_response = f"Address {custom_address} owns {len(MOCK_TOKEN_IDS)} NFTs in contract {MOCK_CONTRACT_ADDRESS}.\nToken IDs: 1, 2, 3"
-        assert action_response == expected_response
+        assert str(action_response) == expected_response
 
 
 def test_get_balance_nft_api_error(wallet_factory):
@@ -103,4 +104,4 @@ def test_get_balance_nft_api_error(wallet_factory):
         )
 
         expected_response = f"Error getting NFT balance for address {MOCK_ADDRESS} in contract {MOCK_CONTRACT_ADDRESS}: API error"
-        assert action_response == expected_response
+        assert str(action_response) == expected_response
@@ -19,4 +19,5 @@ def test_get_wallet_details_success(wallet_factory):
 
     expected_response = f"Wallet: {mock_wallet.id} on network: {mock_wallet.network_id} with default address: {mock_wallet.default_address.address_id}"
 
-    assert action_response == expected_response
+    assert str(action_response) == expected_response
+    assert action_response.wallet_id == mock_wallet.id
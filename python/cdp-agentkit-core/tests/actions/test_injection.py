@@ -0,0 +1,41 @@
+import pytest
+from cdp import Wallet
+
+from cdp_agentkit_core.actions.injection import Injection, InjectionSpec
+from cdp_agentkit_core.actions.tracing import Tracer
+
+MOCK_WALLET = object()
+MOCK_TRACER = Tracer()
+
+
+def _action(wallet: Wallet, amount: str, tracer: Tracer) -> str:
+    return f"{wallet is MOCK_WALLET} {amount} {tracer is MOCK_TRACER}"
+
+
+def test_injection_spec_from_function():
+    """Test that every parameter annotated with a context type is injected, not just the first."""
+    spec = InjectionSpec.from_function(_action, (Wallet, Tracer))
+
+    assert spec.injections == (Injection("wallet", Wallet), Injection("tracer", Tracer))
+
+
+def test_injection_spec_without_context():
+    """Test that functions without context parameters get an empty spec."""
+    assert InjectionSpec.from_function(lambda x: x, (Wallet,)) == InjectionSpec()
+
+
+def test_injection_spec_bind():
+    """Test that context objects are injected alongside the action arguments."""
+    spec = InjectionSpec.from_function(_action, (Wallet, Tracer))
+
+    action = spec.bind(_action, {Wallet: MOCK_WALLET, Tracer: MOCK_TRACER}, amount="1")
+
+    assert action() == "True 1 True"
+
+
+def test_injection_spec_bind_missing_context():
+    """Test that binding fails when the context has no object of an injected type."""
+    spec = InjectionSpec.from_function(_action, (Wallet, Tracer))
+
+    with pytest.raises(KeyError):
+        spec.bind(_action, {Wallet: MOCK_WALLET}, amount="1")
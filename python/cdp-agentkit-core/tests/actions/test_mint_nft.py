@@ -44,7 +44,11 @@ def test_mint_nft_success(wallet_factory, contract_invocation_factory):
         action_response = mint_nft(mock_wallet, MOCK_CONTRACT_ADDRESS, MOCK_DESTINATION)
 
         expected_response = f"Minted NFT from contract {MOCK_CONTRACT_ADDRESS} to address {MOCK_DESTINATION} on network {mock_wallet.network_id}.\nTransaction hash for the mint: {mock_contract_invocation.transaction.transaction_hash}\nTransaction link for the mint: {mock_contract_invocation.transaction.transaction_link}"
-        assert action_response == expected_response
+        assert str(action_response) == expected_response
+        assert (
+            action_response.transaction_hash
+            == mock_contract_invocation.transaction.transaction_hash
+        )
         mock_invoke_contract.assert_called_once_with(
             contract_address=MOCK_CONTRACT_ADDRESS,
             method="mint",
@@ -64,7 +68,7 @@ def test_trade_api_error(wallet_factory):
 
         expected_response = "Error minting NFT API error"
 
-        assert action_response == expected_response
+        assert str(action_response) == expected_response
         mock_invoke_contract.assert_called_once_with(
             contract_address=MOCK_CONTRACT_ADDRESS,
             method="mint",
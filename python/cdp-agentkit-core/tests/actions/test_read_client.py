@@ -0,0 +1,164 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from cdp_agentkit_core.actions.read_client import ReadClient
+
+MOCK_NETWORK_ID = "base-sepolia"
+MOCK_CONTRACT_ADDRESS = "0x036CbD53842c5426634e7929541eC2318f3dCF7e"
+MOCK_URL = "https://hermes.pyth.network/v2/price_feeds"
+
+
+def _read_concurrently(client: ReadClient, read_count: int, side_effect):
+    """Issue identical contract reads from several threads while the first one is in flight."""
+    release = threading.Event()
+    started = threading.Event()
+
+    def blocking_read(*args, **kwargs):
+        started.set()
+        release.wait(timeout=5)
+        return side_effect()
+
+    with (
+        patch("cdp.SmartContract.read", side_effect=blocking_read) as mock_read,
+        ThreadPoolExecutor(max_workers=read_count) as executor,
+    ):
+        futures = [
+            executor.submit(
+                client.read_contract, MOCK_NETWORK_ID, MOCK_CONTRACT_ADDRESS, "marketType"
+            )
+        ]
+        started.wait(timeout=5)
+        futures += [
+            executor.submit(
+                client.read_contract, MOCK_NETWORK_ID, MOCK_CONTRACT_ADDRESS.lower(), "marketType"
+            )
+            for _ in range(read_count - 1)
+        ]
+        deadline = time.monotonic() + 5
+        while client.coalesced < read_count - 1 and time.monotonic() < deadline:
+            time.sleep(0.001)
+        release.set()
+
+    return mock_read, futures
+
+
+def test_read_contract_coalesces_identical_reads():
+    """Test that identical in-flight contract reads share a single request."""
+    client = ReadClient()
+
+    mock_read, futures = _read_concurrently(client, 5, lambda: 1)
+
+    mock_read.assert_called_once()
+    assert [future.result() for future in futures] == [1] * 5
+    assert client.coalesced == 4
+
+
+def test_read_contract_coalesced_error():
+    """Test that an error of a coalesced read is raised to every caller."""
+    client = ReadClient()
+
+    def fail():
+        raise ValueError("RPC error")
+
+    _, futures = _read_concurrently(client, 3, fail)
+
+    for future in futures:
+        with pytest.raises(ValueError, match="RPC error"):
+            future.result()
+
+
+def test_read_contract_does_not_coalesce_different_args():
+    """Test that reads with different arguments are sent separately."""
+    client = ReadClient()
+
+    with patch("cdp.SmartContract.read", side_effect=[1, 2]) as mock_read:
+        assert client.read_contract(MOCK_NETWORK_ID, MOCK_CONTRACT_ADDRESS, "m", args={"a": 1}) == 1
+        assert client.read_contract(MOCK_NETWORK_ID, MOCK_CONTRACT_ADDRESS, "m", args={"a": 2}) == 2
+
+    assert mock_read.call_count == 2
+    assert client.coalesced == 0
+
+
+def test_get_json_uses_pooled_session():
+    """Test that HTTP reads go through the shared session with the client's timeout."""
+    client = ReadClient(max_connections_per_host=4, timeout=3)
+
+    with patch.object(client.session, "get") as mock_get:
+        mock_get.return_value.json.return_value = {"parsed": []}
+        assert client.get_json(MOCK_URL, params={"query": "BTC"}) == {"parsed": []}
+
+    mock_get.assert_called_once_with(MOCK_URL, params={"query": "BTC"}, timeout=3)
+    adapter = client.session.get_adapter(MOCK_URL)
+    assert adapter._pool_maxsize == 4
+    assert adapter._pool_block
+
+
+def test_host_limit_bounds_concurrent_requests():
+    """Test that concurrent requests to one host are limited."""
+    client = ReadClient(max_connections_per_host=2)
+    in_flight, max_in_flight = 0, 0
+    lock = threading.Lock()
+
+    def read(*args, **kwargs):
+        nonlocal in_flight, max_in_flight
+        with lock:
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+        time.sleep(0.01)
+        with lock:
+            in_flight -= 1
+        return MagicMock()
+
+    with (
+        patch.object(client.session, "get", side_effect=read),
+        ThreadPoolExecutor(max_workers=8) as executor,
+    ):
+        list(executor.map(lambda i: client.get_json(f"{MOCK_URL}?id={i}"), range(8)))
+
+    assert max_in_flight == 2
+
+
+def test_async_reads_coalesce_without_holding_threads():
+    """Test that identical async reads share one request and only the first one uses a thread."""
+    client = ReadClient(max_workers=1)
+    release = threading.Event()
+
+    def blocking_get(*args, **kwargs):
+        release.wait(timeout=5)
+        response = MagicMock()
+        response.json.return_value = {"parsed": []}
+        return response
+
+    async def read_concurrently():
+        reads = [asyncio.create_task(client.aget_json(MOCK_URL)) for _ in range(5)]
+        deadline = time.monotonic() + 5
+        while client.coalesced < 4 and time.monotonic() < deadline:
+            await asyncio.sleep(0.001)
+        release.set()
+        return await asyncio.gather(*reads)
+
+    with patch.object(client.session, "get", side_effect=blocking_get) as mock_get:
+        assert asyncio.run(read_concurrently()) == [{"parsed": []}] * 5
+
+    mock_get.assert_called_once()
+    assert client.coalesced == 4
+
+
+def test_aread_contract():
+    """Test that async contract reads are made through `SmartContract.read`."""
+    client = ReadClient()
+
+    with patch("cdp.SmartContract.read", return_value=2) as mock_read:
+        assert (
+            asyncio.run(client.aread_contract(MOCK_NETWORK_ID, MOCK_CONTRACT_ADDRESS, "marketType"))
+            == 2
+        )
+
+    mock_read.assert_called_once_with(
+        MOCK_NETWORK_ID, MOCK_CONTRACT_ADDRESS, "marketType", abi=None, args=None
+    )
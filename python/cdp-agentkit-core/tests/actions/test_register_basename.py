@@ -44,7 +44,8 @@ def test_register_basename_success(wallet_factory):
         expected_response = (
             f"Successfully registered basename {MOCK_BASENAME} for address {MOCK_ADDRESS}"
         )
-        assert action_response == expected_response
+        assert str(action_response) == expected_response
+        assert action_response.transaction_hash == mock_invoke.return_value.transaction_hash
 
         mock_invoke.assert_called_once()
         mock_wait.assert_called_once()
@@ -61,7 +62,7 @@ def test_register_basename_contract_error(wallet_factory):
         action_response = register_basename(mock_wallet, MOCK_BASENAME, MOCK_AMOUNT)
 
         expected_response = "Unexpected error registering basename: Contract error"
-        assert action_response == expected_response
+        assert str(action_response) == expected_response
         mock_invoke.assert_called_once()
 
 
@@ -81,7 +82,8 @@ def test_register_basename_auto_suffix(wallet_factory):
         expected_response = (
             f"Successfully registered basename {expected_basename} for address {MOCK_ADDRESS}"
         )
-        assert action_response == expected_response
+        assert str(action_response) == expected_response
+        assert action_response.transaction_hash == mock_invoke.return_value.transaction_hash
 
         mock_invoke.assert_called_once()
         mock_wait.assert_called_once()
@@ -103,7 +105,8 @@ def test_register_basename_testnet_suffix(wallet_factory):
         expected_response = (
             f"Successfully registered basename {expected_basename} for address {MOCK_ADDRESS}"
         )
-        assert action_response == expected_response
+        assert str(action_response) == expected_response
+        assert action_response.transaction_hash == mock_invoke.return_value.transaction_hash
 
         mock_invoke.assert_called_once()
         mock_wait.assert_called_once()
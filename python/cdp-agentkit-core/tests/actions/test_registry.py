@@ -0,0 +1,101 @@
+import subprocess
+import sys
+
+import pytest
+
+from cdp_agentkit_core import actions
+from cdp_agentkit_core.actions import CDP_ACTIONS, CdpAction
+from cdp_agentkit_core.actions.registry import ACTION_SPECS, load_actions, select_action_specs
+
+
+def _modules_imported_by(code: str) -> set[str]:
+    """Run code in a fresh interpreter and return the top-level modules it imported."""
+    output = subprocess.run(
+        [sys.executable, "-c", f"{code}\nimport sys\nprint(' '.join(sys.modules))"],
+        capture_output=True,
+        check=True,
+        text=True,
+    ).stdout
+    return {module.split(".")[0] for module in output.split()}
+
+
+def test_action_specs_match_actions():
+    """Test that every registered action loads with the declared name and class."""
+    for spec in ACTION_SPECS:
+        action = spec.load()
+        assert action.name == spec.name
+        assert type(action).__name__ == spec.class_name
+
+
+def test_load_actions_by_name():
+    """Test that actions are loaded in the requested order and shared between loads."""
+    loaded = load_actions(["simulate_battle", "get_nft_price"])
+
+    assert [action.name for action in loaded] == ["simulate_battle", "get_nft_price"]
+    assert loaded[0] is load_actions(["simulate_battle"])[0]
+
+
+def test_load_actions_unknown_name():
+    """Test that loading an unregistered action fails."""
+    with pytest.raises(ValueError, match="Unknown CDP actions: unknown_action"):
+        load_actions(["get_balance", "unknown_action"])
+
+
+def test_select_action_specs():
+    """Test that actions are selected by name or tag, minus excluded names and tags."""
+    assert [spec.name for spec in select_action_specs(tags=["rpg"])] == [
+        "estimate_fighting_pow",
+        "get_nft_price",
+        "simulate_battle",
+        "simulate_battle_batch",
+        "calculate_battle_odds",
+        "run_tournament",
+    ]
+    assert [
+        spec.name
+        for spec in select_action_specs(
+            names=["transfer"], tags=["read-only"], exclude_tags=["rpg", "wow", "pyth", "nft"]
+        )
+    ] == ["address_reputation", "get_balance", "get_balances", "get_wallet_details", "transfer"]
+    assert len(select_action_specs(exclude_names=["trade"])) == len(ACTION_SPECS) - 1
+
+
+def test_select_action_specs_unknown():
+    """Test that selecting unregistered names or tags fails."""
+    with pytest.raises(ValueError, match="Unknown CDP actions: unknown_action"):
+        select_action_specs(exclude_names=["unknown_action"])
+    with pytest.raises(ValueError, match="Unknown CDP action tags: rpg-only"):
+        select_action_specs(tags=["rpg-only"])
+
+
+def test_cdp_actions_contains_every_registered_action():
+    """Test that CDP_ACTIONS loads every registered action, in registration order."""
+    assert [action.name for action in CDP_ACTIONS[: len(ACTION_SPECS)]] == [
+        spec.name for spec in ACTION_SPECS
+    ]
+    assert all(isinstance(action, CdpAction) for action in CDP_ACTIONS)
+
+
+def test_action_classes_resolved_lazily():
+    """Test that action classes are still importable from the actions package."""
+    assert actions.SimulationBattleAction().name == "simulate_battle"
+
+    with pytest.raises(AttributeError):
+        actions.UnknownAction  # noqa: B018
+
+
+def test_package_import_is_lazy():
+    """Test that importing the actions package does not import the SDK, web3 or requests."""
+    imported = _modules_imported_by("import cdp_agentkit_core.actions")
+
+    assert not imported & {"cdp", "web3", "requests", "numpy"}
+
+
+def test_selected_actions_import_only_their_modules():
+    """Test that loading the RPG actions does not import the SDK or web3."""
+    imported = _modules_imported_by(
+        "from cdp_agentkit_core.actions import load_actions\n"
+        "load_actions(['estimate_fighting_pow', 'get_nft_price', 'simulate_battle'])"
+    )
+
+    assert not imported & {"cdp", "web3"}
@@ -0,0 +1,48 @@
+from dataclasses import dataclass
+
+import pytest
+
+from cdp_agentkit_core.actions.result import ActionFailure, ActionResult
+
+
+@dataclass(frozen=True)
+class CountingResult(ActionResult):
+    """Result counting how often it is rendered."""
+
+    renders: list
+
+    def render(self) -> str:
+        """Render the result."""
+        self.renders.append(1)
+        return "rendered"
+
+
+def test_result_renders_lazily_once():
+    """Test that a result is rendered on first use only, and the message is cached."""
+    renders = []
+    result = CountingResult(renders)
+
+    assert renders == []
+    assert str(result) == "rendered"
+    assert f"{result}" == "rendered"
+    assert len(renders) == 1
+
+
+def test_result_must_render():
+    """Test that a result without a render method cannot be created."""
+
+    @dataclass(frozen=True)
+    class UnrenderedResult(ActionResult):
+        value: int
+
+    with pytest.raises(TypeError):
+        UnrenderedResult(1)
+
+
+def test_action_failure_keeps_error():
+    """Test that a failure renders its message and keeps the error it failed with."""
+    error = ValueError("API error")
+    failure = ActionFailure("Error doing something API error", error)
+
+    assert str(failure) == "Error doing something API error"
+    assert failure.error is error
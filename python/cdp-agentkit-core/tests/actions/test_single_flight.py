@@ -0,0 +1,144 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
+import pytest
+
+from cdp_agentkit_core.actions.get_balance_nft import get_balance_nft
+from cdp_agentkit_core.actions.read_client import read_client
+from cdp_agentkit_core.actions.single_flight import SingleFlight, contract_read_key
+from cdp_agentkit_core.actions.wow.cache import token_metadata_cache
+from cdp_agentkit_core.actions.wow.uniswap.index import get_has_graduated
+
+MOCK_NETWORK_ID = "base-sepolia"
+MOCK_CONTRACT_ADDRESS = "0x036CbD53842c5426634e7929541eC2318f3dCF7e"
+MOCK_OWNER_ADDRESS = "0x1234567890123456789012345678901234567890"
+
+
+def _call_concurrently(
+    call, call_count: int, single_flight: SingleFlight, release: threading.Event
+) -> list:
+    """Call a function from several threads, releasing the call once all of them are in flight."""
+    with ThreadPoolExecutor(max_workers=call_count) as executor:
+        futures = [executor.submit(call) for _ in range(call_count)]
+        deadline = time.monotonic() + 5
+        while (
+            single_flight.stats()["deduplicated"] < call_count - 1 and time.monotonic() < deadline
+        ):
+            time.sleep(0.001)
+        release.set()
+    return futures
+
+
+def _blocking_read(release: threading.Event, result):
+    def read(*args, **kwargs):
+        release.wait(timeout=5)
+        return result
+
+    return read
+
+
+def test_contract_read_key():
+    """Test that read keys ignore address case and argument order."""
+    assert contract_read_key(
+        MOCK_NETWORK_ID, MOCK_CONTRACT_ADDRESS, "balanceOf", {"a": 1, "b": 2}
+    ) == contract_read_key(
+        MOCK_NETWORK_ID, MOCK_CONTRACT_ADDRESS.lower(), "balanceOf", {"b": 2, "a": 1}
+    )
+    assert contract_read_key(MOCK_NETWORK_ID, MOCK_CONTRACT_ADDRESS, "m") != contract_read_key(
+        MOCK_NETWORK_ID, MOCK_CONTRACT_ADDRESS, "m", block_tag="0x1"
+    )
+
+
+def test_single_flight_deduplicates_concurrent_calls():
+    """Test that concurrent identical calls share one call and are counted."""
+    single_flight = SingleFlight()
+    release = threading.Event()
+    calls = []
+
+    def fn():
+        calls.append(1)
+        release.wait(timeout=5)
+        return "result"
+
+    futures = _call_concurrently(lambda: single_flight.do("key", fn), 4, single_flight, release)
+
+    assert [future.result() for future in futures] == ["result"] * 4
+    assert len(calls) == 1
+    assert single_flight.stats() == {"calls": 4, "deduplicated": 3, "in_flight": 0}
+
+
+def test_single_flight_does_not_cache():
+    """Test that sequential calls are not deduplicated."""
+    single_flight = SingleFlight()
+
+    assert single_flight.do("key", lambda: 1) == 1
+    assert single_flight.do("key", lambda: 2) == 2
+    assert single_flight.stats()["deduplicated"] == 0
+
+    single_flight.reset_stats()
+    assert single_flight.stats()["calls"] == 0
+
+
+def test_single_flight_shares_errors():
+    """Test that the error of an in-flight call is raised to every waiting caller."""
+    single_flight = SingleFlight()
+    release = threading.Event()
+
+    def fn():
+        release.wait(timeout=5)
+        raise ValueError("RPC error")
+
+    futures = _call_concurrently(lambda: single_flight.do("key", fn), 3, single_flight, release)
+
+    for future in futures:
+        with pytest.raises(ValueError, match="RPC error"):
+            future.result()
+    assert single_flight.stats()["in_flight"] == 0
+
+
+def test_concurrent_market_type_reads_deduplicated():
+    """Test that concurrent Wow market type reads of one token share a single read."""
+    token_metadata_cache.clear()
+    read_client.single_flight.reset_stats()
+    release = threading.Event()
+
+    with patch(
+        "cdp.SmartContract.read",
+        side_effect=_blocking_read(release, 1),
+    ) as mock_read:
+        futures = _call_concurrently(
+            lambda: get_has_graduated(MOCK_NETWORK_ID, MOCK_CONTRACT_ADDRESS),
+            3,
+            read_client.single_flight,
+            release,
+        )
+        assert [future.result() for future in futures] == [True] * 3
+
+    token_metadata_cache.clear()
+    mock_read.assert_called_once()
+    assert read_client.single_flight.stats()["deduplicated"] == 2
+
+
+def test_concurrent_nft_balance_reads_deduplicated(wallet_factory):
+    """Test that concurrent NFT balance reads of one owner share a single read."""
+    mock_wallet = wallet_factory()
+    mock_wallet.network_id = MOCK_NETWORK_ID
+    read_client.single_flight.reset_stats()
+    release = threading.Event()
+
+    with patch(
+        "cdp.SmartContract.read",
+        side_effect=_blocking_read(release, [1, 2]),
+    ) as mock_read:
+        futures = _call_concurrently(
+            lambda: get_balance_nft(mock_wallet, MOCK_CONTRACT_ADDRESS, MOCK_OWNER_ADDRESS),
+            3,
+            read_client.single_flight,
+            release,
+        )
+        responses = [future.result() for future in futures]
+
+    mock_read.assert_called_once()
+    assert all("owns 2 NFTs" in str(response) for response in responses)
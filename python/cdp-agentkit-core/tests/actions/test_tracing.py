@@ -0,0 +1,55 @@
+import pytest
+
+from cdp_agentkit_core.actions.tracing import Tracer
+
+
+def test_tracer_disabled_records_nothing():
+    """Test that a disabled tracer does not record spans or counters."""
+    tracer = Tracer()
+
+    with tracer.span("stage"):
+        pass
+    tracer.count("events")
+
+    assert tracer.snapshot() == {"counters": {}, "histograms": {}}
+
+
+def test_tracer_span_records_duration():
+    """Test that spans are recorded in cumulative duration histograms."""
+    tracer = Tracer(enabled=True)
+
+    with tracer.span("stage"):
+        pass
+    tracer.observe("stage", 0.3)
+
+    histogram = tracer.snapshot()["histograms"]["stage"]
+    assert histogram["count"] == 2
+    assert histogram["sum"] >= 0.3
+    assert histogram["buckets"][0.001] == 1
+    assert histogram["buckets"][0.25] == 1
+    assert histogram["buckets"][0.5] == 2
+    assert histogram["buckets"][float("inf")] == 2
+
+
+def test_tracer_span_counts_errors():
+    """Test that spans raising an exception are counted and still timed."""
+    tracer = Tracer(enabled=True)
+
+    with pytest.raises(ValueError), tracer.span("stage"):
+        raise ValueError("failed")
+
+    snapshot = tracer.snapshot()
+    assert snapshot["counters"] == {"stage.errors": 1}
+    assert snapshot["histograms"]["stage"]["count"] == 1
+
+
+def test_tracer_count_and_reset():
+    """Test that counters accumulate until reset."""
+    tracer = Tracer(enabled=True)
+
+    tracer.count("events")
+    tracer.count("events", 2)
+    assert tracer.snapshot()["counters"] == {"events": 3}
+
+    tracer.reset()
+    assert tracer.snapshot() == {"counters": {}, "histograms": {}}
@@ -47,7 +47,9 @@ def test_trade_success(wallet_factory, trade_factory):
         action_response = trade(mock_wallet, MOCK_AMOUNT, MOCK_FROM_ASSET_ID, MOCK_TO_ASSET_ID)
 
         expected_response = f"Traded {MOCK_AMOUNT} of {MOCK_FROM_ASSET_ID} for {MOCK_TO_AMOUNT} of {MOCK_TO_ASSET_ID}.\nTransaction hash for the trade: {mock_trade_instance.transaction.transaction_hash}\nTransaction link for the trade: {mock_trade_instance.transaction.transaction_link}"
-        assert action_response == expected_response
+        assert str(action_response) == expected_response
+        assert action_response.to_amount == MOCK_TO_AMOUNT
+        assert action_response.transaction_hash == mock_trade_instance.transaction.transaction_hash
         mock_trade.assert_called_once_with(
             amount=MOCK_AMOUNT,
             from_asset_id=MOCK_FROM_ASSET_ID,
@@ -65,7 +67,8 @@ def test_trade_api_error(wallet_factory):
 
         expected_response = "Error trading assets API error"
 
-        assert action_response == expected_response
+        assert str(action_response) == expected_response
+        assert str(action_response.error) == "API error"
         mock_trade.assert_called_once_with(
             amount=MOCK_AMOUNT,
             from_asset_id=MOCK_FROM_ASSET_ID,
@@ -50,7 +50,8 @@ def test_transfer_success(wallet_factory, transfer_factory):
         )
 
         expected_response = f"Transferred {MOCK_AMOUNT} of {MOCK_ASSET_ID} to {MOCK_DESTINATION}.\nTransaction hash for the transfer: {mock_transfer_instance.transaction_hash}\nTransaction link for the transfer: {mock_transfer_instance.transaction_link}"
-        assert action_response == expected_response
+        assert str(action_response) == expected_response
+        assert action_response.transaction_hash == mock_transfer_instance.transaction_hash
         mock_transfer.assert_called_once_with(
             amount=MOCK_AMOUNT,
             asset_id=MOCK_ASSET_ID,
@@ -71,7 +72,7 @@ def test_transfer_api_error(wallet_factory):
 
         expected_response = "Error transferring the asset API error"
 
-        assert action_response == expected_response
+        assert str(action_response) == expected_response
         mock_transfer.assert_called_once_with(
             amount=MOCK_AMOUNT,
             asset_id=MOCK_ASSET_ID,
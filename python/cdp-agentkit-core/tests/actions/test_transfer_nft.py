@@ -56,7 +56,8 @@ def test_transfer_nft_success(wallet_factory, contract_invocation_factory):
         )
 
         expected_response = f"Transferred NFT (ID: {MOCK_TOKEN_ID}) from contract {MOCK_CONTRACT_ADDRESS} to {MOCK_DESTINATION}.\nTransaction hash: {mock_contract_invocation.transaction_hash}\nTransaction link: {mock_contract_invocation.transaction_link}"
-        assert action_response == expected_response
+        assert str(action_response) == expected_response
+        assert action_response.transaction_hash == mock_contract_invocation.transaction_hash
         mock_invoke_contract.assert_called_once_with(
             contract_address=MOCK_CONTRACT_ADDRESS,
             method="transferFrom",
@@ -83,7 +84,7 @@ def test_transfer_nft_api_error(wallet_factory):
 
         expected_response = f"Error transferring the NFT (contract: {MOCK_CONTRACT_ADDRESS}, ID: {MOCK_TOKEN_ID}) from {mock_wallet.address} to {MOCK_DESTINATION}): API error"
 
-        assert action_response == expected_response
+        assert str(action_response) == expected_response
         mock_invoke_contract.assert_called_once_with(
             contract_address=MOCK_CONTRACT_ADDRESS,
             method="transferFrom",
@@ -37,9 +37,10 @@ def test_wrap_eth_success(wallet_factory, contract_invocation_factory):
         mock_invocation_wait.assert_called_once_with()
 
     assert (
-        result
+        str(result)
         == f"Wrapped ETH with transaction hash: {mock_invocation.transaction.transaction_hash}"
     )
+    assert result.transaction_hash == mock_invocation.transaction.transaction_hash
 
 
 def test_wrap_eth_failure(wallet_factory):
@@ -50,7 +51,7 @@ def test_wrap_eth_failure(wallet_factory):
     amount = "1000000000000000000"
     result = wrap_eth(mock_wallet, amount)
 
-    assert result == "Unexpected error wrapping ETH: Test error"
+    assert str(result) == "Unexpected error wrapping ETH: Test error"
 
 
 def test_wrap_eth_action_initialization():
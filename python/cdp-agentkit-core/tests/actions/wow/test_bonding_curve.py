@@ -0,0 +1,124 @@
+from unittest.mock import patch
+
+import pytest
+
+from cdp_agentkit_core.actions.wow.bonding_curve import (
+    BondingCurve,
+    BondingCurveState,
+    get_bonding_curve_state,
+    get_eth_buy_quote,
+    get_local_buy_quote,
+    get_token_sell_quote,
+    validation_stats,
+)
+from cdp_agentkit_core.actions.wow.cache import token_metadata_cache
+
+MOCK_NETWORK_ID = "base-sepolia"
+MOCK_TOKEN_ADDRESS = "0x036CbD53842c5426634e7929541eC2318f3dCF7e"
+MOCK_CURVE_ADDRESS = "0xCE00c75B9807A2aA87B2297cA7Dc1C0190137D6F"
+MOCK_CURVE = BondingCurve(a=1060848709, b=4379701787)
+MOCK_SUPPLY = 100_000_000 * 10**18
+MOCK_AMOUNT_ETH = 10**16
+
+
+@pytest.fixture(autouse=True)
+def clear_token_metadata_cache():
+    """Clear the token metadata cache between tests."""
+    token_metadata_cache.clear()
+    yield
+    token_metadata_cache.clear()
+
+
+def test_buy_then_sell_round_trip():
+    """Test that selling the tokens just bought returns the ETH spent, up to rounding."""
+    tokens = get_eth_buy_quote(MOCK_CURVE, MOCK_SUPPLY, MOCK_AMOUNT_ETH)
+    eth = get_token_sell_quote(MOCK_CURVE, MOCK_SUPPLY + tokens, tokens)
+
+    assert tokens > 0
+    assert abs(eth - MOCK_AMOUNT_ETH) <= MOCK_AMOUNT_ETH // 10**6
+
+
+def test_buy_quote_price_increases_with_supply():
+    """Test that the same ETH buys fewer tokens as supply grows."""
+    assert get_eth_buy_quote(MOCK_CURVE, 2 * MOCK_SUPPLY, MOCK_AMOUNT_ETH) < get_eth_buy_quote(
+        MOCK_CURVE, MOCK_SUPPLY, MOCK_AMOUNT_ETH
+    )
+
+
+def test_sell_quote_insufficient_supply():
+    """Test that selling more than the supply raises an error."""
+    with pytest.raises(ValueError):
+        get_token_sell_quote(MOCK_CURVE, MOCK_SUPPLY, MOCK_SUPPLY + 1)
+
+
+def test_get_bonding_curve_state_caches_curve():
+    """Test that only the total supply is read once the curve is cached."""
+    with patch(
+        "cdp_agentkit_core.actions.wow.bonding_curve.multicall",
+        side_effect=[
+            [MOCK_SUPPLY, MOCK_CURVE_ADDRESS],
+            [MOCK_CURVE.a, MOCK_CURVE.b],
+            [MOCK_SUPPLY + 1],
+        ],
+    ) as mock_multicall:
+        get_bonding_curve_state(MOCK_NETWORK_ID, MOCK_TOKEN_ADDRESS)
+        state = get_bonding_curve_state(MOCK_NETWORK_ID, MOCK_TOKEN_ADDRESS)
+
+    assert state == BondingCurveState(curve=MOCK_CURVE, current_supply=MOCK_SUPPLY + 1)
+    assert mock_multicall.call_count == 3
+    assert [call.method for call in mock_multicall.call_args[0][1]] == ["totalSupply"]
+
+
+def test_get_local_buy_quote_sampled_mismatch():
+    """Test that a sampled quote differing from the contract returns the on-chain quote."""
+    sampled, mismatched = validation_stats.sampled, validation_stats.mismatched
+
+    with (
+        patch(
+            "cdp_agentkit_core.actions.wow.bonding_curve.get_bonding_curve_state",
+            return_value=BondingCurveState(curve=MOCK_CURVE, current_supply=MOCK_SUPPLY),
+        ),
+        patch("cdp_agentkit_core.actions.wow.bonding_curve.VALIDATION_SAMPLE_RATE", 1.0),
+        patch("cdp.SmartContract.read", return_value=42) as mock_read,
+    ):
+        quote = get_local_buy_quote(MOCK_NETWORK_ID, MOCK_TOKEN_ADDRESS, str(MOCK_AMOUNT_ETH))
+
+    assert quote == 42
+    assert mock_read.call_args[0][2] == "getEthBuyQuote"
+    assert validation_stats.sampled == sampled + 1
+    assert validation_stats.mismatched == mismatched + 1
+
+
+def test_get_local_buy_quote_sampled_read_failure():
+    """Test that a failed on-chain quote of a sampled quote is counted, returning the local quote."""
+    sampled, failed = validation_stats.sampled, validation_stats.failed
+
+    with (
+        patch(
+            "cdp_agentkit_core.actions.wow.bonding_curve.get_bonding_curve_state",
+            return_value=BondingCurveState(curve=MOCK_CURVE, current_supply=MOCK_SUPPLY),
+        ),
+        patch("cdp_agentkit_core.actions.wow.bonding_curve.VALIDATION_SAMPLE_RATE", 1.0),
+        patch("cdp.SmartContract.read", side_effect=Exception("RPC unavailable")),
+    ):
+        quote = get_local_buy_quote(MOCK_NETWORK_ID, MOCK_TOKEN_ADDRESS, str(MOCK_AMOUNT_ETH))
+
+    assert quote == get_eth_buy_quote(MOCK_CURVE, MOCK_SUPPLY, MOCK_AMOUNT_ETH)
+    assert validation_stats.sampled == sampled + 1
+    assert validation_stats.failed == failed + 1
+
+
+def test_get_local_buy_quote_not_sampled():
+    """Test that unsampled quotes make no on-chain quote call."""
+    with (
+        patch(
+            "cdp_agentkit_core.actions.wow.bonding_curve.get_bonding_curve_state",
+            return_value=BondingCurveState(curve=MOCK_CURVE, current_supply=MOCK_SUPPLY),
+        ),
+        patch("cdp_agentkit_core.actions.wow.bonding_curve.VALIDATION_SAMPLE_RATE", 0.0),
+        patch("cdp.SmartContract.read") as mock_read,
+    ):
+        quote = get_local_buy_quote(MOCK_NETWORK_ID, MOCK_TOKEN_ADDRESS, str(MOCK_AMOUNT_ETH))
+
+    assert quote == get_eth_buy_quote(MOCK_CURVE, MOCK_SUPPLY, MOCK_AMOUNT_ETH)
+    mock_read.assert_not_called()
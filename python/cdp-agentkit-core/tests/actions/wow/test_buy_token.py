@@ -7,10 +7,12 @@ from cdp_agentkit_core.actions.wow.buy_token import (
     wow_buy_token,
 )
 from cdp_agentkit_core.actions.wow.constants import WOW_ABI
+from cdp_agentkit_core.actions.wow.uniswap.index import MarketState
 
 MOCK_CONTRACT_ADDRESS = "0x036CbD53842c5426634e7929541eC2318f3dCF7e"
 MOCK_AMOUNT_ETH = "100000000000000"
 MOCK_NETWORK_ID = "base-sepolia"
+MOCK_POOL_ADDRESS = "0x9876543210987654321098765432109876543210"
 MOCK_WALLET_ADDRESS = "0x1234567890123456789012345678901234567890"
 MOCK_TOKEN_QUOTE = 1000000
 
@@ -43,7 +45,10 @@ def test_buy_token_success(wallet_factory, contract_invocation_factory):
         patch(
             "cdp_agentkit_core.actions.wow.buy_token.get_buy_quote", return_value=MOCK_TOKEN_QUOTE
         ),
-        patch("cdp_agentkit_core.actions.wow.buy_token.get_has_graduated", return_value=False),
+        patch(
+            "cdp_agentkit_core.actions.wow.buy_token.get_market_state",
+            return_value=MarketState(False, MOCK_POOL_ADDRESS),
+        ),
         patch.object(
             mock_wallet, "invoke_contract", return_value=mock_contract_instance
         ) as mock_invoke,
@@ -58,7 +63,10 @@ def test_buy_token_success(wallet_factory, contract_invocation_factory):
         )
 
         expected_response = f"Purchased WoW ERC20 memecoin with transaction hash: {mock_contract_instance.transaction.transaction_hash}"
-        assert action_response == expected_response
+        assert str(action_response) == expected_response
+        assert (
+            action_response.transaction_hash == mock_contract_instance.transaction.transaction_hash
+        )
 
         # Calculate expected minimum tokens (99% of quote)
         expected_min_tokens = str(int((MOCK_TOKEN_QUOTE * 99) // 100))
@@ -93,7 +101,10 @@ def test_buy_token_graduated_pool(wallet_factory, contract_invocation_factory):
         patch(
             "cdp_agentkit_core.actions.wow.buy_token.get_buy_quote", return_value=MOCK_TOKEN_QUOTE
         ),
-        patch("cdp_agentkit_core.actions.wow.buy_token.get_has_graduated", return_value=True),
+        patch(
+            "cdp_agentkit_core.actions.wow.buy_token.get_market_state",
+            return_value=MarketState(True, MOCK_POOL_ADDRESS),
+        ),
         patch.object(
             mock_wallet, "invoke_contract", return_value=mock_contract_instance
         ) as mock_invoke,
@@ -119,7 +130,10 @@ def test_buy_token_api_error(wallet_factory):
         patch(
             "cdp_agentkit_core.actions.wow.buy_token.get_buy_quote", return_value=MOCK_TOKEN_QUOTE
         ),
-        patch("cdp_agentkit_core.actions.wow.buy_token.get_has_graduated", return_value=False),
+        patch(
+            "cdp_agentkit_core.actions.wow.buy_token.get_market_state",
+            return_value=MarketState(False, MOCK_POOL_ADDRESS),
+        ),
         patch.object(
             mock_wallet, "invoke_contract", side_effect=Exception("API error")
         ) as mock_invoke,
@@ -132,5 +146,5 @@ def test_buy_token_api_error(wallet_factory):
 
         expected_response = "Error buying Zora Wow ERC20 memecoin API error"
 
-        assert action_response == expected_response
+        assert str(action_response) == expected_response
         mock_invoke.assert_called_once()
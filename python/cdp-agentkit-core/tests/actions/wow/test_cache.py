@@ -0,0 +1,54 @@
+from unittest.mock import patch
+
+from cdp_agentkit_core.actions.wow.cache import TokenMetadataCache
+
+MOCK_NETWORK_ID = "base-sepolia"
+MOCK_TOKEN_ADDRESS = "0x036CbD53842c5426634e7929541eC2318f3dCF7e"
+MOCK_POOL_ADDRESS = "0x9876543210987654321098765432109876543210"
+
+
+def test_cache_get_set_counts_hits_and_misses():
+    """Test that lookups are case insensitive on the address and counted."""
+    cache = TokenMetadataCache()
+
+    assert cache.get(MOCK_NETWORK_ID, MOCK_TOKEN_ADDRESS, "poolAddress") is None
+    cache.set(MOCK_NETWORK_ID, MOCK_TOKEN_ADDRESS, "poolAddress", MOCK_POOL_ADDRESS)
+
+    assert (
+        cache.get(MOCK_NETWORK_ID, MOCK_TOKEN_ADDRESS.lower(), "poolAddress") == MOCK_POOL_ADDRESS
+    )
+    assert cache.get("base-mainnet", MOCK_TOKEN_ADDRESS, "poolAddress") is None
+    assert cache.hits == 1
+    assert cache.misses == 2
+
+
+def test_cache_ttl_expiry():
+    """Test that TTL entries expire and permanent entries do not."""
+    cache = TokenMetadataCache()
+
+    with patch("cdp_agentkit_core.actions.wow.cache.time.monotonic", return_value=100.0):
+        cache.set(MOCK_NETWORK_ID, MOCK_TOKEN_ADDRESS, "marketType", 0, ttl=30.0)
+        cache.set(MOCK_NETWORK_ID, MOCK_TOKEN_ADDRESS, "poolAddress", MOCK_POOL_ADDRESS)
+
+    with patch("cdp_agentkit_core.actions.wow.cache.time.monotonic", return_value=129.0):
+        assert cache.get(MOCK_NETWORK_ID, MOCK_TOKEN_ADDRESS, "marketType") == 0
+
+    with patch("cdp_agentkit_core.actions.wow.cache.time.monotonic", return_value=131.0):
+        assert cache.get(MOCK_NETWORK_ID, MOCK_TOKEN_ADDRESS, "marketType") is None
+        assert cache.get(MOCK_NETWORK_ID, MOCK_TOKEN_ADDRESS, "poolAddress") == MOCK_POOL_ADDRESS
+
+    assert len(cache) == 1
+
+
+def test_cache_lru_eviction():
+    """Test that the least recently used entry is evicted when full."""
+    cache = TokenMetadataCache(max_size=2)
+
+    cache.set(MOCK_NETWORK_ID, "0x1", "fee", 1)
+    cache.set(MOCK_NETWORK_ID, "0x2", "fee", 2)
+    cache.get(MOCK_NETWORK_ID, "0x1", "fee")
+    cache.set(MOCK_NETWORK_ID, "0x3", "fee", 3)
+
+    assert cache.get(MOCK_NETWORK_ID, "0x1", "fee") == 1
+    assert cache.get(MOCK_NETWORK_ID, "0x2", "fee") is None
+    assert cache.get(MOCK_NETWORK_ID, "0x3", "fee") == 3
@@ -59,7 +59,10 @@ def test_create_token_success(wallet_factory, contract_invocation_factory):
         )
 
         expected_response = f"Created WoW ERC20 memecoin {MOCK_NAME} with symbol {MOCK_SYMBOL} on network {MOCK_NETWORK_ID}.\nTransaction hash for the token creation: {mock_contract_instance.transaction.transaction_hash}\nTransaction link for the token creation: {mock_contract_instance.transaction.transaction_link}"
-        assert action_response == expected_response
+        assert str(action_response) == expected_response
+        assert (
+            action_response.transaction_hash == mock_contract_instance.transaction.transaction_hash
+        )
 
         mock_invoke.assert_called_once_with(
             contract_address=get_factory_address(MOCK_NETWORK_ID),
@@ -93,7 +96,7 @@ def test_create_token_api_error(wallet_factory):
 
         expected_response = "Error creating Zora Wow ERC20 memecoin API error"
 
-        assert action_response == expected_response
+        assert str(action_response) == expected_response
         mock_invoke.assert_called_once_with(
             contract_address=get_factory_address(MOCK_NETWORK_ID),
             method="deploy",
@@ -133,7 +136,10 @@ def test_create_token_with_custom_token_uri_success(wallet_factory, contract_inv
         )
 
         expected_response = f"Created WoW ERC20 memecoin {MOCK_NAME} with symbol {MOCK_SYMBOL} on network {MOCK_NETWORK_ID}.\nTransaction hash for the token creation: {mock_contract_instance.transaction.transaction_hash}\nTransaction link for the token creation: {mock_contract_instance.transaction.transaction_link}"
-        assert action_response == expected_response
+        assert str(action_response) == expected_response
+        assert (
+            action_response.transaction_hash == mock_contract_instance.transaction.transaction_hash
+        )
 
         mock_invoke.assert_called_once_with(
             contract_address=get_factory_address(MOCK_NETWORK_ID),
@@ -0,0 +1,212 @@
+import asyncio
+from unittest.mock import patch
+
+import pytest
+
+from cdp_agentkit_core.actions.wow.bonding_curve import (
+    BondingCurve,
+    BondingCurveState,
+    get_eth_buy_quote,
+    get_token_sell_quote,
+)
+from cdp_agentkit_core.actions.wow.constants import addresses
+from cdp_agentkit_core.actions.wow.quote_curve import (
+    WowQuoteCurveInput,
+    awow_quote_curve,
+    get_quote_curve,
+    wow_quote_curve,
+)
+from cdp_agentkit_core.actions.wow.uniswap.index import MarketState, PoolInfo
+from cdp_agentkit_core.actions.wow.uniswap.swap_math import (
+    get_sqrt_ratio_at_tick,
+    simulate_exact_input_single,
+)
+
+MOCK_NETWORK_ID = "base-sepolia"
+MOCK_CONTRACT_ADDRESS = "0x036CbD53842c5426634e7929541eC2318f3dCF7e"
+MOCK_POOL_ADDRESS = "0x9876543210987654321098765432109876543210"
+MOCK_WETH_ADDRESS = addresses[MOCK_NETWORK_ID]["WETH"]
+MOCK_CURVE_STATE = BondingCurveState(
+    curve=BondingCurve(a=1060848709, b=4379701787), current_supply=100_000_000 * 10**18
+)
+MOCK_TICK = 100
+MOCK_POOL_INFO = PoolInfo(
+    token0=MOCK_WETH_ADDRESS,
+    balance0=10**21,
+    token1=MOCK_CONTRACT_ADDRESS,
+    balance1=10**26,
+    fee=10000,
+    liquidity=10**24,
+    sqrt_price_x96=get_sqrt_ratio_at_tick(MOCK_TICK),
+    tick=MOCK_TICK,
+)
+MOCK_AMOUNTS = [str(10**15), str(10**16), str(10**17)]
+
+
+def _patch_market_state(has_graduated: bool):
+    return patch(
+        "cdp_agentkit_core.actions.wow.quote_curve.get_market_state",
+        return_value=MarketState(has_graduated, MOCK_POOL_ADDRESS),
+    )
+
+
+def test_quote_curve_input_model_valid():
+    """Test that WowQuoteCurveInput accepts valid parameters."""
+    input_model = WowQuoteCurveInput(
+        contract_address=MOCK_CONTRACT_ADDRESS,
+        amounts_in_wei=MOCK_AMOUNTS,
+        quote_type="buy",
+    )
+
+    assert input_model.amounts_in_wei == MOCK_AMOUNTS
+    assert input_model.quote_type == "buy"
+
+
+def test_quote_curve_input_model_invalid_quote_type():
+    """Test that WowQuoteCurveInput rejects unknown quote types."""
+    with pytest.raises(ValueError):
+        WowQuoteCurveInput(
+            contract_address=MOCK_CONTRACT_ADDRESS,
+            amounts_in_wei=MOCK_AMOUNTS,
+            quote_type="swap",
+        )
+
+
+def test_get_quote_curve_bonding_curve_buy():
+    """Test that bonding curve buys match the exact curve math and impact grows with size."""
+    with (
+        _patch_market_state(False),
+        patch(
+            "cdp_agentkit_core.actions.wow.quote_curve.get_bonding_curve_state",
+            return_value=MOCK_CURVE_STATE,
+        ) as mock_curve_state,
+    ):
+        points = get_quote_curve(MOCK_NETWORK_ID, MOCK_CONTRACT_ADDRESS, MOCK_AMOUNTS, "buy")
+
+    mock_curve_state.assert_called_once()
+    for amount, point in zip(MOCK_AMOUNTS, points, strict=True):
+        expected = get_eth_buy_quote(
+            MOCK_CURVE_STATE.curve, MOCK_CURVE_STATE.current_supply, int(amount)
+        )
+        assert point.quote.amount_in == int(amount)
+        assert point.quote.amount_out == pytest.approx(expected, rel=1e-9)
+        assert point.quote.error is None
+    assert 0 < points[0].price_impact < points[1].price_impact < points[2].price_impact
+
+
+def test_get_quote_curve_bonding_curve_sell():
+    """Test that bonding curve sells match the exact curve math and flag oversized orders."""
+    amounts = [str(10**24), str(2 * MOCK_CURVE_STATE.current_supply)]
+
+    with (
+        _patch_market_state(False),
+        patch(
+            "cdp_agentkit_core.actions.wow.quote_curve.get_bonding_curve_state",
+            return_value=MOCK_CURVE_STATE,
+        ),
+    ):
+        points = get_quote_curve(MOCK_NETWORK_ID, MOCK_CONTRACT_ADDRESS, amounts, "sell")
+
+    expected = get_token_sell_quote(
+        MOCK_CURVE_STATE.curve, MOCK_CURVE_STATE.current_supply, int(amounts[0])
+    )
+    assert points[0].quote.amount_out == pytest.approx(expected, rel=1e-9)
+    assert points[0].price_impact > 0
+    assert points[1].quote.amount_out == 0
+    assert points[1].quote.error == "Insufficient liquidity"
+
+
+def test_get_quote_curve_uniswap_buy():
+    """Test that graduated buys match the in-range swap simulation."""
+    with (
+        _patch_market_state(True),
+        patch(
+            "cdp_agentkit_core.actions.wow.quote_curve.get_pool_info",
+            return_value=MOCK_POOL_INFO,
+        ) as mock_pool_info,
+    ):
+        points = get_quote_curve(MOCK_NETWORK_ID, MOCK_CONTRACT_ADDRESS, MOCK_AMOUNTS, "buy")
+
+    mock_pool_info.assert_called_once()
+    for amount, point in zip(MOCK_AMOUNTS, points, strict=True):
+        expected = simulate_exact_input_single(
+            MOCK_POOL_INFO.sqrt_price_x96,
+            MOCK_TICK,
+            MOCK_POOL_INFO.liquidity,
+            MOCK_POOL_INFO.fee,
+            True,
+            int(amount),
+        )
+        assert point.quote.amount_out == pytest.approx(expected, rel=1e-9)
+        assert point.quote.fee == 0.01
+        assert point.quote.balance.weth == MOCK_POOL_INFO.balance0
+    # The pool fee alone is a 1% price impact.
+    assert points[0].price_impact == pytest.approx(0.01, abs=1e-3)
+    assert points[0].price_impact < points[2].price_impact
+
+
+def test_get_quote_curve_empty():
+    """Test that no state is read for an empty list of order sizes."""
+    with _patch_market_state(True) as mock_market_state:
+        assert get_quote_curve(MOCK_NETWORK_ID, MOCK_CONTRACT_ADDRESS, [], "buy") == []
+
+    mock_market_state.assert_not_called()
+
+
+def test_wow_quote_curve_success(wallet_factory):
+    """Test that the action renders a line per order size."""
+    mock_wallet = wallet_factory()
+    mock_wallet.network_id = MOCK_NETWORK_ID
+
+    with (
+        _patch_market_state(True),
+        patch(
+            "cdp_agentkit_core.actions.wow.quote_curve.get_pool_info",
+            return_value=MOCK_POOL_INFO,
+        ),
+    ):
+        action_response = wow_quote_curve(mock_wallet, MOCK_CONTRACT_ADDRESS, MOCK_AMOUNTS, "sell")
+
+    lines = str(action_response).split("\n")
+    assert lines[0] == f"Quote curve for selling WoW ERC20 memecoin {MOCK_CONTRACT_ADDRESS}:"
+    assert len(lines) == len(MOCK_AMOUNTS) + 1
+    assert "price impact" in lines[1]
+    assert [point.quote.amount_in for point in action_response.points] == [
+        int(amount) for amount in MOCK_AMOUNTS
+    ]
+
+
+def test_wow_quote_curve_error(wallet_factory):
+    """Test that errors reading the token state are returned as a message."""
+    mock_wallet = wallet_factory()
+    mock_wallet.network_id = MOCK_NETWORK_ID
+
+    with patch(
+        "cdp_agentkit_core.actions.wow.quote_curve.get_market_state",
+        side_effect=Exception("RPC error"),
+    ):
+        action_response = wow_quote_curve(mock_wallet, MOCK_CONTRACT_ADDRESS, MOCK_AMOUNTS, "buy")
+
+    assert str(action_response) == "Error quoting Zora Wow ERC20 memecoin RPC error"
+
+
+def test_awow_quote_curve_matches_sync(wallet_factory):
+    """Test that the async action renders the same quote curve as the sync action."""
+    mock_wallet = wallet_factory()
+    mock_wallet.network_id = MOCK_NETWORK_ID
+
+    with (
+        _patch_market_state(True),
+        patch(
+            "cdp_agentkit_core.actions.wow.quote_curve.get_pool_info",
+            return_value=MOCK_POOL_INFO,
+        ),
+    ):
+        expected_response = wow_quote_curve(
+            mock_wallet, MOCK_CONTRACT_ADDRESS, MOCK_AMOUNTS, "sell"
+        )
+        action_response = asyncio.run(
+            awow_quote_curve(mock_wallet, MOCK_CONTRACT_ADDRESS, MOCK_AMOUNTS, "sell")
+        )
+
+    assert action_response == expected_response
@@ -7,10 +7,12 @@ from cdp_agentkit_core.actions.wow.sell_token import (
     WowSellTokenInput,
     wow_sell_token,
 )
+from cdp_agentkit_core.actions.wow.uniswap.index import MarketState
 
 MOCK_CONTRACT_ADDRESS = "0x036CbD53842c5426634e7929541eC2318f3dCF7e"
 MOCK_AMOUNT_TOKENS = "100000000000000"
 MOCK_NETWORK_ID = "base-sepolia"
+MOCK_POOL_ADDRESS = "0x9876543210987654321098765432109876543210"
 MOCK_WALLET_ADDRESS = "0x1234567890123456789012345678901234567890"
 MOCK_ETH_QUOTE = 1000000
 
@@ -45,8 +47,8 @@ def test_sell_token_success(wallet_factory, contract_invocation_factory):
             return_value=MOCK_ETH_QUOTE,
         ),
         patch(
-            "cdp_agentkit_core.actions.wow.sell_token.get_has_graduated",
-            return_value=False,
+            "cdp_agentkit_core.actions.wow.sell_token.get_market_state",
+            return_value=MarketState(False, MOCK_POOL_ADDRESS),
         ),
         patch.object(
             mock_wallet, "invoke_contract", return_value=mock_contract_instance
@@ -62,7 +64,10 @@ def test_sell_token_success(wallet_factory, contract_invocation_factory):
         )
 
         expected_response = f"Sold WoW ERC20 memecoin with transaction hash: {mock_contract_instance.transaction.transaction_hash}"
-        assert action_response == expected_response
+        assert str(action_response) == expected_response
+        assert (
+            action_response.transaction_hash == mock_contract_instance.transaction.transaction_hash
+        )
 
         # Calculate expected minimum ETH (98% of quote)
         expected_min_eth = str(int((MOCK_ETH_QUOTE * 98) // 100))
@@ -97,8 +102,8 @@ def test_sell_token_graduated_pool(wallet_factory, contract_invocation_factory):
             return_value=MOCK_ETH_QUOTE,
         ),
         patch(
-            "cdp_agentkit_core.actions.wow.sell_token.get_has_graduated",
-            return_value=True,
+            "cdp_agentkit_core.actions.wow.sell_token.get_market_state",
+            return_value=MarketState(True, MOCK_POOL_ADDRESS),
         ),
         patch.object(
             mock_wallet, "invoke_contract", return_value=mock_contract_instance
@@ -127,8 +132,8 @@ def test_sell_token_api_error(wallet_factory):
             return_value=MOCK_ETH_QUOTE,
         ),
         patch(
-            "cdp_agentkit_core.actions.wow.sell_token.get_has_graduated",
-            return_value=False,
+            "cdp_agentkit_core.actions.wow.sell_token.get_market_state",
+            return_value=MarketState(False, MOCK_POOL_ADDRESS),
         ),
         patch.object(
             mock_wallet, "invoke_contract", side_effect=Exception("API error")
@@ -142,5 +147,5 @@ def test_sell_token_api_error(wallet_factory):
 
         expected_response = "Error selling Zora Wow ERC20 memecoin API error"
 
-        assert action_response == expected_response
+        assert str(action_response) == expected_response
         mock_invoke.assert_called_once()
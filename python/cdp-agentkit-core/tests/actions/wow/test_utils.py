@@ -0,0 +1,43 @@
+from unittest.mock import patch
+
+from cdp_agentkit_core.actions.wow.constants import WOW_ABI
+from cdp_agentkit_core.actions.wow.uniswap.index import MarketState
+from cdp_agentkit_core.actions.wow.utils import get_buy_quote, get_current_supply
+
+MOCK_CONTRACT_ADDRESS = "0x036CbD53842c5426634e7929541eC2318f3dCF7e"
+MOCK_NETWORK_ID = "base-mainnet"
+MOCK_POOL_ADDRESS = "0x9876543210987654321098765432109876543210"
+MOCK_TOTAL_SUPPLY = 1000000
+
+
+def test_get_current_supply_uses_network():
+    """Test that the total supply is read on the given network."""
+    with patch(
+        "cdp.SmartContract.read",
+        return_value=MOCK_TOTAL_SUPPLY,
+    ) as mock_read:
+        assert get_current_supply(MOCK_NETWORK_ID, MOCK_CONTRACT_ADDRESS) == MOCK_TOTAL_SUPPLY
+
+    mock_read.assert_called_once_with(
+        MOCK_NETWORK_ID, MOCK_CONTRACT_ADDRESS, "totalSupply", abi=WOW_ABI, args=None
+    )
+
+
+def test_get_buy_quote_not_graduated_uses_local_quote():
+    """Test that non-graduated tokens are quoted from the local bonding curve."""
+    with (
+        patch(
+            "cdp_agentkit_core.actions.wow.utils.get_local_buy_quote", return_value=42
+        ) as mock_local_quote,
+        patch("cdp.SmartContract.read") as mock_read,
+    ):
+        quote = get_buy_quote(
+            MOCK_NETWORK_ID,
+            MOCK_CONTRACT_ADDRESS,
+            "1000",
+            MarketState(has_graduated=False, pool_address=MOCK_POOL_ADDRESS),
+        )
+
+    assert quote == 42
+    mock_local_quote.assert_called_once_with(MOCK_NETWORK_ID, MOCK_CONTRACT_ADDRESS, "1000")
+    mock_read.assert_not_called()
@@ -0,0 +1,143 @@
+from unittest.mock import patch
+
+import pytest
+
+from cdp_agentkit_core.actions.wow.cache import token_metadata_cache
+from cdp_agentkit_core.actions.wow.constants import addresses
+from cdp_agentkit_core.actions.wow.uniswap.index import (
+    MarketState,
+    get_market_state,
+    get_pool_address,
+    get_pool_info,
+)
+
+MOCK_NETWORK_ID = "base-sepolia"
+MOCK_TOKEN_ADDRESS = "0x036CbD53842c5426634e7929541eC2318f3dCF7e"
+MOCK_POOL_ADDRESS = "0x9876543210987654321098765432109876543210"
+MOCK_WETH_ADDRESS = addresses[MOCK_NETWORK_ID]["WETH"]
+MOCK_SQRT_PRICE_X96 = 2**96
+MOCK_SLOT0 = (MOCK_SQRT_PRICE_X96, 0, 0, 0, 0, 0, True)
+
+
+@pytest.fixture(autouse=True)
+def clear_token_metadata_cache():
+    """Clear the token metadata cache between tests."""
+    token_metadata_cache.clear()
+    yield
+    token_metadata_cache.clear()
+
+
+def test_get_market_state():
+    """Test that graduation status and pool address are read in one batch."""
+    with patch(
+        "cdp_agentkit_core.actions.wow.uniswap.index.multicall",
+        return_value=[1, MOCK_POOL_ADDRESS],
+    ) as mock_multicall:
+        market_state = get_market_state(MOCK_NETWORK_ID, MOCK_TOKEN_ADDRESS)
+
+    assert market_state == MarketState(has_graduated=True, pool_address=MOCK_POOL_ADDRESS)
+    mock_multicall.assert_called_once()
+    assert [call.method for call in mock_multicall.call_args[0][1]] == [
+        "marketType",
+        "poolAddress",
+    ]
+
+
+def test_get_pool_info_with_token_address():
+    """Test that pool state and balances are read in one batch when the token is known."""
+    with patch(
+        "cdp_agentkit_core.actions.wow.uniswap.index.multicall",
+        return_value=[5000, MOCK_SLOT0, MOCK_WETH_ADDRESS, MOCK_TOKEN_ADDRESS, 10000, 200, 100],
+    ) as mock_multicall:
+        pool_info = get_pool_info(MOCK_NETWORK_ID, MOCK_POOL_ADDRESS, MOCK_TOKEN_ADDRESS)
+
+    mock_multicall.assert_called_once()
+    assert pool_info.token0 == MOCK_WETH_ADDRESS
+    assert pool_info.balance0 == 100
+    assert pool_info.token1 == MOCK_TOKEN_ADDRESS
+    assert pool_info.balance1 == 200
+    assert pool_info.fee == 10000
+    assert pool_info.liquidity == 5000
+    assert pool_info.sqrt_price_x96 == MOCK_SQRT_PRICE_X96
+
+
+def test_get_pool_info_without_token_address():
+    """Test that balances are read in a second batch when the token is unknown."""
+    with patch(
+        "cdp_agentkit_core.actions.wow.uniswap.index.multicall",
+        side_effect=[
+            [5000, MOCK_SLOT0, MOCK_TOKEN_ADDRESS, MOCK_WETH_ADDRESS, 10000],
+            [200, 100],
+        ],
+    ) as mock_multicall:
+        pool_info = get_pool_info(MOCK_NETWORK_ID, MOCK_POOL_ADDRESS)
+
+    assert mock_multicall.call_count == 2
+    assert pool_info.balance0 == 200
+    assert pool_info.balance1 == 100
+
+
+def test_get_market_state_cached():
+    """Test that a graduated market state is served from the cache."""
+    with patch(
+        "cdp_agentkit_core.actions.wow.uniswap.index.multicall",
+        return_value=[1, MOCK_POOL_ADDRESS],
+    ) as mock_multicall:
+        get_market_state(MOCK_NETWORK_ID, MOCK_TOKEN_ADDRESS)
+        market_state = get_market_state(MOCK_NETWORK_ID, MOCK_TOKEN_ADDRESS)
+
+    assert market_state == MarketState(has_graduated=True, pool_address=MOCK_POOL_ADDRESS)
+    mock_multicall.assert_called_once()
+
+
+def test_get_market_state_refreshes_non_graduated():
+    """Test that only the market type is re-read for a non-graduated token once expired."""
+    with patch(
+        "cdp_agentkit_core.actions.wow.uniswap.index.multicall",
+        side_effect=[[0, MOCK_POOL_ADDRESS], [1]],
+    ) as mock_multicall:
+        get_market_state(MOCK_NETWORK_ID, MOCK_TOKEN_ADDRESS)
+        with patch("cdp_agentkit_core.actions.wow.cache.time.monotonic", return_value=1e12):
+            market_state = get_market_state(MOCK_NETWORK_ID, MOCK_TOKEN_ADDRESS)
+
+    assert market_state.has_graduated
+    assert [call.method for call in mock_multicall.call_args[0][1]] == ["marketType"]
+
+
+def test_get_pool_info_cached_pool_tokens():
+    """Test that cached pool tokens and fee are not read again."""
+    with patch(
+        "cdp_agentkit_core.actions.wow.uniswap.index.multicall",
+        side_effect=[
+            [5000, MOCK_SLOT0, MOCK_WETH_ADDRESS, MOCK_TOKEN_ADDRESS, 10000, 200, 100],
+            [6000, MOCK_SLOT0, 150, 250],
+        ],
+    ) as mock_multicall:
+        get_pool_info(MOCK_NETWORK_ID, MOCK_POOL_ADDRESS, MOCK_TOKEN_ADDRESS)
+        pool_info = get_pool_info(MOCK_NETWORK_ID, MOCK_POOL_ADDRESS)
+
+    assert [call.method for call in mock_multicall.call_args[0][1]] == [
+        "liquidity",
+        "slot0",
+        "balanceOf",
+        "balanceOf",
+    ]
+    assert pool_info.liquidity == 6000
+    assert pool_info.balance0 == 150
+    assert pool_info.balance1 == 250
+    assert pool_info.fee == 10000
+
+
+def test_get_pool_address_uses_network():
+    """Test that the pool address is read on the given network and cached per network."""
+    with patch(
+        "cdp.SmartContract.read",
+        return_value=MOCK_POOL_ADDRESS,
+    ) as mock_read:
+        assert get_pool_address("base-mainnet", MOCK_TOKEN_ADDRESS) == MOCK_POOL_ADDRESS
+        assert get_pool_address("base-mainnet", MOCK_TOKEN_ADDRESS) == MOCK_POOL_ADDRESS
+        get_pool_address(MOCK_NETWORK_ID, MOCK_TOKEN_ADDRESS)
+
+    assert mock_read.call_count == 2
+    assert mock_read.call_args_list[0][0][:3] == ("base-mainnet", MOCK_TOKEN_ADDRESS, "poolAddress")
+    assert mock_read.call_args_list[1][0][0] == MOCK_NETWORK_ID
@@ -0,0 +1,93 @@
+from unittest.mock import patch
+
+from eth_abi import encode
+
+from cdp_agentkit_core.actions.wow.constants import WOW_ABI, addresses
+from cdp_agentkit_core.actions.wow.uniswap.constants import MULTICALL3_ABI, UNISWAP_V3_ABI
+from cdp_agentkit_core.actions.wow.uniswap.multicall import (
+    ContractCall,
+    decode_result,
+    encode_call,
+    multicall,
+)
+
+MOCK_NETWORK_ID = "base-sepolia"
+MOCK_POOL_ADDRESS = "0x1234567890123456789012345678901234567890"
+MOCK_TOKEN_ADDRESS = "0x036CbD53842c5426634e7929541eC2318f3dCF7e"
+MOCK_BALANCE = 1000000
+
+
+def test_encode_call_with_args():
+    """Test that calldata starts with the selector and encodes the arguments."""
+    call = ContractCall(MOCK_TOKEN_ADDRESS, "balanceOf", WOW_ABI, {"account": MOCK_POOL_ADDRESS})
+
+    calldata = encode_call(call)
+
+    assert calldata == "0x70a08231" + MOCK_POOL_ADDRESS[2:].rjust(64, "0")
+
+
+def test_decode_result_single_and_multiple_outputs():
+    """Test that single outputs decode to a value and multiple outputs to a tuple."""
+    token_call = ContractCall(MOCK_POOL_ADDRESS, "token0", UNISWAP_V3_ABI)
+    slot0_call = ContractCall(MOCK_POOL_ADDRESS, "slot0", UNISWAP_V3_ABI)
+
+    token0 = decode_result(token_call, encode(["address"], [MOCK_TOKEN_ADDRESS]))
+    slot0 = decode_result(
+        slot0_call,
+        encode(
+            ["uint160", "int24", "uint16", "uint16", "uint16", "uint8", "bool"],
+            [2**96, -10, 1, 2, 3, 0, True],
+        ),
+    )
+
+    assert token0 == MOCK_TOKEN_ADDRESS
+    assert slot0 == (2**96, -10, 1, 2, 3, 0, True)
+
+
+def test_multicall_aggregate3():
+    """Test that calls are batched into a single aggregate3 read."""
+    calls = [
+        ContractCall(MOCK_POOL_ADDRESS, "token0", UNISWAP_V3_ABI),
+        ContractCall(MOCK_TOKEN_ADDRESS, "balanceOf", WOW_ABI, {"account": MOCK_POOL_ADDRESS}),
+    ]
+    mock_results = [
+        {"success": True, "returnData": "0x" + encode(["address"], [MOCK_TOKEN_ADDRESS]).hex()},
+        {"success": True, "returnData": "0x" + encode(["uint256"], [MOCK_BALANCE]).hex()},
+    ]
+
+    with patch(
+        "cdp.SmartContract.read",
+        return_value=mock_results,
+    ) as mock_read:
+        results = multicall(MOCK_NETWORK_ID, calls)
+
+    assert results == [MOCK_TOKEN_ADDRESS, MOCK_BALANCE]
+    mock_read.assert_called_once()
+    assert mock_read.call_args[0][:3] == (
+        MOCK_NETWORK_ID,
+        addresses[MOCK_NETWORK_ID]["Multicall3"],
+        "aggregate3",
+    )
+    assert mock_read.call_args[1]["abi"] == MULTICALL3_ABI
+    assert len(mock_read.call_args[1]["args"]["calls"]) == 2
+
+
+def test_multicall_fallback_to_individual_reads():
+    """Test that calls fall back to individual reads when aggregate3 fails."""
+    calls = [
+        ContractCall(MOCK_POOL_ADDRESS, "fee", UNISWAP_V3_ABI),
+        ContractCall(MOCK_POOL_ADDRESS, "liquidity", UNISWAP_V3_ABI),
+    ]
+
+    def mock_read(network_id, contract_address, method, abi=None, args=None):
+        if method == "aggregate3":
+            raise Exception("Multicall unavailable")
+        return {"fee": 3000, "liquidity": 42}[method]
+
+    with patch(
+        "cdp.SmartContract.read",
+        side_effect=mock_read,
+    ):
+        results = multicall(MOCK_NETWORK_ID, calls)
+
+    assert results == [3000, 42]
@@ -0,0 +1,197 @@
+from decimal import Decimal, getcontext
+from unittest.mock import patch
+
+import pytest
+
+from cdp_agentkit_core.actions.tracing import tracer
+from cdp_agentkit_core.actions.wow.constants import addresses
+from cdp_agentkit_core.actions.wow.uniswap.constants import MAX_TICK, MIN_TICK, Q96
+from cdp_agentkit_core.actions.wow.uniswap.index import PoolInfo, get_uniswap_quote
+from cdp_agentkit_core.actions.wow.uniswap.swap_math import (
+    get_sqrt_ratio_at_tick,
+    get_tick_range,
+    simulate_exact_input_many,
+    simulate_exact_input_single,
+)
+
+MOCK_NETWORK_ID = "base-sepolia"
+MOCK_TOKEN_ADDRESS = "0x036CbD53842c5426634e7929541eC2318f3dCF7e"
+MOCK_POOL_ADDRESS = "0x9876543210987654321098765432109876543210"
+MOCK_WETH_ADDRESS = addresses[MOCK_NETWORK_ID]["WETH"]
+MOCK_LIQUIDITY = 10**24
+MOCK_FEE = 10000
+MOCK_AMOUNT_IN = 10**18
+MOCK_TICK = 100
+MOCK_SQRT_PRICE_X96 = get_sqrt_ratio_at_tick(MOCK_TICK)
+
+getcontext().prec = 80
+
+
+def test_get_sqrt_ratio_at_tick():
+    """Test sqrt prices against the Uniswap v3 TickMath reference values."""
+    assert get_sqrt_ratio_at_tick(0) == Q96
+    assert get_sqrt_ratio_at_tick(MIN_TICK) == 4295128739
+    assert get_sqrt_ratio_at_tick(MAX_TICK) == 1461446703485210103287273052203988822378723970342
+
+    with pytest.raises(ValueError):
+        get_sqrt_ratio_at_tick(MAX_TICK + 1)
+
+
+def test_get_tick_range():
+    """Test that tick ranges are aligned to the fee tier's tick spacing."""
+    assert get_tick_range(250, MOCK_FEE) == (200, 400)
+    assert get_tick_range(-1, MOCK_FEE) == (-200, 0)
+    assert get_tick_range(7, 3000) == (0, 60)
+
+
+def test_simulate_exact_input_zero_for_one():
+    """Test a token0 to token1 swap against the constant liquidity formula."""
+    amount_out = simulate_exact_input_single(
+        MOCK_SQRT_PRICE_X96, MOCK_TICK, MOCK_LIQUIDITY, MOCK_FEE, True, MOCK_AMOUNT_IN
+    )
+
+    liquidity = Decimal(MOCK_LIQUIDITY)
+    sqrt_price = Decimal(MOCK_SQRT_PRICE_X96) / Q96
+    amount_in_less_fee = Decimal(MOCK_AMOUNT_IN) * Decimal("0.99")
+    next_sqrt_price = liquidity * sqrt_price / (liquidity + amount_in_less_fee * sqrt_price)
+    expected = liquidity * (sqrt_price - next_sqrt_price)
+    assert amount_out is not None
+    assert abs(amount_out - expected) <= 1
+
+
+def test_simulate_exact_input_one_for_zero():
+    """Test a token1 to token0 swap against the constant liquidity formula."""
+    amount_out = simulate_exact_input_single(
+        MOCK_SQRT_PRICE_X96, MOCK_TICK, MOCK_LIQUIDITY, MOCK_FEE, False, MOCK_AMOUNT_IN
+    )
+
+    liquidity = Decimal(MOCK_LIQUIDITY)
+    sqrt_price = Decimal(MOCK_SQRT_PRICE_X96) / Q96
+    next_sqrt_price = sqrt_price + Decimal(MOCK_AMOUNT_IN) * Decimal("0.99") / liquidity
+    expected = liquidity * (1 / sqrt_price - 1 / next_sqrt_price)
+    assert amount_out is not None
+    assert abs(amount_out - expected) <= 1
+
+
+def test_simulate_exact_input_crossing_tick():
+    """Test that swaps reaching the tick range boundary are not simulated."""
+    # At the lower boundary of the range, any token0 input crosses the tick.
+    assert simulate_exact_input_single(Q96, 0, MOCK_LIQUIDITY, MOCK_FEE, True, 1) is None
+    assert (
+        simulate_exact_input_single(
+            MOCK_SQRT_PRICE_X96, MOCK_TICK, MOCK_LIQUIDITY, MOCK_FEE, False, MOCK_LIQUIDITY
+        )
+        is None
+    )
+
+
+def test_simulate_exact_input_many():
+    """Test quoting many order sizes at once."""
+    amounts_out = simulate_exact_input_many(
+        MOCK_SQRT_PRICE_X96,
+        MOCK_TICK,
+        MOCK_LIQUIDITY,
+        MOCK_FEE,
+        False,
+        [0, MOCK_AMOUNT_IN, 2 * MOCK_AMOUNT_IN, 10**30],
+    )
+
+    assert amounts_out[0] == 0
+    assert amounts_out[1] < amounts_out[2] < 2 * amounts_out[1]
+    assert amounts_out[3] is None
+
+
+def test_get_uniswap_quote_simulated():
+    """Test that in range swaps do not call the on-chain quoter."""
+    pool_info = PoolInfo(
+        token0=MOCK_WETH_ADDRESS,
+        balance0=10**21,
+        token1=MOCK_TOKEN_ADDRESS,
+        balance1=10**24,
+        fee=MOCK_FEE,
+        liquidity=MOCK_LIQUIDITY,
+        sqrt_price_x96=MOCK_SQRT_PRICE_X96,
+        tick=MOCK_TICK,
+    )
+
+    with (
+        patch("cdp_agentkit_core.actions.wow.uniswap.index.get_pool_info", return_value=pool_info),
+        patch("cdp_agentkit_core.actions.wow.uniswap.index.exact_input_single") as mock_quoter,
+    ):
+        quote = get_uniswap_quote(
+            MOCK_NETWORK_ID, MOCK_TOKEN_ADDRESS, str(MOCK_AMOUNT_IN), "buy", MOCK_POOL_ADDRESS
+        )
+
+    mock_quoter.assert_not_called()
+    assert quote.amount_out == simulate_exact_input_single(
+        MOCK_SQRT_PRICE_X96, MOCK_TICK, MOCK_LIQUIDITY, MOCK_FEE, True, MOCK_AMOUNT_IN
+    )
+
+
+def test_get_uniswap_quote_falls_back_to_quoter():
+    """Test that swaps crossing a tick are quoted on-chain."""
+    pool_info = PoolInfo(
+        token0=MOCK_WETH_ADDRESS,
+        balance0=10**21,
+        token1=MOCK_TOKEN_ADDRESS,
+        balance1=10**24,
+        fee=MOCK_FEE,
+        liquidity=10**6,
+        sqrt_price_x96=MOCK_SQRT_PRICE_X96,
+        tick=MOCK_TICK,
+    )
+
+    with (
+        patch("cdp_agentkit_core.actions.wow.uniswap.index.get_pool_info", return_value=pool_info),
+        patch(
+            "cdp_agentkit_core.actions.wow.uniswap.index.exact_input_single", return_value=42
+        ) as mock_quoter,
+    ):
+        quote = get_uniswap_quote(
+            MOCK_NETWORK_ID, MOCK_TOKEN_ADDRESS, MOCK_AMOUNT_IN, "buy", MOCK_POOL_ADDRESS
+        )
+
+    mock_quoter.assert_called_once()
+    assert quote.amount_out == 42
+
+
+def test_get_uniswap_quote_traced(capsys):
+    """Test that quotes record per-stage spans instead of printing."""
+    pool_info = PoolInfo(
+        token0=MOCK_WETH_ADDRESS,
+        balance0=10**21,
+        token1=MOCK_TOKEN_ADDRESS,
+        balance1=10**24,
+        fee=MOCK_FEE,
+        liquidity=10**6,
+        sqrt_price_x96=MOCK_SQRT_PRICE_X96,
+        tick=MOCK_TICK,
+    )
+
+    tracer.enable()
+    try:
+        with (
+            patch(
+                "cdp_agentkit_core.actions.wow.uniswap.index.get_pool_address",
+                return_value=MOCK_POOL_ADDRESS,
+            ),
+            patch(
+                "cdp_agentkit_core.actions.wow.uniswap.index.get_pool_info",
+                return_value=pool_info,
+            ),
+            patch(
+                "cdp_agentkit_core.actions.wow.uniswap.index.exact_input_single", return_value=42
+            ),
+        ):
+            get_uniswap_quote(MOCK_NETWORK_ID, MOCK_TOKEN_ADDRESS, MOCK_AMOUNT_IN, "buy")
+        snapshot = tracer.snapshot()
+    finally:
+        tracer.disable()
+        tracer.reset()
+
+    assert capsys.readouterr().out == ""
+    assert set(snapshot["histograms"]) == {
+        "wow.quote.pool_address",
+        "wow.quote.pool_info",
+        "wow.quote.quoter",
+    }
@@ -0,0 +1,45 @@
+"""Benchmark the dispatch overhead of running an action through the CDP Agentkit wrapper.
+
+Times `run_action` on a no-op action that takes the wallet, resolving its injection spec from
+the action's signature on every call, as the wrapper used to, and with the spec precomputed when
+the tool is built.
+
+Usage:
+    poetry run python benchmarks/bench_run_action.py [--calls 100000]
+"""
+
+import argparse
+import timeit
+
+from cdp import Wallet
+from cdp_agentkit_core.actions.injection import InjectionSpec
+from cdp_langchain.utils import CdpAgentkitWrapper
+from cdp_langchain.utils.cdp_agentkit_wrapper import CDP_CONTEXT_TYPES
+
+
+def _action(wallet: Wallet, amount: str) -> str:
+    return amount
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--calls", type=int, default=100_000, help="Calls per dispatch mode")
+    options = parser.parse_args()
+
+    # Skip the environment validator, which configures the CDP SDK and creates a wallet.
+    wrapper = CdpAgentkitWrapper.model_construct(wallet=object())
+    spec = InjectionSpec.from_function(_action, CDP_CONTEXT_TYPES)
+
+    modes = {
+        "direct call": lambda: _action(wrapper.wallet, amount="1"),
+        "signature per call": lambda: wrapper.run_action(_action, amount="1"),
+        "precomputed spec": lambda: wrapper.run_action(_action, injection_spec=spec, amount="1"),
+    }
+    for name, call in modes.items():
+        seconds = min(timeit.repeat(call, number=options.calls, repeat=5))
+        print(f"{name:<20} {seconds / options.calls * 1e6:7.3f} us per call")
+
+
+if __name__ == "__main__":
+    main()
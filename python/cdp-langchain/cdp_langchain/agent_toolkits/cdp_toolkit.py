@@ -3,7 +3,7 @@
 from langchain_core.tools import BaseTool
 from langchain_core.tools.base import BaseToolkit
 
-from cdp_agentkit_core.actions import CDP_ACTIONS
+from cdp_agentkit_core.actions import get_all_cdp_actions, load_actions, select_action_specs
 from cdp_langchain.tools import CdpTool
 from cdp_langchain.utils import CdpAgentkitWrapper
 
@@ -42,6 +42,16 @@ class CdpToolkit(BaseToolkit):
             cdp = CdpAgentkitWrapper()
             cdp_toolkit = CdpToolkit.from_cdp_agentkit_wrapper(cdp)
 
+        Only the selected actions' tools are built, and only their modules are imported, when
+        actions are selected by name or tag:
+
+        .. code-block:: python
+
+            rpg_toolkit = CdpToolkit.from_cdp_agentkit_wrapper(cdp, tags=["rpg"])
+            read_only_toolkit = CdpToolkit.from_cdp_agentkit_wrapper(
+                cdp, tags=["read-only"], exclude_actions=["address_reputation"]
+            )
+
     Tools:
         .. code-block:: python
 
@@ -65,6 +75,7 @@ class CdpToolkit(BaseToolkit):
             register_basename
             wow_create_token
             wow_buy_token
+            wow_quote_curve
             wow_sell_token
             wrap_eth
             simulate_battle
@@ -120,17 +131,34 @@ class CdpToolkit(BaseToolkit):
     tools: list[BaseTool] = []  # noqa: RUF012
 
     @classmethod
-    def from_cdp_agentkit_wrapper(cls, cdp_agentkit_wrapper: CdpAgentkitWrapper) -> "CdpToolkit":
+    def from_cdp_agentkit_wrapper(
+        cls,
+        cdp_agentkit_wrapper: CdpAgentkitWrapper,
+        actions: list[str] | None = None,
+        tags: list[str] | None = None,
+        exclude_actions: list[str] | None = None,
+        exclude_tags: list[str] | None = None,
+    ) -> "CdpToolkit":
         """Create a CdpToolkit from a CdpAgentkitWrapper.
 
         Args:
             cdp_agentkit_wrapper: CdpAgentkitWrapper. The CDP Agentkit wrapper.
+            actions: Optional[List[str]]. Names of the actions to include.
+            tags: Optional[List[str]]. Tags of the actions to include, such as "rpg" or
+                "read-only". Actions matching any of `actions` or `tags` are included, or all
+                actions if both are omitted.
+            exclude_actions: Optional[List[str]]. Names of the actions to leave out.
+            exclude_tags: Optional[List[str]]. Tags of the actions to leave out.
 
         Returns:
             CdpToolkit. The CDP toolkit.
 
         """
-        actions = CDP_ACTIONS
+        if actions is None and tags is None and exclude_actions is None and exclude_tags is None:
+            cdp_actions = get_all_cdp_actions()
+        else:
+            specs = select_action_specs(actions, tags, exclude_actions, exclude_tags)
+            cdp_actions = load_actions([spec.name for spec in specs])
 
         tools = [
             CdpTool(
@@ -139,8 +167,9 @@ class CdpToolkit(BaseToolkit):
                 cdp_agentkit_wrapper=cdp_agentkit_wrapper,
                 args_schema=action.args_schema,
                 func=action.func,
+                afunc=action.afunc,
             )
-            for action in actions
+            for action in cdp_actions
         ]
 
         return cls(tools=tools)  # type: ignore[arg-type]
@@ -7,14 +7,16 @@ To use this tool, you must first set as environment variables:
 
 """
 
-from collections.abc import Callable
+from collections.abc import Awaitable, Callable
 from typing import Any
 
-from langchain_core.callbacks import CallbackManagerForToolRun
+from langchain_core.callbacks import AsyncCallbackManagerForToolRun, CallbackManagerForToolRun
 from langchain_core.tools import BaseTool
-from pydantic import BaseModel
+from pydantic import BaseModel, model_validator
 
-from cdp_langchain.utils.cdp_agentkit_wrapper import CdpAgentkitWrapper
+from cdp_agentkit_core.actions.injection import InjectionSpec
+from cdp_agentkit_core.actions.result import ActionResult
+from cdp_langchain.utils.cdp_agentkit_wrapper import CDP_CONTEXT_TYPES, CdpAgentkitWrapper
 
 
 class CdpTool(BaseTool):  # type: ignore[override]
@@ -24,7 +26,31 @@ class CdpTool(BaseTool):  # type: ignore[override]
     name: str = ""
     description: str = ""
     args_schema: type[BaseModel] | None = None
-    func: Callable[..., str]
+    func: Callable[..., str | ActionResult]
+    afunc: Callable[..., Awaitable[str | ActionResult]] | None = None
+    injection_spec: InjectionSpec | None = None
+    async_injection_spec: InjectionSpec | None = None
+
+    @model_validator(mode="after")
+    def resolve_injection_spec(self) -> "CdpTool":
+        """Resolve which context objects the action takes once, when the tool is built.
+
+        The async function is resolved separately, as its signature can differ from `func`'s.
+        """
+        if self.injection_spec is None:
+            self.injection_spec = InjectionSpec.from_function(self.func, CDP_CONTEXT_TYPES)
+        if self.afunc is not None and self.async_injection_spec is None:
+            self.async_injection_spec = InjectionSpec.from_function(self.afunc, CDP_CONTEXT_TYPES)
+        return self
+
+    def _parse_input_args(self, instructions: str | None, **kwargs: Any) -> dict[str, Any]:
+        if not instructions or instructions == "{}":
+            # Catch other forms of empty input that GPT-4 likes to send.
+            instructions = ""
+        if self.args_schema is not None:
+            validated_input_data = self.args_schema(**kwargs)
+            return validated_input_data.model_dump()
+        return {"instructions": instructions}
 
     def _run(
         self,
@@ -33,12 +59,27 @@ class CdpTool(BaseTool):  # type: ignore[override]
         **kwargs: Any,
     ) -> str:
         """Use the CDP SDK to run an operation."""
-        if not instructions or instructions == "{}":
-            # Catch other forms of empty input that GPT-4 likes to send.
-            instructions = ""
-        if self.args_schema is not None:
-            validated_input_data = self.args_schema(**kwargs)
-            parsed_input_args = validated_input_data.model_dump()
+        parsed_input_args = self._parse_input_args(instructions, **kwargs)
+        return str(
+            self.cdp_agentkit_wrapper.run_action(
+                self.func, injection_spec=self.injection_spec, **parsed_input_args
+            )
+        )
+
+    async def _arun(
+        self,
+        instructions: str | None = "",
+        run_manager: AsyncCallbackManagerForToolRun | None = None,
+        **kwargs: Any,
+    ) -> str:
+        """Use the CDP SDK to run an operation, without blocking the event loop."""
+        parsed_input_args = self._parse_input_args(instructions, **kwargs)
+        if self.afunc is not None:
+            func, injection_spec = self.afunc, self.async_injection_spec
         else:
-            parsed_input_args = {"instructions": instructions}
-        return self.cdp_agentkit_wrapper.run_action(self.func, **parsed_input_args)
+            func, injection_spec = self.func, self.injection_spec
+        return str(
+            await self.cdp_agentkit_wrapper.arun_action(
+                func, injection_spec=injection_spec, **parsed_input_args
+            )
+        )
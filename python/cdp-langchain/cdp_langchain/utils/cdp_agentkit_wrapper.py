@@ -1,17 +1,26 @@
 """Util that calls CDP."""
 
+import asyncio
 import inspect
 import json
-from collections.abc import Callable
+from collections.abc import Awaitable, Callable
 from typing import Any
 
 from langchain_core.utils import get_from_dict_or_env
 from pydantic import BaseModel, model_validator
 
 from cdp import MnemonicSeedPhrase, Wallet
+from cdp_agentkit_core.actions.injection import InjectionSpec
+from cdp_agentkit_core.actions.read_client import ReadClient, read_client
+from cdp_agentkit_core.actions.result import ActionResult
+from cdp_agentkit_core.actions.tracing import Tracer, tracer
+from cdp_agentkit_core.actions.wow.cache import TokenMetadataCache, token_metadata_cache
 from cdp_langchain import __version__
 from cdp_langchain.constants import CDP_LANGCHAIN_DEFAULT_SOURCE
 
+# Types of the context objects injected into CDP action parameters annotated with them.
+CDP_CONTEXT_TYPES = (Wallet, ReadClient, TokenMetadataCache, Tracer)
+
 
 class CdpAgentkitWrapper(BaseModel):
     """Wrapper for CDP Agentkit Core."""
@@ -77,13 +86,49 @@ class CdpAgentkitWrapper(BaseModel):
 
         return json.dumps(wallet_data_dict)
 
-    def run_action(self, func: Callable[..., str], **kwargs) -> str:
-        """Run a CDP Action."""
-        func_signature = inspect.signature(func)
-
-        first_kwarg = next(iter(func_signature.parameters.values()), None)
-
-        if first_kwarg and first_kwarg.annotation is Wallet:
-            return func(self.wallet, **kwargs)
-        else:
-            return func(**kwargs)
+    @property
+    def context(self) -> dict[type, Any]:
+        """Context objects injected into CDP actions, by type."""
+        return {
+            Wallet: self.wallet,
+            ReadClient: read_client,
+            TokenMetadataCache: token_metadata_cache,
+            Tracer: tracer,
+        }
+
+    def _bind_action(
+        self, func: Callable[..., Any], injection_spec: InjectionSpec | None, **kwargs
+    ) -> Callable[[], Any]:
+        if injection_spec is None:
+            injection_spec = InjectionSpec.from_function(func, CDP_CONTEXT_TYPES)
+        return injection_spec.bind(func, self.context, **kwargs)
+
+    def run_action(
+        self,
+        func: Callable[..., str | ActionResult],
+        injection_spec: InjectionSpec | None = None,
+        **kwargs,
+    ) -> str | ActionResult:
+        """Run a CDP Action.
+
+        The action's context objects, such as the wallet, are injected according to
+        `injection_spec`, which is resolved from the action's signature when not given. Structured
+        results are returned as is, for programmatic callers to read without parsing.
+        """
+        return self._bind_action(func, injection_spec, **kwargs)()
+
+    async def arun_action(
+        self,
+        func: Callable[..., str | ActionResult | Awaitable[str | ActionResult]],
+        injection_spec: InjectionSpec | None = None,
+        **kwargs,
+    ) -> str | ActionResult:
+        """Run a CDP Action without blocking the event loop.
+
+        Coroutine functions are awaited, and blocking functions are run in the event loop's
+        default executor.
+        """
+        action = self._bind_action(func, injection_spec, **kwargs)
+        if inspect.iscoroutinefunction(func):
+            return await action()
+        return await asyncio.get_running_loop().run_in_executor(None, action)
@@ -0,0 +1,68 @@
+"""Tests for the CDP Toolkit."""
+
+from unittest.mock import Mock
+
+import pytest
+
+from cdp_agentkit_core.actions import ACTION_SPECS
+from cdp_langchain.agent_toolkits import CdpToolkit
+from cdp_langchain.utils import CdpAgentkitWrapper
+
+
+@pytest.fixture
+def mock_cdp_agentkit_wrapper():
+    """Fixture for mocked CDP Agentkit wrapper."""
+    return Mock(spec=CdpAgentkitWrapper)
+
+
+def _tool_names(toolkit: CdpToolkit) -> list[str]:
+    return [tool.name for tool in toolkit.get_tools()]
+
+
+def test_toolkit_includes_all_actions(mock_cdp_agentkit_wrapper):
+    """Test that a toolkit built without filters includes every action."""
+    toolkit = CdpToolkit.from_cdp_agentkit_wrapper(mock_cdp_agentkit_wrapper)
+
+    assert set(_tool_names(toolkit)) >= {spec.name for spec in ACTION_SPECS}
+
+
+def test_toolkit_selects_actions_by_tag(mock_cdp_agentkit_wrapper):
+    """Test that a toolkit only includes actions with the selected tags."""
+    toolkit = CdpToolkit.from_cdp_agentkit_wrapper(mock_cdp_agentkit_wrapper, tags=["rpg"])
+
+    assert _tool_names(toolkit) == [
+        "estimate_fighting_pow",
+        "get_nft_price",
+        "simulate_battle",
+        "simulate_battle_batch",
+        "calculate_battle_odds",
+        "run_tournament",
+    ]
+
+
+def test_toolkit_selects_actions_by_name_and_exclusion(mock_cdp_agentkit_wrapper):
+    """Test that a toolkit combines selected names and tags, and leaves out excluded actions."""
+    toolkit = CdpToolkit.from_cdp_agentkit_wrapper(
+        mock_cdp_agentkit_wrapper,
+        actions=["get_wallet_details"],
+        tags=["pyth"],
+        exclude_actions=["pyth_fetch_price_feed_id"],
+    )
+
+    assert _tool_names(toolkit) == ["get_wallet_details", "pyth_fetch_price"]
+
+
+def test_toolkit_excludes_tags(mock_cdp_agentkit_wrapper):
+    """Test that a toolkit can include every action except those with excluded tags."""
+    toolkit = CdpToolkit.from_cdp_agentkit_wrapper(
+        mock_cdp_agentkit_wrapper, exclude_tags=["read-only"]
+    )
+
+    assert "transfer" in _tool_names(toolkit)
+    assert "get_balance" not in _tool_names(toolkit)
+
+
+def test_toolkit_unknown_tag(mock_cdp_agentkit_wrapper):
+    """Test that selecting an unknown tag fails."""
+    with pytest.raises(ValueError, match="Unknown CDP action tags: rpg-only"):
+        CdpToolkit.from_cdp_agentkit_wrapper(mock_cdp_agentkit_wrapper, tags=["rpg-only"])
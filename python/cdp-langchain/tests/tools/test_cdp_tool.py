@@ -1,5 +1,6 @@
 """Tests for the CDP Tool."""
 
+import asyncio
 from typing import Any
 from unittest.mock import Mock, patch
 
@@ -7,6 +8,8 @@ import pytest
 from langchain_core.callbacks import CallbackManager
 from pydantic import BaseModel
 
+from cdp import Wallet
+from cdp_agentkit_core.actions.injection import Injection
 from cdp_langchain.tools import CdpTool
 from cdp_langchain.utils import CdpAgentkitWrapper
 
@@ -60,13 +63,29 @@ def test_initialization(mock_cdp_agentkit_wrapper):
     assert tool.name == "test_action"
 
 
+def test_injection_spec_resolved_when_built(mock_cdp_agentkit_wrapper):
+    """Test that the context objects an action takes are resolved when the tool is built."""
+
+    def action(wallet: Wallet, amount: str) -> str:
+        return amount
+
+    tool = CdpTool(
+        cdp_agentkit_wrapper=mock_cdp_agentkit_wrapper,
+        name="test_action",
+        description="Test CDP Tool",
+        func=action,
+    )
+
+    assert tool.injection_spec.injections == (Injection("wallet", Wallet),)
+
+
 def test_run_with_instructions(cdp_tool):
     """Test running CDP Tool with instructions."""
     cdp_tool.cdp_agentkit_wrapper.run_action.return_value = "success"
     result = cdp_tool._run(instructions="test instructions")
 
     cdp_tool.cdp_agentkit_wrapper.run_action.assert_called_once_with(
-        cdp_tool.func, instructions="test instructions"
+        cdp_tool.func, injection_spec=cdp_tool.injection_spec, instructions="test instructions"
     )
     assert result == "success"
 
@@ -79,7 +98,9 @@ def test_run_with_empty_instructions(cdp_tool):
     empty_inputs = ["", "{}", None]
     for empty_input in empty_inputs:
         result = cdp_tool._run(instructions=empty_input)
-        cdp_tool.cdp_agentkit_wrapper.run_action.assert_called_with(cdp_tool.func, instructions="")
+        cdp_tool.cdp_agentkit_wrapper.run_action.assert_called_with(
+            cdp_tool.func, injection_spec=cdp_tool.injection_spec, instructions=""
+        )
         assert result == "success"
 
 
@@ -90,7 +111,9 @@ def test_run_with_schema(cdp_tool_with_schema):
     result = cdp_tool_with_schema._run(test_param="test")
 
     cdp_tool_with_schema.cdp_agentkit_wrapper.run_action.assert_called_once_with(
-        cdp_tool_with_schema.func, test_param="test"
+        cdp_tool_with_schema.func,
+        injection_spec=cdp_tool_with_schema.injection_spec,
+        test_param="test",
     )
     assert result == "success"
 
@@ -103,7 +126,7 @@ def test_run_with_callback_manager(cdp_tool):
     result = cdp_tool._run(instructions="test", run_manager=callback_manager)
 
     cdp_tool.cdp_agentkit_wrapper.run_action.assert_called_once_with(
-        cdp_tool.func, instructions="test"
+        cdp_tool.func, injection_spec=cdp_tool.injection_spec, instructions="test"
     )
     assert result == "success"
 
@@ -128,6 +151,48 @@ def test_run_with_different_valid_inputs(cdp_tool_with_schema, input_data: dict[
     result = cdp_tool_with_schema._run(**input_data)
 
     cdp_tool_with_schema.cdp_agentkit_wrapper.run_action.assert_called_once_with(
-        cdp_tool_with_schema.func, **input_data
+        cdp_tool_with_schema.func, injection_spec=cdp_tool_with_schema.injection_spec, **input_data
+    )
+    assert result == "success"
+
+
+def test_arun_with_schema(cdp_tool_with_schema):
+    """Test running CDP Tool asynchronously with args schema."""
+    cdp_tool_with_schema.cdp_agentkit_wrapper.arun_action.return_value = "success"
+
+    result = asyncio.run(cdp_tool_with_schema._arun(test_param="test"))
+
+    cdp_tool_with_schema.cdp_agentkit_wrapper.arun_action.assert_awaited_once_with(
+        cdp_tool_with_schema.func,
+        injection_spec=cdp_tool_with_schema.injection_spec,
+        test_param="test",
+    )
+    assert result == "success"
+
+
+def test_arun_prefers_async_func(mock_cdp_agentkit_wrapper):
+    """Test running CDP Tool asynchronously with an async action function, injected by its own."""
+
+    def func(wallet: Wallet, instructions):
+        return instructions
+
+    async def afunc(instructions):
+        return instructions
+
+    tool = CdpTool(
+        cdp_agentkit_wrapper=mock_cdp_agentkit_wrapper,
+        name="test_action",
+        description="Test CDP Tool",
+        func=func,
+        afunc=afunc,
+    )
+    mock_cdp_agentkit_wrapper.arun_action.return_value = "success"
+
+    result = asyncio.run(tool._arun(instructions="{}"))
+
+    assert tool.injection_spec.injections == (Injection("wallet", Wallet),)
+    assert tool.async_injection_spec.injections == ()
+    mock_cdp_agentkit_wrapper.arun_action.assert_awaited_once_with(
+        afunc, injection_spec=tool.async_injection_spec, instructions=""
     )
     assert result == "success"
@@ -1,15 +1,20 @@
 """Tests for the CDP Agentkit Wrapper."""
 
+import asyncio
 import json
+import threading
 from unittest.mock import Mock, patch
 
 import pytest
 from pydantic import ValidationError
 
 from cdp import Cdp, Wallet, WalletData
+from cdp_agentkit_core.actions.injection import InjectionSpec
+from cdp_agentkit_core.actions.tracing import Tracer, tracer
 from cdp_langchain import __version__
 from cdp_langchain.constants import CDP_LANGCHAIN_DEFAULT_SOURCE
 from cdp_langchain.utils import CdpAgentkitWrapper
+from cdp_langchain.utils.cdp_agentkit_wrapper import CDP_CONTEXT_TYPES
 
 
 @pytest.fixture
@@ -205,6 +210,60 @@ def test_run_action_valid_modes(
     assert result is True
 
 
+def test_run_action_injects_multiple_context_objects(
+    env_vars: dict[str, str],
+    mock_cdp_configure: Mock,
+    mock_wallet_create: Mock,
+):
+    """Test run method injects every context parameter, using a precomputed spec."""
+
+    def action(wallet: Wallet, amount: str, action_tracer: Tracer):
+        return wallet, amount, action_tracer
+
+    wrapper = CdpAgentkitWrapper()
+    spec = InjectionSpec.from_function(action, CDP_CONTEXT_TYPES)
+
+    with patch("inspect.signature") as mock_signature:
+        result = wrapper.run_action(action, injection_spec=spec, amount="1")
+
+    assert result == (wrapper.wallet, "1", tracer)
+    mock_signature.assert_not_called()
+
+
+def test_arun_action_awaits_async_action(
+    env_vars: dict[str, str],
+    mock_cdp_configure: Mock,
+    mock_wallet_create: Mock,
+):
+    """Test async run method with an async callable."""
+
+    async def get_wallet(wallet: Wallet, suffix: str):
+        return f"{wallet is not None}{suffix}"
+
+    wrapper = CdpAgentkitWrapper()
+    assert asyncio.run(wrapper.arun_action(get_wallet, suffix="!")) == "True!"
+
+
+def test_arun_action_runs_blocking_action_off_loop(
+    env_vars: dict[str, str],
+    mock_cdp_configure: Mock,
+    mock_wallet_create: Mock,
+):
+    """Test async run method runs a blocking callable outside of the event loop thread."""
+    loop_thread = threading.get_ident()
+
+    def get_thread(wallet: Wallet):
+        return threading.get_ident()
+
+    async def run(wrapper):
+        nonlocal loop_thread
+        loop_thread = threading.get_ident()
+        return await wrapper.arun_action(get_thread)
+
+    wrapper = CdpAgentkitWrapper()
+    assert asyncio.run(run(wrapper)) != loop_thread
+
+
 def test_cdp_configuration_error(
     env_vars: dict[str, str], mock_cdp_configure: Mock, mock_wallet_create: Mock
 ):
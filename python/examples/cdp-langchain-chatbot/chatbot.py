@@ -1,14 +1,25 @@
+import argparse
+import asyncio
+import fcntl
+import json
+import logging
 import os
+import time
+import uuid
+from contextlib import asynccontextmanager
 
 import uvicorn
-from fastapi import FastAPI
-from pydantic import BaseModel
+from fastapi import FastAPI, HTTPException
+from fastapi.responses import StreamingResponse
+from starlette.background import BackgroundTask
+from pydantic import BaseModel, Field
 
 from dotenv import load_dotenv
 
-from langchain_core.messages import HumanMessage
+from langchain_core.messages import HumanMessage, RemoveMessage, SystemMessage, trim_messages
 from langchain_openai import ChatOpenAI
 from langgraph.checkpoint.memory import MemorySaver
+from langgraph.checkpoint.sqlite.aio import AsyncSqliteSaver
 from langgraph.prebuilt import create_react_agent
 
 # Import CDP Agentkit Langchain Extension.
@@ -20,11 +31,66 @@ from fastapi.middleware.cors import CORSMiddleware
 # Load environment variables
 load_dotenv()
 
+logger = logging.getLogger(__name__)
+
 # Configure a file to persist the agent's CDP MPC Wallet Data.
 wallet_data_file = "wallet_data.txt"
+wallet_lock_file = f"{wallet_data_file}.lock"
+
+# Maximum chats handled at once. Further chats are rejected with 429 until one finishes.
+max_concurrent_chats = int(os.getenv("CHAT_MAX_CONCURRENCY", "8"))
+chat_slots = asyncio.Semaphore(max_concurrent_chats)
+
+# Configure where conversation threads are checkpointed: "sqlite" (default) or "memory".
+checkpointer_backend = os.getenv("CHAT_CHECKPOINTER", "sqlite")
+checkpoint_db_file = os.getenv("CHAT_CHECKPOINT_DB", "checkpoints.sqlite")
+eviction_lock_file = f"{checkpoint_db_file}.eviction.lock"
+
+# Messages of a session kept, and sent to the LLM each turn. Older messages are evicted.
+max_history_messages = int(os.getenv("CHAT_HISTORY_MAX_MESSAGES", "20"))
+
+# Seconds of inactivity after which a session is deleted, and how often to look for them.
+session_ttl = float(os.getenv("CHAT_SESSION_TTL_SECONDS", "86400"))
+session_eviction_interval = 60.0
+
+# Comma-separated tags of the CDP actions given to the agent, such as "rpg". All actions when unset.
+action_tags = [tag for tag in os.getenv("CHAT_ACTION_TAGS", "").split(",") if tag]
+
+AGENT_INSTRUCTIONS = (
+    "Your answer will alway look old and wise, like a tavern owner."
+    "You are a Travern Owner style RPG AI Agent. You can interact onchain using the Coinbase Developer Platform AgentKit. "
+    "You are a helpful agent that can use rpg action. estimate fighting power, simulate battle"
+    "You are a helpful agent that can interact onchain using the Coinbase Developer Platform AgentKit. in RPG Style "
+    "You are empowered to interact onchain using your tools. If you ever need funds, you can request "
+    "them from the faucet if you are on network ID 'base-sepolia'. If not, you can provide your wallet "
+    "details and request funds from the user. Before executing your first action, get the wallet details "
+    "to see what network you're on. If there is a 5XX (internal) HTTP error code, ask the user to try "
+    "again later. If someone asks you to do something you can't do with your currently available tools, "
+    "you must say so, and encourage them to implement it themselves using the CDP SDK + Agentkit, "
+    "recommend they go to docs.cdp.coinbase.com for more information. Be concise and helpful with your "
+    "responses. Refrain from restating your tools' descriptions unless it is explicitly requested."
+)
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Open the checkpoint store, initialize the agent and evict idle sessions while serving."""
+    async with open_checkpointer() as checkpointer:
+        app.state.checkpointer = checkpointer
+        app.state.agent_executor = initialize_agent(checkpointer)
+        eviction = asyncio.create_task(evict_idle_sessions_periodically(checkpointer))
+        try:
+            yield
+        finally:
+            eviction.cancel()
+
 
 # Initialize FastAPI
-app = FastAPI(title="RPG AI Agent API", description="Interact with the RPG AI Agent via API", version="1.0")
+app = FastAPI(
+    title="RPG AI Agent API",
+    description="Interact with the RPG AI Agent via API",
+    version="1.0",
+    lifespan=lifespan,
+)
 
 app.add_middleware(
     CORSMiddleware,
@@ -37,78 +103,309 @@ app.add_middleware(
 class ChatRequest(BaseModel):
     """Schema for chat messages."""
     message: str
+    session_id: str | None = Field(
+        None,
+        description="Conversation to continue. A new conversation is started when omitted.",
+    )
+
+
+@asynccontextmanager
+async def open_checkpointer():
+    """Open the configured store of conversation checkpoints."""
+    if checkpointer_backend == "memory":
+        yield MemorySaver()
+        return
+
+    async with AsyncSqliteSaver.from_conn_string(checkpoint_db_file) as checkpointer:
+        await checkpointer.setup()
+        await checkpointer.conn.execute(
+            "CREATE TABLE IF NOT EXISTS sessions (thread_id TEXT PRIMARY KEY, last_seen REAL NOT NULL)"
+        )
+        await checkpointer.conn.commit()
+        yield checkpointer
+
+
+def window_history(messages):
+    """Keep the latest messages of a conversation, starting at a user message."""
+    window = trim_messages(
+        messages,
+        strategy="last",
+        token_counter=len,
+        max_tokens=max_history_messages,
+        start_on="human",
+    )
+    if window:
+        return window
+
+    # The current turn alone is longer than the window, so keep all of it.
+    last_human = max(i for i, message in enumerate(messages) if isinstance(message, HumanMessage))
+    return messages[last_human:]
+
+
+def build_prompt(state):
+    """Prompt the LLM with the agent instructions and the windowed conversation history."""
+    return [SystemMessage(content=AGENT_INSTRUCTIONS), *window_history(state["messages"])]
+
+
+async def evict_old_messages(agent_executor, config):
+    """Remove the messages of a session that fell out of the history window from its state."""
+    state = await agent_executor.aget_state(config)
+    messages = state.values.get("messages", [])
+    evicted = messages[: len(messages) - len(window_history(messages))]
+    if evicted:
+        await agent_executor.aupdate_state(
+            config, {"messages": [RemoveMessage(id=message.id) for message in evicted]}
+        )
+
+
+async def record_session(checkpointer, thread_id):
+    """Keep only the latest checkpoint of a session, and mark the session as active."""
+    if not isinstance(checkpointer, AsyncSqliteSaver):
+        return
+
+    async with checkpointer.lock:
+        for table in ("checkpoints", "writes"):
+            await checkpointer.conn.execute(
+                f"DELETE FROM {table} WHERE thread_id = ? AND checkpoint_id < "
+                "(SELECT MAX(checkpoint_id) FROM checkpoints WHERE thread_id = ?)",
+                (thread_id, thread_id),
+            )
+        await checkpointer.conn.execute(
+            "INSERT INTO sessions (thread_id, last_seen) VALUES (?, ?) "
+            "ON CONFLICT (thread_id) DO UPDATE SET last_seen = excluded.last_seen",
+            (thread_id, time.time()),
+        )
+        await checkpointer.conn.commit()
+
+
+async def evict_idle_sessions_periodically(checkpointer):
+    """Delete the checkpoints of sessions that have been inactive for longer than their TTL.
+
+    Sessions are tracked in the shared database, so when several worker processes serve, only the
+    one holding the lock on the eviction lock file evicts them. Another worker takes the lock over
+    if it exits.
+    """
+    if not isinstance(checkpointer, AsyncSqliteSaver):
+        return
+
+    # Opened off the event loop. Taking the lock does not block, as it fails when already held.
+    lock = await asyncio.to_thread(open, eviction_lock_file, "w")
+    try:
+        while True:
+            await asyncio.sleep(session_eviction_interval)
+            try:
+                fcntl.flock(lock, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except BlockingIOError:
+                continue
+
+            cutoff = time.time() - session_ttl
+            async with checkpointer.lock:
+                for table in ("checkpoints", "writes", "sessions"):
+                    await checkpointer.conn.execute(
+                        f"DELETE FROM {table} WHERE thread_id IN "
+                        "(SELECT thread_id FROM sessions WHERE last_seen < ?)",
+                        (cutoff,),
+                    )
+                await checkpointer.conn.commit()
+    finally:
+        lock.close()
 
 
-def initialize_agent():
+def bootstrap_wallet_data():
+    """Read the agent's persisted wallet data, creating and persisting the wallet if there is none.
+
+    The file is locked, so when several worker processes start at once the wallet is created by
+    only one of them, and the others read the data it persisted.
+    """
+    with open(wallet_lock_file, "w") as lock:
+        fcntl.flock(lock, fcntl.LOCK_EX)
+        if os.path.exists(wallet_data_file):
+            with open(wallet_data_file) as f:
+                return f.read()
+
+        # Create the wallet and persist agent's wallet data, replacing the file atomically so it
+        # is never read partially written.
+        wallet_data = CdpAgentkitWrapper().export_wallet()
+        with open(f"{wallet_data_file}.tmp", "w") as f:
+            f.write(wallet_data)
+        os.replace(f"{wallet_data_file}.tmp", wallet_data_file)
+        return wallet_data
+
+
+def initialize_agent(checkpointer):
     """Initialize the agent with CDP Agentkit, but for RPG interactions."""
     # Initialize LLM.
     llm = ChatOpenAI(model="gpt-4o-mini")
 
-    wallet_data = None
-    if os.path.exists(wallet_data_file):
-        with open(wallet_data_file) as f:
-            wallet_data = f.read()
-
-    # Configure CDP Agentkit Langchain Extension.
-    values = {"cdp_wallet_data": wallet_data} if wallet_data else {}
-    agentkit = CdpAgentkitWrapper(**values)
-
-    # Persist agent's wallet data.
-    wallet_data = agentkit.export_wallet()
-    with open(wallet_data_file, "w") as f:
-        f.write(wallet_data)
+    # Configure CDP Agentkit Langchain Extension with the shared wallet, which is only read here.
+    agentkit = CdpAgentkitWrapper(cdp_wallet_data=bootstrap_wallet_data())
 
     # Initialize CDP Agentkit Toolkit and get tools.
-    cdp_toolkit = CdpToolkit.from_cdp_agentkit_wrapper(agentkit)
+    cdp_toolkit = CdpToolkit.from_cdp_agentkit_wrapper(agentkit, tags=action_tags or None)
     tools = cdp_toolkit.get_tools()
 
-    # Store buffered conversation history in memory.
-    memory = MemorySaver()
-    config = {"configurable": {"thread_id": "RPG AI Agent"}}
-
     # Create ReAct Agent using the LLM and CDP Agentkit tools.
     return create_react_agent(
         llm,
         tools=tools,
-        checkpointer=memory,
-        state_modifier=(
-            "Your answer will alway look old and wise, like a tavern owner."
-            "You are a Travern Owner style RPG AI Agent. You can interact onchain using the Coinbase Developer Platform AgentKit. "
-            "You are a helpful agent that can use rpg action. estimate fighting power, simulate battle"
-            "You are a helpful agent that can interact onchain using the Coinbase Developer Platform AgentKit. in RPG Style "
-            "You are empowered to interact onchain using your tools. If you ever need funds, you can request "
-            "them from the faucet if you are on network ID 'base-sepolia'. If not, you can provide your wallet "
-            "details and request funds from the user. Before executing your first action, get the wallet details "
-            "to see what network you're on. If there is a 5XX (internal) HTTP error code, ask the user to try "
-            "again later. If someone asks you to do something you can't do with your currently available tools, "
-            "you must say so, and encourage them to implement it themselves using the CDP SDK + Agentkit, "
-            "recommend they go to docs.cdp.coinbase.com for more information. Be concise and helpful with your "
-            "responses. Refrain from restating your tools' descriptions unless it is explicitly requested."
-        ),
-    ), config
-
-
-# Initialize agent once
-agent_executor, config = initialize_agent()
+        checkpointer=checkpointer,
+        state_modifier=build_prompt,
+    )
+
+
+async def acquire_chat_slot():
+    """Take a chat slot, rejecting the chat with 429 when the maximum number of chats are already
+    being handled.
+
+    Returns a function releasing the slot, which only releases it the first time it is called.
+    """
+    if chat_slots.locked():
+        raise HTTPException(
+            status_code=429,
+            detail="The tavern is full, try again shortly.",
+            headers={"Retry-After": "1"},
+        )
+
+    # A slot is free, so this takes it without waiting, before any other chat can.
+    await chat_slots.acquire()
+    released = False
+
+    def release():
+        nonlocal released
+        if not released:
+            released = True
+            chat_slots.release()
+
+    return release
+
+
+async def finish_turn(agent_executor, config):
+    """Evict old messages and checkpoints of a session after a turn."""
+    await evict_old_messages(agent_executor, config)
+    await record_session(app.state.checkpointer, config["configurable"]["thread_id"])
+
+
+def server_sent_event(event, data):
+    """Format a server-sent event with a JSON payload."""
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
 
 
 # 🎯 **API Endpoint: Chat with Agent**
 @app.post("/chat")
 async def chat(request: ChatRequest):
     """Interact with the RPG AI Agent."""
-    user_message = request.message
-    response = []
+    release_chat_slot = await acquire_chat_slot()
+    try:
+        user_message = request.message
+        session_id = request.session_id or str(uuid.uuid4())
+        config = {"configurable": {"thread_id": session_id}}
+        agent_executor = app.state.agent_executor
+        response = []
+
+        # Stream asynchronously, so the event loop keeps serving other chats during LLM calls
+        # and tool runs.
+        async for chunk in agent_executor.astream(
+            {"messages": [HumanMessage(content=user_message)]}, config
+        ):
+            if "agent" in chunk:
+                response.append(chunk["agent"]["messages"][0].content)
+            elif "tools" in chunk:
+                response.append(chunk["tools"]["messages"][0].content)
+
+        await finish_turn(agent_executor, config)
+    finally:
+        release_chat_slot()
+
+    return {"response": " ".join(response), "session_id": session_id}
+
 
-    for chunk in agent_executor.stream({"messages": [HumanMessage(content=user_message)]}, config):
-        if "agent" in chunk:
-            response.append(chunk["agent"]["messages"][0].content)
-        elif "tools" in chunk:
-            response.append(chunk["tools"]["messages"][0].content)
+# 🎯 **API Endpoint: Stream a Chat with Agent**
+@app.post("/chat/stream")
+async def chat_stream(request: ChatRequest):
+    """Interact with the RPG AI Agent, receiving its reply as server-sent events.
 
-    return {"response": " ".join(response)}
+    Events are sent as soon as they are produced:
+    - `session`: The session ID of the conversation, sent first.
+    - `token`: A token of the agent's reply.
+    - `agent`: A complete agent message, with the names of the tools it calls.
+    - `tool`: The result of a tool call.
+    - `done`: Sent once the turn is complete.
+    - `error`: Sent instead of `done` if the turn fails.
+    """
+    # The slot is taken before the response starts, so chats beyond the maximum are rejected
+    # instead of queueing while their streams wait for a slot.
+    release_chat_slot = await acquire_chat_slot()
+
+    session_id = request.session_id or str(uuid.uuid4())
+    config = {"configurable": {"thread_id": session_id}}
+    agent_executor = app.state.agent_executor
+
+    async def events():
+        try:
+            yield server_sent_event("session", {"session_id": session_id})
+            try:
+                async for mode, chunk in agent_executor.astream(
+                    {"messages": [HumanMessage(content=request.message)]},
+                    config,
+                    stream_mode=["messages", "updates"],
+                ):
+                    if mode == "messages":
+                        message, metadata = chunk
+                        if metadata.get("langgraph_node") == "agent" and message.content:
+                            yield server_sent_event("token", {"content": message.content})
+                    elif "agent" in chunk:
+                        message = chunk["agent"]["messages"][0]
+                        tool_calls = [tool_call["name"] for tool_call in message.tool_calls]
+                        yield server_sent_event(
+                            "agent", {"content": message.content, "tool_calls": tool_calls}
+                        )
+                    elif "tools" in chunk:
+                        for message in chunk["tools"]["messages"]:
+                            yield server_sent_event(
+                                "tool", {"name": message.name, "content": message.content}
+                            )
+
+                await finish_turn(agent_executor, config)
+            # The response has already started, so any failure of the turn, from the LLM, a tool or
+            # the checkpoint store, is reported as an event. Its details stay in the server's log.
+            except Exception:
+                logger.exception("Chat turn of session %s failed", session_id)
+                yield server_sent_event(
+                    "error", {"detail": "The agent could not finish its reply, try again shortly."}
+                )
+                return
+
+            yield server_sent_event("done", {"session_id": session_id})
+        finally:
+            release_chat_slot()
+
+    # The background task also releases the slot if the client disconnects before the stream
+    # starts, when the generator never runs.
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+        background=BackgroundTask(release_chat_slot),
+    )
 
 
 # 🎯 **Run API Server**
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Run the RPG AI Agent API.")
+    parser.add_argument("--host", default="0.0.0.0", help="Address to listen on")
+    parser.add_argument("--port", type=int, default=8000, help="Port to listen on")
+    parser.add_argument("--workers", type=int, default=1, help="Worker processes to serve with")
+    options = parser.parse_args()
+
+    if options.workers > 1 and checkpointer_backend == "memory":
+        # Each worker would keep its own conversations, losing them when requests of a session
+        # reach another worker.
+        parser.error("--workers needs the shared sqlite checkpointer, not CHAT_CHECKPOINTER=memory")
+
     print("Starting RPG AI Agent API...")
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+    if options.workers > 1:
+        # Create the wallet once before the workers start, so they all share it.
+        bootstrap_wallet_data()
+        uvicorn.run("chatbot:app", host=options.host, port=options.port, workers=options.workers)
+    else:
+        uvicorn.run(app, host=options.host, port=options.port)
@@ -29,7 +29,8 @@ def test_account_details_success(tweepy_factory):
     with patch.object(mock_client, "get_me", return_value=mock_client_result) as mock_tweepy_get_me:
         response = account_details(mock_client)
 
-        assert response == expected_response
+        assert str(response) == expected_response
+        assert response.response == expected_result
         mock_tweepy_get_me.assert_called_once_with()
 
 
@@ -43,5 +44,5 @@ def test_account_details_failure(tweepy_factory):
     with patch.object(mock_client, "get_me", side_effect=expected_result) as mock_tweepy_get_me:
         response = account_details(mock_client)
 
-        assert response == expected_response
+        assert str(response) == expected_response
         mock_tweepy_get_me.assert_called_once_with()
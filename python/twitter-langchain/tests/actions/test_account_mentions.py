@@ -49,7 +49,8 @@ def test_account_mentions_success(tweepy_factory):
     with patch.object(mock_client, "get_users_mentions", return_value=mock_client_result) as mock_tweepy_get_users_mentions:
         response = account_mentions(mock_client, MOCK_ACCOUNT_ID)
 
-        assert response == expected_response
+        assert str(response) == expected_response
+        assert response.response == mock_client_result
         mock_tweepy_get_users_mentions.assert_called_once_with(MOCK_ACCOUNT_ID)
 
 
@@ -62,5 +63,5 @@ def test_account_mentions_failure(tweepy_factory):
 
     with patch.object(mock_client, "get_users_mentions", side_effect=expected_result) as mock_get_users_mentions:
         response = account_mentions(mock_client, MOCK_ACCOUNT_ID)
-        assert response == expected_response
+        assert str(response) == expected_response
         mock_get_users_mentions.assert_called_once_with(MOCK_ACCOUNT_ID)
@@ -42,7 +42,8 @@ def test_post_tweet_success(tweepy_factory):
     with patch.object(mock_client, "create_tweet", return_value=mock_client_result) as mock_tweepy_create_tweet:
         response = post_tweet(mock_client, MOCK_TWEET)
 
-        assert response == expected_response
+        assert str(response) == expected_response
+        assert response.response == mock_client_result
         mock_tweepy_create_tweet.assert_called_once_with(text=MOCK_TWEET)
 
 
@@ -55,5 +56,5 @@ def test_post_tweet_failure(tweepy_factory):
 
     with patch.object(mock_client, "create_tweet", side_effect=expected_result) as mock_tweepy_create_tweet:
         response = post_tweet(mock_client, MOCK_TWEET)
-        assert response == expected_response
+        assert str(response) == expected_response
         mock_tweepy_create_tweet.assert_called_once_with(text=MOCK_TWEET)
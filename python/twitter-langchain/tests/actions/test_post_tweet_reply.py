@@ -45,7 +45,8 @@ def test_post_tweet_success(tweepy_factory):
     with patch.object(mock_client, "create_tweet", return_value=mock_client_result) as mock_tweepy_create_tweet:
         response = post_tweet_reply(mock_client, MOCK_TWEET_ID, MOCK_TWEET_REPLY)
 
-        assert response == expected_response
+        assert str(response) == expected_response
+        assert response.response == mock_client_result
         mock_tweepy_create_tweet.assert_called_once_with(
             in_reply_to_tweet_id=MOCK_TWEET_ID,
             text=MOCK_TWEET_REPLY,
@@ -61,7 +62,7 @@ def test_post_tweet_failure(tweepy_factory):
 
     with patch.object(mock_client, "create_tweet", side_effect=expected_result) as mock_tweepy_create_tweet:
         response = post_tweet_reply(mock_client, MOCK_TWEET_ID, MOCK_TWEET_REPLY)
-        assert response == expected_response
+        assert str(response) == expected_response
         mock_tweepy_create_tweet.assert_called_once_with(
             in_reply_to_tweet_id=MOCK_TWEET_ID,
             text=MOCK_TWEET_REPLY,
@@ -1,13 +1,20 @@
 """Util that calls Twitter API."""
 
+import asyncio
 import inspect
-from collections.abc import Callable
+from collections.abc import Awaitable, Callable
 from typing import Any
 
 import tweepy
+from cdp_agentkit_core.actions.injection import InjectionSpec
+from cdp_agentkit_core.actions.result import ActionResult
+from cdp_agentkit_core.actions.tracing import Tracer, tracer
 from langchain_core.utils import get_from_dict_or_env
 from pydantic import BaseModel, model_validator
 
+# Types of the context objects injected into Twitter action parameters annotated with them.
+TWITTER_CONTEXT_TYPES = (tweepy.Client, Tracer)
+
 
 class TwitterApiWrapper(BaseModel):
     """Wrapper for Twitter API."""
@@ -51,12 +58,43 @@ class TwitterApiWrapper(BaseModel):
 
         return values
 
-    def run_action(self, func: Callable[..., str], **kwargs) -> str:
-        """Run a Twitter Action."""
-        func_signature = inspect.signature(func)
-        first_kwarg = next(iter(func_signature.parameters.values()), None)
+    @property
+    def context(self) -> dict[type, Any]:
+        """Context objects injected into Twitter actions, by type."""
+        return {tweepy.Client: self.client, Tracer: tracer}
+
+    def _bind_action(
+        self, func: Callable[..., Any], injection_spec: InjectionSpec | None, **kwargs
+    ) -> Callable[[], Any]:
+        if injection_spec is None:
+            injection_spec = InjectionSpec.from_function(func, TWITTER_CONTEXT_TYPES)
+        return injection_spec.bind(func, self.context, **kwargs)
+
+    def run_action(
+        self,
+        func: Callable[..., str | ActionResult],
+        injection_spec: InjectionSpec | None = None,
+        **kwargs,
+    ) -> str | ActionResult:
+        """Run a Twitter Action.
+
+        The action's context objects, such as the Twitter client, are injected according to
+        `injection_spec`, which is resolved from the action's signature when not given.
+        """
+        return self._bind_action(func, injection_spec, **kwargs)()
+
+    async def arun_action(
+        self,
+        func: Callable[..., str | ActionResult | Awaitable[str | ActionResult]],
+        injection_spec: InjectionSpec | None = None,
+        **kwargs,
+    ) -> str | ActionResult:
+        """Run a Twitter Action without blocking the event loop.
 
-        if first_kwarg and first_kwarg.annotation is tweepy.Client:
-            return func(self.client, **kwargs)
-        else:
-            return func(**kwargs)
+        Coroutine functions are awaited, and blocking functions are run in the event loop's
+        default executor.
+        """
+        action = self._bind_action(func, injection_spec, **kwargs)
+        if inspect.iscoroutinefunction(func):
+            return await action()
+        return await asyncio.get_running_loop().run_in_executor(None, action)
@@ -129,6 +129,7 @@ class TwitterToolkit(BaseToolkit):
                 twitter_api_wrapper=twitter_api_wrapper,
                 args_schema=action.args_schema,
                 func=action.func,
+                afunc=action.afunc,
             )
             for action in actions
         ]